@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Throughput of ``Device`` versus ``AsyncDevice`` across a simulated fleet.
+
+Every switch is a local NETCONF stub: a callback that sleeps for the
+configured round-trip time and returns a canned ``get-system-uptime``
+reply.  The serial run polls each switch in turn, the async run keeps all
+of them in flight on one event loop.
+
+Usage:
+    python benchmarks/bench_async.py [--devices N] [--calls N] [--rtt S]
+"""
+from __future__ import print_function
+import argparse
+import asyncio
+import time
+import xml.etree.ElementTree as ET
+
+import pynos.async_device
+import pynos.device
+
+UPTIME_REPLY = ('<rpc-reply xmlns:ns1="urn:brocade.com:mgmt:brocade-system">'
+                '<ns1:show-system-uptime><ns1:days>1</ns1:days>'
+                '<ns1:hours>2</ns1:hours><ns1:minutes>3</ns1:minutes>'
+                '<ns1:seconds>4</ns1:seconds></ns1:show-system-uptime>'
+                '</rpc-reply>')
+
+
+def stub_callback(rtt):
+    """Return a callback that behaves like a NETCONF session `rtt` away."""
+    def callback(call, handler='edit_config', **kwargs):
+        time.sleep(rtt)
+        return ET.fromstring(UPTIME_REPLY)
+    return callback
+
+
+def run_serial(devices, calls, rtt):
+    start = time.time()
+    for _ in range(devices):
+        dev = pynos.device.Device(conn=('127.0.0.1', '22'), test=True,
+                                  callback=stub_callback(rtt))
+        for _ in range(calls):
+            dev.system.uptime
+    return time.time() - start
+
+
+def run_async(devices, calls, rtt):
+    loop = asyncio.new_event_loop()
+
+    def poll(adev):
+        return asyncio.gather(*[adev.system.uptime() for _ in range(calls)])
+
+    start = time.time()
+    adevs = [pynos.async_device.AsyncDevice(conn=('127.0.0.1', '22'),
+                                            test=True, loop=loop,
+                                            callback=stub_callback(rtt))
+             for _ in range(devices)]
+    loop.run_until_complete(asyncio.gather(*[d.connect() for d in adevs]))
+    loop.run_until_complete(asyncio.gather(*[poll(d) for d in adevs]))
+    loop.close()
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Device versus AsyncDevice throughput.')
+    parser.add_argument('--devices', type=int, default=100)
+    parser.add_argument('--calls', type=int, default=3)
+    parser.add_argument('--rtt', type=float, default=0.05)
+    args = parser.parse_args()
+
+    rpcs = args.devices * args.calls
+    for name, func in [('serial Device', run_serial),
+                       ('AsyncDevice', run_async)]:
+        elapsed = func(args.devices, args.calls, args.rtt)
+        print('%-15s %6d RPCs in %7.2fs  %8.1f RPC/s' %
+              (name, rpcs, elapsed, rpcs / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Cold-import benchmark for ``pynos.device``.
+
+Each scenario runs in a fresh interpreter so nothing is shared through
+``sys.modules``.  Compares the lazy import of ``pynos.device`` against
+eagerly importing every feature module listed in ``VERSIONS`` (what
+``pynos.device`` used to do at import time), and against touching a single
+feature of one firmware version.
+
+Usage:
+    python benchmarks/bench_import.py [--runs N]
+"""
+from __future__ import print_function
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = [
+    ('import pynos.device',
+     'import pynos.device'),
+    ('import + one feature (5.0.1 interface)',
+     'import pynos.device\n'
+     'dev = pynos.device.Device(conn=("127.0.0.1", "22"), test=True,\n'
+     '                          callback=lambda *a, **k: None)\n'
+     'dev.interface'),
+    ('eager import of every VERSIONS entry',
+     'import pynos.device\n'
+     'for features in pynos.device.VERSIONS.values():\n'
+     '    for path in features.values():\n'
+     '        try:\n'
+     '            pynos.device.resolve_class(path)\n'
+     '        except (ImportError, SyntaxError):\n'
+     '            pass'),
+]
+
+
+def time_scenario(code, runs):
+    """Return the wall times, in seconds, of `runs` fresh interpreters."""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [ROOT] + [p for p in [env.get('PYTHONPATH')] if p])
+    # Bytecode is written on the warm-up run, so the timed runs measure
+    # import cost rather than compilation.
+    command = [sys.executable, '-W', 'ignore', '-c', code]
+    subprocess.check_call(command, env=env)
+    timings = []
+    for _ in range(runs):
+        start = time.time()
+        subprocess.check_call(command, env=env)
+        timings.append(time.time() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Cold-import benchmark for pynos.device.')
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    baseline = time_scenario('pass', args.runs)
+    print('%-45s %10s %10s' % ('scenario', 'min (ms)', 'median (ms)'))
+    print('%-45s %10.1f %10.1f' % ('interpreter startup',
+                                   min(baseline) * 1000,
+                                   sorted(baseline)[len(baseline) // 2] *
+                                   1000))
+    for name, code in SCENARIOS:
+        timings = sorted(time_scenario(code, args.runs))
+        print('%-45s %10.1f %10.1f' % (name, timings[0] * 1000,
+                                       timings[len(timings) // 2] * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Time of ``Interface.interfaces`` on a large chassis.
+
+Synthetic ``get-interface-detail`` and ``get-ip-interface`` replies with
+the requested number of interfaces are parsed up front; the callback hands
+out the parsed trees, so only the parsing of the rows and the join of the
+two replies are measured.  The run is repeated at a fifth of the size: a
+linear join takes about five times as long at full size, the old
+quadratic join about twenty-five times.
+
+Usage:
+    python benchmarks/bench_interfaces.py [--interfaces N] [--max-time S]
+"""
+from __future__ import print_function
+import argparse
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+import pynos.versions.base.interface
+
+NAMESPACE = 'urn:brocade.com:mgmt:brocade-interface-ext'
+DETAIL = ('<interface><interface-type>tengigabitethernet</interface-type>'
+          '<interface-name>{0}/{1}/{2}</interface-name>'
+          '<port-role>Edge</port-role>'
+          '<if-name>TenGigabitEthernet {0}/{1}/{2}</if-name>'
+          '<if-state>up</if-state><line-protocol-state>up'
+          '</line-protocol-state><current-hardware-address>0005.33e5.{3:04x}'
+          '</current-hardware-address></interface>')
+IP = ('<interface><interface-type>{0}</interface-type>'
+      '<interface-name>{1}</interface-name><if-state>up</if-state>'
+      '<line-protocol-state>up</line-protocol-state>'
+      '<ip-address><ipv4>10.{2}.{3}.1/24</ipv4></ip-address></interface>')
+
+
+def port_name(i):
+    return (i // 4096 + 1, i // 64 % 64, i % 64 + 1)
+
+
+def build_replies(count):
+    detail = ''.join(DETAIL.format(*(port_name(i) + (i,)))
+                     for i in range(count))
+    ips = []
+    for i in range(count):
+        if i % 2:
+            ips.append(IP.format('ve', i, i // 256, i % 256))
+        else:
+            ips.append(IP.format('tengigabitethernet',
+                                 '%s/%s/%s' % port_name(i),
+                                 i // 256, i % 256))
+    detail = ET.fromstring('<output xmlns="%s">%s<has-more>false</has-more>'
+                           '</output>' % (NAMESPACE, detail))
+    ips = ET.fromstring('<output xmlns="%s">%s</output>' %
+                        (NAMESPACE, ''.join(ips)))
+    return detail, ips
+
+
+def run(count):
+    detail, ips = build_replies(count)
+
+    def callback(call, handler='edit_config'):
+        if call.tag == 'get-ip-interface':
+            return ips
+        return detail
+
+    interface = pynos.versions.base.interface.Interface(callback)
+    start = time.time()
+    result = interface.interfaces
+    elapsed = time.time() - start
+    assert len(result) == count
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Interface.interfaces time on synthetic replies.')
+    parser.add_argument('--interfaces', type=int, default=5000)
+    parser.add_argument('--max-time', type=float, default=None,
+                        help='exit with status 1 if the full size run '
+                             'takes longer')
+    args = parser.parse_args()
+
+    small = run(args.interfaces // 5)
+    full = run(args.interfaces)
+    print('%6d interfaces %8.3fs' % (args.interfaces // 5, small))
+    print('%6d interfaces %8.3fs  (%.1fx)' % (args.interfaces, full,
+                                             full / small))
+    if args.max_time is not None and full > args.max_time:
+        print('slower than %ss' % args.max_time)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Peak memory of ``Device.mac_table`` versus ``Device.iter_mac_table``.
+
+A canned ``get-mac-address-table`` reply of the requested size is built
+up front, so only the parsing is measured.  ``mac_table`` parses the whole
+reply into a tree before decoding it, ``iter_mac_table`` decodes entries
+as they are parsed and discards them.  The reply text, which both need in
+full, is not counted.
+
+Usage:
+    python benchmarks/bench_stream.py [--entries N]
+"""
+from __future__ import print_function
+import argparse
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+import pynos.device
+
+NAMESPACE = 'urn:brocade.com:mgmt:brocade-mac-address-table'
+ENTRY = ('<mac-address-table><vlanid>{0}</vlanid>'
+         '<mac-address>{1:04x}.{2:04x}.{3:04x}</mac-address>'
+         '<mac-type>dynamic</mac-type><mac-state>active</mac-state>'
+         '<forwarding-interface><interface-type>TenGigabitEthernet'
+         '</interface-type><interface-name>1/0/{4}</interface-name>'
+         '</forwarding-interface></mac-address-table>')
+
+
+def build_reply(entries):
+    body = ''.join(ENTRY.format(i % 4000, i >> 32, (i >> 16) & 0xffff,
+                                i & 0xffff, i % 48)
+                   for i in range(entries))
+    return ('<rpc-reply><get-mac-address-table-output xmlns="%s">%s'
+            '</get-mac-address-table-output></rpc-reply>' % (NAMESPACE, body))
+
+
+def stub_callback(reply):
+    """Return a callback that answers every call with `reply`."""
+    def callback(call, handler='edit_config', **kwargs):
+        if handler == 'get_stream':
+            return reply
+        return ET.fromstring(reply).find(
+            '{%s}get-mac-address-table-output' % NAMESPACE)
+    return callback
+
+
+def measure(func):
+    tracemalloc.start()
+    start = time.time()
+    count = func()
+    elapsed = time.time() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return count, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='mac_table versus iter_mac_table peak memory.')
+    parser.add_argument('--entries', type=int, default=100000)
+    args = parser.parse_args()
+
+    reply = build_reply(args.entries)
+    dev = pynos.device.Device(conn=('127.0.0.1', '22'), test=True,
+                              callback=stub_callback(reply))
+    print('reply size %.1f MB' % (len(reply) / 1e6))
+    for name, func in [('mac_table', lambda: len(dev.mac_table)),
+                       ('iter_mac_table',
+                        lambda: sum(1 for _ in dev.iter_mac_table()))]:
+        count, elapsed, peak = measure(func)
+        print('%-15s %8d entries in %6.2fs  peak %8.1f MB' %
+              (name, count, elapsed, peak / 1e6))
+
+
+if __name__ == '__main__':
+    main()
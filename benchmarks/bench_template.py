@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Time to build edit-config documents with the YANG builders and with
+precompiled ``pynos.template`` templates.
+
+Each of N interface descriptions is produced both ways as the bytes the
+device hands to ncclient: the builder path builds an ``ElementTree`` and
+serializes it, the template path only fills the values in.  A second
+column adds the parse ncclient does before sending, which both paths pay.
+
+Usage:
+    python benchmarks/bench_template.py [--calls N]
+"""
+from __future__ import print_function
+import argparse
+import time
+import xml.etree.ElementTree as ET
+
+import lxml.etree
+
+import pynos.template
+import pynos.utilities
+from pynos.versions.base.yang.brocade_interface import brocade_interface
+
+
+def with_builder(yang, count):
+    for port in range(count):
+        config = yang.interface_tengigabitethernet_description(
+            name='1/0/%d' % port, description='server %d' % port)
+        yield ET.tostring(config)
+
+
+def with_template(yang, count):
+    template = pynos.template.compile_builder(
+        yang.interface_tengigabitethernet_description, 'name', 'description')
+    for port in range(count):
+        yield template.render(name='1/0/%d' % port,
+                              description='server %d' % port)
+
+
+def run(produce, yang, count, parse):
+    start = time.time()
+    for document in produce(yang, count):
+        if parse:
+            lxml.etree.fromstring(document)
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='YANG builders against precompiled templates.')
+    parser.add_argument('--calls', type=int, default=50000)
+    args = parser.parse_args()
+
+    yang = brocade_interface(callback=pynos.utilities.return_xml)
+    assert list(with_builder(yang, 3)) == list(with_template(yang, 3))
+    print('%d edit-config documents     build   build+parse' % args.calls)
+    for name, produce in [('builder + tostring', with_builder),
+                          ('template.render', with_template)]:
+        print('  %-20s %8.3fs %8.3fs' % (
+            name, run(produce, yang, args.calls, False),
+            run(produce, yang, args.calls, True)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+
+Memory and time to load the generated YANG builders of several releases.
+
+Each measurement runs in a fresh interpreter that imports every YANG
+module of the given releases, then reads the builder table of every
+class, and reports the memory allocated while doing so (``tracemalloc``)
+and the time taken by each step.  Loading one release and then
+all of them shows what each extra release costs a long-running process.
+
+Usage:
+    python benchmarks/bench_yang.py
+"""
+from __future__ import print_function
+import compileall
+import json
+import os
+import subprocess
+import sys
+
+PACKAGES = [
+    ('5.0.1', 'pynos.versions.base.yang'),
+    ('6.0.1', 'pynos.versions.ver_6.ver_6_0_1.yang'),
+    ('7.0.0', 'pynos.versions.ver_7.ver_7_0_0.yang'),
+    ('7.1.0', 'pynos.versions.ver_7.ver_7_1_0.yang'),
+]
+
+MEASURE = '''
+import importlib, json, os, sys, time, tracemalloc
+import pynos.versions.registry
+packages = sys.argv[1:]
+tracemalloc.start()
+start = time.time()
+classes = []
+for package in packages:
+    path = os.path.dirname(importlib.import_module(package).__file__)
+    for name in sorted(os.listdir(path)):
+        if name.endswith('.py') and name != '__init__.py':
+            module = importlib.import_module('%s.%s' % (package, name[:-3]))
+            classes.append(getattr(module, name[:-3]))
+imported = time.time() - start
+imported_memory = tracemalloc.get_traced_memory()[0]
+for cls in classes:
+    pynos.versions.registry.builder_names(cls)
+loaded = time.time() - start - imported
+print(json.dumps([imported_memory, imported,
+                  tracemalloc.get_traced_memory()[0], loaded]))
+'''
+
+
+def measure(packages):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+    output = subprocess.check_output(
+        [sys.executable, '-c', MEASURE] + packages, env=env)
+    return json.loads(output.decode('utf-8'))
+
+
+def main():
+    # Fill the bytecode cache so only loading is measured.
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for _, package in PACKAGES:
+        compileall.compile_dir(os.path.join(root, *package.split('.')),
+                               quiet=1)
+    print('releases loaded               imported          tables loaded')
+    for count in range(1, len(PACKAGES) + 1):
+        releases = [release for release, _ in PACKAGES[:count]]
+        packages = [package for _, package in PACKAGES[:count]]
+        imported_memory, imported, memory, loaded = measure(packages)
+        print('  %-26s %6.1f MB %6.2fs %6.1f MB %6.2fs' % (
+            ', '.join(releases), imported_memory / 1e6, imported,
+            memory / 1e6, loaded))
+
+
+if __name__ == '__main__':
+    main()
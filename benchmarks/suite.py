@@ -0,0 +1,353 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Benchmark suite of pynos, for comparing releases.
+
+Groups:
+    import    Cold import of ``pynos.device`` in a fresh interpreter.
+    features  Construction of every feature class of each firmware version
+              in ``VERSIONS``.
+    builders  One call of the most used ``brocade_interface`` and
+              ``brocade_rbridge`` builders.
+    parsers   Operational getters on large replies generated by
+              ``pynos.simulator``; the replies are generated up front, so
+              the parsing and decoding of the rows are measured.
+    e2e       ``Device`` sessions, paged tables and configuration pushes
+              over SSH against a local ``pynos.simulator``.
+
+Each benchmark is run once to warm up, then timed `repeat` times; the
+minimum and median time per call are reported.  ``--output`` saves the
+results as JSON, and ``--compare`` reports the ratio of each minimum to
+the one in a saved file and exits with status 1 if a benchmark got slower
+than ``--threshold``.
+
+Usage:
+    python benchmarks/suite.py [--filter TEXT] [--quick] [--output FILE]
+                               [--compare FILE] [--threshold RATIO]
+"""
+from __future__ import print_function
+import argparse
+import collections
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pynos.device  # noqa: E402
+import pynos.simulator  # noqa: E402
+import pynos.utilities  # noqa: E402
+import pynos.versions.registry  # noqa: E402
+
+SIZES = dict(interfaces=2000, vlans=1000, port_channels=500,
+             macs=20000, lldp_neighbors=2000, arp=20000)
+"""dict: Table sizes of the simulated switch."""
+
+PUSHES = 100
+"""int: Number of edits of the configuration push scenarios."""
+
+BUILDERS = [
+    ('brocade_interface', 'interface_tengigabitethernet_description'),
+    ('brocade_interface', 'interface_tengigabitethernet_mtu'),
+    ('brocade_interface', 'interface_tengigabitethernet_shutdown'),
+    ('brocade_interface',
+     'interface_tengigabitethernet_switchport_mode_vlan_mode'),
+    ('brocade_interface',
+     'interface_tengigabitethernet_switchport_trunk_allowed_vlan_add'),
+    ('brocade_interface',
+     'interface_tengigabitethernet_ip_ip_config_address_address'),
+    ('brocade_interface', 'interface_vlan_interface_vlan_name'),
+    ('brocade_rbridge', 'rbridge_id_interface_ve_name'),
+    ('brocade_rbridge',
+     'rbridge_id_interface_ve_ip_ip_config_address_address'),
+    ('brocade_rbridge',
+     'rbridge_id_interface_loopback_ip_ip_config_address_address'),
+    ('brocade_rbridge',
+     'rbridge_id_router_bgp_router_bgp_cmds_holder_router_bgp_attributes_'
+     'neighbor_ips_neighbor_addr_remote_as'),
+]
+"""list: (module, builder) of the builders timed, from the 5.0.1 tables."""
+
+GETTERS = [
+    ('interface.interface_detail', lambda dev: dev.interface.interface_detail),
+    ('interface.interfaces', lambda dev: dev.interface.interfaces),
+    ('interface.vlans', lambda dev: dev.interface.vlans),
+    ('interface.port_channels', lambda dev: dev.interface.port_channels),
+    ('lldp.neighbors', lambda dev: dev.lldp.neighbors()),
+    ('mac_table', lambda dev: dev.mac_table),
+    ('iter_mac_table', lambda dev: list(dev.iter_mac_table())),
+    ('services.arp', lambda dev: dev.services.arp),
+    ('services.iter_arp', lambda dev: list(dev.services.iter_arp())),
+    ('vcs.vcs_nodes', lambda dev: dev.vcs.vcs_nodes),
+]
+"""list: (name, function of a Device) of the operational getters timed."""
+
+Benchmark = collections.namedtuple('Benchmark',
+                                   'group name setup number repeat')
+_cleanup = []
+_simulator = []
+
+
+def benchmarks():
+    """Return every benchmark of the suite, in order.
+
+    Each ``setup`` returns the function to time.
+    """
+    result = [Benchmark('import', 'interpreter', lambda: _python('pass'),
+                        1, 5),
+              Benchmark('import', 'pynos.device',
+                        lambda: _python('import pynos.device'), 1, 5)]
+    for version in sorted(pynos.device.VERSIONS):
+        result.append(Benchmark('features', version,
+                                _feature_setup(version), 10, 5))
+    for module, name in BUILDERS:
+        result.append(Benchmark('builders', name,
+                                _builder_setup(module, name), 1000, 5))
+    for name, getter in GETTERS:
+        result.append(Benchmark('parsers', name, _parser_setup(getter),
+                                1, 5))
+    result.extend([
+        Benchmark('e2e', 'session', _session_setup, 1, 5),
+        Benchmark('e2e', 'interface_detail', _e2e_setup(
+            lambda dev: dev.interface.interface_detail), 1, 5),
+        Benchmark('e2e', 'mac_table', _e2e_setup(
+            lambda dev: dev.mac_table), 1, 5),
+        Benchmark('e2e', 'push_serial', _e2e_setup(_push_serial), 1, 3),
+        Benchmark('e2e', 'push_execute_many', _e2e_setup(
+            _push_execute_many), 1, 3),
+        Benchmark('e2e', 'push_transaction', _e2e_setup(
+            _push_transaction), 1, 3),
+    ])
+    return result
+
+
+def _python(code):
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [ROOT] + [p for p in [env.get('PYTHONPATH')] if p])
+    command = [sys.executable, '-W', 'ignore', '-c', code]
+    return lambda: subprocess.check_call(command, env=env)
+
+
+def _callback(call, handler='edit_config', **kwargs):
+    return call
+
+
+def _feature_setup(version):
+    def setup():
+        classes = []
+        for path in pynos.device.VERSIONS[version].values():
+            try:
+                classes.append(pynos.device.resolve_class(path))
+            except (ImportError, SyntaxError):
+                # Feature modules that do not import in this tree.
+                pass
+
+        def construct():
+            for cls in classes:
+                cls(_callback)
+        return construct
+    return setup
+
+
+def _builder_setup(module, name):
+    def setup():
+        cls = pynos.versions.registry.builder_class(module, '5.0.1')
+        table = pynos.versions.registry._table(cls)
+        recipe = table.builders[name]
+        kwargs = dict((table.kwargs[index], '1') for index in recipe[1:]
+                      if table.kwargs[index] is not None)
+        builder = getattr(cls(callback=pynos.utilities.return_xml), name)
+        return lambda: builder(**kwargs)
+    return setup
+
+
+def _simulator_instance():
+    if not _simulator:
+        simulator = pynos.simulator.Simulator(**SIZES)
+        simulator.start()
+        _cleanup.append(simulator.stop)
+        _simulator.append(simulator)
+    return _simulator[0]
+
+
+def _parser_setup(getter):
+    def setup():
+        simulator = _simulator_instance()
+        replies = {}
+
+        def callback(call, handler='edit_config', **kwargs):
+            request = pynos.device.Device._element(call)
+            key = pynos.device.lxml.etree.tostring(request)
+            reply = replies.get(key)
+            if reply is None:
+                reply = replies[key] = simulator.reply(request)
+            if handler == 'get_stream':
+                return reply
+            return pynos.device.Device._reply_tree(reply)
+        dev = pynos.device.Device(conn=('127.0.0.1', '22'), test=True,
+                                  callback=callback)
+        return lambda: getter(dev)
+    return setup
+
+
+def _device():
+    simulator = _simulator_instance()
+    dev = pynos.device.Device(conn=simulator.conn, auth=simulator.auth)
+    _cleanup.append(dev.close)
+    return dev
+
+
+def _session_setup():
+    simulator = _simulator_instance()
+
+    def session():
+        with pynos.device.Device(conn=simulator.conn, auth=simulator.auth):
+            pass
+    return session
+
+
+def _e2e_setup(scenario):
+    def setup():
+        dev = _device()
+        return lambda: scenario(dev)
+    return setup
+
+
+def _descriptions(dev):
+    return [dev.interface.description(
+        int_type='tengigabitethernet', name='1/0/%d' % (port % 48 + 1),
+        desc='port %d' % port, callback=pynos.utilities.return_xml)
+        for port in range(PUSHES)]
+
+
+def _push_serial(dev):
+    for config in _descriptions(dev):
+        dev._callback(config)
+
+
+def _push_execute_many(dev):
+    dev.execute_many(_descriptions(dev))
+
+
+def _push_transaction(dev):
+    configs = _descriptions(dev)
+    with dev.transaction():
+        for config in configs:
+            dev._call(config)
+
+
+def run(benchmark, quick):
+    """Time one benchmark.
+
+    Returns:
+        dict: min and median seconds per call, number and repeat.
+    """
+    func = benchmark.setup()
+    func()
+    repeat = 1 if quick else benchmark.repeat
+    timings = sorted(
+        timer / benchmark.number for timer in
+        timeit.repeat(func, repeat=repeat, number=benchmark.number))
+    return {'group': benchmark.group, 'min': timings[0],
+            'median': timings[len(timings) // 2],
+            'number': benchmark.number, 'repeat': repeat}
+
+
+def compare(results, baseline, threshold):
+    """Print the ratio of each minimum to the baseline.
+
+    Returns:
+        list: Names of the benchmarks slower than `threshold` times the
+        baseline.
+    """
+    if baseline.get('sizes') != results['sizes']:
+        print('warning: the baseline was run with other table sizes')
+    slower = []
+    width = max([len(name) for name in results['benchmarks']] + [9])
+    print()
+    print('%-*s %12s' % (width, 'benchmark', 'vs. baseline'))
+    for name, result in results['benchmarks'].items():
+        before = baseline['benchmarks'].get(name)
+        if before is None or not before['min']:
+            continue
+        ratio = result['min'] / before['min']
+        flag = ''
+        if ratio > threshold:
+            slower.append(name)
+            flag = '  slower'
+        print('%-*s %11.2fx%s' % (width, name, ratio, flag))
+    return slower
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark suite of pynos.')
+    parser.add_argument('--filter', default=None,
+                        help='run the benchmarks whose group/name contains '
+                             'this text')
+    parser.add_argument('--quick', action='store_true',
+                        help='time each benchmark once')
+    parser.add_argument('--output', default=None,
+                        help='save the results to this JSON file')
+    parser.add_argument('--compare', default=None,
+                        help='JSON file of an earlier run')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='slowdown reported as a regression')
+    args = parser.parse_args()
+
+    results = collections.OrderedDict([
+        ('python', platform.python_version()),
+        ('platform', platform.platform()),
+        ('time', time.strftime('%Y-%m-%dT%H:%M:%S')),
+        ('sizes', SIZES),
+        ('benchmarks', collections.OrderedDict())])
+    selected = [('%s/%s' % (benchmark.group, benchmark.name), benchmark)
+                for benchmark in benchmarks()]
+    selected = [(name, benchmark) for name, benchmark in selected
+                if not args.filter or args.filter in name]
+    width = max([len(name) for name, _ in selected] + [9])
+    print('%-*s %10s %11s' % (width, 'benchmark', 'min (ms)', 'median (ms)'))
+    try:
+        for name, benchmark in selected:
+            result = run(benchmark, args.quick)
+            results['benchmarks'][name] = result
+            print('%-*s %10.3f %11.3f' % (width, name, result['min'] * 1000,
+                                          result['median'] * 1000))
+            sys.stdout.flush()
+    finally:
+        for cleanup in reversed(_cleanup):
+            cleanup()
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(results, output, indent=2)
+    if args.compare:
+        with open(args.compare) as baseline:
+            slower = compare(results, json.load(baseline), args.threshold)
+        if slower:
+            print('%d benchmark(s) slower than %sx the baseline'
+                  % (len(slower), args.threshold))
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import threading
+
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+
+import pynos.device
+from pynos.exceptions import PynosException
+
+DEFAULT_MAX_WORKERS = 256
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def default_executor():
+    """Return the thread pool shared by every ``AsyncDevice``.
+
+    ncclient blocks the calling thread until a reply arrives, so each RPC in
+    flight occupies one worker.  The pool is sized for fleets of hundreds of
+    sessions rather than for CPU count.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS)
+        return _executor
+
+
+class AsyncDevice(object):
+    """
+    AsyncDevice exposes a ``pynos.device.Device`` to an asyncio event loop.
+
+    Every method returns an awaitable future.  Feature objects are reached
+    the same way as on ``Device`` (``adev.interface``, ``adev.lldp``, ...);
+    calling any of their methods or properties returns a future for the
+    result.  The work itself runs on an executor so one event loop can keep
+    hundreds of NETCONF sessions in flight.
+
+    Attributes:
+        device: The wrapped ``Device`` once connected, else ``None``.
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Args:
+            loop: Event loop to schedule work on.  Defaults to the current
+                event loop at call time.
+            executor: ``concurrent.futures.Executor`` running the blocking
+                NETCONF calls.  Defaults to ``default_executor()``.
+            All other keyword arguments are passed to
+            ``pynos.device.Device``.
+
+        Returns:
+            Instance of the AsyncDevice object.
+
+        Raises:
+            PynosException: if asyncio is not available.
+
+        Examples:
+            >>> import asyncio
+            >>> import pynos.async_device
+            >>> async def neighbors(switches):
+            ...     auth = ('admin', 'password')
+            ...     devs = [pynos.async_device.AsyncDevice(
+            ...             conn=(switch, '22'), auth=auth)
+            ...             for switch in switches]
+            ...     await asyncio.gather(*[d.connect() for d in devs])
+            ...     try:
+            ...         return await asyncio.gather(
+            ...             *[d.lldp.neighbors() for d in devs])
+            ...     finally:
+            ...         await asyncio.gather(*[d.close() for d in devs])
+            >>> loop = asyncio.get_event_loop()
+            >>> output = loop.run_until_complete(
+            ...     neighbors(['10.24.39.211', '10.24.39.203']))
+        """
+        if asyncio is None:
+            raise PynosException('AsyncDevice requires asyncio.')
+        self._loop = kwargs.pop('loop', None)
+        self._executor = kwargs.pop('executor', None)
+        self._device_kwargs = kwargs
+        self.device = None
+
+    def __aenter__(self):
+        return self.connect()
+
+    def __aexit__(self, exctype, excinst, exctb):
+        return self.close()
+
+    def __getattr__(self, name):
+        if name in pynos.device.NOS_ATTRS:
+            return _AsyncFeature(self, name)
+        raise AttributeError(name)
+
+    def _submit(self, func, *args, **kwargs):
+        loop = self._loop or asyncio.get_event_loop()
+        executor = self._executor or default_executor()
+        return loop.run_in_executor(executor,
+                                    functools.partial(func, *args, **kwargs))
+
+    def _connect(self):
+        if self.device is None:
+            self.device = pynos.device.Device(**self._device_kwargs)
+        elif not self.device.connection and not self.device._test:
+            self.device.reconnect()
+        return self
+
+    def _close(self):
+        if self.device is not None and self.device.connection:
+            self.device.close()
+
+    def connect(self):
+        """Open the NETCONF session and detect the firmware version.
+
+        Returns:
+            Future resolving to this ``AsyncDevice``.
+        """
+        return self._submit(self._connect)
+
+    def close(self):
+        """Close the NETCONF session.
+
+        Returns:
+            Future resolving to ``None``.
+        """
+        return self._submit(self._close)
+
+    def call(self, method, *args, **kwargs):
+        """Call a device method by dotted path.
+
+        Args:
+            method (str): Path of the attribute relative to the ``Device``.
+                Ex. ``interface.interfaces``, ``lldp.neighbors`` or
+                ``mac_table``.  Properties are read; anything callable is
+                called with `args` and `kwargs`.
+
+        Returns:
+            Future resolving to the return value of the method.
+        """
+        return self._submit(self._call, method, args, kwargs)
+
+    def _call(self, method, args, kwargs):
+        if self.device is None:
+            raise PynosException('AsyncDevice is not connected.')
+        target = self.device
+        for name in method.split('.'):
+            target = getattr(target, name)
+        if callable(target):
+            return target(*args, **kwargs)
+        return target
+
+    def rpc(self, call, handler='edit_config', **kwargs):
+        """Send a single NETCONF call through the device callback.
+
+        Args:
+            call: ``ElementTree`` element of the request.
+            handler: Same as ``pynos.device.Device._callback_main``.
+
+        Returns:
+            Future resolving to the callback's return value.
+        """
+        return self._submit(self._rpc, call, handler, kwargs)
+
+    def _rpc(self, call, handler, kwargs):
+        if self.device is None:
+            raise PynosException('AsyncDevice is not connected.')
+        return self.device._callback(call, handler=handler, **kwargs)
+
+    def run(self, func, *args, **kwargs):
+        """Run `func` with the connected ``Device`` as first argument.
+
+        Useful to group several synchronous calls into one unit of work.
+
+        Returns:
+            Future resolving to the return value of `func`.
+        """
+        return self._submit(self._run, func, args, kwargs)
+
+    def _run(self, func, args, kwargs):
+        if self.device is None:
+            raise PynosException('AsyncDevice is not connected.')
+        return func(self.device, *args, **kwargs)
+
+    @property
+    def mac_table(self):
+        """Future resolving to the MAC table of the device."""
+        return self.call('mac_table')
+
+
+class _AsyncFeature(object):
+    """Proxy that turns attribute access on a feature object into futures.
+    """
+
+    def __init__(self, adev, name):
+        self._adev = adev
+        self._name = name
+
+    def __getattr__(self, attr):
+        return functools.partial(self._adev.call,
+                                 '%s.%s' % (self._name, attr))
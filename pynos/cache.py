@@ -0,0 +1,414 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import collections
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+
+import lxml.etree
+
+DEFAULT_VERSION_CACHE = os.path.join('~', '.pynos', 'versions.json')
+
+_READ_RPC = re.compile('^(get|show)[-_]')
+
+
+def capabilities_digest(capabilities):
+    """Return a stable fingerprint of NETCONF hello capabilities.
+
+    Args:
+        capabilities (iterable): Capability URIs advertised by the device.
+
+    Returns:
+        str: Hex digest, independent of capability order.
+    """
+    joined = '\n'.join(sorted(set(capabilities)))
+    return hashlib.sha1(joined.encode('utf-8')).hexdigest()
+
+
+class VersionCache(object):
+    """
+    VersionCache remembers the firmware version detected for each device.
+
+    Entries are keyed by host and tied to the capabilities the device
+    advertised in its NETCONF hello.  A firmware upgrade changes the
+    capability set, which invalidates the entry, so ``Device`` can trust a
+    hit and skip the ``show-firmware-version`` RPC.
+
+    Attributes:
+        None
+    """
+
+    def __init__(self, path=DEFAULT_VERSION_CACHE, ttl=86400):
+        """
+        Args:
+            path (str): JSON file backing the cache.  ``None`` keeps the
+                cache in memory only.  Default: ~/.pynos/versions.json
+            ttl (float): Seconds an entry stays valid.  Default: one day.
+
+        Returns:
+            Instance of the VersionCache object.
+
+        Raises:
+            None
+
+        Examples:
+            >>> import pynos.cache
+            >>> import pynos.device
+            >>> cache = pynos.cache.VersionCache(ttl=3600)
+            >>> conn = ('10.24.39.211', '22')
+            >>> auth = ('admin', 'password')
+            >>> with pynos.device.Device(conn=conn, auth=auth,
+            ...                          version_cache=cache) as dev:
+            ...     output = dev.interface.vlans
+        """
+        self._path = os.path.expanduser(path) if path else None
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = None
+
+    def _load(self):
+        if self._entries is not None:
+            return
+        self._entries = {}
+        if self._path is None or not os.path.exists(self._path):
+            return
+        try:
+            with open(self._path) as cache_file:
+                self._entries = json.load(cache_file)
+        except (IOError, OSError, ValueError) as error:
+            logging.warning('Ignoring unreadable version cache %s: %s',
+                            self._path, error)
+
+    def _save(self):
+        if self._path is None:
+            return
+        directory = os.path.dirname(self._path)
+        try:
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory)
+            handle, tmp_path = tempfile.mkstemp(dir=directory or '.')
+            with os.fdopen(handle, 'w') as cache_file:
+                json.dump(self._entries, cache_file, sort_keys=True)
+            os.rename(tmp_path, self._path)
+        except (IOError, OSError) as error:
+            logging.warning('Could not write version cache %s: %s',
+                            self._path, error)
+
+    def get(self, host, capabilities):
+        """Return the cached firmware version of `host`.
+
+        Args:
+            host (str): Device key, usually 'address:port'.
+            capabilities (iterable): Capabilities from the current hello.
+
+        Returns:
+            str: The firmware version, or ``None`` on a miss, an expired
+            entry or changed capabilities.
+        """
+        with self._lock:
+            self._load()
+            entry = self._entries.get(host)
+        if entry is None:
+            return None
+        if time.time() - entry['time'] > self._ttl:
+            return None
+        if entry['capabilities'] != capabilities_digest(capabilities):
+            return None
+        return entry['version']
+
+    def set(self, host, capabilities, version):
+        """Store the firmware version detected for `host`.
+        """
+        with self._lock:
+            self._load()
+            self._entries[host] = dict(version=version, time=time.time(),
+                                       capabilities=capabilities_digest(
+                                           capabilities))
+            self._save()
+
+    def invalidate(self, host=None):
+        """Drop the entry of `host`, or every entry if `host` is ``None``.
+        """
+        with self._lock:
+            self._load()
+            if host is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(host, None)
+            self._save()
+
+
+def namespace_family(namespace):
+    """Return the YANG module family of a namespace.
+
+    An operational ``-ext`` module reports on the state its base module
+    configures, so both belong to one family.
+
+    Args:
+        namespace (str): Namespace URI.
+
+    Returns:
+        str: The namespace without an ``-ext`` suffix.
+
+    Examples:
+        >>> import pynos.cache
+        >>> pynos.cache.namespace_family(
+        ...     'urn:brocade.com:mgmt:brocade-interface-ext')
+        'urn:brocade.com:mgmt:brocade-interface'
+    """
+    if namespace.endswith('-ext'):
+        return namespace[:-len('-ext')]
+    return namespace
+
+
+def _namespace(element):
+    tag = element.tag
+    if callable(tag) or not tag.startswith('{'):
+        # Comments and processing instructions, or no namespace.
+        return ''
+    return tag[1:tag.index('}')]
+
+
+def _families(call, handler):
+    """Namespace families of the elements of a call.  The ``config`` and
+    ``filter`` wrappers of ``get_config`` and ``edit_config`` calls are left
+    out: they have no namespace of their own."""
+    if handler in ('get_config', 'edit_config'):
+        elements = (element for container in call
+                    for element in container.iter())
+    else:
+        elements = call.iter()
+    return frozenset(namespace_family(_namespace(element))
+                     for element in elements)
+
+
+def is_read(call, handler):
+    """Tell whether a call only reads the device.
+
+    ``get_config`` calls are reads, and so are ``get`` and ``get_stream``
+    RPCs named ``get-*`` or ``show-*``, after the NOS convention.
+
+    Args:
+        call: The request, as an lxml element.
+        handler (str): ``Device`` handler of the call.
+
+    Returns:
+        bool
+    """
+    if handler == 'get_config':
+        return True
+    return (handler in ('get', 'get_stream') and
+            _READ_RPC.match(lxml.etree.QName(call).localname) is not None)
+
+
+class ResponseCache(object):
+    """
+    ResponseCache serves repeated reads of a device from memory.
+
+    Replies to ``get_config`` calls and to ``get`` RPCs named ``get-*`` or
+    ``show-*`` are kept for the TTL of the namespace of the request, keyed
+    by the canonical XML of the request.  The least recently used replies
+    are evicted when the cache holds more than `max_entries` replies or
+    `max_bytes` of reply text.
+
+    Writes drop what they may have made stale: an ``edit_config`` drops
+    the replies whose requests share a namespace family (see
+    ``namespace_family``) with the edit, while ``delete_config``,
+    ``copy_config`` and RPCs that are not reads (``commit``,
+    ``firmware-download``, ...) drop every reply.  Only writes made through
+    the device are seen; changes made by other sessions show after the TTL.
+
+    ``get`` hits are parsed anew from the cached text, so callers may
+    modify them; ``get_config`` hits share one reply object.
+
+    Attributes:
+        None
+    """
+
+    def __init__(self, ttl=10, ttls=None, max_entries=512,
+                 max_bytes=32 * 1024 * 1024):
+        """
+        Args:
+            ttl (float): Seconds a reply is used.  Default: 10.
+            ttls (dict): Seconds a reply is used, by namespace of the
+                request, overriding `ttl`.  0 disables caching for a
+                namespace.  Ex. {'urn:brocade.com:mgmt:brocade-vcs': 60}
+            max_entries (int): Most replies kept.  Default: 512.
+            max_bytes (int): Most reply text kept, in bytes.  Default: 32
+                MiB.
+
+        Returns:
+            Instance of the ResponseCache object.
+
+        Raises:
+            None
+
+        Examples:
+            >>> import pynos.cache
+            >>> import pynos.device
+            >>> cache = pynos.cache.ResponseCache(
+            ...     ttl=30, ttls={'urn:brocade.com:mgmt:brocade-arp': 5})
+            >>> conn = ('10.24.39.211', '22')
+            >>> auth = ('admin', 'password')
+            >>> with pynos.device.Device(conn=conn, auth=auth,
+            ...                          response_cache=cache) as dev:
+            ...     vlans = dev.interface.vlans
+            ...     vlans = dev.interface.vlans
+            >>> cache.stats()['hits']
+            1
+        """
+        self._ttl = ttl
+        self._ttls = dict(ttls or {})
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # key -> (expires, families, size, reply), least recently used
+        # first.
+        self._entries = collections.OrderedDict()
+        self._bytes = 0
+        self._generation = 0
+        self._counts = dict(hits=0, misses=0, evictions=0, invalidations=0)
+
+    @staticmethod
+    def key(call, handler):
+        """Return the cache key of a call, or ``None`` if it is not a read.
+
+        Args:
+            call: The request, as an lxml element.
+            handler (str): ``Device`` handler of the call.
+
+        Returns:
+            tuple: (handler, canonical XML of `call`).
+        """
+        if handler != 'get_stream' and is_read(call, handler):
+            return handler, lxml.etree.tostring(call, method='c14n')
+        return None
+
+    @property
+    def generation(self):
+        """int: Changes whenever replies are dropped.  Pass the value read
+        before sending a request to ``put``."""
+        return self._generation
+
+    def get(self, key):
+        """Return the cached reply for `key`, or ``None``.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None and entry[0] <= now:
+                self._bytes -= entry[2]
+                entry = None
+            if entry is None:
+                self._counts['misses'] += 1
+                return None
+            # Move to the most recently used end.
+            self._entries[key] = entry
+            self._counts['hits'] += 1
+            return entry[3]
+
+    def put(self, key, call, reply, size, generation):
+        """Cache the reply of a call.
+
+        Args:
+            key (tuple): From ``key``.
+            call: The request, as an lxml element.
+            reply: The reply to return on hits.
+            size (int): Length of the reply text.
+            generation (int): ``generation`` before the request was sent.
+                The reply is not cached if a write may have made it stale
+                since.
+
+        Returns:
+            None
+        """
+        request = call[0] if key[0] == 'get_config' and len(call) else call
+        ttl = self._ttls.get(_namespace(request), self._ttl)
+        if ttl <= 0 or size > self._max_bytes:
+            return
+        families = _families(call, key[0])
+        with self._lock:
+            if generation != self._generation:
+                return
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+            self._entries[key] = (time.time() + ttl, families, size, reply)
+            self._bytes += size
+            while (len(self._entries) > self._max_entries or
+                   self._bytes > self._max_bytes):
+                _, entry = self._entries.popitem(last=False)
+                self._bytes -= entry[2]
+                self._counts['evictions'] += 1
+
+    def invalidate_for(self, call, handler):
+        """Drop the replies a call may make stale.
+
+        Args:
+            call: The request, as an lxml element.
+            handler (str): ``Device`` handler of the call.
+
+        Returns:
+            None
+        """
+        if is_read(call, handler):
+            return
+        if handler == 'edit_config':
+            self.invalidate(_families(call, handler))
+        else:
+            self.invalidate()
+
+    def invalidate(self, namespaces=None):
+        """Drop the replies of the namespace families of `namespaces`.
+
+        Args:
+            namespaces (iterable): Namespace URIs.  ``None`` drops every
+                reply.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._generation += 1
+            if namespaces is None:
+                dropped = list(self._entries)
+            else:
+                families = set(namespace_family(namespace)
+                               for namespace in namespaces)
+                dropped = [key for key, entry in self._entries.items()
+                           if not families.isdisjoint(entry[1])]
+            for key in dropped:
+                self._bytes -= self._entries.pop(key)[2]
+            self._counts['invalidations'] += len(dropped)
+
+    def stats(self):
+        """Return the hit and miss counts of the cache.
+
+        Returns:
+            dict: hits, misses, evictions (replies dropped for space),
+            invalidations (replies dropped by writes), entries and bytes
+            (replies and reply text held now).
+        """
+        with self._lock:
+            stats = dict(self._counts)
+            stats.update(entries=len(self._entries), bytes=self._bytes)
+        return stats
@@ -0,0 +1,236 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Push a desired configuration as the smallest edit-config that gets the
+device there.
+"""
+import copy
+import xml.etree.ElementTree as ET
+
+import lxml.etree
+
+from pynos.exceptions import PynosException
+import pynos.instrumentation
+import pynos.utilities
+from pynos.utilities import edit_entry, edit_operation, element_text
+
+
+class DesiredState(object):
+    """
+    DesiredState collects the edit-config documents that describe how the
+    running configuration should look, compares them with what the device
+    has and sends only the difference.
+
+    The documents are captured from the feature methods called in a
+    ``with`` block, as in a transaction, or added with ``capture``.  The
+    configuration they touch is fetched with a single ``get-config``: its
+    subtree filter selects the leaves of the documents, and list entries by
+    their key.  Leaves that already have the desired value are dropped from
+    the edit, as are deletes of configuration the device does not have.
+    List entries are matched on their first leaf, where the YANG builders
+    always put the key; an element that cannot be matched with certainty,
+    and ``replace`` or ``create`` operations, are sent unchanged.
+
+    Attributes:
+        documents (Element): The desired configuration, with the captured
+            documents merged, or ``None``.
+        current (Element): The ``data`` element fetched from the device,
+            or ``None`` before ``diff``.
+        delta (Element): The edit-config document of the last ``diff``, or
+            ``None`` if the device already has the desired configuration.
+        rpcs (int): Number of RPCs sent.
+    """
+
+    def __init__(self, device, dry_run=False):
+        """
+        Args:
+            device (pynos.device.Device): Device to configure.
+            dry_run (bool): Compute the delta on exit from the ``with``
+                block without sending it.  Default: False.
+
+        Returns:
+            Instance of the DesiredState object.
+
+        Raises:
+            None
+
+        Examples:
+            >>> import pynos.device
+            >>> conn = ('10.24.39.211', '22')
+            >>> auth = ('admin', 'password')
+            >>> with pynos.device.Device(conn=conn, auth=auth) as dev:
+            ...     with dev.desired_state() as state:
+            ...         for port in range(1, 49):
+            ...             dev.interface.description(
+            ...                 int_type='tengigabitethernet',
+            ...                 name='1/0/%d' % port, desc='server')
+            ...     print(state.rpcs)
+            1
+        """
+        self._device = device
+        self._dry_run = dry_run
+        self.documents = None
+        self.current = None
+        self.delta = None
+        self.rpcs = 0
+
+    def __enter__(self):
+        self._device._begin(self)
+        return self
+
+    def __exit__(self, exctype, excinst, exctb):
+        self._device._end(self)
+        if exctype is not None:
+            return
+        if self._dry_run:
+            self.diff()
+        else:
+            self.apply()
+
+    def capture(self, config, target='running'):
+        """Add an edit-config document to the desired configuration.
+
+        Args:
+            config: The document, as an ElementTree or lxml element or
+                serialized XML.
+            target (str): Target datastore.  Only ``running`` is supported.
+
+        Returns:
+            None, like a sent edit-config.
+
+        Raises:
+            PynosException: if `target` is not ``running``, or `config`
+                sets a leaf to another value than an earlier document.
+        """
+        if target != 'running':
+            raise PynosException('A desired state only covers the running '
+                                 'configuration, not %r.' % target)
+        if isinstance(config, lxml.etree._Element):
+            config = copy.deepcopy(config)
+        elif isinstance(config, (bytes, str)):
+            config = lxml.etree.fromstring(config)
+        else:
+            config = lxml.etree.fromstring(ET.tostring(config))
+        if self.documents is None:
+            self.documents = config
+        elif not pynos.utilities.merge_config(self.documents, config):
+            name = pynos.instrumentation.caller()
+            raise PynosException('%s conflicts with the desired state.'
+                                 % name)
+        self.current = None
+
+    def diff(self):
+        """Compare the desired configuration with the device.
+
+        The configuration is fetched on the first call only.
+
+        Returns:
+            Element: The edit-config document that gets the device to the
+            desired configuration, or ``None`` if it is already there.
+        """
+        self.delta = None
+        if self.documents is None:
+            return None
+        if self.current is None:
+            self.rpcs += 1
+            self.current = self._device._running_config(
+                [_selection(container) for container in self.documents
+                 if not callable(container.tag)])
+        delta = lxml.etree.Element('config')
+        for container in self.documents:
+            kept = _delta(self.current.findall(container.tag), container)
+            if kept is not None:
+                delta.append(kept)
+        if len(delta):
+            self.delta = delta
+        return self.delta
+
+    def apply(self):
+        """Send the edit-config computed by ``diff``, if any.
+
+        Returns:
+            Element: The document sent, or ``None``.
+
+        Raises:
+            RPCError: if the device rejected the edit.
+        """
+        delta = self.diff()
+        if delta is not None:
+            self.rpcs += 1
+            self._device._callback(delta)
+            # The device now has the desired configuration.
+            self.current = None
+        return delta
+
+
+def _is_key(element):
+    """Whether `element` is the first leaf of a list entry."""
+    parent = element.getparent()
+    return (parent is not None and parent[0] is element and
+            not callable(element.tag) and not len(element) and
+            bool(element_text(element)))
+
+
+def _selection(element):
+    """Subtree filter that selects what `element` configures."""
+    selector = lxml.etree.Element(element.tag, nsmap=element.nsmap)
+    for child in element:
+        if callable(child.tag):
+            continue
+        if len(child):
+            selector.append(_selection(child))
+            continue
+        leaf = lxml.etree.SubElement(selector, child.tag)
+        if _is_key(child):
+            leaf.text = child.text
+    return selector
+
+
+def _deletes(element):
+    return any(edit_operation(node) in ('delete', 'remove')
+               for node in element.iter() if not callable(node.tag))
+
+
+def _delta(siblings, edit):
+    """The part of `edit` that changes the nodes `siblings` of the running
+    configuration, or None."""
+    if callable(edit.tag):
+        return None
+    operation = edit_operation(edit)
+    node, certain = edit_entry(siblings, edit)
+    if operation in ('delete', 'remove'):
+        if certain and node is None:
+            return None
+        return copy.deepcopy(edit)
+    if not certain or operation in ('replace', 'create'):
+        return copy.deepcopy(edit)
+    if node is None and not _deletes(edit):
+        return copy.deepcopy(edit)
+    if not len(edit):
+        if element_text(node) == element_text(edit):
+            return None
+        return copy.deepcopy(edit)
+    deltas = [_delta([] if node is None else node.findall(child.tag), child)
+              for child in edit]
+    # The key of a new entry alone would create it.
+    if not any(kept is not None and (node is not None or not _is_key(child))
+               for child, kept in zip(edit, deltas)):
+        return None
+    if _is_key(edit[0]) and deltas[0] is None:
+        deltas[0] = copy.deepcopy(edit[0])
+    result = lxml.etree.Element(edit.tag, edit.attrib, nsmap=edit.nsmap)
+    result.extend(kept for kept in deltas if kept is not None)
+    return result
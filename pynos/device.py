@@ -14,131 +14,157 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+import collections
+import importlib
 import logging
+import time
 import xml.etree.ElementTree as ET
 
+import lxml.etree
 from ncclient import manager
-from ncclient import xml_
 import ncclient
+import ncclient.operations
+
+import pynos.cache
+import pynos.desired_state
+from pynos.exceptions import PynosException
+import pynos.instrumentation
+import pynos.mac_table
+import pynos.mirror
+import pynos.records
+import pynos.scheduler
+import pynos.tracing
+import pynos.transaction
+import pynos.utilities
 
-import pynos.versions.ver_5.ver_5_0_1.bgp
-import pynos.versions.ver_5.ver_5_0_1.snmp
-import pynos.versions.ver_5.ver_5_0_1.interface
-import pynos.versions.ver_5.ver_5_0_1.lldp
-import pynos.versions.ver_5.ver_5_0_1.system
-import pynos.versions.ver_5.ver_5_0_1.services
-import pynos.versions.ver_5.ver_5_0_1.fabric_service
-import pynos.versions.ver_5.ver_5_0_1.vcs
-import pynos.versions.ver_5.ver_5_0_1.firmware
-import pynos.versions.ver_5.ver_5_0_1.ras
-import pynos.versions.ver_6.ver_6_0_1.bgp
-import pynos.versions.ver_6.ver_6_0_1.snmp
-import pynos.versions.ver_6.ver_6_0_1.interface
-import pynos.versions.ver_6.ver_6_0_1.lldp
-import pynos.versions.ver_6.ver_6_0_1.system
-import pynos.versions.ver_6.ver_6_0_1.services
-import pynos.versions.ver_6.ver_6_0_1.fabric_service
-import pynos.versions.ver_6.ver_6_0_1.vcs
-import pynos.versions.ver_6.ver_6_0_1.firmware
-import pynos.versions.ver_6.ver_6_0_1.ras
-import pynos.versions.ver_7.ver_7_0_0.bgp
-import pynos.versions.ver_7.ver_7_0_0.interface
-import pynos.versions.ver_7.ver_7_0_0.lldp
-import pynos.versions.ver_7.ver_7_0_0.firmware
-import pynos.versions.ver_7.ver_7_1_0.system
-import pynos.versions.ver_7.ver_7_1_0.nsx
-import pynos.versions.ver_7.ver_7_1_0.hw_vtep
-import pynos.versions.ver_7.ver_7_1_0.vcenter
 VERSIONS = {
     '5.0.1': {
-        'bgp': pynos.versions.ver_5.ver_5_0_1.bgp.BGP,
-        'snmp': pynos.versions.ver_5.ver_5_0_1.snmp.SNMP,
-        'interface': pynos.versions.ver_5.ver_5_0_1.interface.Interface,
-        'lldp': pynos.versions.ver_5.ver_5_0_1.lldp.LLDP,
-        'system': pynos.versions.ver_5.ver_5_0_1.system.System,
-        'services': pynos.versions.ver_5.ver_5_0_1.services.Services,
-        'fabric_service': pynos.versions.ver_5.ver_5_0_1.fabric_service
-                          .FabricService,
-        'vcs': pynos.versions.ver_5.ver_5_0_1.vcs.VCS,
-        'firmware': pynos.versions.ver_5.ver_5_0_1.firmware.Firmware,
-        'ras': pynos.versions.ver_5.ver_5_0_1.ras.RAS,
+        'bgp': 'pynos.versions.ver_5.ver_5_0_1.bgp.BGP',
+        'snmp': 'pynos.versions.ver_5.ver_5_0_1.snmp.SNMP',
+        'interface': 'pynos.versions.ver_5.ver_5_0_1.interface.Interface',
+        'lldp': 'pynos.versions.ver_5.ver_5_0_1.lldp.LLDP',
+        'system': 'pynos.versions.ver_5.ver_5_0_1.system.System',
+        'services': 'pynos.versions.ver_5.ver_5_0_1.services.Services',
+        'fabric_service': ('pynos.versions.ver_5.ver_5_0_1.fabric_service.'
+                           'FabricService'),
+        'vcs': 'pynos.versions.ver_5.ver_5_0_1.vcs.VCS',
+        'firmware': 'pynos.versions.ver_5.ver_5_0_1.firmware.Firmware',
+        'ras': 'pynos.versions.ver_5.ver_5_0_1.ras.RAS',
     },
     '6.0.1': {
-        'bgp': pynos.versions.ver_6.ver_6_0_1.bgp.BGP,
-        'snmp': pynos.versions.ver_6.ver_6_0_1.snmp.SNMP,
-        'interface': pynos.versions.ver_6.ver_6_0_1.interface.Interface,
-        'lldp': pynos.versions.ver_6.ver_6_0_1.lldp.LLDP,
-        'system': pynos.versions.ver_6.ver_6_0_1.system.System,
-        'services': pynos.versions.ver_6.ver_6_0_1.services.Services,
-        'fabric_service': pynos.versions.ver_6.ver_6_0_1.fabric_service
-                          .FabricService,
-        'vcs': pynos.versions.ver_6.ver_6_0_1.vcs.VCS,
-        'firmware': pynos.versions.ver_6.ver_6_0_1.firmware.Firmware,
-        'ras': pynos.versions.ver_6.ver_6_0_1.ras.RAS,
+        'bgp': 'pynos.versions.ver_6.ver_6_0_1.bgp.BGP',
+        'snmp': 'pynos.versions.ver_6.ver_6_0_1.snmp.SNMP',
+        'interface': 'pynos.versions.ver_6.ver_6_0_1.interface.Interface',
+        'lldp': 'pynos.versions.ver_6.ver_6_0_1.lldp.LLDP',
+        'system': 'pynos.versions.ver_6.ver_6_0_1.system.System',
+        'services': 'pynos.versions.ver_6.ver_6_0_1.services.Services',
+        'fabric_service': ('pynos.versions.ver_6.ver_6_0_1.fabric_service.'
+                           'FabricService'),
+        'vcs': 'pynos.versions.ver_6.ver_6_0_1.vcs.VCS',
+        'firmware': 'pynos.versions.ver_6.ver_6_0_1.firmware.Firmware',
+        'ras': 'pynos.versions.ver_6.ver_6_0_1.ras.RAS',
     },
     '6.0.2': {
-        'bgp': pynos.versions.ver_6.ver_6_0_1.bgp.BGP,
-        'snmp': pynos.versions.ver_6.ver_6_0_1.snmp.SNMP,
-        'interface': pynos.versions.ver_6.ver_6_0_1.interface.Interface,
-        'lldp': pynos.versions.ver_6.ver_6_0_1.lldp.LLDP,
-        'system': pynos.versions.ver_6.ver_6_0_1.system.System,
-        'services': pynos.versions.ver_6.ver_6_0_1.services.Services,
-        'fabric_service': pynos.versions.ver_6.ver_6_0_1.fabric_service
-                          .FabricService,
-        'vcs': pynos.versions.ver_6.ver_6_0_1.vcs.VCS,
-        'firmware': pynos.versions.ver_6.ver_6_0_1.firmware.Firmware,
-        'ras': pynos.versions.ver_6.ver_6_0_1.ras.RAS,
+        'bgp': 'pynos.versions.ver_6.ver_6_0_1.bgp.BGP',
+        'snmp': 'pynos.versions.ver_6.ver_6_0_1.snmp.SNMP',
+        'interface': 'pynos.versions.ver_6.ver_6_0_1.interface.Interface',
+        'lldp': 'pynos.versions.ver_6.ver_6_0_1.lldp.LLDP',
+        'system': 'pynos.versions.ver_6.ver_6_0_1.system.System',
+        'services': 'pynos.versions.ver_6.ver_6_0_1.services.Services',
+        'fabric_service': ('pynos.versions.ver_6.ver_6_0_1.fabric_service.'
+                           'FabricService'),
+        'vcs': 'pynos.versions.ver_6.ver_6_0_1.vcs.VCS',
+        'firmware': 'pynos.versions.ver_6.ver_6_0_1.firmware.Firmware',
+        'ras': 'pynos.versions.ver_6.ver_6_0_1.ras.RAS',
     },
     '7.0.0': {
-        'bgp': pynos.versions.ver_7.ver_7_0_0.bgp.BGP,
-        'snmp': pynos.versions.ver_6.ver_6_0_1.snmp.SNMP,
-        'interface': pynos.versions.ver_7.ver_7_0_0.interface.Interface,
-        'lldp': pynos.versions.ver_7.ver_7_0_0.lldp.LLDP,
-        'system': pynos.versions.ver_6.ver_6_0_1.system.System,
-        'services': pynos.versions.ver_6.ver_6_0_1.services.Services,
-        'fabric_service': pynos.versions.ver_6.ver_6_0_1.fabric_service
-                          .FabricService,
-        'vcs': pynos.versions.ver_6.ver_6_0_1.vcs.VCS,
-        'firmware': pynos.versions.ver_7.ver_7_0_0.firmware.Firmware,
-        'ras': pynos.versions.ver_6.ver_6_0_1.ras.RAS,
+        'bgp': 'pynos.versions.ver_7.ver_7_0_0.bgp.BGP',
+        'snmp': 'pynos.versions.ver_6.ver_6_0_1.snmp.SNMP',
+        'interface': 'pynos.versions.ver_7.ver_7_0_0.interface.Interface',
+        'lldp': 'pynos.versions.ver_7.ver_7_0_0.lldp.LLDP',
+        'system': 'pynos.versions.ver_6.ver_6_0_1.system.System',
+        'services': 'pynos.versions.ver_6.ver_6_0_1.services.Services',
+        'fabric_service': ('pynos.versions.ver_6.ver_6_0_1.fabric_service.'
+                           'FabricService'),
+        'vcs': 'pynos.versions.ver_6.ver_6_0_1.vcs.VCS',
+        'firmware': 'pynos.versions.ver_7.ver_7_0_0.firmware.Firmware',
+        'ras': 'pynos.versions.ver_6.ver_6_0_1.ras.RAS',
     },
     '7.0.1': {
-        'bgp': pynos.versions.ver_7.ver_7_0_0.bgp.BGP,
-        'snmp': pynos.versions.ver_6.ver_6_0_1.snmp.SNMP,
-        'interface': pynos.versions.ver_7.ver_7_0_0.interface.Interface,
-        'lldp': pynos.versions.ver_7.ver_7_0_0.lldp.LLDP,
-        'system': pynos.versions.ver_6.ver_6_0_1.system.System,
-        'services': pynos.versions.ver_6.ver_6_0_1.services.Services,
-        'fabric_service': pynos.versions.ver_6.ver_6_0_1.fabric_service
-                          .FabricService,
-        'vcs': pynos.versions.ver_6.ver_6_0_1.vcs.VCS,
-        'firmware': pynos.versions.ver_7.ver_7_0_0.firmware.Firmware,
-        'ras': pynos.versions.ver_6.ver_6_0_1.ras.RAS,
-        'nsx': pynos.versions.ver_7.ver_7_1_0.nsx.Nsx,
-        'hw_vtep': pynos.versions.ver_7.ver_7_1_0.hw_vtep.hwvtep,
-        'vcenter': pynos.versions.ver_7.ver_7_1_0.vcenter.Vcenter
+        'bgp': 'pynos.versions.ver_7.ver_7_0_0.bgp.BGP',
+        'snmp': 'pynos.versions.ver_6.ver_6_0_1.snmp.SNMP',
+        'interface': 'pynos.versions.ver_7.ver_7_0_0.interface.Interface',
+        'lldp': 'pynos.versions.ver_7.ver_7_0_0.lldp.LLDP',
+        'system': 'pynos.versions.ver_6.ver_6_0_1.system.System',
+        'services': 'pynos.versions.ver_6.ver_6_0_1.services.Services',
+        'fabric_service': ('pynos.versions.ver_6.ver_6_0_1.fabric_service.'
+                           'FabricService'),
+        'vcs': 'pynos.versions.ver_6.ver_6_0_1.vcs.VCS',
+        'firmware': 'pynos.versions.ver_7.ver_7_0_0.firmware.Firmware',
+        'ras': 'pynos.versions.ver_6.ver_6_0_1.ras.RAS',
+        'nsx': 'pynos.versions.ver_7.ver_7_1_0.nsx.Nsx',
+        'hw_vtep': 'pynos.versions.ver_7.ver_7_1_0.hw_vtep.hwvtep',
+        'vcenter': 'pynos.versions.ver_7.ver_7_1_0.vcenter.Vcenter'
     },
     '7.1.0': {
-        'bgp': pynos.versions.ver_7.ver_7_0_0.bgp.BGP,
-        'snmp': pynos.versions.ver_6.ver_6_0_1.snmp.SNMP,
-        'interface': pynos.versions.ver_7.ver_7_0_0.interface.Interface,
-        'lldp': pynos.versions.ver_7.ver_7_0_0.lldp.LLDP,
-        'system': pynos.versions.ver_7.ver_7_1_0.system.System,
-        'services': pynos.versions.ver_6.ver_6_0_1.services.Services,
-        'fabric_service': pynos.versions.ver_6.ver_6_0_1.fabric_service
-                          .FabricService,
-        'vcs': pynos.versions.ver_6.ver_6_0_1.vcs.VCS,
-        'firmware': pynos.versions.ver_7.ver_7_0_0.firmware.Firmware,
-        'ras': pynos.versions.ver_6.ver_6_0_1.ras.RAS,
-        'nsx': pynos.versions.ver_7.ver_7_1_0.nsx.Nsx,
-        'hw_vtep': pynos.versions.ver_7.ver_7_1_0.hw_vtep.hwvtep,
-        'vcenter': pynos.versions.ver_7.ver_7_1_0.vcenter.Vcenter
+        'bgp': 'pynos.versions.ver_7.ver_7_0_0.bgp.BGP',
+        'snmp': 'pynos.versions.ver_6.ver_6_0_1.snmp.SNMP',
+        'interface': 'pynos.versions.ver_7.ver_7_0_0.interface.Interface',
+        'lldp': 'pynos.versions.ver_7.ver_7_0_0.lldp.LLDP',
+        'system': 'pynos.versions.ver_7.ver_7_1_0.system.System',
+        'services': 'pynos.versions.ver_6.ver_6_0_1.services.Services',
+        'fabric_service': ('pynos.versions.ver_6.ver_6_0_1.fabric_service.'
+                           'FabricService'),
+        'vcs': 'pynos.versions.ver_6.ver_6_0_1.vcs.VCS',
+        'firmware': 'pynos.versions.ver_7.ver_7_0_0.firmware.Firmware',
+        'ras': 'pynos.versions.ver_6.ver_6_0_1.ras.RAS',
+        'nsx': 'pynos.versions.ver_7.ver_7_1_0.nsx.Nsx',
+        'hw_vtep': 'pynos.versions.ver_7.ver_7_1_0.hw_vtep.hwvtep',
+        'vcenter': 'pynos.versions.ver_7.ver_7_1_0.vcenter.Vcenter'
     }
 }
 
+NETCONF_NAMESPACE = 'urn:ietf:params:xml:ns:netconf:base:1.0'
+
 NOS_ATTRS = ['bgp', 'snmp', 'interface', 'lldp', 'system', 'services',
              'fabric_service', 'vcs', 'firmware', 'ras', 'vcenter', 'hw_vtep', 'nsx']
 
+_RESOLVED = {}
+
+
+def resolve_class(path):
+    """Import and return the class named by a dotted path.
+
+    Entries in ``VERSIONS`` are stored as dotted paths so that importing
+    ``pynos.device`` does not pull in every feature module (and the generated
+    YANG builders behind them).  Classes are imported on first use and
+    memoized.
+
+    Args:
+        path (str): Dotted path to a class.  Ex.
+            'pynos.versions.ver_7.ver_7_0_0.interface.Interface'
+
+    Returns:
+        The class object.
+
+    Raises:
+        ImportError: if the module cannot be imported.
+        AttributeError: if the module has no such class.
+
+    Examples:
+        >>> import pynos.device
+        >>> path = pynos.device.VERSIONS['5.0.1']['lldp']
+        >>> pynos.device.resolve_class(path).__name__
+        'LLDP'
+    """
+    try:
+        return _RESOLVED[path]
+    except KeyError:
+        module_name, class_name = path.rsplit('.', 1)
+        module = importlib.import_module(module_name)
+        cls = _RESOLVED[path] = getattr(module, class_name)
+        return cls
+
 
 class DeviceCommError(Exception):
     """
@@ -171,6 +197,40 @@ class Device(object):
             auth_method (string): ```key``` if using ssh-key auth.
                 ```userpass``` if using username/password auth.
             auth_key (string): Location of ssh key to use for authentication.
+            timeout (int): Seconds to wait for the reply to each NETCONF call.
+                Default: 600.
+            auto_reconnect (bool): Open a new session and retry once when a
+                call fails because the session was lost.  Default: False.
+            version_cache (VersionCache): Trust the firmware version cached
+                for this device as long as its hello capabilities are
+                unchanged, instead of asking the device.  ``True`` uses a
+                cache at the default location.  Default: None.
+            response_cache (ResponseCache): Serve repeated reads (``get``
+                RPCs and ``get_config`` calls) from this cache until they
+                expire or a write through this device makes them stale.
+                ``True`` uses a cache with the default TTL.  See
+                ``pynos.cache.ResponseCache``.  Default: None.
+            config_mirror (bool): Answer ``get_config`` calls from a local
+                copy of the running configuration, fetched once per
+                top-level container and kept up to date with the edits
+                made through this device.  See
+                ``pynos.mirror.ConfigMirror``.  Default: False.
+            instrumentation (Instrumentation): Measure the latency and
+                payload of each call in this registry, which several
+                devices can share.  ``True`` uses a new one.  See
+                ``pynos.instrumentation.Instrumentation``.  Default: None.
+            records (bool): Return operational tables (``mac_table``,
+                ``interface.vlans``, ``lldp.neighbors``, ...) as compact
+                ``pynos.records`` rows instead of dicts.  Default: False.
+            scheduler (Scheduler): Hold each RPC until this scheduler has
+                a free slot, so the RPCs in flight to the switch stay
+                within a limit adapted to its round-trip times.  ``True``
+                uses the scheduler of the switch shared by all the devices
+                connected to it with ``True``.  See
+                ``pynos.scheduler.Scheduler``.  Default: None.
+            tracer (Tracer): Open tracing spans for the calls of the
+                feature methods and the RPCs they make.  See
+                ``pynos.tracing.Tracer``.  Default: None.
 
         Returns:
             Instance of the device object.
@@ -195,6 +255,29 @@ class Device(object):
         self._hostkey_verify = kwargs.pop('hostkey_verify', None)
         self._auth_method = kwargs.pop('auth_method', 'userpass')
         self._auth_key = kwargs.pop('auth_key', None)
+        self._timeout = kwargs.pop('timeout', 600)
+        self._auto_reconnect = kwargs.pop('auto_reconnect', False)
+        self._reconnects = 0
+        self._version_cache = kwargs.pop('version_cache', None)
+        if self._version_cache is True:
+            self._version_cache = pynos.cache.VersionCache()
+        self._response_cache = kwargs.pop('response_cache', None)
+        if self._response_cache is True:
+            self._response_cache = pynos.cache.ResponseCache()
+        self._config_mirror = None
+        if kwargs.pop('config_mirror', False):
+            self._config_mirror = pynos.mirror.ConfigMirror(
+                self._running_config)
+        self._instrumentation = kwargs.pop('instrumentation', None)
+        if self._instrumentation is True:
+            self._instrumentation = pynos.instrumentation.Instrumentation()
+        self._records = kwargs.pop('records', False)
+        self._scheduler = kwargs.pop('scheduler', None)
+        if self._scheduler is True:
+            self._scheduler = pynos.scheduler.switch_scheduler(*self._conn)
+        self._tracer = kwargs.pop('tracer', None)
+        self._mac_index = None
+        self._transaction = None
         self._test = kwargs.pop('test', False)
         self._callback = kwargs.pop('callback', None)
         if self._callback is None:
@@ -204,12 +287,31 @@ class Device(object):
 
         if self._test is False:
             self.reconnect()
-            ver = self.firmware_version
+            ver = self._detect_version()
         else:
             ver = '5.0.1'
 
-        for nos_attr in NOS_ATTRS:
-            setattr(self, nos_attr, VERSIONS[ver][nos_attr](self._callback))
+        self._version = ver
+        self._features = VERSIONS[ver]
+
+    def __getattr__(self, name):
+        """Build NOS feature objects (``interface``, ``bgp``, ...) on first
+        access.  Only the feature modules for the detected firmware version
+        are imported, and only when they are used.
+        """
+        features = self.__dict__.get('_features')
+        if features is None or name not in NOS_ATTRS:
+            raise AttributeError(name)
+        if name not in features:
+            raise AttributeError('%r is not supported on firmware %s' %
+                                 (name, self._version))
+        feature = resolve_class(features[name])(self._call)
+        if self._records:
+            feature._records = True
+        if self._tracer is not None:
+            feature = pynos.tracing.TracedFeature(feature, self._tracer)
+        setattr(self, name, feature)
+        return feature
 
     def __enter__(self):
         if not self.connection and self._test is False:
@@ -230,23 +332,64 @@ class Device(object):
                                        xmlns=namespace)
         result = self._callback(request_mac_table, handler='get')
         for entry in result.findall('{%s}mac-address-table' % namespace):
-            address = entry.find('{%s}mac-address' % namespace).text
-            vlan = entry.find('{%s}vlanid' % namespace).text
-            mac_type = entry.find('{%s}mac-type' % namespace).text
-            state = entry.find('{%s}mac-state' % namespace).text
-            interface = entry.find('{%s}forwarding-interface' % namespace)
-            interface_type = interface.find('{%s}interface-type' %
-                                            namespace).text
-            interface_name = interface.find('{%s}interface-name' %
-                                            namespace).text
-            interface = '%s%s' % (interface_type, interface_name)
-
-            table.append(dict(mac_address=address, interface=interface,
-                              state=state, vlan=vlan,
-                              type=mac_type))
+            table.append(pynos.records.build(
+                pynos.records.MacTableEntry,
+                self._mac_table_entry(entry, namespace), self._records))
 
         return table
 
+    def iter_mac_table(self):
+        """Iterate over the MAC table of the device.
+
+        Same entries as ``mac_table``, but they are decoded incrementally:
+        each entry is yielded as soon as it is parsed and released after,
+        instead of building a tree of the whole table.  The text of the
+        reply is still received in full before the first entry, since
+        ncclient does not stream replies.
+
+        Args:
+            None
+
+        Returns:
+            Generator of dict.
+
+        Raises:
+            PynosException: if the device answers with an rpc-error.
+
+        Examples:
+            >>> import pynos.device
+            >>> conn = ('10.24.39.211', '22')
+            >>> auth = ('admin', 'password')
+            >>> with pynos.device.Device(conn=conn, auth=auth) as dev:
+            ...     for entry in dev.iter_mac_table():
+            ...         print(entry['mac_address'], entry['interface'])
+        """
+        namespace = 'urn:brocade.com:mgmt:brocade-mac-address-table'
+        request_mac_table = ET.Element('get-mac-address-table',
+                                       xmlns=namespace)
+        reply = self._callback(request_mac_table, handler='get_stream')
+        for entry in pynos.utilities.iter_elements(
+                reply, '{%s}mac-address-table' % namespace):
+            yield pynos.records.build(pynos.records.MacTableEntry,
+                                      self._mac_table_entry(entry, namespace),
+                                      self._records)
+
+    @staticmethod
+    def _mac_table_entry(entry, namespace):
+        address = entry.find('{%s}mac-address' % namespace).text
+        vlan = entry.find('{%s}vlanid' % namespace).text
+        mac_type = entry.find('{%s}mac-type' % namespace).text
+        state = entry.find('{%s}mac-state' % namespace).text
+        interface = entry.find('{%s}forwarding-interface' % namespace)
+        interface_type = interface.find('{%s}interface-type' %
+                                        namespace).text
+        interface_name = interface.find('{%s}interface-name' %
+                                        namespace).text
+        interface = '%s%s' % (interface_type, interface_name)
+
+        return dict(mac_address=address, interface=interface,
+                    state=state, vlan=vlan, type=mac_type)
+
     @property
     def firmware_version(self):
         """
@@ -268,6 +411,168 @@ class Device(object):
         ver = self._callback(request_ver, handler='get')
         return ver.find('.//*{%s}os-version' % namespace).text
 
+    def _detect_version(self):
+        """Firmware version of the device, from the version cache if it is
+        still valid for the capabilities of this session.
+        """
+        if self._version_cache is None:
+            return self.firmware_version
+        host = '%s:%s' % (self._conn[0], self._conn[1])
+        capabilities = list(self._mgr.server_capabilities)
+        ver = self._version_cache.get(host, capabilities)
+        if ver is None:
+            ver = self.firmware_version
+            self._version_cache.set(host, capabilities, ver)
+        return ver
+
+    def _call(self, call, *args, **kwargs):
+        """Entry point of the feature objects for NETCONF calls.
+
+        Forwards to the device callback, except that edit-config calls are
+        handed to the open transaction, if any.
+        """
+        if self._transaction is not None:
+            handler = args[0] if args else kwargs.get('handler',
+                                                      'edit_config')
+            if handler == 'edit_config':
+                return self._transaction.capture(
+                    call, kwargs.get('target', 'running'))
+        return self._callback(call, *args, **kwargs)
+
+    def transaction(self, **kwargs):
+        """Batch configuration changes into as few edit-configs as possible.
+
+        Used as a context manager: the changes made in the ``with`` block
+        are captured and committed when it exits, or discarded if it raises.
+        See ``pynos.transaction.Transaction``.
+
+        Args:
+            target (str): ``running`` applies each batch as it is sent.
+                ``candidate`` stages every change in the candidate datastore
+                and commits them together, or not at all.  Default: running.
+            validate (bool): Validate the candidate before committing.
+                Default: True.
+            confirm_timeout (int): Make the commit a confirmed commit that
+                the device rolls back unless ``Transaction.confirm()`` is
+                called within this many seconds.  Default: None.
+
+        Returns:
+            pynos.transaction.Transaction
+
+        Raises:
+            PynosException: if a transaction is already open on the device.
+
+        Examples:
+            >>> import pynos.device
+            >>> conn = ('10.24.39.211', '22')
+            >>> auth = ('admin', 'password')
+            >>> with pynos.device.Device(conn=conn, auth=auth) as dev:
+            ...     with dev.transaction():
+            ...         dev.interface.add_vlan_int('736')
+            ...         dev.interface.add_vlan_int('737')
+            ...     with dev.transaction(target='candidate',
+            ...                          confirm_timeout=120) as tx:
+            ...         dev.interface.del_vlan_int('736')
+            ...         dev.interface.del_vlan_int('737')
+            ...     tx.confirm()
+        """
+        return pynos.transaction.Transaction(self, **kwargs)
+
+    def desired_state(self, **kwargs):
+        """Send only the configuration changes the device does not have.
+
+        Used as a context manager: the changes made in the ``with`` block
+        are captured, compared with the running configuration, fetched
+        once, and what differs is sent in one edit-config when it exits.
+        See ``pynos.desired_state.DesiredState``.
+
+        Args:
+            dry_run (bool): Compute the edit without sending it.  Default:
+                False.
+
+        Returns:
+            pynos.desired_state.DesiredState
+
+        Raises:
+            PynosException: if a transaction or desired state is already
+                open on the device.
+
+        Examples:
+            >>> import pynos.device
+            >>> conn = ('10.24.39.211', '22')
+            >>> auth = ('admin', 'password')
+            >>> with pynos.device.Device(conn=conn, auth=auth) as dev:
+            ...     with dev.desired_state(dry_run=True) as state:
+            ...         dev.interface.add_vlan_int('736')
+            ...         dev.interface.add_vlan_int('737')
+            ...     print(state.delta is None)
+            True
+        """
+        return pynos.desired_state.DesiredState(self, **kwargs)
+
+    def _datastore_rpc(self, operation, *children):
+        """Send a base NETCONF operation.  `children` are (name, value)
+        pairs; a ``target`` or ``source`` value names a datastore.
+        """
+        rpc = ET.Element(operation, xmlns=NETCONF_NAMESPACE)
+        for name, value in children:
+            child = ET.SubElement(rpc, name)
+            if name in ('target', 'source'):
+                ET.SubElement(child, value)
+            elif value is not None:
+                child.text = str(value)
+        return self._callback(rpc, handler='get')
+
+    def lock(self, target='candidate'):
+        """Lock a configuration datastore against other sessions.
+
+        Raises:
+            RPCError: if the datastore is locked by another session.
+        """
+        return self._datastore_rpc('lock', ('target', target))
+
+    def unlock(self, target='candidate'):
+        """Release a lock taken with ``lock``."""
+        return self._datastore_rpc('unlock', ('target', target))
+
+    def validate(self, source='candidate'):
+        """Validate a configuration datastore.
+
+        Raises:
+            RPCError: if the datastore is not valid.
+        """
+        return self._datastore_rpc('validate', ('source', source))
+
+    def discard_changes(self):
+        """Revert the candidate datastore to the running configuration."""
+        return self._datastore_rpc('discard-changes')
+
+    def commit(self, confirm_timeout=None):
+        """Commit the candidate datastore to the running configuration.
+
+        Args:
+            confirm_timeout (int): Make this a confirmed commit, rolled back
+                by the device unless followed by another ``commit`` within
+                `confirm_timeout` seconds.  Default: None.
+
+        Raises:
+            RPCError: if the device refuses the commit.
+        """
+        if confirm_timeout is None:
+            return self._datastore_rpc('commit')
+        return self._datastore_rpc('commit', ('confirmed', None),
+                                   ('confirm-timeout', confirm_timeout))
+
+    def _begin(self, transaction):
+        if self._transaction is not None:
+            raise PynosException('A transaction is already open on %s.' %
+                                 self._conn[0])
+        self._transaction = transaction
+
+    def _end(self, transaction):
+        if self._transaction is transaction:
+            self._transaction = None
+
     def _callback_main(self, call, handler='edit_config', target='running',
                        source='startup'):
         """
@@ -275,39 +580,54 @@ class Device(object):
 
         Args:
             call: An Element Tree element containing the XML of the NETCONF
-                call you intend to make to the device.
+                call you intend to make to the device, or the bytes of a
+                rendered ``pynos.template.Template``.
             handler: Type of ncclient call to make.
                 get_config: NETCONF standard get config.
-                get: ncclient dispatch. For custom RPCs.
+                get: ncclient dispatch. For custom RPCs.  Returns the
+                    parsed rpc-reply as an lxml element.
+                get_stream: ncclient dispatch returning the raw reply text,
+                    received in full, for incremental decoding of large
+                    replies.
                 edit_config: NETCONF standard edit.
                 delete_config: NETCONF standard delete.
                 copy_config: NETCONF standard copy.
             target: Target configuration location for action. Only used for
                 edit_config, delete_config, and copy_config.
             source: Source of configuration information for copying
-                configuration. Only used for copy_config.
+                configuration. Only used for copy_config, and for
+                get_config: ``running`` reads the running datastore with
+                a get-config RPC, configuration only, past the config
+                mirror and the response cache.  The subtree filters are
+                the children of `call`; without any, the whole
+                configuration is read.
+
+        When the device was created with ``auto_reconnect``, a call that
+        fails because the session dropped is retried once on a new session.
 
         Returns:
             None
 
         Raises:
-            None
+            DeviceCommError: if the device cannot be reached.
         """
         try:
-            if handler == 'get_config':
-                call = ET.tostring(call.getchildren()[0])
-                return self._mgr.get(filter=('subtree', call))
-
-            call = ET.tostring(call)
-            if handler == 'get':
-                call_element = xml_.to_ele(call)
-                return ET.fromstring(str(self._mgr.dispatch(call_element)))
-            if handler == 'edit_config':
-                self._mgr.edit_config(target=target, config=call)
-            if handler == 'delete_config':
-                self._mgr.delete_config(target=target)
-            if handler == 'copy_config':
-                self._mgr.copy_config(target=target, source=source)
+            return self._send(call, handler, target, source)
+        except (ncclient.transport.AuthenticationError,
+                ncclient.transport.SSHUnknownHostError) as error:
+            logging.error(error)
+            raise DeviceCommError
+        except (ncclient.transport.TransportError,
+                ncclient.transport.SessionCloseError,
+                ncclient.transport.SSHError) as error:
+            if not self._auto_reconnect:
+                logging.error(error)
+                raise DeviceCommError
+            logging.warning('%s; reconnecting to %s', error, self._conn[0])
+        try:
+            self.reconnect()
+            self._reconnects += 1
+            return self._send(call, handler, target, source)
         except (ncclient.transport.TransportError,
                 ncclient.transport.SessionCloseError,
                 ncclient.transport.SSHError,
@@ -316,6 +636,447 @@ class Device(object):
             logging.error(error)
             raise DeviceCommError
 
+    def _send(self, call, handler, target, source):
+        """Issue one NETCONF call.  See ``_callback_main``.
+        """
+        tracer = self._tracer
+        if tracer is None:
+            # ncclient takes lxml elements as they are; anything else it
+            # would serialize or parse again.
+            call = self._element(call)
+            return self._send_measured(call, handler, target, source)
+        name = 'rpc'
+        if not isinstance(call, (bytes, str)):
+            name = 'rpc %s' % lxml.etree.QName(
+                pynos.instrumentation._tag(call, handler)).localname
+        with tracer.span(name, handler=handler):
+            with tracer.span('serialize'):
+                call = self._element(call)
+            return self._send_measured(call, handler, target, source)
+
+    def _send_measured(self, call, handler, target, source):
+        instrumentation = self._instrumentation
+        if instrumentation is None:
+            return self._send_mirrored(call, handler, target, source)
+        record = instrumentation.begin(call, handler, target)
+        previous = pynos.instrumentation.activate(record)
+        try:
+            result = self._send_mirrored(call, handler, target, source)
+        except Exception as error:
+            instrumentation.end(record, error)
+            raise
+        finally:
+            pynos.instrumentation.activate(previous)
+        instrumentation.end(record)
+        return result
+
+    def _send_mirrored(self, call, handler, target, source):
+        mirror = self._config_mirror
+        if mirror is None:
+            return self._send_cached(call, handler, target, source)
+        if handler == 'get_config' and source != 'running':
+            return mirror.query(call[0])
+        try:
+            result = self._send_cached(call, handler, target, source)
+        except Exception:
+            mirror.apply(call, handler, target, applied=False)
+            raise
+        mirror.apply(call, handler, target)
+        return result
+
+    def _send_cached(self, call, handler, target, source):
+        cache = self._response_cache
+        if cache is None or (handler == 'get_config' and
+                             source == 'running'):
+            return self._send_element(call, handler, target, source)
+        key = cache.key(call, handler)
+        if key is None:
+            try:
+                return self._send_element(call, handler, target, source)
+            finally:
+                cache.invalidate_for(call, handler)
+        reply = cache.get(key)
+        if reply is not None:
+            return self._reply_tree(reply) if handler == 'get' else reply
+        generation = cache.generation
+        if handler == 'get':
+            text = self._exchange(call, handler, target, source)
+            reply = self._reply_tree(text)
+            cache.put(key, call, text, len(text), generation)
+            return reply
+        reply = self._send_element(call, handler, target, source)
+        cache.put(key, call, reply, len(reply.xml), generation)
+        return reply
+
+    def _send_element(self, call, handler, target, source):
+        reply = self._exchange(call, handler, target, source)
+        if handler == 'get':
+            return self._reply_tree(reply)
+        if handler in ('get_stream', 'get_config'):
+            return reply
+
+    def _exchange(self, call, handler, target, source):
+        """Send `call` and return the reply as it arrives: its text for
+        ``get`` and ``get_stream``, the ncclient reply otherwise.
+        """
+        scheduler = self._scheduler
+        if scheduler is None:
+            reply = self._traced_transport(call, handler, target, source)
+        else:
+            with scheduler.acquire((handler, call.tag)):
+                reply = self._traced_transport(call, handler, target,
+                                               source)
+        record = pynos.instrumentation.current()
+        if record is not None:
+            record.sent = True
+            text = reply
+            if not isinstance(text, (bytes, str)):
+                text = getattr(reply, 'xml', None) or ''
+            record.reply_bytes = len(text)
+        return reply
+
+    def _traced_transport(self, call, handler, target, source):
+        if self._tracer is None:
+            return self._transport(call, handler, target, source)
+        with self._tracer.span('transport'):
+            return self._transport(call, handler, target, source)
+
+    def _transport(self, call, handler, target, source):
+        reply = None
+        if handler in ('get', 'get_stream'):
+            reply = self._dispatch_raw(call)
+        if handler == 'get_config':
+            if source == 'running':
+                reply = self._mgr.get_config(
+                    source='running', filter=call if len(call) else None)
+            else:
+                reply = self._mgr.get(filter=('subtree', call[0]))
+        if handler == 'edit_config':
+            reply = self._mgr.edit_config(target=target, config=call)
+        if handler == 'delete_config':
+            reply = self._mgr.delete_config(target=target)
+        if handler == 'copy_config':
+            reply = self._mgr.copy_config(target=target, source=source)
+        return reply
+
+    def _running_config(self, subtree):
+        """Fetch running configuration through the device callback.
+        `subtree` is a subtree filter element, a list of them, or None for
+        the whole configuration.
+        """
+        spec = lxml.etree.Element('filter', type='subtree')
+        if isinstance(subtree, list):
+            spec.extend(subtree)
+        elif subtree is not None:
+            spec.append(subtree)
+        reply = self._callback(spec, handler='get_config', source='running')
+        return reply.data_ele
+
+    @property
+    def scheduler(self):
+        """The ``pynos.scheduler.Scheduler`` of the device, or ``None``.
+        """
+        return self._scheduler
+
+    @property
+    def tracer(self):
+        """The ``pynos.tracing.Tracer`` of the device, or ``None``.
+        """
+        return self._tracer
+
+    @property
+    def instrumentation(self):
+        """The ``pynos.instrumentation.Instrumentation`` of the device, or
+        ``None``.
+        """
+        return self._instrumentation
+
+    @property
+    def config_mirror(self):
+        """The ``pynos.mirror.ConfigMirror`` of the device, or ``None``.
+        """
+        return self._config_mirror
+
+    @property
+    def response_cache(self):
+        """The ``pynos.cache.ResponseCache`` of the device, or ``None``.
+
+        Examples:
+            >>> import pynos.device
+            >>> conn = ('10.24.39.211', '22')
+            >>> auth = ('admin', 'password')
+            >>> with pynos.device.Device(conn=conn, auth=auth,
+            ...                          response_cache=True) as dev:
+            ...     uptime = dev.system.uptime
+            ...     print(dev.response_cache.stats()['misses'])
+            1
+        """
+        return self._response_cache
+
+    def execute_many(self, calls, **kwargs):
+        """Send many independent NETCONF calls without waiting in between.
+
+        Up to `window` requests are outstanding on the session at once and
+        each reply is matched to its request by message-id, so a batch costs
+        about one round trip per `window` calls instead of one per call.
+        Calls must not depend on each other's results.
+
+        Devices with a custom callback (test mode) run the calls one after
+        the other.  While a transaction is open, edit-config calls are
+        captured by it as usual.  With a scheduler, each outstanding request
+        holds one of its slots, so the window shrinks to the slots the
+        scheduler has free.
+
+        Args:
+            calls (list): Each item is a call Element or rendered
+                ``pynos.template`` request, sent as an edit-config, or a
+                tuple (call, handler) or (call, handler, target) as for
+                ``_callback_main``.  Handlers: get, get_stream, get_config
+                and edit_config.
+            window (int): Maximum outstanding requests.  Default: 16.
+            return_exceptions (bool): Return the exception of a failed call
+                in its place instead of raising it.  Default: False.
+
+        Returns:
+            list: the result of each call, in the order of `calls`.
+
+        Raises:
+            ValueError: if a handler cannot be pipelined.
+            RPCError: if a call fails and `return_exceptions` is False.
+            DeviceCommError: if the device cannot be reached.
+
+        Examples:
+            >>> import xml.etree.ElementTree as ET
+            >>> import pynos.device
+            >>> conn = ('10.24.39.211', '22')
+            >>> auth = ('admin', 'password')
+            >>> ns = 'urn:brocade.com:mgmt:brocade-interface-ext'
+            >>> with pynos.device.Device(conn=conn, auth=auth) as dev:
+            ...     replies = dev.execute_many(
+            ...         [(ET.Element('get-vlan-brief', xmlns=ns), 'get'),
+            ...          (ET.Element('get-ip-interface', xmlns=ns), 'get')])
+        """
+        window = kwargs.pop('window', 16)
+        return_exceptions = kwargs.pop('return_exceptions', False)
+        calls = [self._call_spec(call) for call in calls]
+        for _, handler, _ in calls:
+            if handler not in ('get', 'get_stream', 'get_config',
+                               'edit_config'):
+                raise ValueError('%r calls cannot be pipelined.' % handler)
+
+        results = [None] * len(calls)
+        pending = collections.deque()
+        try:
+            for index, (call, handler, target) in enumerate(calls):
+                if (self._transaction is not None and
+                        handler == 'edit_config'):
+                    self._transaction.capture(call, target)
+                elif self._callback != self._callback_main:
+                    results[index] = self._guard(
+                        return_exceptions, self._callback, call,
+                        handler=handler,
+                        **({} if target == 'running' else {'target': target}))
+                else:
+                    if len(pending) >= window:
+                        self._finish(pending.popleft(), results,
+                                     return_exceptions)
+                    self._pipeline(index, call, handler, target, pending,
+                                   results, return_exceptions)
+            while pending:
+                self._finish(pending.popleft(), results, return_exceptions)
+        finally:
+            for item in pending:
+                if item[4] is not None:
+                    item[4].cancel()
+        return results
+
+    def _pipeline(self, index, call, handler, target, pending, results,
+                  return_exceptions):
+        """Send one call of ``execute_many`` and queue it in `pending`."""
+        ticket = None
+        if self._scheduler is not None:
+            call = self._element(call)
+            key = (handler, call.tag)
+            ticket = self._scheduler.acquire(key, blocking=False)
+            while ticket is None and pending:
+                # Our own replies free the slots the window needs.
+                self._finish(pending.popleft(), results, return_exceptions)
+                ticket = self._scheduler.acquire(key, blocking=False)
+            if ticket is None:
+                ticket = self._scheduler.acquire(key)
+        record = None
+        if self._instrumentation is not None:
+            call = self._element(call)
+            record = self._instrumentation.begin(call, handler, target)
+        try:
+            rpc = self._guard(return_exceptions, self._send_async, call,
+                              handler, target)
+        except Exception as error:
+            if ticket is not None:
+                ticket.release(error)
+            raise
+        if isinstance(rpc, Exception):
+            results[index] = rpc
+            if ticket is not None:
+                ticket.release(rpc)
+            if record is not None:
+                self._instrumentation.end(record, rpc)
+        else:
+            pending.append((index, handler, rpc, record, ticket))
+
+    @staticmethod
+    def _call_spec(call):
+        if not isinstance(call, tuple):
+            return call, 'edit_config', 'running'
+        if len(call) == 2:
+            return call[0], call[1], 'running'
+        return call
+
+    @staticmethod
+    def _guard(return_exceptions, func, *args, **kwargs):
+        if not return_exceptions:
+            return func(*args, **kwargs)
+        try:
+            return func(*args, **kwargs)
+        except ncclient.operations.RPCError as error:
+            return error
+
+    def _send_async(self, call, handler, target):
+        """Write one request to the session and return its pending RPC."""
+        session = self._mgr._session
+        device_handler = self._mgr._device_handler
+        element = self._element(call)
+        if self._response_cache is not None:
+            # Pipelined reads are always sent; writes still drop the
+            # replies they make stale.
+            self._response_cache.invalidate_for(element, handler)
+        if self._config_mirror is not None:
+            self._config_mirror.apply(element, handler, target)
+        try:
+            if handler == 'edit_config':
+                rpc = ncclient.operations.EditConfig(
+                    session, device_handler, True, self._mgr.timeout)
+                return rpc.request(element, target=target)
+            if handler == 'get_config':
+                rpc = ncclient.operations.Get(
+                    session, device_handler, True, self._mgr.timeout)
+                return rpc.request(filter=('subtree', element[0]))
+            rpc = ncclient.operations.Dispatch(
+                session, device_handler, True, self._mgr.timeout)
+            return rpc.request(element)
+        except (ncclient.transport.TransportError,
+                ncclient.transport.SessionCloseError,
+                ncclient.transport.SSHError) as error:
+            logging.error(error)
+            raise DeviceCommError
+
+    def _finish(self, pending, results, return_exceptions):
+        index, handler, rpc, record, ticket = pending
+        if ticket is None:
+            self._complete(index, handler, rpc, record, results,
+                           return_exceptions)
+            return
+        with ticket:
+            self._complete(index, handler, rpc, record, results,
+                           return_exceptions)
+
+    def _complete(self, index, handler, rpc, record, results,
+                  return_exceptions):
+        """Wait for the reply of a call of ``execute_many``."""
+        if record is None:
+            results[index] = self._guard(return_exceptions, self._reply, rpc,
+                                         handler)
+            return
+        record.sent = True
+        previous = pynos.instrumentation.activate(record)
+        try:
+            results[index] = self._guard(return_exceptions, self._reply, rpc,
+                                         handler)
+        except Exception as error:
+            self._instrumentation.end(record, error)
+            raise
+        finally:
+            pynos.instrumentation.activate(previous)
+        if rpc.reply is not None:
+            record.reply_bytes = len(rpc.reply.xml)
+        error = results[index]
+        self._instrumentation.end(
+            record, error if isinstance(error, Exception) else None)
+
+    def _reply(self, rpc, handler):
+        """Wait for the reply of an RPC sent by ``_send_async``."""
+        rpc.event.wait(self._mgr.timeout)
+        if not rpc.event.is_set():
+            raise ncclient.operations.TimeoutExpiredError(
+                'ncclient timed out while waiting for an rpc reply.')
+        if rpc.error is not None:
+            raise rpc.error
+        reply = rpc.reply
+        if handler == 'get_stream':
+            return reply.xml
+        if handler == 'get':
+            return self._reply_tree(reply.xml)
+        reply.parse()
+        if reply.error is not None:
+            raise reply.error
+        if handler == 'get_config':
+            return reply
+
+    @staticmethod
+    def _element(call):
+        """Return the request `call` as an lxml element.
+
+        Requests built with ElementTree are serialized and parsed once;
+        lxml elements are used as they are.
+        """
+        if isinstance(call, lxml.etree._Element):
+            return call
+        if not isinstance(call, bytes):
+            call = ET.tostring(call)
+        return lxml.etree.fromstring(call)
+
+    @staticmethod
+    def _reply_tree(reply):
+        """Parse the text of an rpc-reply once and return its root element.
+
+        Raises:
+            RPCError: if the reply holds an rpc-error.
+        """
+        if not isinstance(reply, bytes):
+            # lxml refuses str documents with an encoding declaration.
+            reply = reply.encode('utf-8')
+        record = pynos.instrumentation.current()
+        if record is None and not pynos.tracing.active:
+            root = lxml.etree.fromstring(reply)
+        else:
+            start = time.time()
+            with pynos.tracing.span('parse'):
+                root = lxml.etree.fromstring(reply)
+            if record is not None:
+                record.parse_seconds += time.time() - start
+        error = root.find('.//{%s}rpc-error' % NETCONF_NAMESPACE)
+        if error is not None:
+            raise ncclient.operations.RPCError(error)
+        return root
+
+    def _dispatch_raw(self, call_element):
+        """Dispatch a custom RPC and return the unparsed reply text.
+
+        The RPC is issued asynchronously so ncclient does not build its own
+        tree of the reply; large replies can then be parsed incrementally.
+        """
+        rpc = ncclient.operations.Dispatch(self._mgr._session,
+                                           self._mgr._device_handler,
+                                           True, self._mgr.timeout)
+        rpc.request(call_element)
+        rpc.event.wait(self._mgr.timeout)
+        if not rpc.event.is_set():
+            raise ncclient.operations.TimeoutExpiredError(
+                'ncclient timed out while waiting for an rpc reply.')
+        if rpc.error is not None:
+            raise rpc.error
+        return rpc.reply.xml
+
     @property
     def connection(self):
         """
@@ -362,7 +1123,7 @@ class Device(object):
                                         hostkey_verify=self._hostkey_verify)
         else:
             raise ValueError("auth_method incorrect value.")
-        self._mgr.timeout = 600
+        self._mgr.timeout = self._timeout
 
         return True
 
@@ -393,6 +1154,55 @@ class Device(object):
         results = [x for x in self.mac_table if x['mac_address'] == mac]
         return results
 
+    def mac_table_index(self, ttl=60):
+        """Return the ``MacTableIndex`` of this device.
+
+        The index is created on first use and shared by later calls, so
+        lookups from many callers are served by one MAC table fetch per
+        `ttl`.
+
+        Args:
+            ttl (float): Seconds a MAC table snapshot is used.  Only applies
+                to the call that creates the index.  Default: 60.
+
+        Returns:
+            pynos.mac_table.MacTableIndex
+        """
+        if self._mac_index is None:
+            self._mac_index = pynos.mac_table.MacTableIndex(self, ttl=ttl)
+        return self._mac_index
+
+    def find_interfaces_by_macs(self, mac_addresses, refresh=False):
+        """Find the interfaces through which many MACs can be reached.
+
+        All MACs are resolved against one indexed snapshot of the MAC table
+        (see ``mac_table_index``) instead of one fetch per MAC.
+
+        Args:
+            mac_addresses (list[str]): MAC addresses, in 'xx:xx:xx:xx:xx:xx',
+                'xxxx.xxxx.xxxx' or any other common notation.
+            refresh (bool): Fetch a new snapshot first.  Default: False.
+
+        Returns:
+            dict: maps each MAC address, as given, to a list of mac table
+            data.
+
+        Raises:
+            ValueError: if a MAC address is malformed.
+
+        Examples:
+            >>> import pynos.device
+            >>> conn = ('10.24.39.211', '22')
+            >>> auth = ('admin', 'password')
+            >>> with pynos.device.Device(conn=conn, auth=auth) as dev:
+            ...     x = dev.find_interfaces_by_macs(
+            ...     ['10:23:45:67:89:ab', '0005.33e5.d764'])
+        """
+        index = self.mac_table_index()
+        if refresh:
+            index.refresh()
+        return index.find_interfaces_by_macs(mac_addresses)
+
     def close(self):
         """Close NETCONF session.
 
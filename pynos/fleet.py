@@ -0,0 +1,279 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+import socket
+import time
+
+import ncclient.operations
+import ncclient.transport
+
+import pynos.device
+
+RETRY_ON = (pynos.device.DeviceCommError,
+            ncclient.transport.TransportError,
+            ncclient.operations.TimeoutExpiredError,
+            socket.error)
+
+
+class DeviceResult(namedtuple('DeviceResult', ['host', 'result', 'error',
+                                               'attempts', 'elapsed'])):
+    """Outcome of a fleet operation on one device.
+
+    Attributes:
+        host (str): Host the operation ran against.
+        result: Return value of the operation, ``None`` on error.
+        error (Exception): Exception raised by the last attempt, or ``None``.
+        attempts (int): Number of attempts made.
+        elapsed (float): Seconds spent on the device, including retries.
+    """
+    __slots__ = ()
+
+    @property
+    def ok(self):
+        """bool: ``True`` if the operation succeeded."""
+        return self.error is None
+
+
+class FleetTimeout(Exception):
+    """Exception for devices that did not finish within the fleet timeout.
+    """
+    pass
+
+
+class Fleet(object):
+    """
+    Fleet runs one pynos operation across many devices in parallel.
+
+    Attributes:
+        inventory (list[dict]): Keyword arguments for
+            ``pynos.device.Device`` of each device.
+    """
+
+    def __init__(self, inventory, **kwargs):
+        """
+        Args:
+            inventory (list): Devices to operate on.  Each item is either a
+                ``dict`` of ``Device`` keyword arguments, a ``conn`` tuple
+                such as ``('10.0.0.1', '22')``, or a host name (port 22).
+            concurrency (int): Maximum number of devices worked on at once.
+                Default: 16.
+            timeout (float): Seconds a single device may take, including
+                retries, before it is reported with ``FleetTimeout``.  Also
+                the ``Device`` timeout of each NETCONF call, unless the
+                inventory item sets its own.  Default: no limit.
+            retries (int): Extra attempts after a failure listed in
+                `retry_on`.  Default: 0.
+            retry_delay (float): Seconds before the first retry.  Default: 1.
+            backoff (float): Multiplier applied to `retry_delay` after each
+                retry.  Default: 2.
+            retry_on (tuple): Exception types that trigger a retry.
+                Default: ``RETRY_ON``.
+            processes (bool): Use a process pool instead of threads.  The
+                operation, its arguments and its result must be picklable.
+                Default: ``False``.
+            All other keyword arguments are defaults for every ``Device``.
+                Ex. ``auth=('admin', 'password')``.
+
+        Returns:
+            Instance of the Fleet object.
+
+        Raises:
+            ValueError: if `concurrency` is less than 1.
+
+        Examples:
+            >>> import pynos.fleet
+            >>> switches = ['10.24.39.211', '10.24.39.203']
+            >>> auth = ('admin', 'password')
+            >>> fleet = pynos.fleet.Fleet(switches, auth=auth, concurrency=50,
+            ...                           timeout=120, retries=2)
+            >>> for res in fleet.run('interface.vlans'):
+            ...     if res.ok:
+            ...         print(res.host, len(res.result))
+            ...     else:
+            ...         print(res.host, repr(res.error))
+        """
+        self._concurrency = kwargs.pop('concurrency', 16)
+        if self._concurrency < 1:
+            raise ValueError('`concurrency` must be at least 1.')
+        self._timeout = kwargs.pop('timeout', None)
+        self._retries = kwargs.pop('retries', 0)
+        self._retry_delay = kwargs.pop('retry_delay', 1)
+        self._backoff = kwargs.pop('backoff', 2)
+        self._retry_on = kwargs.pop('retry_on', RETRY_ON)
+        self._processes = kwargs.pop('processes', False)
+        if self._timeout is not None:
+            # A call hung past the fleet timeout would hold its worker.
+            kwargs['timeout'] = self._timeout
+        self.inventory = [self._device_kwargs(item, kwargs)
+                          for item in inventory]
+
+    @staticmethod
+    def _device_kwargs(item, defaults):
+        device_kwargs = dict(defaults)
+        if isinstance(item, dict):
+            device_kwargs.update(item)
+        elif isinstance(item, (tuple, list)):
+            device_kwargs['conn'] = tuple(item)
+        else:
+            device_kwargs['conn'] = (item, '22')
+        return device_kwargs
+
+    def run(self, operation, *args, **kwargs):
+        """Run `operation` on every device.
+
+        Args:
+            operation: Either a dotted path relative to the ``Device``
+                (``'interface.vlans'``, ``'mac_table'``,
+                ``'bgp.get_bgp_neighbors'``) or a function called with the
+                connected ``Device`` as its first argument.
+            args, kwargs: Passed on to `operation`.  Properties take none.
+
+        Returns:
+            Generator of ``DeviceResult`` in order of completion.
+
+        Raises:
+            None.  Errors are reported per device in ``DeviceResult.error``.
+        """
+        policy = (self._retries, self._retry_delay, self._backoff,
+                  self._retry_on)
+        if self._processes:
+            executor = ProcessPoolExecutor(max_workers=self._concurrency)
+        else:
+            executor = ThreadPoolExecutor(max_workers=self._concurrency)
+        futures = {}
+        try:
+            for device_kwargs in self.inventory:
+                future = executor.submit(run_on_device, device_kwargs,
+                                         operation, args, kwargs, policy)
+                futures[future] = device_kwargs['conn'][0]
+            for result in self._collect(futures):
+                yield result
+        finally:
+            executor.shutdown(wait=False)
+            for future in futures:
+                future.cancel()
+
+    def _collect(self, futures):
+        pending = set(futures)
+        started = {}
+        while pending:
+            now = time.time()
+            for future in pending:
+                if future not in started and future.running():
+                    started[future] = now
+            wait_time = None
+            if self._timeout is not None:
+                expired = [f for f in pending if f in started and
+                           now - started[f] >= self._timeout]
+                for future in expired:
+                    pending.discard(future)
+                    future.cancel()
+                    error = FleetTimeout('No result after %ss.' %
+                                         self._timeout)
+                    yield DeviceResult(futures[future], None, error, None,
+                                       now - started[future])
+                if not pending:
+                    break
+                deadlines = [started[f] + self._timeout - now
+                             for f in pending if f in started]
+                # Queued futures are polled so their deadline starts when a
+                # worker picks them up, not when they were submitted.
+                wait_time = min(deadlines + [0.1])
+            done, pending = wait(pending, timeout=wait_time,
+                                 return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def run(inventory, operation, *args, **kwargs):
+    """Run `operation` across `inventory` with default fleet settings.
+
+    Shortcut for ``Fleet(inventory, **options).run(operation, *args)``.
+    Fleet and ``Device`` options are given in `options` so they do not
+    collide with keyword arguments of the operation.
+
+    Args:
+        inventory (list): See ``Fleet``.
+        operation: See ``Fleet.run``.
+        options (dict): Keyword arguments for ``Fleet``.
+        args, kwargs: Passed on to `operation`.
+
+    Returns:
+        Generator of ``DeviceResult`` in order of completion.
+
+    Examples:
+        >>> import pynos.fleet
+        >>> auth = ('admin', 'password')
+        >>> results = list(pynos.fleet.run(['10.24.39.211'], 'mac_table',
+        ...                                options=dict(auth=auth)))
+    """
+    options = kwargs.pop('options', {})
+    return Fleet(inventory, **options).run(operation, *args, **kwargs)
+
+
+def run_on_device(device_kwargs, operation, args, kwargs, policy):
+    """Connect to one device and run `operation` on it with retries.
+
+    Module level so it can be shipped to a process pool.
+
+    Returns:
+        DeviceResult
+    """
+    retries, delay, backoff, retry_on = policy
+    host = device_kwargs['conn'][0]
+    start = time.time()
+    attempts = 0
+    while True:
+        attempts += 1
+        try:
+            with pynos.device.Device(**device_kwargs) as dev:
+                result = call_operation(dev, operation, args, kwargs)
+            return DeviceResult(host, result, None, attempts,
+                                time.time() - start)
+        except Exception as error:
+            retry = (isinstance(error, retry_on) and
+                     not isinstance(error,
+                                    ncclient.transport.AuthenticationError))
+            if not retry or attempts > retries:
+                return DeviceResult(host, None, error, attempts,
+                                    time.time() - start)
+        time.sleep(delay)
+        delay *= backoff
+
+
+def call_operation(dev, operation, args, kwargs):
+    """Run `operation` against a connected device.
+
+    Args:
+        dev (Device): The device.
+        operation: Dotted attribute path or function; see ``Fleet.run``.
+
+    Returns:
+        The return value of the operation.
+    """
+    if callable(operation):
+        return operation(dev, *args, **kwargs)
+    target = dev
+    for name in operation.split('.'):
+        target = getattr(target, name)
+    if callable(target):
+        return target(*args, **kwargs)
+    return target
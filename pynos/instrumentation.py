@@ -0,0 +1,396 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Per-RPC latency and payload measurements of ``Device`` calls.
+"""
+import bisect
+import logging
+import os
+import sys
+import threading
+import time
+
+import lxml.etree
+
+import pynos.tracing
+
+LATENCY_BOUNDS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5,
+                  1.0, 2.0, 5.0, 10.0, 30.0, 60.0)
+"""tuple: Upper bounds, in seconds, of the latency histogram buckets."""
+
+SIZE_BOUNDS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304,
+               16777216)
+"""tuple: Upper bounds, in bytes, of the reply size histogram buckets."""
+
+_local = threading.local()
+_PACKAGE = os.path.dirname(os.path.abspath(__file__))
+_DEVICE = os.path.join(_PACKAGE, 'device.py')
+# Frames of these files are plumbing between a feature method and the RPC.
+_PLUMBING = tuple(os.path.join(_PACKAGE, name) for name in (
+    'device.py', 'cache.py', 'mirror.py', 'paging.py', 'transaction.py',
+    'desired_state.py', 'template.py', 'utilities.py', 'instrumentation.py',
+    'tracing.py', os.path.join('versions', 'registry.py')))
+
+
+class RPCRecord(object):
+    """Measurements of one call made through a ``Device``.
+
+    Attributes:
+        handler (str): ``get``, ``get_stream``, ``get_config``,
+            ``edit_config``, ...
+        tag (str): Qualified tag of the request: the RPC for ``get``
+            calls, the top-level container for ``get_config`` and
+            ``edit_config``.
+        namespace (str): Namespace of `tag`.
+        name (str): Local name of `tag`.  Ex. 'get-interface-detail'
+        method (str): Feature method that made the call, as
+            'Class.method', or ``None`` if it cannot be told.  Ex.
+            'Interface.description'
+        target (str): Target datastore.
+        sent (bool): False if the call was answered without an RPC, from
+            a response cache or config mirror.
+        seconds (float): Wall time of the call.
+        parse_seconds (float): Time spent parsing the reply.
+        request_bytes (int): Size of the serialized request.
+        reply_bytes (int): Size of the reply, or 0 if it is unknown.
+        error (Exception): What the call raised, or ``None``.
+    """
+    __slots__ = ('handler', 'tag', 'namespace', 'name', 'method', 'target',
+                 'sent', 'seconds', 'parse_seconds', 'request_bytes',
+                 'reply_bytes', 'error', 'started')
+
+    def __init__(self, call, handler, target, method):
+        tag = _tag(call, handler)
+        qname = lxml.etree.QName(tag)
+        self.handler = handler
+        self.tag = tag
+        self.namespace = qname.namespace
+        self.name = qname.localname
+        self.method = method
+        self.target = target
+        self.sent = False
+        self.seconds = 0.0
+        self.parse_seconds = 0.0
+        self.request_bytes = len(lxml.etree.tostring(call))
+        self.reply_bytes = 0
+        self.error = None
+        self.started = time.time()
+
+    def __repr__(self):
+        return ('<RPCRecord %s %s %s %.1fms %dB>'
+                % (self.handler, self.name, self.method,
+                   self.seconds * 1000, self.reply_bytes))
+
+
+class Histogram(object):
+    """Counts of values in fixed buckets.
+
+    Attributes:
+        bounds (tuple): Upper bound of each bucket; a last bucket holds
+            the larger values.
+        counts (list): Number of values in each bucket.
+    """
+
+    def __init__(self, bounds):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+
+    def add(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding quantile `q`, or ``None`` if
+        the histogram is empty.  Values above the last bound report
+        ``float('inf')``.
+        """
+        total = sum(self.counts)
+        if not total:
+            return None
+        rank = q * total
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                break
+        if index < len(self.bounds):
+            return self.bounds[index]
+        return float('inf')
+
+
+class Aggregate(object):
+    """Totals of the calls that share a key.
+
+    Attributes:
+        count (int): Number of calls.
+        sent (int): Number of calls that sent an RPC.
+        errors (int): Number of calls that raised.
+        seconds (float): Total wall time.
+        parse_seconds (float): Total parse time.
+        request_bytes (int): Total request size.
+        reply_bytes (int): Total reply size.
+        latency (Histogram): Wall times.
+        size (Histogram): Reply sizes.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.sent = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.parse_seconds = 0.0
+        self.request_bytes = 0
+        self.reply_bytes = 0
+        self.latency = Histogram(LATENCY_BOUNDS)
+        self.size = Histogram(SIZE_BOUNDS)
+
+    def add(self, record):
+        self.count += 1
+        self.sent += record.sent
+        self.errors += record.error is not None
+        self.seconds += record.seconds
+        self.parse_seconds += record.parse_seconds
+        self.request_bytes += record.request_bytes
+        self.reply_bytes += record.reply_bytes
+        self.latency.add(record.seconds)
+        self.size.add(record.reply_bytes)
+
+
+class Instrumentation(object):
+    """
+    Instrumentation measures the calls made through one or more devices.
+
+    Each call is measured in an ``RPCRecord``, handed to the listeners as
+    soon as it completes, and added to aggregates keyed by RPC name,
+    calling feature method and handler.  Nothing is measured for devices
+    created without instrumentation.
+
+    Attributes:
+        None
+    """
+
+    KEYS = ('name', 'method', 'handler')
+    """tuple: Attributes of ``RPCRecord`` the calls are aggregated on."""
+
+    def __init__(self, listeners=None):
+        """
+        Args:
+            listeners (list): Functions called with each ``RPCRecord``.
+
+        Returns:
+            Instance of the Instrumentation object.
+
+        Raises:
+            None
+
+        Examples:
+            >>> import pynos.device
+            >>> import pynos.instrumentation
+            >>> metrics = pynos.instrumentation.Instrumentation()
+            >>> conn = ('10.24.39.211', '22')
+            >>> auth = ('admin', 'password')
+            >>> with pynos.device.Device(conn=conn, auth=auth,
+            ...                          instrumentation=metrics) as dev:
+            ...     dev.interface.interface_detail
+            ...     dev.interface.vlans
+            >>> print(metrics.report(by='method'))
+        """
+        self._listeners = list(listeners or [])
+        self._lock = threading.Lock()
+        self._aggregates = dict((key, {}) for key in self.KEYS)
+
+    def add_listener(self, listener):
+        """Call `listener` with the ``RPCRecord`` of each call.
+
+        Listeners run in the thread that made the call; exceptions they
+        raise are logged and ignored.
+        """
+        with self._lock:
+            self._listeners = self._listeners + [listener]
+
+    def remove_listener(self, listener):
+        with self._lock:
+            self._listeners = [item for item in self._listeners
+                               if item != listener]
+
+    def begin(self, call, handler, target='running'):
+        """Start measuring a call.
+
+        Args:
+            call: The request, as an lxml element.
+            handler (str): ``Device`` handler of the call.
+            target (str): Target datastore.
+
+        Returns:
+            RPCRecord: The record to pass to ``end``.
+        """
+        return RPCRecord(call, handler, target, caller())
+
+    def end(self, record, error=None):
+        """Complete `record`, aggregate it and notify the listeners.
+
+        Args:
+            record (RPCRecord): Record returned by ``begin``.
+            error (Exception): What the call raised, if anything.
+
+        Returns:
+            None
+        """
+        record.seconds = time.time() - record.started
+        record.error = error
+        with self._lock:
+            for key in self.KEYS:
+                value = getattr(record, key)
+                aggregates = self._aggregates[key]
+                if value not in aggregates:
+                    aggregates[value] = Aggregate()
+                aggregates[value].add(record)
+            listeners = self._listeners
+        for listener in listeners:
+            try:
+                listener(record)
+            except Exception as error:
+                logging.warning('Instrumentation listener failed: %s', error)
+
+    def stats(self, by='name'):
+        """Return the aggregates of the calls measured so far.
+
+        Args:
+            by (str): ``name``, ``method`` or ``handler``.
+
+        Returns:
+            dict: ``Aggregate`` of each value of `by`.
+
+        Raises:
+            ValueError: if `by` is not one of the keys.
+        """
+        if by not in self.KEYS:
+            raise ValueError('by must be one of: %s' % repr(self.KEYS))
+        with self._lock:
+            return dict(self._aggregates[by])
+
+    def report(self, by='name', limit=20):
+        """Return a text table of the calls that took the most time.
+
+        Args:
+            by (str): ``name``, ``method`` or ``handler``.
+            limit (int): Number of rows.
+
+        Returns:
+            str
+        """
+        rows = sorted(self.stats(by).items(),
+                      key=lambda item: -item[1].seconds)
+        lines = ['%-40s %7s %7s %10s %9s %9s %9s %10s'
+                 % (by, 'calls', 'rpcs', 'total (s)', 'mean (ms)',
+                    'p50 (ms)', 'p95 (ms)', 'reply (KB)')]
+        for key, aggregate in rows[:limit]:
+            lines.append('%-40s %7d %7d %10.3f %9.1f %9s %9s %10.1f' % (
+                key, aggregate.count, aggregate.sent, aggregate.seconds,
+                aggregate.seconds / aggregate.count * 1000,
+                _milliseconds(aggregate.latency.quantile(0.5)),
+                _milliseconds(aggregate.latency.quantile(0.95)),
+                aggregate.reply_bytes / 1024.0))
+        return '\n'.join(lines)
+
+    def reset(self):
+        """Drop the aggregates."""
+        with self._lock:
+            self._aggregates = dict((key, {}) for key in self.KEYS)
+
+
+def _tag(call, handler):
+    """Tag of the RPC of `call`, or of its top-level container for
+    ``get_config`` and ``edit_config``."""
+    if handler in ('get_config', 'edit_config') and len(call):
+        return call[0].tag
+    return call.tag
+
+
+def _milliseconds(bound):
+    if bound == float('inf'):
+        return '>%d' % (LATENCY_BOUNDS[-1] * 1000)
+    return '<=%g' % (bound * 1000)
+
+
+def current():
+    """Return the record of the call in progress in this thread, or None.
+    """
+    return getattr(_local, 'record', None)
+
+
+def activate(record):
+    """Make `record` the call in progress in this thread.
+
+    Returns:
+        The record it replaces, to restore afterwards.
+    """
+    previous = getattr(_local, 'record', None)
+    _local.record = record
+    return previous
+
+
+def inherit(func):
+    """Wrap `func` to run in another thread on behalf of the caller, so the
+    calls it makes are attributed to the caller's feature method, and
+    traced in the caller's open span.
+    """
+    method = caller(sys._getframe(1))
+    parent = pynos.tracing.current()
+
+    def run(*args, **kwargs):
+        previous_method = getattr(_local, 'method', None)
+        _local.method = method
+        previous = pynos.tracing.inherit(parent)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _local.method = previous_method
+            pynos.tracing.inherit(previous)
+    return run
+
+
+def caller(frame=None):
+    """Return the name of the feature method a call is made for.
+
+    That is the first function up the stack outside the pynos plumbing
+    (``Device``, caches, transactions, ...), or the caller whose work this
+    thread does through ``inherit``.
+
+    Args:
+        frame: Frame to start from.  Default: the caller of the function
+            that calls this one.
+
+    Returns:
+        str: Ex. 'Interface.ip_address' or 'Device.execute_many', or
+        ``None`` if the stack holds plumbing only.
+    """
+    method = getattr(_local, 'method', None)
+    if method is not None:
+        return method
+    if frame is None:
+        frame = sys._getframe(2)
+    while frame is not None:
+        filename = os.path.abspath(frame.f_code.co_filename)
+        name = frame.f_code.co_name
+        if filename == _DEVICE and not name.startswith('_'):
+            return 'Device.%s' % name
+        if not filename.startswith(_PLUMBING):
+            instance = frame.f_locals.get('self')
+            if instance is not None:
+                return '%s.%s' % (type(instance).__name__, name)
+            return name
+        frame = frame.f_back
+    return None
@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import re
+import threading
+import time
+
+_SEPARATORS = re.compile('[:.-]')
+_HEX_MAC = re.compile('^[0-9a-f]{12}$')
+
+
+def normalize_mac(mac_address):
+    """Return `mac_address` in the dotted form used by NOS.
+
+    Args:
+        mac_address (str): MAC address as 'xx:xx:xx:xx:xx:xx',
+            'xx-xx-xx-xx-xx-xx', 'xxxx.xxxx.xxxx' or 'xxxxxxxxxxxx', in
+            either case.
+
+    Returns:
+        str: 'xxxx.xxxx.xxxx' in lower case.
+
+    Raises:
+        ValueError: if `mac_address` does not have 12 hex digits.
+
+    Examples:
+        >>> import pynos.mac_table
+        >>> pynos.mac_table.normalize_mac('10:23:45:67:89:AB')
+        '1023.4567.89ab'
+    """
+    digits = _SEPARATORS.sub('', mac_address.lower())
+    if not _HEX_MAC.match(digits):
+        raise ValueError('%r is not a MAC address.' % mac_address)
+    return '%s.%s.%s' % (digits[0:4], digits[4:8], digits[8:12])
+
+
+class MacTableIndex(object):
+    """
+    MacTableIndex answers MAC table queries from one snapshot of the table.
+
+    The snapshot is fetched once and indexed by MAC address, VLAN and
+    interface, so any number of lookups cost a dict access instead of a
+    ``get-mac-address-table`` RPC each.  The snapshot is refetched when it
+    is older than `ttl` or when ``refresh()`` is called.
+
+    Attributes:
+        None
+    """
+
+    def __init__(self, device=None, **kwargs):
+        """
+        Args:
+            device (Device): Device whose MAC table is indexed.  ``None``
+                indexes a fixed snapshot given as `entries`.
+            entries (list[dict]): Snapshot to index instead of fetching one.
+            ttl (float): Seconds before the snapshot is refetched on the next
+                lookup.  ``None`` keeps it until ``refresh()``.  Default: 60.
+
+        Returns:
+            Instance of the MacTableIndex object.
+
+        Raises:
+            ValueError: if neither `device` nor `entries` is given.
+
+        Examples:
+            >>> import pynos.device
+            >>> import pynos.mac_table
+            >>> conn = ('10.24.39.211', '22')
+            >>> auth = ('admin', 'password')
+            >>> with pynos.device.Device(conn=conn, auth=auth) as dev:
+            ...     index = pynos.mac_table.MacTableIndex(dev, ttl=30)
+            ...     found = index.find_interfaces_by_macs(
+            ...         ['10:23:45:67:89:ab', '0005.33e5.d764'])
+            ...     on_vlan = index.by_vlan('10')
+        """
+        entries = kwargs.pop('entries', None)
+        if device is None and entries is None:
+            raise ValueError('Either `device` or `entries` must be given.')
+        self._device = device
+        self._ttl = kwargs.pop('ttl', 60)
+        self._lock = threading.Lock()
+        self._by_mac = {}
+        self._by_vlan = {}
+        self._by_interface = {}
+        self._fetched = None
+        if entries is not None:
+            self._build(entries)
+
+    def __len__(self):
+        self._current()
+        return sum(len(entries) for entries in self._by_mac.values())
+
+    @property
+    def age(self):
+        """float: Seconds since the snapshot was taken, ``None`` before the
+        first fetch."""
+        if self._fetched is None:
+            return None
+        return time.time() - self._fetched
+
+    def refresh(self):
+        """Fetch and index a new snapshot of the MAC table.
+
+        Raises:
+            ValueError: if the index was built from a fixed snapshot.
+        """
+        if self._device is None:
+            raise ValueError('Index of a fixed snapshot cannot be refreshed.')
+        with self._lock:
+            self._build(self._device.iter_mac_table())
+
+    def _build(self, entries):
+        by_mac = {}
+        by_vlan = {}
+        by_interface = {}
+        for entry in entries:
+            by_mac.setdefault(normalize_mac(entry['mac_address']),
+                              []).append(entry)
+            by_vlan.setdefault(entry['vlan'], []).append(entry)
+            by_interface.setdefault(entry['interface'], []).append(entry)
+        self._by_mac, self._by_vlan, self._by_interface = (by_mac, by_vlan,
+                                                           by_interface)
+        self._fetched = time.time()
+
+    def _current(self):
+        if self._device is None:
+            return
+        fetched = self._fetched
+        if fetched is not None and (self._ttl is None or
+                                    time.time() - fetched < self._ttl):
+            return
+        with self._lock:
+            # Another thread may have refreshed while we waited.
+            if self._fetched == fetched:
+                self._build(self._device.iter_mac_table())
+
+    def lookup(self, mac_address):
+        """Entries of one MAC address, in any notation.
+
+        Returns:
+            list[dict]: MAC table entries; empty if the MAC is not known.
+        """
+        self._current()
+        return list(self._by_mac.get(normalize_mac(mac_address), ()))
+
+    def find_interfaces_by_macs(self, mac_addresses):
+        """Entries of many MAC addresses from one snapshot.
+
+        Args:
+            mac_addresses (list[str]): MAC addresses, in any notation.
+
+        Returns:
+            dict: maps each given MAC address, as given, to its list of
+            entries.  Unknown MACs map to an empty list.
+        """
+        self._current()
+        by_mac = self._by_mac
+        return dict((mac, list(by_mac.get(normalize_mac(mac), ())))
+                    for mac in mac_addresses)
+
+    def by_vlan(self, vlan):
+        """list[dict]: entries learned on `vlan`."""
+        self._current()
+        return list(self._by_vlan.get(str(vlan), ()))
+
+    def by_interface(self, interface):
+        """list[dict]: entries learned on `interface`, named as in
+        ``mac_table`` (Ex. 'TenGigabitEthernet1/0/1')."""
+        self._current()
+        return list(self._by_interface.get(interface, ()))
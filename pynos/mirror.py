@@ -0,0 +1,313 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Local mirror of the running configuration of a device.
+"""
+import copy
+import threading
+
+import lxml.etree
+
+import pynos.cache
+from pynos.utilities import edit_entry, edit_operation, element_text, \
+    strip_operations
+
+NETCONF_NAMESPACE = 'urn:ietf:params:xml:ns:netconf:base:1.0'
+_DATA = '{%s}data' % NETCONF_NAMESPACE
+
+
+class MirrorReply(object):
+    """
+    MirrorReply stands in for the ncclient ``GetReply`` of a
+    ``get_config`` call answered by a ``ConfigMirror``.
+
+    Attributes:
+        data_ele: The ``data`` element with the matching configuration.
+            Also available as ``data``.
+        ok (bool): Always True.
+        error: Always None.
+    """
+    ok = True
+    error = None
+
+    def __init__(self, data):
+        self.data_ele = data
+
+    @property
+    def data(self):
+        return self.data_ele
+
+    @property
+    def data_xml(self):
+        return lxml.etree.tostring(self.data_ele).decode('utf-8')
+
+    @property
+    def xml(self):
+        return ('<rpc-reply xmlns="%s">%s</rpc-reply>'
+                % (NETCONF_NAMESPACE, self.data_xml))
+
+    def __str__(self):
+        return self.xml
+
+    def __repr__(self):
+        return self.xml
+
+
+class ConfigMirror(object):
+    """
+    ConfigMirror answers ``get_config`` calls from a local copy of the
+    running configuration.
+
+    The copy is fetched per top-level container the first time a query
+    needs it, or all at once with ``load``, and queries are answered with
+    NETCONF subtree filtering on the copy.  Edits sent through the device
+    are applied to the copy as well.  Without a schema, list entries are
+    matched on their first leaf, where the YANG builders always put the
+    key; when an edit cannot be placed with certainty, or it failed on
+    the device, the containers it touched are fetched again on their next
+    query.  Other writes (candidate edits, ``commit``, ``copy_config``,
+    ...) drop the whole copy.  Changes made by other sessions are only
+    seen after ``resync``.
+
+    Unlike the ``get`` the device uses for ``get_config`` calls without a
+    mirror, the copy holds configuration only, no operational state.  The
+    device fetches it through its callback, so loads and resyncs are
+    scheduled, measured and traced like any other call.
+
+    Attributes:
+        None
+    """
+
+    def __init__(self, fetch):
+        """
+        Args:
+            fetch (function): Returns the ``data`` element of the running
+                configuration, given a subtree filter element, or ``None``
+                for the whole configuration.
+
+        Returns:
+            Instance of the ConfigMirror object.
+
+        Raises:
+            None
+
+        Examples:
+            >>> import pynos.device
+            >>> conn = ('10.24.39.211', '22')
+            >>> auth = ('admin', 'password')
+            >>> with pynos.device.Device(conn=conn, auth=auth,
+            ...                          config_mirror=True) as dev:
+            ...     dev.config_mirror.load()
+            ...     for port in range(1, 49):
+            ...         ips = dev.interface.get_ip_addresses(
+            ...             int_type='tengigabitethernet',
+            ...             name='1/0/%d' % port, version=4)
+            ...     print(dev.config_mirror.stats()['fetches'])
+            1
+        """
+        self._fetch = fetch
+        self._lock = threading.RLock()
+        self._data = lxml.etree.Element(_DATA)
+        self._loaded = set()
+        self._full = False
+        self._counts = dict(fetches=0, queries=0, edits=0, resyncs=0)
+
+    def load(self):
+        """Fetch the whole running configuration.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        data = self._fetch(None)
+        with self._lock:
+            self._counts['fetches'] += 1
+            self._data = copy.deepcopy(data)
+            self._data.tag = _DATA
+            self._loaded = set(child.tag for child in self._data)
+            self._full = True
+
+    def resync(self, *tags):
+        """Drop the copy of some or all top-level containers, so their
+        next query fetches them again.
+
+        Args:
+            *tags (str): Qualified tags of the containers.  Ex.
+                '{urn:brocade.com:mgmt:brocade-interface}interface'.
+                None drops everything.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._counts['resyncs'] += 1
+            if not tags:
+                self._data = lxml.etree.Element(_DATA)
+                self._loaded = set()
+                self._full = False
+                return
+            if self._full:
+                self._loaded = set(child.tag for child in self._data)
+                self._full = False
+            for tag in tags:
+                self._loaded.discard(tag)
+                for child in self._data.findall(tag):
+                    self._data.remove(child)
+
+    def query(self, subtree):
+        """Answer a ``get_config`` call.
+
+        Args:
+            subtree: The subtree filter, as an lxml element.
+
+        Returns:
+            MirrorReply: The configuration that matches `subtree`.
+        """
+        self._ensure(subtree.tag)
+        result = lxml.etree.Element(_DATA)
+        with self._lock:
+            self._counts['queries'] += 1
+            for node in _filter(self._data, subtree):
+                result.append(node)
+        return MirrorReply(result)
+
+    def apply(self, call, handler='edit_config', target='running',
+              applied=True):
+        """Bring the copy up to date with a call sent to the device.
+
+        Args:
+            call: The request, as an lxml element.
+            handler (str): ``Device`` handler of the call.
+            target (str): Target datastore of the call.
+            applied (bool): False if the device reported a failure.
+
+        Returns:
+            None
+        """
+        if pynos.cache.is_read(call, handler):
+            return
+        if handler != 'edit_config' or target != 'running':
+            self.resync()
+            return
+        with self._lock:
+            self._counts['edits'] += 1
+            for container in call:
+                if not self._full and container.tag not in self._loaded:
+                    continue
+                if not applied or not _merge(self._data, container):
+                    self.resync(container.tag)
+
+    def stats(self):
+        """Return the activity counts of the mirror.
+
+        Returns:
+            dict: fetches (configuration RPCs sent), queries (calls
+            answered), edits (edits applied) and resyncs.
+        """
+        with self._lock:
+            return dict(self._counts)
+
+    def _ensure(self, tag):
+        with self._lock:
+            if self._full or tag in self._loaded:
+                return
+        data = self._fetch(lxml.etree.Element(tag))
+        with self._lock:
+            self._counts['fetches'] += 1
+            for child in self._data.findall(tag):
+                self._data.remove(child)
+            for child in data.findall(tag):
+                self._data.append(copy.deepcopy(child))
+            self._loaded.add(tag)
+
+
+def _matches(node, selector):
+    if node.tag == selector.tag:
+        return True
+    # Filters without a namespace match any.
+    return (not selector.tag.startswith('{') and
+            lxml.etree.QName(node).localname == selector.tag)
+
+
+def _filter(parent, selector):
+    """Copies of the children of `parent` that subtree filter `selector`
+    selects, as in RFC 6241 section 6."""
+    return [selected for selected in
+            (_select(node, selector) for node in parent
+             if not callable(node.tag) and _matches(node, selector))
+            if selected is not None]
+
+
+def _select(node, selector):
+    children = [child for child in selector if not callable(child.tag)]
+    if not children:
+        text = element_text(selector)
+        if text and text != element_text(node):
+            return None
+        return copy.deepcopy(node)
+    content = [child for child in children
+               if not len(child) and element_text(child)]
+    for child in content:
+        if not any(_matches(candidate, child) and
+                   element_text(candidate) == element_text(child)
+                   for candidate in node if not callable(candidate.tag)):
+            return None
+    others = [child for child in children if child not in content]
+    if not others:
+        return copy.deepcopy(node)
+    selected = []
+    for child in others:
+        selected.extend(_filter(node, child))
+    if not selected:
+        return None
+    result = lxml.etree.Element(node.tag, node.attrib, nsmap=node.nsmap)
+    for child in content:
+        for candidate in node:
+            if not callable(candidate.tag) and _matches(candidate, child):
+                result.append(copy.deepcopy(candidate))
+    for child in selected:
+        result.append(child)
+    return result
+
+
+def _merge(parent, edit):
+    """Apply an edit-config element to the children of `parent`.
+
+    Returns:
+        bool: False if the edit could not be placed with certainty.
+    """
+    if callable(edit.tag):
+        return True
+    operation = edit_operation(edit)
+    node, certain = edit_entry(parent.findall(edit.tag), edit)
+    if not certain:
+        return False
+    if operation in ('delete', 'remove'):
+        if node is not None:
+            parent.remove(node)
+        return True
+    if operation == 'replace' or node is None:
+        if node is None:
+            parent.append(strip_operations(edit))
+        else:
+            parent.replace(node, strip_operations(edit))
+        return True
+    if not len(edit):
+        node.text = edit.text
+        return True
+    return all([_merge(node, child) for child in edit])
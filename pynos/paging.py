@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+import pynos.instrumentation
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def prefetch_executor():
+    """Return the thread pool that fetches pages ahead of their consumers.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=16)
+        return _executor
+
+
+class PageCursor(object):
+    """
+    PageCursor iterates over the rows of a paginated operational RPC.
+
+    NOS splits long tables (``get-interface-detail``, ``get-vlan-brief``,
+    ``get-lldp-neighbor-detail``, ...) into pages: each reply says whether
+    more follow (``has-more``, ``next-page-cursor``) and the next request
+    names where the previous page ended.  The cursor requests the next page
+    in the background as soon as a page arrives, so the device works on it
+    while the caller consumes the current rows.  Rows are produced lazily;
+    stopping the iteration stops the paging.
+
+    Attributes:
+        pages (int): Number of pages received so far.
+    """
+
+    def __init__(self, callback, request, rows, next_request, **kwargs):
+        """
+        Args:
+            callback (function): Callback of the feature object.
+            request (Element): Request of the first page.
+            rows (function): Called with a page reply; returns the rows of
+                that page.
+            next_request (function): Called with a page reply; returns the
+                request of the next page, or ``None`` after the last page.
+            first_reply (Element): Reply of the first page if it has already
+                been fetched.  `request` is then not sent.
+            prefetch (bool): Fetch the next page while the current one is
+                consumed.  Default: True.
+
+        Returns:
+            Instance of the PageCursor object.
+
+        Raises:
+            None
+
+        Examples:
+            >>> import xml.etree.ElementTree as ET
+            >>> import pynos.device
+            >>> import pynos.paging
+            >>> urn = '{urn:brocade.com:mgmt:brocade-interface-ext}'
+            >>> def next_request(reply):
+            ...     if reply.find('%shas-more' % urn).text != 'true':
+            ...         return None
+            ...     request = ET.Element('get-vlan-brief', xmlns=urn[1:-1])
+            ...     last = ET.SubElement(request, 'last-rcvd-vlan-id')
+            ...     last.text = reply.find('%slast-vlan-id' % urn).text
+            ...     return request
+            >>> conn = ('10.24.39.211', '22')
+            >>> auth = ('admin', 'password')
+            >>> with pynos.device.Device(conn=conn, auth=auth) as dev:
+            ...     cursor = pynos.paging.PageCursor(
+            ...         dev._call, ET.Element('get-vlan-brief',
+            ...                               xmlns=urn[1:-1]),
+            ...         lambda reply: reply.findall('%svlan' % urn),
+            ...         next_request)
+            ...     vlan_ids = [vlan.find('%svlan-id' % urn).text
+            ...                 for vlan in cursor]
+        """
+        self._callback = callback
+        self._request = request
+        self._rows = rows
+        self._next_request = next_request
+        self._first_reply = kwargs.pop('first_reply', None)
+        self._prefetch = kwargs.pop('prefetch', True)
+        self.pages = 0
+
+    def __iter__(self):
+        for page in self.iter_pages():
+            for row in self._rows(page):
+                yield row
+
+    def _fetch(self, request):
+        return self._callback(request, 'get')
+
+    def iter_pages(self):
+        """Yield the reply of each page in turn.
+        """
+        reply = self._first_reply
+        if reply is None:
+            reply = self._fetch(self._request)
+        pending = None
+        try:
+            while reply is not None:
+                self.pages += 1
+                request = self._next_request(reply)
+                if request is not None and self._prefetch:
+                    pending = prefetch_executor().submit(
+                        pynos.instrumentation.inherit(self._fetch), request)
+                yield reply
+                if request is None:
+                    return
+                if pending is not None:
+                    reply, pending = pending.result(), None
+                else:
+                    reply = self._fetch(request)
+        finally:
+            # Abandoned early: drop the page fetched ahead.
+            if pending is not None:
+                pending.cancel()
+
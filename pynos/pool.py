@@ -0,0 +1,330 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+from contextlib import contextmanager
+import logging
+import threading
+import time
+
+import pynos.device
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+def default_pool():
+    """Return the process-wide ``SessionPool``, creating it on first use.
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = SessionPool()
+        return _default_pool
+
+
+class SessionPool(object):
+    """
+    SessionPool keeps NETCONF sessions open between uses.
+
+    Sessions are keyed by (host, port, user).  A released ``Device`` stays
+    connected and is handed out again on the next ``acquire`` for the same
+    key, skipping SSH key exchange, the NETCONF hello and firmware
+    detection.  Devices are created with ``auto_reconnect`` so a session
+    dropped by the switch is re-established on the next call.
+
+    Attributes:
+        None
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Args:
+            max_idle (float): Seconds an unused session is kept before it is
+                closed.  Default: 300.
+            keepalive_interval (float): Sessions idle for longer than this
+                are probed with a cheap RPC before being handed out, and by
+                ``keepalive()``.  Default: 60.
+            max_per_key (int): Maximum idle sessions kept per key.
+                Default: 4.
+            background (bool): Start a daemon thread that calls
+                ``keepalive()`` every `keepalive_interval` seconds.
+                Default: False.
+            All other keyword arguments are defaults for every ``Device``.
+
+        Returns:
+            Instance of the SessionPool object.
+
+        Raises:
+            None
+
+        Examples:
+            >>> import pynos.pool
+            >>> pool = pynos.pool.SessionPool(max_idle=120)
+            >>> conn = ('10.24.39.211', '22')
+            >>> auth = ('admin', 'password')
+            >>> for _ in range(3):
+            ...     with pool.device(conn=conn, auth=auth) as dev:
+            ...         output = dev.interface.vlans
+            >>> pool.stats['hits'], pool.stats['misses']
+            (2, 1)
+            >>> pool.close()
+        """
+        self._max_idle = kwargs.pop('max_idle', 300)
+        self._keepalive_interval = kwargs.pop('keepalive_interval', 60)
+        self._max_per_key = kwargs.pop('max_per_key', 4)
+        background = kwargs.pop('background', False)
+        self._device_defaults = kwargs
+        self._lock = threading.Lock()
+        self._idle = {}
+        self._in_use = {}
+        self._stats = dict(hits=0, misses=0, evictions=0, probe_failures=0,
+                           connects=0, connect_time_total=0.0,
+                           connect_time_max=0.0, reconnects=0)
+        self._closed = threading.Event()
+        if background:
+            thread = threading.Thread(target=self._keepalive_loop,
+                                      name='pynos-session-pool')
+            thread.daemon = True
+            thread.start()
+
+    @staticmethod
+    def key(device_kwargs):
+        """Pool key of a set of ``Device`` keyword arguments.
+
+        Returns:
+            tuple: (host, port, user)
+        """
+        conn = device_kwargs['conn']
+        auth = device_kwargs.get('auth', (None, None))
+        return (conn[0], str(conn[1]), auth[0])
+
+    @property
+    def stats(self):
+        """dict: pool counters.
+
+        hits, misses: acquisitions served from an idle session or by
+        connecting.  evictions: idle sessions closed for age or size.
+        probe_failures: idle sessions found dead.  connects,
+        connect_time_total, connect_time_max: new sessions and the seconds
+        spent connecting and detecting firmware.  reconnects: sessions
+        transparently re-established during a call.  idle, in_use: current
+        session counts.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['reconnects'] += sum(dev._reconnects
+                                       for dev in self._all_devices())
+            stats['idle'] = sum(len(v) for v in self._idle.values())
+            stats['in_use'] = len(self._in_use)
+        return stats
+
+    def _all_devices(self):
+        for entries in self._idle.values():
+            for dev, _ in entries:
+                yield dev
+        for dev in self._in_use:
+            yield dev
+
+    def acquire(self, **kwargs):
+        """Return a connected ``Device``, reusing an idle session if possible.
+
+        Args:
+            Keyword arguments of ``pynos.device.Device``, merged over the
+            pool defaults.
+
+        Returns:
+            pynos.device.Device
+
+        Raises:
+            DeviceCommError, ncclient exceptions: if connecting fails.
+        """
+        device_kwargs = dict(self._device_defaults)
+        device_kwargs.update(kwargs)
+        device_kwargs['auto_reconnect'] = True
+        key = self.key(device_kwargs)
+        while True:
+            with self._lock:
+                entries = self._idle.get(key)
+                if not entries:
+                    break
+                dev, last_used = entries.pop()
+            if self._alive(dev, time.time() - last_used):
+                with self._lock:
+                    self._stats['hits'] += 1
+                    self._in_use[dev] = key
+                return dev
+            self._discard(dev)
+            with self._lock:
+                self._stats['probe_failures'] += 1
+
+        start = time.time()
+        dev = pynos.device.Device(**device_kwargs)
+        elapsed = time.time() - start
+        with self._lock:
+            self._stats['misses'] += 1
+            self._stats['connects'] += 1
+            self._stats['connect_time_total'] += elapsed
+            self._stats['connect_time_max'] = max(
+                self._stats['connect_time_max'], elapsed)
+            self._in_use[dev] = key
+        return dev
+
+    def release(self, dev):
+        """Return `dev` to the pool for reuse.
+
+        A device that is no longer connected is dropped.
+        """
+        with self._lock:
+            key = self._in_use.pop(dev, None)
+        if key is None or self._closed.is_set() or not self._connected(dev):
+            self._discard(dev)
+            return
+        with self._lock:
+            entries = self._idle.setdefault(key, [])
+            entries.append((dev, time.time()))
+            overflow = entries[:-self._max_per_key]
+            del entries[:-self._max_per_key]
+            self._stats['evictions'] += len(overflow)
+        for old, _ in overflow:
+            self._discard(old)
+
+    @contextmanager
+    def device(self, **kwargs):
+        """Context manager around ``acquire`` and ``release``.
+
+        A device whose block raises ``DeviceCommError`` is not reused; it
+        is released whatever else the block raises.
+        """
+        dev = self.acquire(**kwargs)
+        broken = False
+        try:
+            yield dev
+        except pynos.device.DeviceCommError:
+            broken = True
+            raise
+        finally:
+            if broken:
+                with self._lock:
+                    self._in_use.pop(dev, None)
+                self._discard(dev)
+            else:
+                self.release(dev)
+
+    def evict_idle(self):
+        """Close sessions that have been idle for longer than `max_idle`.
+
+        Returns:
+            int: number of sessions closed.
+        """
+        now = time.time()
+        expired = []
+        with self._lock:
+            for key, entries in list(self._idle.items()):
+                keep = [(dev, used) for dev, used in entries
+                        if now - used < self._max_idle]
+                expired.extend(dev for dev, used in entries
+                               if now - used >= self._max_idle)
+                if keep:
+                    self._idle[key] = keep
+                else:
+                    del self._idle[key]
+            self._stats['evictions'] += len(expired)
+        for dev in expired:
+            self._discard(dev)
+        return len(expired)
+
+    def keepalive(self):
+        """Evict expired sessions and probe the remaining idle ones.
+
+        Probing keeps the SSH session from being closed by the switch and
+        drops sessions that died while idle.  A session is taken out of the
+        pool while it is probed, so ``acquire`` cannot hand it out then.
+        """
+        self.evict_idle()
+        with self._lock:
+            idle = [(key, dev) for key, entries in self._idle.items()
+                    for dev, _ in entries]
+        for key, dev in idle:
+            with self._lock:
+                entries = self._idle.get(key, [])
+                entry = next((e for e in entries if e[0] is dev), None)
+                if entry is None:
+                    # Acquired or evicted since the list was taken.
+                    continue
+                entries.remove(entry)
+                if not entries:
+                    del self._idle[key]
+            if self._alive(dev, self._keepalive_interval):
+                with self._lock:
+                    if not self._closed.is_set():
+                        entries = self._idle.setdefault(key, [])
+                        entries.append(entry)
+                        entries.sort(key=lambda item: item[1])
+                        continue
+            else:
+                with self._lock:
+                    self._stats['probe_failures'] += 1
+            self._discard(dev)
+
+    def close(self):
+        """Close every idle session and stop the keepalive thread.
+
+        Devices still in use are closed when released.
+        """
+        self._closed.set()
+        with self._lock:
+            idle = [dev for entries in self._idle.values()
+                    for dev, _ in entries]
+            self._idle.clear()
+        for dev in idle:
+            self._discard(dev)
+
+    def _keepalive_loop(self):
+        while not self._closed.wait(self._keepalive_interval):
+            try:
+                self.keepalive()
+            except Exception as error:
+                logging.error(error)
+
+    @staticmethod
+    def _connected(dev):
+        try:
+            return dev._test or dev.connection
+        except Exception:
+            return False
+
+    def _alive(self, dev, idle_for):
+        if not self._connected(dev):
+            return False
+        if idle_for < self._keepalive_interval or dev._test:
+            return True
+        try:
+            dev.firmware_version
+            return True
+        except Exception as error:
+            logging.info('Dropping idle session to %s: %s', dev._conn[0],
+                         error)
+            return False
+
+    def _discard(self, dev):
+        with self._lock:
+            self._stats['reconnects'] += dev._reconnects
+        try:
+            if not dev._test and dev.connection:
+                dev.close()
+        except Exception as error:
+            logging.info('Error closing session to %s: %s', dev._conn[0],
+                         error)
@@ -0,0 +1,245 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Compact record types for operational tables.
+
+Devices created with ``records=True`` return these instead of one ``dict``
+per row.  A record stores its values in ``__slots__`` and shares repeated
+values such as interface types, VLAN ids and states, so snapshots of many
+switches take a fraction of the memory of the equivalent dicts.  Records
+keep the dict interface (``row['interface-name']``, ``get``, ``keys``,
+``items``) for existing callers, and expose every field as an attribute
+with dashes replaced by underscores (``row.interface_name``).
+"""
+import sys
+
+try:
+    intern_value = sys.intern
+except AttributeError:  # Python 2
+    intern_value = intern  # noqa: F821
+
+
+class Record(object):
+    """Base class of the record types.  Use ``record_type`` to make one.
+    """
+    __slots__ = ()
+    _keys = ()
+    _interned = frozenset()
+
+    def __init__(self, *args, **kwargs):
+        if len(args) > len(self.__slots__):
+            raise TypeError('%s takes at most %d values' %
+                            (type(self).__name__, len(self.__slots__)))
+        values = dict(zip(self.__slots__, args))
+        for key, value in kwargs.items():
+            values[key.replace('-', '_')] = value
+        for slot in self.__slots__:
+            value = values.pop(slot, None)
+            if slot in self._interned and isinstance(value, str):
+                value = intern_value(value)
+            object.__setattr__(self, slot, value)
+        if values:
+            raise TypeError('%s has no field %r' %
+                            (type(self).__name__, sorted(values)[0]))
+
+    @classmethod
+    def from_dict(cls, values):
+        """Build a record from a row ``dict`` keyed by the field names.
+        """
+        return cls(**values)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('%s is read-only' % type(self).__name__)
+
+    def __reduce__(self):
+        return (type(self), tuple(self.values()))
+
+    def __getitem__(self, key):
+        try:
+            slot = key.replace('-', '_')
+        except AttributeError:
+            raise KeyError(key)
+        if slot not in self.__slots__:
+            # Methods and class attributes are not fields.
+            raise KeyError(key)
+        return getattr(self, slot)
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __eq__(self, other):
+        if isinstance(other, Record):
+            return (type(self) is type(other) and
+                    self.values() == other.values())
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '%s(%s)' % (type(self).__name__, ', '.join(
+            '%s=%r' % (slot, getattr(self, slot)) for slot in self.__slots__))
+
+    def get(self, key, default=None):
+        """Dict-style lookup of a field by its key."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        """list: the field keys, as in the ``dict`` form of the row."""
+        return list(self._keys)
+
+    def values(self):
+        """list: the field values in field order."""
+        return [getattr(self, slot) for slot in self.__slots__]
+
+    def items(self):
+        """list: (key, value) pairs, as in the ``dict`` form of the row."""
+        return list(zip(self._keys, self.values()))
+
+    def to_dict(self):
+        """dict: the row as returned without ``records``.  Nested records
+        are converted too.
+        """
+        return dict((key, _plain(value)) for key, value in self.items())
+
+
+def _plain(value):
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    return value
+
+
+def record_type(name, keys, interned=()):
+    """Create a record type.
+
+    Args:
+        name (str): Class name.
+        keys (list): Field keys, as used in the ``dict`` form of the row.
+        interned (list): Keys of fields whose values repeat across rows and
+            are shared between records.
+
+    Returns:
+        A ``Record`` subclass.
+
+    Examples:
+        >>> import pynos.records
+        >>> Port = pynos.records.record_type(
+        ...     'Port', ['interface-type', 'interface-name'],
+        ...     interned=['interface-type'])
+        >>> port = Port('tengigabitethernet', '1/0/1')
+        >>> port['interface-name'], port.interface_type
+        ('1/0/1', 'tengigabitethernet')
+    """
+    slots = tuple(key.replace('-', '_') for key in keys)
+    namespace = dict(__slots__=slots, _keys=tuple(keys),
+                     _interned=frozenset(key.replace('-', '_')
+                                         for key in interned),
+                     __module__=__name__)
+    return type(name, (Record,), namespace)
+
+
+def build(cls, values, enabled=True):
+    """Return the row `values` as a `cls` record if `enabled`.
+
+    Feature methods call this for every row so that devices without
+    ``records`` keep returning plain dicts.
+
+    Args:
+        cls: Record type of the row.
+        values (dict): The row.
+        enabled (bool): Whether records were requested.
+
+    Returns:
+        A `cls` instance, or `values` unchanged.
+    """
+    if enabled:
+        return cls.from_dict(values)
+    return values
+
+
+MacTableEntry = record_type(
+    'MacTableEntry', ['mac_address', 'interface', 'state', 'vlan', 'type'],
+    interned=['interface', 'state', 'vlan', 'type'])
+
+InterfaceDetail = record_type(
+    'InterfaceDetail',
+    ['interface-type', 'interface-name', 'interface-role', 'if-name',
+     'interface-state', 'interface-proto-state', 'interface-mac'],
+    interned=['interface-type', 'interface-role', 'interface-state',
+              'interface-proto-state'])
+
+VlanPort = record_type(
+    'VlanPort', ['interface-type', 'interface-name', 'tag'],
+    interned=['interface-type', 'interface-name', 'tag'])
+
+Vlan = record_type(
+    'Vlan',
+    ['interface-name', 'vlan-state', 'vlan-id', 'vlan-type', 'interface'],
+    interned=['vlan-state', 'vlan-id', 'vlan-type'])
+
+PortChannelMember = record_type(
+    'PortChannelMember',
+    ['rbridge-id', 'interface-type', 'interface-name', 'actor_port', 'sync'],
+    interned=['rbridge-id', 'interface-type', 'sync'])
+
+PortChannel = record_type(
+    'PortChannel',
+    ['interface-name', 'interfaces', 'aggregator_id', 'aggregator_type',
+     'is_vlag', 'aggregator_mode', 'system_priority', 'actor_system_id',
+     'partner-oper-priority', 'partner-system-id', 'admin-key', 'oper-key',
+     'partner-oper-key', 'rx-link-count', 'tx-link-count', 'individual-agg',
+     'ready-agg'],
+    interned=['aggregator_type', 'is_vlag', 'aggregator_mode',
+              'system_priority', 'actor_system_id', 'partner-oper-priority',
+              'rx-link-count', 'tx-link-count', 'individual-agg',
+              'ready-agg'])
+
+LLDPNeighbor = record_type(
+    'LLDPNeighbor',
+    ['local-int-name', 'local-int-mac', 'remote-int-name', 'remote-int-mac',
+     'remote-chassis-id', 'remote-system-name'],
+    interned=['remote-chassis-id', 'remote-system-name'])
+
+LLDPNeighborDetail = record_type(
+    'LLDPNeighborDetail',
+    ['local-int-name', 'local-int-mac', 'remote-int-name', 'remote-int-mac',
+     'remote-chassis-id', 'remote-system-name', 'remote-system-description',
+     'remote-management-address'],
+    interned=['remote-chassis-id', 'remote-system-name',
+              'remote-system-description', 'remote-management-address'])
+
+TrillLink = record_type(
+    'TrillLink',
+    ['source-rbridgeid', 'source-switch-wwn', 'dest-rbridgeid',
+     'source-interface', 'dest-interface', 'link-cost', 'link-costcount'],
+    interned=['source-rbridgeid', 'source-switch-wwn', 'dest-rbridgeid',
+              'link-cost', 'link-costcount'])
@@ -0,0 +1,296 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Adaptive limit of the RPCs in flight to one switch.
+"""
+import collections
+import threading
+import time
+
+import ncclient.operations
+import ncclient.transport
+
+_schedulers = {}
+_schedulers_lock = threading.Lock()
+
+# Failures that mean the switch is overloaded, rather than refusing a call.
+_OVERLOAD = (ncclient.operations.TimeoutExpiredError,
+             ncclient.transport.TransportError)
+
+
+def switch_scheduler(host, port='22', **kwargs):
+    """Return the process-wide ``Scheduler`` of a switch, creating it with
+    `kwargs` on first use.
+
+    Args:
+        host (str): IP or host name of the switch.
+        port (str): NETCONF port.  Default: 22.
+
+    Returns:
+        Scheduler
+    """
+    key = '%s:%s' % (host, port)
+    with _schedulers_lock:
+        if key not in _schedulers:
+            _schedulers[key] = Scheduler(**kwargs)
+        return _schedulers[key]
+
+
+class SchedulerTimeout(Exception):
+    """Exception for calls that waited too long for a free slot.
+    """
+    pass
+
+
+class Ticket(object):
+    """A slot held for one RPC.
+
+    Release it once the reply has arrived, or use it as a context manager
+    around the RPC.  Releasing a ticket twice has no effect.
+
+    Attributes:
+        key: Kind of the RPC, whose latencies are compared.
+        started (float): Time the slot was granted.
+    """
+    __slots__ = ('key', 'started', '_scheduler', '_done')
+
+    def __init__(self, scheduler, key, started):
+        self.key = key
+        self.started = started
+        self._scheduler = scheduler
+        self._done = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exctype, excinst, exctb):
+        self.release(excinst)
+
+    def release(self, error=None):
+        """Free the slot and adapt the limit to the round trip.
+
+        Args:
+            error (Exception): What the RPC raised, if anything.  Timeouts
+                and transport errors count as overload; other errors, such
+                as an ``RPCError``, as a normal reply.
+        """
+        if not self._done:
+            self._done = True
+            self._scheduler._release(self, error, sample=True)
+
+    def cancel(self):
+        """Free the slot of an RPC whose reply will not be waited for."""
+        if not self._done:
+            self._done = True
+            self._scheduler._release(self, None, sample=False)
+
+
+class Scheduler(object):
+    """
+    Scheduler limits the RPCs in flight to one switch and adapts the limit
+    to the round-trip times it observes.
+
+    The limit follows AIMD: it grows by one slot per window of replies
+    that come back fast while at least half the slots are in use, and is
+    cut by `backoff` when a round trip takes more than `tolerance` times
+    the baseline of its kind plus `slack`, or the switch times out or
+    drops the session.  The baseline is the fastest round trip of the kind
+    in the last one or two `baseline_window` periods.  The limit is cut at
+    most once per round trip: replies to requests sent before a cut do not
+    cut it again.
+
+    Calls waiting for a slot are queued per caller, by default the calling
+    thread, and callers are served in turn, so one thread with many calls
+    cannot starve the others.
+
+    Several devices connected to the same switch share its scheduler when
+    created with ``scheduler=True``; see ``switch_scheduler``.
+
+    Attributes:
+        limit (float): Current limit of RPCs in flight.
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Args:
+            initial_limit (int): Starting limit.  Default: 4.
+            min_limit (int): Lowest limit.  Default: 1.
+            max_limit (int): Highest limit.  Default: 32.
+            backoff (float): Factor the limit is cut by.  Default: 0.7.
+            tolerance (float): Round trips longer than this multiple of the
+                baseline are a sign of overload.  Default: 2.0.
+            slack (float): Seconds a round trip may exceed the tolerance
+                by, for the jitter of the session: ncclient picks up
+                requests and replies every 0.1 seconds.  Default: 0.1.
+            baseline_window (float): Seconds after which a baseline round
+                trip starts to age out.  Default: 60.
+            queue_timeout (float): Seconds a call may wait for a slot
+                before ``SchedulerTimeout`` is raised, or None to wait for
+                as long as it takes.  Default: None.
+            clock (function): Returns the current time in seconds.
+                Default: ``time.time``.
+
+        Returns:
+            Instance of the Scheduler object.
+
+        Raises:
+            ValueError: if the limits are not ordered.
+
+        Examples:
+            >>> import pynos.device
+            >>> import pynos.scheduler
+            >>> conn = ('10.24.39.211', '22')
+            >>> auth = ('admin', 'password')
+            >>> with pynos.device.Device(conn=conn, auth=auth,
+            ...                          scheduler=True) as dev:
+            ...     dev.interface.interface_detail
+            ...     print(dev.scheduler.stats()['in_flight'])
+            0
+        """
+        self.min_limit = kwargs.pop('min_limit', 1)
+        self.max_limit = kwargs.pop('max_limit', 32)
+        self.limit = float(kwargs.pop('initial_limit', 4))
+        if not self.min_limit <= self.limit <= self.max_limit:
+            raise ValueError('initial_limit must be between min_limit and '
+                             'max_limit.')
+        self.backoff = kwargs.pop('backoff', 0.7)
+        self.tolerance = kwargs.pop('tolerance', 2.0)
+        self.slack = kwargs.pop('slack', 0.1)
+        self.baseline_window = kwargs.pop('baseline_window', 60)
+        self.queue_timeout = kwargs.pop('queue_timeout', None)
+        self._clock = kwargs.pop('clock', time.time)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        # Waiters of each caller, callers in the order they are served.
+        self._queues = collections.OrderedDict()
+        self._queued = 0
+        # Fastest round trip of each kind: [current, previous, rotated at].
+        self._baselines = {}
+        self._cut_at = 0.0
+        self._completed = 0
+        self._cuts = 0
+        self._timeouts = 0
+        self._rtt = None
+
+    def acquire(self, key=None, caller=None, blocking=True):
+        """Wait for a slot for one RPC.
+
+        Args:
+            key: Kind of the RPC.  Round trips are only compared with
+                those of the same kind.
+            caller: Whom the call is made for; calls of different callers
+                are served in turn.  Default: the calling thread.
+            blocking (bool): Wait for a slot.  Default: True.
+
+        Returns:
+            Ticket: The slot, or ``None`` if `blocking` is False and none
+            is free.
+
+        Raises:
+            SchedulerTimeout: if no slot was free within `queue_timeout`.
+        """
+        with self._lock:
+            if not self._queued and self._in_flight < int(self.limit):
+                self._in_flight += 1
+                return Ticket(self, key, self._clock())
+            if not blocking:
+                return None
+            if caller is None:
+                caller = threading.current_thread().ident
+            waiter = [threading.Event(), key, None]
+            self._queues.setdefault(caller, collections.deque()).append(
+                waiter)
+            self._queued += 1
+        if waiter[0].wait(self.queue_timeout):
+            return waiter[2]
+        with self._lock:
+            if waiter[2] is not None:
+                # Granted while timing out.
+                return waiter[2]
+            queue = self._queues[caller]
+            queue.remove(waiter)
+            if not queue:
+                del self._queues[caller]
+            self._queued -= 1
+        raise SchedulerTimeout('No free slot to the switch within %s '
+                               'seconds.' % self.queue_timeout)
+
+    def stats(self):
+        """Return the state and counters of the scheduler.
+
+        Returns:
+            dict: limit, in_flight, queued, completed (replies), cuts (of
+            the limit), timeouts (overload errors), rtt (smoothed round
+            trip in seconds, or None).
+        """
+        with self._lock:
+            return {'limit': self.limit, 'in_flight': self._in_flight,
+                    'queued': self._queued, 'completed': self._completed,
+                    'cuts': self._cuts, 'timeouts': self._timeouts,
+                    'rtt': self._rtt}
+
+    def _release(self, ticket, error, sample):
+        now = self._clock()
+        with self._lock:
+            busy = 2 * self._in_flight >= int(self.limit) or self._queued
+            self._in_flight -= 1
+            if sample:
+                self._adapt(ticket, now, error, busy)
+            self._grant()
+
+    def _adapt(self, ticket, now, error, busy):
+        if isinstance(error, _OVERLOAD):
+            self._timeouts += 1
+            self._cut(ticket, now)
+            return
+        rtt = now - ticket.started
+        self._completed += 1
+        self._rtt = rtt if self._rtt is None else 0.8 * self._rtt + 0.2 * rtt
+        baseline = self._baseline(ticket.key, rtt, now)
+        if rtt > baseline * self.tolerance + self.slack:
+            self._cut(ticket, now)
+        elif busy:
+            self.limit = min(self.limit + 1.0 / int(self.limit),
+                             self.max_limit)
+
+    def _baseline(self, key, rtt, now):
+        baseline = self._baselines.get(key)
+        if baseline is None:
+            baseline = self._baselines[key] = [rtt, rtt, now]
+        elif now - baseline[2] > self.baseline_window:
+            baseline[:] = [rtt, baseline[0], now]
+        baseline[0] = min(baseline[0], rtt)
+        return min(baseline[0], baseline[1])
+
+    def _cut(self, ticket, now):
+        if ticket.started < self._cut_at:
+            # Sent before the last cut; its delay is already accounted for.
+            return
+        self._cut_at = now
+        self._cuts += 1
+        self.limit = max(self.limit * self.backoff, self.min_limit)
+
+    def _grant(self):
+        """Hand free slots to the waiters, one caller after the other."""
+        while self._queues and self._in_flight < int(self.limit):
+            caller, queue = self._queues.popitem(last=False)
+            waiter = queue.popleft()
+            if queue:
+                self._queues[caller] = queue
+            self._queued -= 1
+            self._in_flight += 1
+            waiter[2] = Ticket(self, waiter[1], self._clock())
+            waiter[0].set()
@@ -0,0 +1,599 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Local NETCONF-over-SSH stand-in for a VDX switch.
+
+Usage:
+    python -m pynos.simulator [--port N] [--interfaces N] [--latency S]
+"""
+from __future__ import print_function
+import argparse
+import collections
+import socket
+import threading
+import time
+import xml.etree.ElementTree as ET
+
+import lxml.etree
+import paramiko
+
+import pynos.mirror
+
+NETCONF_NAMESPACE = 'urn:ietf:params:xml:ns:netconf:base:1.0'
+_EOM = b']]>]]>'
+_INTERFACE_EXT = 'urn:brocade.com:mgmt:brocade-interface-ext'
+_OK = ('get-config', 'get', 'edit-config', 'lock', 'unlock', 'commit',
+       'discard-changes', 'validate', 'copy-config', 'delete-config',
+       'close-session')
+_host_key = []
+
+
+def _key():
+    # Generating a key takes a while; one serves every simulator.
+    if not _host_key:
+        _host_key.append(paramiko.ECDSAKey.generate())
+    return _host_key[0]
+
+
+class Simulator(object):
+    """
+    Simulator serves NETCONF over SSH on a local port, the way a VDX
+    switch answers pynos.
+
+    The operational RPCs that pynos uses for its tables
+    (``show-firmware-version``, ``get-interface-detail``,
+    ``get-ip-interface``, ``get-vlan-brief``, ``get-port-channel-detail``,
+    ``get-mac-address-table``, ``get-lldp-neighbor-detail``, ``get-arp``,
+    ``show-vcs`` and ``show-system-uptime``) get replies generated from the
+    table sizes, split into pages with ``has-more`` where NOS pages them.
+    ``edit-config`` is merged into a running configuration that
+    ``get-config`` and ``get`` with a subtree filter read back.  Other
+    datastore operations (``lock``, ``commit``, ...) just succeed, and
+    unknown RPCs get an ``operation-not-supported`` error.  Each RPC
+    sleeps for its latency before the reply is sent; the RPCs of a session
+    are served one at a time, as on the device.
+
+    Attributes:
+        calls (Counter): Number of RPCs served, by operation name.
+        sessions (int): Number of NETCONF sessions opened.
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Args:
+            host (str): Address to listen on.  Default: 127.0.0.1.
+            port (int): Port to listen on.  Default: 0, any free port.
+            auth (tuple): Accepted username and password.  Default:
+                ('admin', 'password').
+            firmware (str): NOS version reported.  Default: '6.0.1'.
+            interfaces (int): Number of tengigabitethernet ports.  Default:
+                48.
+            ports_per_rbridge (int): Ports of each rbridge.  Default: 48.
+            vlans (int): Number of VLANs.  Default: 100.
+            port_channels (int): Number of port-channels, two ports each.
+                Default: 16.
+            macs (int): Number of MAC table entries.  Default: 1000.
+            lldp_neighbors (int): Number of LLDP neighbors.  Default: one
+                per port.
+            arp (int): Number of ARP entries.  Default: 1000.
+            page_size (int): Rows per page of the paged tables.  Default:
+                100.
+            latency (float): Seconds each RPC takes.  Default: 0.
+            latencies (dict): Seconds taken by some RPCs, by operation
+                name, instead of `latency`.  Ex. {'edit-config': 0.05}.
+
+        Returns:
+            Instance of the Simulator object.
+
+        Raises:
+            None
+
+        Examples:
+            >>> import pynos.device
+            >>> import pynos.simulator
+            >>> with pynos.simulator.Simulator(interfaces=960,
+            ...                                latency=0.005) as sim:
+            ...     with pynos.device.Device(conn=sim.conn,
+            ...                              auth=sim.auth) as dev:
+            ...         print(len(dev.interface.interface_detail))
+            ...     print(sim.calls['get-interface-detail'])
+            960
+            10
+        """
+        self.host = kwargs.pop('host', '127.0.0.1')
+        self.port = kwargs.pop('port', 0)
+        self.auth = kwargs.pop('auth', ('admin', 'password'))
+        self.firmware = kwargs.pop('firmware', '6.0.1')
+        self.interfaces = kwargs.pop('interfaces', 48)
+        self.ports_per_rbridge = kwargs.pop('ports_per_rbridge', 48)
+        self.vlans = kwargs.pop('vlans', 100)
+        self.port_channels = kwargs.pop('port_channels', 16)
+        self.macs = kwargs.pop('macs', 1000)
+        self.lldp_neighbors = kwargs.pop('lldp_neighbors', self.interfaces)
+        self.arp = kwargs.pop('arp', 1000)
+        self.page_size = kwargs.pop('page_size', 100)
+        self.latency = kwargs.pop('latency', 0.0)
+        self.latencies = kwargs.pop('latencies', {})
+        self.calls = collections.Counter()
+        self.sessions = 0
+        self._lock = threading.Lock()
+        self._running = self._initial_config()
+        self._socket = None
+        self._threads = []
+        self._transports = []
+        self._stopped = threading.Event()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exctype, excinst, exctb):
+        self.stop()
+
+    @property
+    def conn(self):
+        """tuple: (host, port) to pass to ``pynos.device.Device``."""
+        return (self.host, str(self.port))
+
+    def start(self):
+        """Listen and serve sessions in background threads.
+
+        Returns:
+            None
+        """
+        self._stopped.clear()
+        _key()
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind((self.host, self.port))
+        self.port = self._socket.getsockname()[1]
+        self._socket.listen(64)
+        self._spawn(self._accept)
+
+    def stop(self):
+        """Stop listening and close the open sessions.
+
+        Returns:
+            None
+        """
+        self._stopped.set()
+        if self._socket is not None:
+            try:
+                # Wake up accept().
+                socket.create_connection((self.host, self.port), 1).close()
+            except socket.error:
+                pass
+            self._socket.close()
+            self._socket = None
+        with self._lock:
+            transports, self._transports = self._transports, []
+        for transport in transports:
+            transport.close()
+        for thread in self._threads:
+            thread.join(5)
+        self._threads = []
+
+    def running_config(self):
+        """Return a copy of the running configuration.
+
+        Returns:
+            Element: The ``data`` element.
+        """
+        with self._lock:
+            return lxml.etree.fromstring(lxml.etree.tostring(self._running))
+
+    def reply(self, request):
+        """Answer an RPC the way a session would, without SSH.
+
+        Args:
+            request: The operation, as an ElementTree or lxml element or
+                serialized XML.
+
+        Returns:
+            bytes: The ``rpc-reply``.
+        """
+        if isinstance(request, lxml.etree._Element):
+            request = lxml.etree.tostring(request)
+        elif not isinstance(request, bytes):
+            request = ET.tostring(request)
+        message = ('<rpc xmlns="%s" message-id="1">' % NETCONF_NAMESPACE
+                   ).encode('utf-8') + request + b'</rpc>'
+        return self._handle(message)[0]
+
+    def _spawn(self, target, *args):
+        thread = threading.Thread(target=target, args=args)
+        thread.daemon = True
+        thread.start()
+        self._threads.append(thread)
+
+    def _accept(self):
+        while not self._stopped.is_set():
+            try:
+                client, _ = self._socket.accept()
+            except socket.error:
+                return
+            if self._stopped.is_set():
+                client.close()
+                return
+            self._spawn(self._serve, client)
+
+    def _serve(self, client):
+        transport = paramiko.Transport(client)
+        transport.add_server_key(_key())
+        with self._lock:
+            self._transports.append(transport)
+        server = _SSHServer(self.auth)
+        try:
+            transport.start_server(server=server)
+            channel = transport.accept(30)
+            if channel is None or not server.netconf.wait(30):
+                return
+            with self._lock:
+                self.sessions += 1
+                session_id = self.sessions
+            self._session(channel, session_id)
+        except (paramiko.SSHException, EOFError, socket.error):
+            pass
+        finally:
+            transport.close()
+
+    def _session(self, channel, session_id):
+        channel.sendall(
+            ('<?xml version="1.0" encoding="UTF-8"?>'
+             '<hello xmlns="%s"><capabilities>'
+             '<capability>urn:ietf:params:netconf:base:1.0</capability>'
+             '<capability>urn:ietf:params:netconf:capability:'
+             'writable-running:1.0</capability>'
+             '<capability>urn:ietf:params:netconf:capability:candidate:1.0'
+             '</capability></capabilities>'
+             '<session-id>%d</session-id></hello>'
+             % (NETCONF_NAMESPACE, session_id)).encode('utf-8') + _EOM)
+        buffered = b''
+        hello = True
+        while not self._stopped.is_set():
+            data = channel.recv(65536)
+            if not data:
+                return
+            buffered += data
+            while _EOM in buffered:
+                message, buffered = buffered.split(_EOM, 1)
+                if hello:
+                    hello = False
+                    continue
+                reply, close = self._handle(message)
+                channel.sendall(reply + _EOM)
+                if close:
+                    return
+
+    def _handle(self, message):
+        """Return the reply to one ``rpc`` message, and whether it closes
+        the session."""
+        rpc = lxml.etree.fromstring(message.strip())
+        message_id = rpc.get('message-id', '')
+        operation = rpc[0]
+        name = lxml.etree.QName(operation).localname
+        with self._lock:
+            self.calls[name] += 1
+        delay = self.latencies.get(name, self.latency)
+        if delay:
+            time.sleep(delay)
+        handler = getattr(self, '_rpc_' + name.replace('-', '_'), None)
+        if handler is not None:
+            body = handler(operation)
+        elif name in _OK:
+            body = '<ok/>'
+        else:
+            body = ('<rpc-error><error-type>protocol</error-type>'
+                    '<error-tag>operation-not-supported</error-tag>'
+                    '<error-severity>error</error-severity>'
+                    '<error-message>%s is not supported</error-message>'
+                    '</rpc-error>' % name)
+        reply = ('<?xml version="1.0" encoding="UTF-8"?>'
+                 '<rpc-reply xmlns="%s" message-id="%s">%s</rpc-reply>'
+                 % (NETCONF_NAMESPACE, message_id, body))
+        return reply.encode('utf-8'), name == 'close-session'
+
+    # Configuration.
+
+    def _initial_config(self):
+        ports = ''.join('<tengigabitethernet><name>%s</name>'
+                        '<shutdown/></tengigabitethernet>'
+                        % self._port(i) for i in range(self.interfaces))
+        vlans = ''.join('<vlan><name>%d</name></vlan>' % vlan
+                        for vlan in range(1, self.vlans + 1))
+        return lxml.etree.fromstring(
+            '<data xmlns="%s">'
+            '<interface xmlns="urn:brocade.com:mgmt:brocade-interface">%s'
+            '</interface><interface-vlan xmlns="urn:brocade.com:mgmt:'
+            'brocade-interface"><interface>%s</interface></interface-vlan>'
+            '</data>' % (NETCONF_NAMESPACE, ports, vlans))
+
+    def _rpc_edit_config(self, operation):
+        config = operation.find('{%s}config' % NETCONF_NAMESPACE)
+        if config is None:
+            config = operation.find('config')
+        with self._lock:
+            for container in config if config is not None else []:
+                pynos.mirror._merge(self._running, container)
+        return '<ok/>'
+
+    def _rpc_get_config(self, operation):
+        spec = operation.find('{%s}filter' % NETCONF_NAMESPACE)
+        data = lxml.etree.Element('data')
+        with self._lock:
+            if spec is None:
+                data.extend(lxml.etree.fromstring(
+                    lxml.etree.tostring(self._running)))
+            else:
+                for selector in spec:
+                    data.extend(pynos.mirror._filter(self._running,
+                                                     selector))
+        return lxml.etree.tostring(data).decode('utf-8')
+
+    _rpc_get = _rpc_get_config
+
+    # Operational tables.
+
+    def _port(self, index):
+        return '%d/0/%d' % (index // self.ports_per_rbridge + 1,
+                            index % self.ports_per_rbridge + 1)
+
+    def _page(self, count, start):
+        end = min(count, start + self.page_size)
+        more = 'true' if end < count else 'false'
+        return range(start, end), more
+
+    def _rpc_show_firmware_version(self, operation):
+        return ('<show-firmware-version xmlns="urn:brocade.com:mgmt:'
+                'brocade-firmware-ext"><switchid>1</switchid>'
+                '<os-name>Network Operating System Software</os-name>'
+                '<os-version>%s</os-version><copy-right-info>Copyright (c) '
+                'Brocade Communications Systems, Inc.</copy-right-info>'
+                '</show-firmware-version>' % self.firmware)
+
+    def _rpc_show_system_uptime(self, operation):
+        return ('<show-system-uptime xmlns="urn:brocade.com:mgmt:'
+                'brocade-system"><rbridge-id>1</rbridge-id><days>1</days>'
+                '<hours>2</hours><minutes>3</minutes><seconds>4</seconds>'
+                '</show-system-uptime>')
+
+    def _rpc_get_interface_detail(self, operation):
+        start = 0
+        last = operation.findtext('.//{%s}interface-name' % _INTERFACE_EXT)
+        if last:
+            names = [self._port(i) for i in range(self.interfaces)]
+            start = names.index(last) + 1 if last in names else 0
+        rows, more = self._page(self.interfaces, start)
+        detail = ''.join(
+            '<interface xmlns="{0}"><interface-type>tengigabitethernet'
+            '</interface-type><interface-name>{1}</interface-name>'
+            '<ifindex>{2}</ifindex><port-role>Edge</port-role>'
+            '<if-name>TenGigabitEthernet {1}</if-name>'
+            '<if-state>up</if-state><line-protocol-state>up'
+            '</line-protocol-state><current-hardware-address>'
+            '00:05:33:e5:{3:02x}:{4:02x}</current-hardware-address>'
+            '</interface>'.format(_INTERFACE_EXT, self._port(i), i + 1,
+                                  i // 256 % 256, i % 256)
+            for i in rows)
+        return '%s<has-more xmlns="%s">%s</has-more>' % (
+            detail, _INTERFACE_EXT, more)
+
+    def _rpc_get_ip_interface(self, operation):
+        return ''.join(
+            '<interface xmlns="{0}"><interface-type>tengigabitethernet'
+            '</interface-type><interface-name>{1}</interface-name>'
+            '<if-state>up</if-state><line-protocol-state>up'
+            '</line-protocol-state><ip-address><ipv4>10.{2}.{3}.1/24</ipv4>'
+            '</ip-address></interface>'.format(_INTERFACE_EXT,
+                                               self._port(i), i // 256 % 256,
+                                               i % 256)
+            for i in range(self.interfaces))
+
+    def _rpc_get_vlan_brief(self, operation):
+        last = operation.findtext('{%s}last-rcvd-vlan-id' % _INTERFACE_EXT)
+        rows, more = self._page(self.vlans, int(last) if last else 0)
+        vlans = []
+        for i in rows:
+            members = ''.join(
+                '<interface><interface-type>tengigabitethernet'
+                '</interface-type><interface-name>%s</interface-name>'
+                '<tag>tagged</tag></interface>'
+                % self._port((i + offset) % self.interfaces)
+                for offset in range(min(2, self.interfaces)))
+            vlans.append('<vlan xmlns="%s"><vlan-id>%d</vlan-id>'
+                         '<vlan-type>static</vlan-type>'
+                         '<vlan-name>VLAN%04d</vlan-name>'
+                         '<vlan-state>active</vlan-state>%s</vlan>'
+                         % (_INTERFACE_EXT, i + 1, i + 1, members))
+        last_id = '<last-vlan-id xmlns="%s">%d</last-vlan-id>' % (
+            _INTERFACE_EXT, rows[-1] + 1) if len(rows) else ''
+        return '%s%s<has-more xmlns="%s">%s</has-more>' % (
+            ''.join(vlans), last_id, _INTERFACE_EXT, more)
+
+    def _rpc_get_port_channel_detail(self, operation):
+        namespace = 'urn:brocade.com:mgmt:brocade-lag'
+        last = operation.findtext('{%s}last-aggregator-id' % namespace)
+        rows, more = self._page(self.port_channels, int(last) if last else 0)
+        lacp = []
+        for i in rows:
+            ports = [self._port(index % max(self.interfaces, 1))
+                     for index in (2 * i, 2 * i + 1)]
+            members = ''.join(
+                '<aggr-member><rbridge-id>%s</rbridge-id>'
+                '<interface-type>tengigabitethernet</interface-type>'
+                '<interface-name>%s</interface-name>'
+                '<actor-port>%d</actor-port><sync>1</sync></aggr-member>'
+                % (port.split('/')[0], port, 2 * i + offset + 1)
+                for offset, port in enumerate(ports))
+            lacp.append(
+                '<lacp xmlns="{0}"><aggregator-id>{1}</aggregator-id>'
+                '<aggregator-type>standard</aggregator-type>'
+                '<isvlag>false</isvlag><aggregator-mode>active'
+                '</aggregator-mode><system-priority>32768</system-priority>'
+                '<actor-system-id>00:05:33:e5:00:01</actor-system-id>'
+                '<partner-oper-priority>32768</partner-oper-priority>'
+                '<partner-system-id>00:05:33:f5:00:01</partner-system-id>'
+                '<admin-key>{1}</admin-key><oper-key>{1}</oper-key>'
+                '<partner-oper-key>{1}</partner-oper-key>'
+                '<rx-link-count>2</rx-link-count>'
+                '<tx-link-count>2</tx-link-count>'
+                '<individual-agg>0</individual-agg><ready-agg>1</ready-agg>'
+                '{2}</lacp>'.format(namespace, i + 1, members))
+        return '%s<has-more xmlns="%s">%s</has-more>' % (
+            ''.join(lacp), namespace, more)
+
+    def _rpc_get_mac_address_table(self, operation):
+        namespace = 'urn:brocade.com:mgmt:brocade-mac-address-table'
+        return ''.join(
+            '<mac-address-table xmlns="{0}"><vlanid>{1}</vlanid>'
+            '<mac-address>00:00:5e:{2:02x}:{3:02x}:{4:02x}</mac-address>'
+            '<mac-type>dynamic</mac-type><mac-state>active</mac-state>'
+            '<forwarding-interface><interface-type>tengigabitethernet'
+            '</interface-type><interface-name>{5}</interface-name>'
+            '</forwarding-interface></mac-address-table>'.format(
+                namespace, i % max(self.vlans, 1) + 1, i // 65536 % 256,
+                i // 256 % 256, i % 256,
+                self._port(i % max(self.interfaces, 1)))
+            for i in range(self.macs)) + (
+                '<has-more xmlns="%s">false</has-more>' % namespace)
+
+    def _rpc_get_lldp_neighbor_detail(self, operation):
+        namespace = 'urn:brocade.com:mgmt:brocade-lldp-ext'
+        indexes = range(self.lldp_neighbors)
+        rbridge = operation.findtext('{%s}rbridge-id' % namespace)
+        if rbridge:
+            indexes = [i for i in indexes if self._port(
+                i % max(self.interfaces, 1)).split('/')[0] == rbridge]
+        last = operation.findtext('{%s}last-rcvd-ifindex' % namespace)
+        start = 0
+        if last:
+            start = len([i for i in indexes if i + 1 <= int(last)])
+        rows, more = self._page(len(indexes), start)
+        return ''.join(
+            '<lldp-neighbor-detail xmlns="{0}">'
+            '<local-interface-name>Te {1}</local-interface-name>'
+            '<local-interface-ifindex>{2}</local-interface-ifindex>'
+            '<local-interface-mac>00:05:33:e5:{3:02x}:{4:02x}'
+            '</local-interface-mac><remote-interface-name>Te 9/0/{5}'
+            '</remote-interface-name><remote-interface-mac>'
+            '00:05:33:f5:{3:02x}:{4:02x}</remote-interface-mac>'
+            '<remote-chassis-id>00:05:33:f5:00:{6:02x}</remote-chassis-id>'
+            '<remote-system-name>spine{6}</remote-system-name>'
+            '</lldp-neighbor-detail>'.format(
+                namespace, self._port(index % max(self.interfaces, 1)),
+                index + 1, index // 256 % 256, index % 256, index % 48 + 1,
+                index // 48 % 256)
+            for index in (indexes[i] for i in rows)) + (
+                '<has-more xmlns="%s">%s</has-more>' % (namespace, more))
+
+    def _rpc_get_arp(self, operation):
+        namespace = 'urn:brocade.com:mgmt:brocade-arp'
+        return ''.join(
+            '<arp-entry xmlns="{0}"><ip-address>10.{1}.{2}.{3}</ip-address>'
+            '<mac-address>00:00:5e:{1:02x}:{2:02x}:{3:02x}</mac-address>'
+            '<interface-type>Ve</interface-type>'
+            '<interface-name>{4}</interface-name>'
+            '<is-resolved>true</is-resolved><age>00:01:00</age>'
+            '<entry-type>dynamic</entry-type></arp-entry>'.format(
+                namespace, i // 65536 % 256, i // 256 % 256, i % 256,
+                i % max(self.vlans, 1) + 1)
+            for i in range(self.arp)) + (
+                '<has-more xmlns="%s">false</has-more>' % namespace)
+
+    def _rpc_show_vcs(self, operation):
+        namespace = 'urn:brocade.com:mgmt:brocade-vcs'
+        rbridges = max(1, -(-self.interfaces // self.ports_per_rbridge))
+        nodes = ''.join(
+            '<vcs-node-info><node-num>{0}</node-num>'
+            '<node-serial-num>BZA0000{0:04d}</node-serial-num>'
+            '<node-condition>Good</node-condition>'
+            '<node-status>Co-ordinator</node-status>'
+            '<node-vcs-id>1</node-vcs-id>'
+            '<node-rbridge-id>{0}</node-rbridge-id>'
+            '<node-is-principal>{1}</node-is-principal>'
+            '<node-switch-mac>00:05:33:00:00:{0:02x}</node-switch-mac>'
+            '<node-switch-wwn>10:00:00:05:33:00:00:{0:02x}</node-switch-wwn>'
+            '<node-switchname>sw{0}</node-switchname>'
+            '<node-public-ip-addresses><node-public-ip-address>'
+            '10.0.0.{0}/24</node-public-ip-address>'
+            '</node-public-ip-addresses></vcs-node-info>'.format(
+                rbridge, 'true' if rbridge == 1 else 'false')
+            for rbridge in range(1, rbridges + 1))
+        return ('<vcs-cluster-type-info xmlns="{0}">vcs-fabric-cluster'
+                '</vcs-cluster-type-info><vcs-nodes xmlns="{0}">{1}'
+                '</vcs-nodes>'.format(namespace, nodes))
+
+
+class _SSHServer(paramiko.ServerInterface):
+    """Accepts one password and the ``netconf`` subsystem."""
+
+    def __init__(self, auth):
+        self._auth = tuple(auth)
+        self.netconf = threading.Event()
+
+    def get_allowed_auths(self, username):
+        return 'password'
+
+    def check_auth_password(self, username, password):
+        if (username, password) == self._auth:
+            return paramiko.AUTH_SUCCESSFUL
+        return paramiko.AUTH_FAILED
+
+    def check_channel_request(self, kind, chanid):
+        if kind == 'session':
+            return paramiko.OPEN_SUCCEEDED
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+    def check_channel_subsystem_request(self, channel, name):
+        if name != 'netconf':
+            return False
+        self.netconf.set()
+        return True
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Serve NETCONF like a VDX switch on a local port.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8300)
+    parser.add_argument('--firmware', default='6.0.1')
+    parser.add_argument('--interfaces', type=int, default=48)
+    parser.add_argument('--vlans', type=int, default=100)
+    parser.add_argument('--port-channels', type=int, default=16)
+    parser.add_argument('--macs', type=int, default=1000)
+    parser.add_argument('--arp', type=int, default=1000)
+    parser.add_argument('--page-size', type=int, default=100)
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='seconds each RPC takes')
+    args = parser.parse_args()
+    simulator = Simulator(host=args.host, port=args.port,
+                          firmware=args.firmware,
+                          interfaces=args.interfaces, vlans=args.vlans,
+                          port_channels=args.port_channels,
+                          macs=args.macs, arp=args.arp,
+                          page_size=args.page_size, latency=args.latency)
+    simulator.start()
+    print('Serving NETCONF on %s:%s, user %s password %s'
+          % (simulator.conn + simulator.auth))
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        simulator.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Precompiled request templates.
+
+The generated YANG builders build a new ``ElementTree`` for every call,
+which the device then serializes before sending it.  A ``Template`` runs a
+builder once with placeholder values and keeps the serialized document as
+byte chunks; ``render`` fills the values in, escaped, and returns the bytes
+of the request.  Rendered requests are accepted wherever a call Element is
+(``Device.execute_many``, transactions, ...).
+"""
+import re
+import threading
+import xml.etree.ElementTree as ET
+
+_SENTINEL = '@@Pynos-Slot-%d@@'
+_SENTINEL_RE = re.compile(b'@@Pynos-Slot-([0-9]+)@@')
+_ESCAPES = (('&', '&amp;'), ('<', '&lt;'), ('>', '&gt;'), ('"', '&quot;'))
+
+_templates = {}
+_templates_lock = threading.Lock()
+
+
+def escape(value):
+    """Return `value` as UTF-8 bytes escaped for XML text and attributes.
+
+    Args:
+        value: The value of a slot.  Anything but a string is converted with
+            ``str``.
+
+    Returns:
+        bytes: The escaped value.
+
+    Examples:
+        >>> import pynos.template
+        >>> pynos.template.escape('R&D <lab>') == b'R&amp;D &lt;lab&gt;'
+        True
+    """
+    if isinstance(value, bytes):
+        value = value.decode('utf-8')
+    elif not isinstance(value, type(u'')):
+        value = str(value)
+    for char, entity in _ESCAPES:
+        if char in value:
+            value = value.replace(char, entity)
+    return value.encode('utf-8')
+
+
+class Template(object):
+    """
+    Template is a serialized request with slots for its variable values.
+
+    Attributes:
+        slots (tuple): Names of the values ``render`` needs.
+    """
+
+    def __init__(self, chunks, names):
+        """
+        Args:
+            chunks (list[bytes]): The literal parts of the document; one more
+                than `names`.
+            names (list[str]): The slot filled in after each chunk but the
+                last.
+
+        Use ``compile_builder`` to make a template from a YANG builder.
+        """
+        if len(chunks) != len(names) + 1:
+            raise ValueError('Need one chunk more than slot names.')
+        self._head = chunks[0]
+        self._pieces = tuple(zip(names, chunks[1:]))
+        self.slots = tuple(sorted(set(names)))
+
+    def render(self, **kwargs):
+        """Fill the slots in.
+
+        Args:
+            One keyword argument per slot.
+
+        Returns:
+            bytes: The request document.
+
+        Raises:
+            KeyError: if a slot is not given.
+        """
+        values = dict((name, escape(kwargs[name])) for name in self.slots)
+        out = [self._head]
+        for name, chunk in self._pieces:
+            out.append(values[name])
+            out.append(chunk)
+        return b''.join(out)
+
+
+def compile_builder(builder, *slots, **fixed):
+    """Compile a YANG builder method to a ``Template``.
+
+    The builder is run once with a placeholder for each slot; the result is
+    cached, so compiling the same builder again is a dict lookup.  Builders
+    must copy the slot values into the document unchanged.
+
+    Args:
+        builder (function): Bound method of a generated YANG class.  Ex.
+            ``brocade_interface().interface_tengigabitethernet_description``
+        *slots (str): The keyword arguments of `builder` that vary between
+            calls.
+        **fixed: Keyword arguments of `builder` that are the same for every
+            call.
+
+    Returns:
+        Template: The compiled builder.
+
+    Raises:
+        ValueError: if `builder` does not copy a slot value into the
+            document unchanged.
+
+    Examples:
+        >>> import pynos.device
+        >>> import pynos.template
+        >>> import pynos.utilities
+        >>> from pynos.versions.base.yang.brocade_interface import (
+        ...     brocade_interface)
+        >>> yang = brocade_interface(callback=pynos.utilities.return_xml)
+        >>> description = pynos.template.compile_builder(
+        ...     yang.interface_tengigabitethernet_description,
+        ...     'name', 'description')
+        >>> conn = ('10.24.39.211', '22')
+        >>> auth = ('admin', 'password')
+        >>> with pynos.device.Device(conn=conn, auth=auth) as dev:
+        ...     output = dev.execute_many(
+        ...         [description.render(name='1/0/%d' % port,
+        ...                             description='server %d' % port)
+        ...          for port in range(1, 49)])
+    """
+    key = (getattr(builder, '__func__', builder), slots,
+           frozenset(fixed.items()))
+    template = _templates.get(key)
+    if template is not None:
+        return template
+    template = _compile(builder, slots, fixed)
+    with _templates_lock:
+        return _templates.setdefault(key, template)
+
+
+def _compile(builder, slots, fixed):
+    kwargs = dict(fixed)
+    kwargs.update((slot, _SENTINEL % index)
+                  for index, slot in enumerate(slots))
+    config = builder(callback=lambda config: config, **kwargs)
+    document = ET.tostring(config)
+    if not isinstance(document, bytes):
+        document = document.encode('utf-8')
+
+    parts = _SENTINEL_RE.split(document)
+    chunks = parts[0::2]
+    names = [slots[int(index)] for index in parts[1::2]]
+    missing = set(slots) - set(names)
+    if missing:
+        raise ValueError('%s does not copy %s into the document unchanged.'
+                         % (getattr(builder, '__name__', builder),
+                            ', '.join(sorted(missing))))
+    return Template(chunks, names)
@@ -0,0 +1,367 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Tracing spans from feature methods down to the NETCONF RPCs they make.
+
+A device created with a ``Tracer`` opens a span for each call of a public
+method or property of its feature objects, such as
+``Interface.ip_address``, and spans nested in it for what the call does:
+
+    build       A generated YANG builder creating the request.
+    rpc <name>  One NETCONF call, split in
+    serialize   converting the request for ncclient,
+    transport   the round trip to the device, and
+    parse       parsing the reply.
+
+The time of a method span outside its children is the method's own work:
+argument validation and decoding of the replies.  Finished spans are handed
+to the exporters of the tracer; ``FileExporter`` writes them to a file for
+flame graphs.
+
+Devices created without a tracer do not open spans: the builders and the
+reply parser only check a module flag that stays False until a tracer is
+used.
+"""
+import json
+import logging
+import os
+import threading
+import time
+import types
+
+active = False
+"""bool: True once a tracer has opened a span in this process."""
+
+_local = threading.local()
+
+
+class Span(object):
+    """One timed operation.
+
+    Attributes:
+        tracer (Tracer): Tracer that opened the span.
+        name (str): Name of the operation.  Ex. 'Interface.ip_address'
+        parent (Span): Span this one is nested in, or ``None``.
+        attributes (dict): Details of the operation.
+        start (float): Start time, in seconds since the epoch.
+        seconds (float): Duration, once the span is finished.
+        child_seconds (float): Total duration of the finished children.
+        thread (int): Identifier of the thread that ran the operation.
+    """
+    __slots__ = ('tracer', 'name', 'parent', 'attributes', 'start',
+                 'seconds', 'child_seconds', 'thread')
+
+    def __init__(self, tracer, name, parent, attributes):
+        self.tracer = tracer
+        self.name = name
+        self.parent = parent
+        self.attributes = attributes
+        self.start = 0.0
+        self.seconds = 0.0
+        self.child_seconds = 0.0
+        self.thread = None
+
+    def __enter__(self):
+        self.thread = threading.current_thread().ident
+        _local.span = self
+        self.start = time.time()
+        return self
+
+    def __exit__(self, exctype, excinst, exctb):
+        self.seconds = time.time() - self.start
+        if exctype is not None:
+            self.attributes['error'] = exctype.__name__
+        _local.span = self.parent
+        self.tracer._finish(self)
+
+    @property
+    def self_seconds(self):
+        """float: Duration outside the children of the span."""
+        return max(self.seconds - self.child_seconds, 0.0)
+
+    @property
+    def path(self):
+        """list: Names of the enclosing spans and this one, outermost
+        first."""
+        names = []
+        span = self
+        while span is not None:
+            names.append(span.name)
+            span = span.parent
+        names.reverse()
+        return names
+
+    def __repr__(self):
+        return '<Span %s %.1fms>' % (';'.join(self.path),
+                                     self.seconds * 1000)
+
+
+class _NoSpan(object):
+    """Context manager that does nothing, for hooks run outside a span."""
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, exctype, excinst, exctb):
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+class Tracer(object):
+    """
+    Tracer opens spans and hands the finished ones to its exporters.
+
+    Spans nest per thread: a span opened while another is open in the same
+    thread becomes its child.
+
+    Attributes:
+        None
+    """
+
+    def __init__(self, exporters=None):
+        """
+        Args:
+            exporters (list): Functions called with each finished ``Span``,
+                innermost spans first, such as ``FileExporter`` objects.
+
+        Returns:
+            Instance of the Tracer object.
+
+        Raises:
+            None
+
+        Examples:
+            >>> import pynos.device
+            >>> import pynos.tracing
+            >>> exporter = pynos.tracing.FileExporter('pynos.folded')
+            >>> tracer = pynos.tracing.Tracer([exporter])
+            >>> conn = ('10.24.39.211', '22')
+            >>> auth = ('admin', 'password')
+            >>> with pynos.device.Device(conn=conn, auth=auth,
+            ...                          tracer=tracer) as dev:
+            ...     dev.interface.ip_address(int_type='tengigabitethernet',
+            ...                              name='225/0/4',
+            ...                              ip_addr='20.10.10.1/24')
+            >>> tracer.close()
+        """
+        self._exporters = list(exporters or [])
+        self._lock = threading.Lock()
+
+    def add_exporter(self, exporter):
+        """Call `exporter` with each finished ``Span``.
+
+        Exporters run in the thread of the span; exceptions they raise are
+        logged and ignored.
+        """
+        with self._lock:
+            self._exporters = self._exporters + [exporter]
+
+    def remove_exporter(self, exporter):
+        with self._lock:
+            self._exporters = [item for item in self._exporters
+                               if item != exporter]
+
+    def span(self, name, **attributes):
+        """Return a span to use as a context manager, nested in the span
+        open in this thread, if any.
+
+        Args:
+            name (str): Name of the operation.
+            attributes: Details of the operation.
+
+        Returns:
+            Span
+        """
+        global active
+        active = True
+        return Span(self, name, current(), attributes)
+
+    def close(self):
+        """Close the exporters that have a ``close`` method."""
+        for exporter in self._exporters:
+            close = getattr(exporter, 'close', None)
+            if close is not None:
+                close()
+
+    def _finish(self, span):
+        with self._lock:
+            if span.parent is not None:
+                span.parent.child_seconds += span.seconds
+            exporters = self._exporters
+        for exporter in exporters:
+            try:
+                exporter(span)
+            except Exception as error:
+                logging.warning('Tracing exporter failed: %s', error)
+
+
+class FileExporter(object):
+    """
+    FileExporter writes finished spans to a file, in one of two formats:
+
+    folded
+        A line per span with its path and its own time in microseconds,
+        ``Interface.ip_address;rpc interface;transport 5210``, the input
+        of ``flamegraph.pl`` and speedscope.
+    chrome
+        A JSON array of trace events, one per span, for ``chrome://tracing``
+        and Perfetto.
+
+    Attributes:
+        path (str): The file.
+        format (str): ``folded`` or ``chrome``.
+    """
+    FORMATS = ('folded', 'chrome')
+
+    def __init__(self, path, format='folded'):
+        """
+        Args:
+            path (str): File to write.  It is replaced.
+            format (str): ``folded`` or ``chrome``.  Default: folded.
+
+        Returns:
+            Instance of the FileExporter object.
+
+        Raises:
+            ValueError: if `format` is not supported.
+        """
+        if format not in self.FORMATS:
+            raise ValueError('format must be one of: %s'
+                             % repr(self.FORMATS))
+        self.path = path
+        self.format = format
+        self._lock = threading.Lock()
+        self._file = open(path, 'w')
+        self._events = 0
+        self._pid = os.getpid()
+        if format == 'chrome':
+            self._file.write('[')
+
+    def __call__(self, span):
+        if self.format == 'folded':
+            line = '%s %d\n' % (';'.join(span.path),
+                                round(span.self_seconds * 1000000))
+        else:
+            line = json.dumps({
+                'name': span.name, 'ph': 'X', 'pid': self._pid,
+                'tid': span.thread, 'ts': round(span.start * 1000000),
+                'dur': round(span.seconds * 1000000),
+                'args': dict((key, str(value)) for key, value in
+                             span.attributes.items())})
+        with self._lock:
+            if self._file.closed:
+                return
+            if self.format == 'chrome':
+                line = '%s\n%s' % (',' if self._events else '', line)
+            self._events += 1
+            self._file.write(line)
+
+    def close(self):
+        """Finish and close the file."""
+        with self._lock:
+            if self._file.closed:
+                return
+            if self.format == 'chrome':
+                self._file.write('\n]\n')
+            self._file.close()
+
+
+class TracedFeature(object):
+    """
+    Stand-in for a feature object that opens a span around each call of
+    its public methods and each read of its public properties.  Generators
+    returned by the methods are traced each time they are resumed.
+
+    Attributes:
+        None
+    """
+
+    def __init__(self, feature, tracer):
+        object.__setattr__(self, '_feature', feature)
+        object.__setattr__(self, '_tracer', tracer)
+
+    def __getattr__(self, name):
+        feature = self._feature
+        if name.startswith('_'):
+            return getattr(feature, name)
+        qualified = '%s.%s' % (type(feature).__name__, name)
+        tracer = self._tracer
+        if isinstance(getattr(type(feature), name, None), property):
+            with tracer.span(qualified):
+                return getattr(feature, name)
+        value = getattr(feature, name)
+        if not callable(value):
+            return value
+
+        def traced(*args, **kwargs):
+            with tracer.span(qualified):
+                result = value(*args, **kwargs)
+            if isinstance(result, types.GeneratorType):
+                return _traced_generator(tracer, qualified, result)
+            return result
+        traced.__name__ = name
+        traced.__doc__ = value.__doc__
+        return traced
+
+    def __setattr__(self, name, value):
+        setattr(self._feature, name, value)
+
+    def __dir__(self):
+        return dir(self._feature)
+
+    def __repr__(self):
+        return '<TracedFeature %r>' % (self._feature,)
+
+
+def _traced_generator(tracer, name, generator):
+    while True:
+        with tracer.span(name):
+            try:
+                item = next(generator)
+            except StopIteration:
+                return
+        yield item
+
+
+def current():
+    """Return the span open in this thread, or None."""
+    return getattr(_local, 'span', None)
+
+
+def span(name, **attributes):
+    """Return a span nested in the span open in this thread, or a context
+    manager that does nothing if there is none.
+
+    Hooks outside ``Device`` use this behind a check of ``active``.
+    """
+    parent = current()
+    if parent is None:
+        return _NO_SPAN
+    return parent.tracer.span(name, **attributes)
+
+
+def inherit(parent):
+    """Make `parent` the open span of this thread, for work done in another
+    thread on its behalf.
+
+    Returns:
+        The span it replaces, to restore afterwards.
+    """
+    previous = current()
+    _local.span = parent
+    return previous
@@ -0,0 +1,274 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import copy
+import logging
+import xml.etree.ElementTree as ET
+
+import lxml.etree
+import ncclient.operations
+
+from pynos.exceptions import PynosException
+import pynos.instrumentation
+import pynos.utilities
+
+
+class TransactionError(PynosException):
+    """Exception for transactions in which some operations failed.
+
+    Attributes:
+        failed (list[Operation]): The operations that failed, each with its
+            ``error``.
+    """
+    def __init__(self, failed):
+        self.failed = failed
+        message = '; '.join('#%d %s: %s' % (op.index, op.name, op.error)
+                            for op in failed)
+        super(TransactionError, self).__init__(
+            '%d operation(s) failed: %s' % (len(failed), message))
+
+
+class Operation(object):
+    """One configuration change captured by a ``Transaction``.
+
+    Attributes:
+        index (int): Position of the change in the transaction.
+        name (str): Name of the pynos method that made the change.  Ex.
+            'Interface.description'
+        config (Element): The edit-config document of the change.
+        target (str): Datastore the change is written to.
+        error (Exception): Why the change was rejected, or ``None``.
+    """
+    __slots__ = ('index', 'name', 'config', 'target', 'error')
+
+    def __init__(self, index, name, config, target):
+        self.index = index
+        self.name = name
+        self.config = config
+        self.target = target
+        self.error = None
+
+    def __repr__(self):
+        return 'Operation(%d, %r, target=%r, error=%r)' % (
+            self.index, self.name, self.target, self.error)
+
+
+class Transaction(object):
+    """
+    Transaction batches configuration changes into few edit-config RPCs.
+
+    While a transaction is open on a ``Device``, every edit-config made
+    through its features is captured instead of sent.  On commit the
+    captured documents are merged, in order, with
+    ``pynos.utilities.merge_config`` and sent as one edit-config, or as few
+    as needed when two changes cannot share a document.  Reads are not
+    captured and do not see uncommitted changes.
+
+    A batch rejected by the device is sent again one operation at a time,
+    so each error is attributed to the operation that caused it.  On the
+    running datastore the other operations are applied.
+
+    With the candidate datastore the changes are all or nothing: the
+    candidate is locked, the batches are written to it, validated and
+    committed at once.  Any error discards the candidate, leaving the
+    running configuration untouched.  A confirmed commit is rolled back by
+    the device unless ``confirm()`` follows within `confirm_timeout`
+    seconds, or if the session drops first.
+
+    Attributes:
+        operations (list[Operation]): The captured changes.
+        rpcs (int): Number of edit-config RPCs sent by ``commit``.
+        pending_confirm (bool): A confirmed commit awaits ``confirm()``.
+    """
+
+    def __init__(self, device, **kwargs):
+        """
+        Args:
+            device (Device): Device the changes are made on.
+            target (str): ``running`` or ``candidate``.  Default: running.
+            validate (bool): Validate the candidate before committing.
+                Default: True.
+            confirm_timeout (int): Seconds the device waits for
+                ``confirm()`` before rolling the commit back.  Default: None,
+                a plain commit.
+
+        Returns:
+            Instance of the Transaction object.
+
+        Raises:
+            ValueError: if `target` is unknown, or `confirm_timeout` is given
+                for the running datastore.
+
+        Examples:
+            >>> import pynos.device
+            >>> conn = ('10.24.39.211', '22')
+            >>> auth = ('admin', 'password')
+            >>> with pynos.device.Device(conn=conn, auth=auth) as dev:
+            ...     with dev.transaction() as tx:
+            ...         for port in range(1, 49):
+            ...             name = '1/0/%d' % port
+            ...             dev.interface.description(
+            ...                 int_type='tengigabitethernet', name=name,
+            ...                 desc='server %d' % port)
+            ...             dev.interface.mtu(
+            ...                 int_type='tengigabitethernet', name=name,
+            ...                 mtu='9216')
+            ...     tx.rpcs
+            1
+        """
+        self.target = kwargs.pop('target', 'running')
+        self._validate = kwargs.pop('validate', True)
+        self._confirm_timeout = kwargs.pop('confirm_timeout', None)
+        if self.target not in ('running', 'candidate'):
+            raise ValueError('`target` must be running or candidate.')
+        if self._confirm_timeout is not None and self.target != 'candidate':
+            raise ValueError('Confirmed commits need target=candidate.')
+        self._device = device
+        self.operations = []
+        self.rpcs = 0
+        self.pending_confirm = False
+        self._committed = False
+
+    def __enter__(self):
+        self._device._begin(self)
+        return self
+
+    def __exit__(self, exctype, excinst, exctb):
+        self._device._end(self)
+        if exctype is None:
+            self.commit()
+        else:
+            self.discard()
+
+    def capture(self, config, target='running'):
+        """Record an edit-config instead of sending it.
+
+        Returns:
+            None, like a sent edit-config.
+        """
+        if self._committed:
+            raise PynosException('Transaction is already committed.')
+        if target == 'running':
+            target = self.target
+        if isinstance(config, lxml.etree._Element):
+            config = ET.fromstring(lxml.etree.tostring(config))
+        elif isinstance(config, bytes):
+            config = ET.fromstring(config)
+        name = pynos.instrumentation.caller()
+        self.operations.append(Operation(len(self.operations), name, config,
+                                         target))
+
+    def discard(self):
+        """Drop the captured changes without sending them."""
+        self.operations = []
+        self._committed = True
+
+    def batches(self):
+        """Merge the captured changes into edit-config documents.
+
+        Returns:
+            list[tuple]: (target, document, operations) for each RPC, in the
+            order they are sent.
+        """
+        batches = []
+        for op in self.operations:
+            if batches and batches[-1][0] == op.target and \
+                    pynos.utilities.merge_config(batches[-1][1], op.config):
+                batches[-1][2].append(op)
+                continue
+            batches.append((op.target, copy.deepcopy(op.config), [op]))
+        return batches
+
+    def commit(self):
+        """Send the captured changes.
+
+        Raises:
+            TransactionError: if the device rejected some operations.  On
+                the running datastore the remaining operations have been
+                applied; on the candidate nothing has.
+            RPCError: if the candidate could not be locked, validated or
+                committed.  Nothing has been applied.
+            DeviceCommError: if the device cannot be reached.
+        """
+        if self._committed:
+            raise PynosException('Transaction is already committed.')
+        self._committed = True
+        if self.target == 'candidate':
+            self._commit_candidate()
+            return
+        failed = self._apply()
+        if failed:
+            raise TransactionError(failed)
+
+    def confirm(self):
+        """Make a confirmed commit permanent.
+
+        Raises:
+            PynosException: if no confirmed commit is pending.
+        """
+        if not self.pending_confirm:
+            raise PynosException('No confirmed commit is pending.')
+        self._device.commit()
+        self.pending_confirm = False
+
+    def _commit_candidate(self):
+        device = self._device
+        device.lock('candidate')
+        try:
+            # Start from the running configuration, not leftovers of
+            # another session.
+            device.discard_changes()
+            failed = self._apply()
+            if failed:
+                raise TransactionError(failed)
+            if self._validate:
+                device.validate('candidate')
+            device.commit(confirm_timeout=self._confirm_timeout)
+            self.pending_confirm = self._confirm_timeout is not None
+        except Exception:
+            try:
+                device.discard_changes()
+            except Exception as error:
+                logging.warning('Could not discard the candidate: %s', error)
+            raise
+        finally:
+            device.unlock('candidate')
+
+    def _apply(self):
+        """Send the batches; return the operations that failed."""
+        for target, config, ops in self.batches():
+            try:
+                self._send(config, target)
+                continue
+            except ncclient.operations.RPCError as error:
+                if len(ops) == 1:
+                    ops[0].error = error
+                    continue
+                logging.info('Batch of %d operations rejected (%s); '
+                             'sending them one at a time.', len(ops), error)
+            for op in ops:
+                try:
+                    self._send(op.config, target)
+                except ncclient.operations.RPCError as error:
+                    op.error = error
+        return [op for op in self.operations if op.error is not None]
+
+    def _send(self, config, target):
+        self.rpcs += 1
+        if target == 'running':
+            return self._device._callback(config)
+        return self._device._callback(config, handler='edit_config',
+                                      target=target)
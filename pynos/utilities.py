@@ -15,10 +15,18 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 from __future__ import print_function
+import copy
 import xml.etree.ElementTree as ET
 import lxml
 import re
 
+from pynos.exceptions import PynosException
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+NETCONF_NAMESPACE = 'urn:ietf:params:xml:ns:netconf:base:1.0'
+_OPERATIONS = ('operation', '{%s}operation' % NETCONF_NAMESPACE)
+
 
 def return_xml(element_tree):
     """Return an XML Element.
@@ -215,15 +223,25 @@ def merge_xml(first_doc, second_doc):
         >>> y = lxml.etree.fromstring('<config><hello /></config>')
         >>> x = pynos.utilities.merge_xml(x, y)
     """
+    # Merge in the tree type of the first document; only a second document
+    # of the other type is converted.
+    first_lxml = isinstance(first_doc, lxml.etree._Element)
+    if first_lxml and not isinstance(second_doc, lxml.etree._Element):
+        second_doc = lxml.etree.fromstring(ET.tostring(second_doc))
+    elif not first_lxml and isinstance(second_doc, lxml.etree._Element):
+        second_doc = ET.fromstring(lxml.etree.tostring(second_doc))
+    _merge_xml(first_doc, second_doc)
+    if first_lxml:
+        return first_doc
+    return lxml.etree.fromstring(ET.tostring(first_doc))
+
+
+def _merge_xml(first_doc, second_doc):
     # Adapted from:
     # http://stackoverflow.com/questions/27258013/merge-two-xml-files-python
     # Maps each elements tag to the element from the first document
-    if isinstance(first_doc, lxml.etree._Element):
-        first_doc = ET.fromstring(lxml.etree.tostring(first_doc))
-    if isinstance(second_doc, lxml.etree._Element):
-        second_doc = ET.fromstring(lxml.etree.tostring(second_doc))
     mapping = {element.tag: element for element in first_doc}
-    for element in second_doc:
+    for element in list(second_doc):
         if not len(element):
             # Recursed fully.  This element has no children.
             try:
@@ -237,10 +255,280 @@ def merge_xml(first_doc, second_doc):
         else:
             # This element has children.  Recurse.
             try:
-                merge_xml(mapping[element.tag], element)
+                _merge_xml(mapping[element.tag], element)
             except KeyError:
                 # The element doesn't exist
                 # add it to the mapping and the root document
                 mapping[element.tag] = element
                 first_doc.append(element)
-    return lxml.etree.fromstring(ET.tostring(first_doc))
+
+
+def merge_config(first_doc, second_doc):
+    """Merges an edit-config document into another, keeping list entries
+    apart.
+
+    Unlike ``merge_xml``, which matches elements by tag alone, list entries
+    are matched on their key: the first leaf of an entry, which is where
+    the YANG builders always put the key leaves.  Two interfaces therefore
+    stay two entries.  Without a schema a container is told apart from a
+    list entry only by that leaf, so a container whose first leaf is set to
+    two different values is kept as two elements.  The documents are not
+    merged when doing so could change what the device ends up with: a leaf
+    set to two different values, or elements with different attributes
+    such as ``operation="delete"``.
+
+    Args:
+        first_doc (Element): Document that `second_doc` is merged into.  It
+            is only modified if the merge succeeds.
+        second_doc (Element): Document to merge.  It is not modified.
+
+    Returns:
+        bool: True if `second_doc` was merged, False if the documents
+        conflict and must be sent separately, in order.
+
+    Raises:
+        None
+
+    Example:
+        >>> import pynos.utilities
+        >>> import xml.etree.ElementTree as ET
+        >>> x = ET.fromstring('<config><interface><tengigabitethernet>'
+        ...                   '<name>1/0/1</name><description>a</description>'
+        ...                   '</tengigabitethernet></interface></config>')
+        >>> y = ET.fromstring('<config><interface><tengigabitethernet>'
+        ...                   '<name>1/0/2</name><description>b</description>'
+        ...                   '</tengigabitethernet></interface></config>')
+        >>> pynos.utilities.merge_config(x, y)
+        True
+        >>> len(x.find('interface'))
+        2
+    """
+    if first_doc.tag != second_doc.tag or \
+            first_doc.attrib != second_doc.attrib:
+        return False
+    if not _merge_children(first_doc, second_doc, dry_run=True):
+        return False
+    _merge_children(first_doc, second_doc, dry_run=False)
+    return True
+
+
+def _entry_key(element):
+    children = list(element)
+    if children and not len(children[0]):
+        return children[0].tag, children[0].text
+    return None
+
+
+def _merge_children(first, second, dry_run):
+    for element in second:
+        match = None
+        for candidate in first:
+            if candidate.tag != element.tag:
+                continue
+            if candidate.attrib != element.attrib or \
+                    bool(len(candidate)) != bool(len(element)):
+                return False
+            if not len(element):
+                match = candidate
+                break
+            first_key = _entry_key(candidate)
+            second_key = _entry_key(element)
+            if first_key is None or second_key is None or \
+                    first_key[0] != second_key[0] or first_key == second_key:
+                match = candidate
+                break
+        if match is None:
+            if not dry_run:
+                first.append(copy.deepcopy(element))
+        elif not len(element):
+            if (match.text or '').strip() != (element.text or '').strip():
+                return False
+        elif not _merge_children(match, element, dry_run):
+            return False
+    return True
+
+
+def element_text(element):
+    """Text of an element without surrounding white space, ``''`` if it has
+    none.
+    """
+    return (element.text or '').strip()
+
+
+def edit_operation(element):
+    """Return the edit-config operation of an element.
+
+    Args:
+        element (Element): Element of an edit-config document.
+
+    Returns:
+        str: Value of its ``operation`` attribute, with or without the
+        NETCONF namespace, or 'merge' if it has none.
+    """
+    for name in _OPERATIONS:
+        if name in element.attrib:
+            return element.attrib[name]
+    return 'merge'
+
+
+def strip_operations(element):
+    """Return a copy of an edit-config element without the ``operation``
+    attributes of it and its descendants.
+    """
+    result = copy.deepcopy(element)
+    for node in result.iter():
+        for name in _OPERATIONS:
+            node.attrib.pop(name, None)
+    return result
+
+
+def edit_entry(siblings, edit):
+    """Find the configuration node an edit-config element applies to.
+
+    Without a schema, list entries are matched on their first leaf, where
+    the YANG builders always put the key, and leaf-list entries on their
+    value.
+
+    Args:
+        siblings (list): The configured elements with the tag of `edit`,
+            children of the node its parent applies to.
+        edit (Element): Element of an edit-config document.
+
+    Returns:
+        tuple: (node or None, True), or (None, False) if that cannot be
+        told without a schema.  None with True means `edit` adds a node.
+    """
+    if not siblings:
+        return None, True
+    if not len(edit):
+        # A leaf, or a leaf-list whose entries are told apart by value.
+        for sibling in siblings:
+            if element_text(sibling) == element_text(edit):
+                return sibling, True
+        if len(siblings) > 1:
+            # A new entry of a leaf-list.
+            return None, True
+        # A leaf whose value changes, or a second entry of a leaf-list.
+        return None, False
+    first = edit[0]
+    if len(first) or not element_text(first):
+        # A container.
+        return (siblings[0], True) if len(siblings) == 1 else (None, False)
+    keyed = [sibling for sibling in siblings
+             if any(child.tag == first.tag and
+                    element_text(child) == element_text(first)
+                    for child in sibling)]
+    if keyed:
+        return keyed[0], True
+    if len(siblings) > 1:
+        # A new entry of a list.
+        return None, True
+    if siblings[0].find(first.tag) is None:
+        # A container getting a new leaf.
+        return siblings[0], True
+    # A new list entry, or a container whose first leaf changes.
+    return None, False
+
+
+def execute_many(callback, calls):
+    """Run independent calls through a feature callback, pipelined if the
+    device supports it.
+
+    When `callback` belongs to a ``Device``, the calls are handed to
+    ``Device.execute_many`` and share round trips.  Any other callback is
+    called once per call, in order.
+
+    Args:
+        callback (function): The callback of a feature object.
+        calls (list[tuple]): (call, handler) pairs.
+
+    Returns:
+        list: The result of each call, in order.
+
+    Raises:
+        None
+
+    Example:
+        >>> import pynos.utilities
+        >>> import xml.etree.ElementTree as ET
+        >>> calls = [(ET.Element('hello'), 'get'), (ET.Element('bye'), 'get')]
+        >>> [e.tag for e in pynos.utilities.execute_many(
+        ...     lambda call, handler: call, calls)]
+        ['hello', 'bye']
+    """
+    device = getattr(callback, '__self__', None)
+    if hasattr(device, 'execute_many'):
+        return device.execute_many(calls)
+    return [callback(call, handler) for call, handler in calls]
+
+
+def iter_elements(reply, tag):
+    """Yields the elements named `tag` of an RPC reply, one at a time.
+
+    When `reply` is the raw text of the reply, it is parsed incrementally
+    and each element is released once the consumer moves on, so the parsed
+    elements do not add up with the number of entries; the text itself is
+    held by the caller.  Do not keep references to the yielded elements;
+    copy what is needed out of them.
+
+    Args:
+        reply (str): Raw XML of the reply.  An already parsed ``Element``
+            is accepted too, in which case matching elements are simply
+            iterated.
+        tag (str): Qualified tag to yield.  Ex.
+            '{urn:brocade.com:mgmt:brocade-arp}arp-entry'
+
+    Returns:
+        Generator of ``Element``.
+
+    Raises:
+        PynosException: if the reply contains an ``rpc-error``.
+
+    Examples:
+        >>> import pynos.utilities
+        >>> reply = '<rpc-reply><entry>1</entry><entry>2</entry></rpc-reply>'
+        >>> [e.text for e in pynos.utilities.iter_elements(reply, 'entry')]
+        ['1', '2']
+    """
+    if not isinstance(reply, (str, bytes, type(u''))):
+        for element in reply.iter(tag):
+            yield element
+        return
+    stack = []
+    for event, element in _iterparse_text(reply):
+        if event == 'start':
+            stack.append(element)
+            continue
+        stack.pop()
+        if element.tag == tag:
+            yield element
+        elif element.tag.endswith('rpc-error'):
+            message = [e.text for e in element.iter()
+                       if e.tag.endswith('error-message')]
+            raise PynosException('rpc-error: %s' % ''.join(
+                m for m in message if m))
+        else:
+            continue
+        element.clear()
+        if stack:
+            stack[-1].remove(element)
+
+
+def _iterparse_text(text):
+    """Yield (event, element) pairs for `text`, fed in fixed-size chunks.
+    """
+    try:
+        parser = ET.XMLPullParser(events=('start', 'end'))
+    except AttributeError:
+        # Python 2 has no pull parser; StringIO wraps `text` without a copy.
+        from StringIO import StringIO
+        for item in ET.iterparse(StringIO(text), events=('start', 'end')):
+            yield item
+        return
+    for offset in range(0, len(text), STREAM_CHUNK_SIZE):
+        parser.feed(text[offset:offset + STREAM_CHUNK_SIZE])
+        for item in parser.read_events():
+            yield item
+    parser.close()
+    for item in parser.read_events():
+        yield item
@@ -15,6 +15,8 @@ limitations under the License.
 """
 import xml.etree.ElementTree as ET
 
+import pynos.records
+
 
 class FabricService(object):
     """
@@ -34,6 +36,7 @@ class FabricService(object):
             None
         """
         self._callback = callback
+        self._records = False
 
     @property
     def trill_links(self):
@@ -65,6 +68,7 @@ class FabricService(object):
                                 'link-cost': link_cost,
                                 'link-costcount': link_cost_count}
 
-                result.append(item_results)
+                result.append(pynos.records.build(
+                    pynos.records.TrillLink, item_results, self._records))
 
         return result
@@ -19,6 +19,8 @@ import xml.etree.ElementTree as ET
 
 from ipaddress import ip_interface
 
+import pynos.paging
+import pynos.records
 import pynos.utilities
 from pynos.exceptions import InvalidVlanId
 from pynos.versions.base.yang.brocade_interface import brocade_interface
@@ -51,6 +53,7 @@ class Interface(object):
             None
         """
         self._callback = callback
+        self._records = False
         self._interface = brocade_interface(
             callback=pynos.utilities.return_xml
         )
@@ -2640,48 +2643,35 @@ class Interface(object):
         """
         urn = "{urn:brocade.com:mgmt:brocade-interface-ext}"
         int_ns = 'urn:brocade.com:mgmt:brocade-interface-ext'
-
-        result = []
-        has_more = ''
-        last_interface_name = ''
-        last_interface_type = ''
-
-        while (has_more == '') or (has_more == 'true'):
-            request_interface = self.get_interface_detail_request(
-                last_interface_name, last_interface_type)
-            interface_result = self._callback(request_interface, 'get')
-            has_more = interface_result.find('%shas-more' % urn).text
-
-            for item in interface_result.findall('%sinterface' % urn):
-                interface_type = item.find('%sinterface-type' % urn).text
-                interface_name = item.find('%sinterface-name' % urn).text
-                last_interface_type = interface_type
-                last_interface_name = interface_name
-                if "gigabitethernet" in interface_type:
-                    interface_role = item.find('%sport-role' % urn).text
-                    if_name = item.find('%sif-name' % urn).text
-                    interface_state = item.find('%sif-state' % urn).text
-                    interface_proto_state = item.find('%sline-protocol-state' %
-                                                      urn).text
-                    interface_mac = item.find(
-                        '%scurrent-hardware-address' % urn).text
-
-                    item_results = {'interface-type': interface_type,
-                                    'interface-name': interface_name,
-                                    'interface-role': interface_role,
-                                    'if-name': if_name,
-                                    'interface-state': interface_state,
-                                    'interface-proto-state':
-                                        interface_proto_state,
-                                    'interface-mac': interface_mac}
-                    result.append(item_results)
+        type_tag = '%sinterface-type' % urn
+        name_tag = '%sinterface-name' % urn
+
+        # The IP interfaces do not depend on the detail pages; fetch them
+        # together with the first page.
+        request_interface = self.get_interface_detail_request('', '')
+        request_ip_interface = ET.Element('get-ip-interface', xmlns=int_ns)
+        interface_result, ip_interface_result = pynos.utilities.execute_many(
+            self._callback, [(request_interface, 'get'),
+                             (request_ip_interface, 'get')])
+
+        # Physical interfaces keyed on (type, name) for the join below.
+        physical = {}
+        pages = pynos.paging.PageCursor(
+            self._callback, request_interface,
+            lambda page: page.findall('%sinterface' % urn),
+            self._next_interface_detail_request,
+            first_reply=interface_result)
+        for item in pages:
+            if "gigabitethernet" in item.find(type_tag).text:
+                item_results = self._interface_detail_row(item, urn)
+                physical.setdefault((item_results['interface-type'],
+                                     item_results['interface-name']),
+                                    item_results)
         # Loopback interfaces. Probably for other non-physical interfaces, too.
         ip_result = []
-        request_interface = ET.Element('get-ip-interface', xmlns=int_ns)
-        interface_result = self._callback(request_interface, 'get')
-        for interface in interface_result.findall('%sinterface' % urn):
-            int_type = interface.find('%sinterface-type' % urn).text
-            int_name = interface.find('%sinterface-name' % urn).text
+        for interface in ip_interface_result.findall('%sinterface' % urn):
+            int_type = interface.find(type_tag).text
+            int_name = interface.find(name_tag).text
             if int_type == 'unknown':
                 continue
 
@@ -2697,8 +2687,7 @@ class Interface(object):
                        'interface-proto-state': int_proto_state,
                        'interface-mac': None,
                        'ip-address': ip_address}
-            x = next((x for x in result if int_type == x['interface-type'] and
-                      int_name == x['interface-name']), None)
+            x = physical.get((int_type, int_name))
             if x is not None:
                 results.update(x)
             ip_result.append(results)
@@ -2735,48 +2724,77 @@ class Interface(object):
         Gigabitethernet, tengigabitethernet, fortygigabitethernet,
         hundredgigabitethernet) and port-channel
         """
+        return list(self.iter_interface_detail())
+
+    def iter_interface_detail(self):
+        """Iterate over the rows of ``interface_detail`` as pages arrive.
+
+        The next page is requested while the current one is consumed, and
+        no further pages are requested once the iteration is abandoned.
+
+        Returns:
+            Generator of the ``interface_detail`` rows.
+
+        Examples:
+            >>> import pynos.device
+            >>> conn = ('10.24.39.211', '22')
+            >>> auth = ('admin', 'password')
+            >>> with pynos.device.Device(conn=conn, auth=auth) as dev:
+            ...     for row in dev.interface.iter_interface_detail():
+            ...         if row['interface-state'] == 'down':
+            ...             break
+        """
+        request_interface = self.get_interface_detail_request('', '')
+        return iter(pynos.paging.PageCursor(
+            self._callback, request_interface, self._interface_detail_rows,
+            self._next_interface_detail_request))
+
+    def _next_interface_detail_request(self, interface_result):
         urn = "{urn:brocade.com:mgmt:brocade-interface-ext}"
+        if interface_result.find('%shas-more' % urn).text != 'true':
+            return None
+        items = interface_result.findall('%sinterface' % urn)
+        if not items:
+            return None
+        return self.get_interface_detail_request(
+            items[-1].find('%sinterface-name' % urn).text,
+            items[-1].find('%sinterface-type' % urn).text)
 
+    def _interface_detail_rows(self, interface_result):
+        urn = "{urn:brocade.com:mgmt:brocade-interface-ext}"
         result = []
-        has_more = ''
-        last_interface_name = ''
-        last_interface_type = ''
-
-        while (has_more == '') or (has_more == 'true'):
-            request_interface = self.get_interface_detail_request(
-                last_interface_name, last_interface_type)
-            interface_result = self._callback(request_interface, 'get')
-            has_more = interface_result.find('%shas-more' % urn).text
-
-            for item in interface_result.findall('%sinterface' % urn):
-                interface_type = item.find('%sinterface-type' % urn).text
-                interface_name = item.find('%sinterface-name' % urn).text
-                last_interface_type = interface_type
-                last_interface_name = interface_name
-                if "gigabitethernet" in interface_type or\
-                   "port-channel" in interface_type:
-                    if "gigabitethernet" in interface_type:
-                        interface_role = item.find('%sport-role' % urn).text
-                    else:
-                        interface_role = "None"
-                    if_name = item.find('%sif-name' % urn).text
-                    interface_state = item.find('%sif-state' % urn).text
-                    interface_proto_state = item.find('%sline-protocol-state' %
-                                                      urn).text
-                    interface_mac = item.find(
-                        '%scurrent-hardware-address' % urn).text
-                    item_results = {'interface-type': interface_type,
-                                    'interface-name': interface_name,
-                                    'interface-role': interface_role,
-                                    'if-name': if_name,
-                                    'interface-state': interface_state,
-                                    'interface-proto-state':
-                                        interface_proto_state,
-                                    'interface-mac': interface_mac}
-                result.append(item_results)
-
+        for item in interface_result.findall('%sinterface' % urn):
+            item_results = self._interface_detail_row(item, urn)
+            if item_results is not None:
+                result.append(pynos.records.build(
+                    pynos.records.InterfaceDetail, item_results,
+                    self._records))
         return result
 
+    @staticmethod
+    def _interface_detail_row(item, urn):
+        interface_type = item.find('%sinterface-type' % urn).text
+        interface_name = item.find('%sinterface-name' % urn).text
+        if "gigabitethernet" in interface_type:
+            interface_role = item.find('%sport-role' % urn).text
+        elif "port-channel" in interface_type:
+            interface_role = "None"
+        else:
+            return None
+        if_name = item.find('%sif-name' % urn).text
+        interface_state = item.find('%sif-state' % urn).text
+        interface_proto_state = item.find('%sline-protocol-state' %
+                                          urn).text
+        interface_mac = item.find(
+            '%scurrent-hardware-address' % urn).text
+        return {'interface-type': interface_type,
+                'interface-name': interface_name,
+                'interface-role': interface_role,
+                'if-name': if_name,
+                'interface-state': interface_state,
+                'interface-proto-state': interface_proto_state,
+                'interface-mac': interface_mac}
+
     @property
     def switchport_list(self):
         """list[dict]:A list of dictionary items describing the details
@@ -2825,40 +2843,62 @@ class Interface(object):
             ...     assert is_vlan_interface_present
             True
         """
+        return list(self.iter_vlans())
+
+    def iter_vlans(self):
+        """Iterate over the rows of ``vlans`` as pages arrive.
+
+        Returns:
+            Generator of the ``vlans`` rows.
+
+        Examples:
+            >>> import pynos.device
+            >>> conn = ('10.24.39.211', '22')
+            >>> auth = ('admin', 'password')
+            >>> with pynos.device.Device(conn=conn, auth=auth) as dev:
+            ...     vlan_ids = [vlan['vlan-id']
+            ...                 for vlan in dev.interface.iter_vlans()]
+        """
+        return iter(pynos.paging.PageCursor(
+            self._callback, self.get_vlan_brief_request(''),
+            self._vlan_rows, self._next_vlan_brief_request))
+
+    def _next_vlan_brief_request(self, interface_result):
         urn = "{urn:brocade.com:mgmt:brocade-interface-ext}"
+        if self.get_node_value(interface_result, '%shas-more',
+                               urn) != 'true':
+            return None
+        return self.get_vlan_brief_request(self.get_node_value(
+            interface_result, '%slast-vlan-id', urn))
 
+    def _vlan_rows(self, interface_result):
+        urn = "{urn:brocade.com:mgmt:brocade-interface-ext}"
         result = []
-        has_more = ''
-        last_vlan_id = ''
-        while (has_more == '') or (has_more == 'true'):
-            request_interface = self.get_vlan_brief_request(last_vlan_id)
-            interface_result = self._callback(request_interface, 'get')
-            has_more = self.get_node_value(interface_result, '%shas-more', urn)
-            last_vlan_id = self.get_node_value(
-                interface_result, '%slast-vlan-id', urn)
-            for interface in interface_result.findall('%svlan' % urn):
-                vlan_id = self.get_node_value(interface, '%svlan-id', urn)
-                vlan_type = self.get_node_value(interface, '%svlan-type', urn)
-                vlan_name = self.get_node_value(interface, '%svlan-name', urn)
-                vlan_state = self.get_node_value(
-                    interface, '%svlan-state', urn)
-                ports = []
-                for intf in interface.findall('%sinterface' % urn):
-                    interface_type = self.get_node_value(
-                        intf, '%sinterface-type', urn)
-                    interface_name = self.get_node_value(
-                        intf, '%sinterface-name', urn)
-                    tag = self.get_node_value(intf, '%stag', urn)
-                    port_results = {'interface-type': interface_type,
-                                    'interface-name': interface_name,
-                                    'tag': tag}
-                    ports.append(port_results)
-                results = {'interface-name': vlan_name,
-                           'vlan-state': vlan_state,
-                           'vlan-id': vlan_id,
-                           'vlan-type': vlan_type,
-                           'interface': ports}
-                result.append(results)
+        for interface in interface_result.findall('%svlan' % urn):
+            vlan_id = self.get_node_value(interface, '%svlan-id', urn)
+            vlan_type = self.get_node_value(interface, '%svlan-type', urn)
+            vlan_name = self.get_node_value(interface, '%svlan-name', urn)
+            vlan_state = self.get_node_value(
+                interface, '%svlan-state', urn)
+            ports = []
+            for intf in interface.findall('%sinterface' % urn):
+                interface_type = self.get_node_value(
+                    intf, '%sinterface-type', urn)
+                interface_name = self.get_node_value(
+                    intf, '%sinterface-name', urn)
+                tag = self.get_node_value(intf, '%stag', urn)
+                port_results = {'interface-type': interface_type,
+                                'interface-name': interface_name,
+                                'tag': tag}
+                ports.append(pynos.records.build(
+                    pynos.records.VlanPort, port_results, self._records))
+            results = {'interface-name': vlan_name,
+                       'vlan-state': vlan_state,
+                       'vlan-id': vlan_id,
+                       'vlan-type': vlan_type,
+                       'interface': ports}
+            result.append(pynos.records.build(
+                pynos.records.Vlan, results, self._records))
         return result
 
     @staticmethod
@@ -2913,87 +2953,109 @@ class Interface(object):
             ...         port_int='1')
             ...         assert is_port_channel_exist
         """
+        return list(self.iter_port_channels())
+
+    def iter_port_channels(self):
+        """Iterate over the rows of ``port_channels`` as pages arrive.
+
+        Returns:
+            Generator of the ``port_channels`` rows.
+
+        Examples:
+            >>> import pynos.device
+            >>> conn = ('10.24.39.211', '22')
+            >>> auth = ('admin', 'password')
+            >>> with pynos.device.Device(conn=conn, auth=auth) as dev:
+            ...     for port_channel in dev.interface.iter_port_channels():
+            ...         if not port_channel['interfaces']:
+            ...             break
+        """
+        return iter(pynos.paging.PageCursor(
+            self._callback, self.get_port_chann_detail_request(''),
+            self._port_channel_rows, self._next_port_chann_detail_request))
+
+    def _next_port_chann_detail_request(self, port_channel_result):
         pc_urn = "{urn:brocade.com:mgmt:brocade-lag}"
-        result = []
-        has_more = ''
+        if self.get_node_value(port_channel_result, '%shas-more',
+                               pc_urn) != 'true':
+            return None
         last_aggregator_id = ''
-        while (has_more == '') or (has_more == 'true'):
-            request_port_channel = self.get_port_chann_detail_request(
-                last_aggregator_id)
-            port_channel_result = self._callback(request_port_channel, 'get')
-            has_more = self.get_node_value(port_channel_result,
-                                           '%shas-more', pc_urn)
-            if has_more == 'true':
-                for x in port_channel_result.findall('%slacp' % pc_urn):
-                    last_aggregator_id = self.get_node_value(x,
-                                                             '%saggregator-id',
-                                                             pc_urn)
-
-            for item in port_channel_result.findall('%slacp' % pc_urn):
-                interface_list = []
-                aggregator_id = self.get_node_value(
-                    item, '%saggregator-id', pc_urn)
-                aggregator_type = self.get_node_value(
-                    item, '%saggregator-type', pc_urn)
-                is_vlag = self.get_node_value(item, '%sisvlag', pc_urn)
-                aggregator_mode = self.get_node_value(
-                    item, '%saggregator-mode', pc_urn)
-                system_priority = self.get_node_value(
-                    item, '%ssystem-priority', pc_urn)
-                actor_system_id = self.get_node_value(
-                    item, '%sactor-system-id', pc_urn)
-                partner_oper_priority = self.get_node_value(
-                    item, '%spartner-oper-priority', pc_urn)
-                partner_system_id = self.get_node_value(
-                    item, '%spartner-system-id', pc_urn)
-                admin_key = self.get_node_value(
-                    item, '%sadmin-key', pc_urn)
-                oper_key = self.get_node_value(item, '%soper-key', pc_urn)
-                partner_oper_key = self.get_node_value(
-                    item, '%spartner-oper-key', pc_urn)
-                rx_link_count = self.get_node_value(
-                    item, '%srx-link-count', pc_urn)
-                tx_link_count = self.get_node_value(
-                    item, '%stx-link-count', pc_urn)
-                individual_agg = self.get_node_value(
-                    item, '%sindividual-agg', pc_urn)
-                ready_agg = self.get_node_value(
-                    item, '%sready-agg', pc_urn)
-                for item1 in item.findall('%saggr-member' % pc_urn):
-                    rbridge_id = self.get_node_value(
-                        item1, '%srbridge-id', pc_urn)
-                    int_type = self.get_node_value(
-                        item1, '%sinterface-type', pc_urn)
-                    int_name = self.get_node_value(
-                        item1, '%sinterface-name', pc_urn)
-                    actor_port = self.get_node_value(
-                        item1, '%sactor-port', pc_urn)
-                    sync = self.get_node_value(item1, '%ssync', pc_urn)
-                    port_channel_interface = {'rbridge-id': rbridge_id,
-                                              'interface-type': int_type,
-                                              'interface-name': int_name,
-                                              'actor_port': actor_port,
-                                              'sync': sync}
-                    interface_list.append(port_channel_interface)
-                results = {'interface-name': 'port-channel-' + aggregator_id,
-                           'interfaces': interface_list,
-                           'aggregator_id': aggregator_id,
-                           'aggregator_type': aggregator_type,
-                           'is_vlag': is_vlag,
-                           'aggregator_mode': aggregator_mode,
-                           'system_priority': system_priority,
-                           'actor_system_id': actor_system_id,
-                           'partner-oper-priority': partner_oper_priority,
-                           'partner-system-id': partner_system_id,
-                           'admin-key': admin_key,
-                           'oper-key': oper_key,
-                           'partner-oper-key': partner_oper_key,
-                           'rx-link-count': rx_link_count,
-                           'tx-link-count': tx_link_count,
-                           'individual-agg': individual_agg,
-                           'ready-agg': ready_agg}
-
-                result.append(results)
+        for x in port_channel_result.findall('%slacp' % pc_urn):
+            last_aggregator_id = self.get_node_value(x, '%saggregator-id',
+                                                     pc_urn)
+        return self.get_port_chann_detail_request(last_aggregator_id)
+
+    def _port_channel_rows(self, port_channel_result):
+        pc_urn = "{urn:brocade.com:mgmt:brocade-lag}"
+        result = []
+        for item in port_channel_result.findall('%slacp' % pc_urn):
+            interface_list = []
+            aggregator_id = self.get_node_value(
+                item, '%saggregator-id', pc_urn)
+            aggregator_type = self.get_node_value(
+                item, '%saggregator-type', pc_urn)
+            is_vlag = self.get_node_value(item, '%sisvlag', pc_urn)
+            aggregator_mode = self.get_node_value(
+                item, '%saggregator-mode', pc_urn)
+            system_priority = self.get_node_value(
+                item, '%ssystem-priority', pc_urn)
+            actor_system_id = self.get_node_value(
+                item, '%sactor-system-id', pc_urn)
+            partner_oper_priority = self.get_node_value(
+                item, '%spartner-oper-priority', pc_urn)
+            partner_system_id = self.get_node_value(
+                item, '%spartner-system-id', pc_urn)
+            admin_key = self.get_node_value(
+                item, '%sadmin-key', pc_urn)
+            oper_key = self.get_node_value(item, '%soper-key', pc_urn)
+            partner_oper_key = self.get_node_value(
+                item, '%spartner-oper-key', pc_urn)
+            rx_link_count = self.get_node_value(
+                item, '%srx-link-count', pc_urn)
+            tx_link_count = self.get_node_value(
+                item, '%stx-link-count', pc_urn)
+            individual_agg = self.get_node_value(
+                item, '%sindividual-agg', pc_urn)
+            ready_agg = self.get_node_value(
+                item, '%sready-agg', pc_urn)
+            for item1 in item.findall('%saggr-member' % pc_urn):
+                rbridge_id = self.get_node_value(
+                    item1, '%srbridge-id', pc_urn)
+                int_type = self.get_node_value(
+                    item1, '%sinterface-type', pc_urn)
+                int_name = self.get_node_value(
+                    item1, '%sinterface-name', pc_urn)
+                actor_port = self.get_node_value(
+                    item1, '%sactor-port', pc_urn)
+                sync = self.get_node_value(item1, '%ssync', pc_urn)
+                port_channel_interface = {'rbridge-id': rbridge_id,
+                                          'interface-type': int_type,
+                                          'interface-name': int_name,
+                                          'actor_port': actor_port,
+                                          'sync': sync}
+                interface_list.append(pynos.records.build(
+                    pynos.records.PortChannelMember,
+                    port_channel_interface, self._records))
+            results = {'interface-name': 'port-channel-' + aggregator_id,
+                       'interfaces': interface_list,
+                       'aggregator_id': aggregator_id,
+                       'aggregator_type': aggregator_type,
+                       'is_vlag': is_vlag,
+                       'aggregator_mode': aggregator_mode,
+                       'system_priority': system_priority,
+                       'actor_system_id': actor_system_id,
+                       'partner-oper-priority': partner_oper_priority,
+                       'partner-system-id': partner_system_id,
+                       'admin-key': admin_key,
+                       'oper-key': oper_key,
+                       'partner-oper-key': partner_oper_key,
+                       'rx-link-count': rx_link_count,
+                       'tx-link-count': tx_link_count,
+                       'individual-agg': individual_agg,
+                       'ready-agg': ready_agg}
+
+            result.append(pynos.records.build(
+                pynos.records.PortChannel, results, self._records))
         return result
 
     @staticmethod
@@ -15,6 +15,9 @@ limitations under the License.
 """
 import xml.etree.ElementTree as ET
 
+import pynos.paging
+import pynos.records
+
 
 class LLDP(object):
     """LLDP class containing LLDP methods and attributes.
@@ -33,60 +36,83 @@ class LLDP(object):
             None
         """
         self._callback = callback
+        self._records = False
 
     def neighbors(self, **kwargs):
 
         """list[dict]: A list of dictionary items describing the operational
         state of LLDP.
         """
-        urn = "{urn:brocade.com:mgmt:brocade-lldp-ext}"
+        return list(self.iter_neighbors(**kwargs))
+
+    def iter_neighbors(self, **kwargs):
+        """Iterate over the rows of ``neighbors`` as pages arrive.
+
+        Args:
+            rbridge_id (str): Neighbors of this rbridge only.
 
-        result = []
-        has_more = ''
-        last_ifindex = ''
-        rbridge_id = None
-        if 'rbridge_id' in kwargs:
-            rbridge_id = kwargs.pop('rbridge_id')
-        while (has_more == '') or (has_more == 'true'):
-            request_lldp = self.get_lldp_neighbors_request(last_ifindex,
-                                                           rbridge_id)
-            lldp_result = self._callback(request_lldp, 'get')
-            has_more = lldp_result.find('%shas-more' % urn).text
+        Returns:
+            Generator of the ``neighbors`` rows.
+
+        Examples:
+            >>> import pynos.device
+            >>> conn = ('10.24.39.211', '22')
+            >>> auth = ('admin', 'password')
+            >>> with pynos.device.Device(conn=conn, auth=auth) as dev:
+            ...     for neighbor in dev.lldp.iter_neighbors():
+            ...         if neighbor['remote-system-name'] == 'spine1':
+            ...             break
+        """
+        urn = "{urn:brocade.com:mgmt:brocade-lldp-ext}"
+        rbridge_id = kwargs.pop('rbridge_id', None)
 
+        def next_request(lldp_result):
+            if lldp_result.find('%shas-more' % urn).text != 'true':
+                return None
+            last_ifindex = ''
             for item in lldp_result.findall('%slldp-neighbor-detail' % urn):
-                local_int_name = item.find('%slocal-interface-name' % urn).text
-                local_int_mac = item.find('%slocal-interface-mac' % urn).text
                 last_ifindex = item.find(
                     '%slocal-interface-ifindex' % urn).text
-                remote_int_name = item.find(
-                    '%sremote-interface-name' % urn).text
-                remote_int_mac = item.find('%sremote-interface-mac' % urn).text
-                remote_chas_id = item.find('%sremote-chassis-id' % urn).text
-                try:
-                    remote_sys_name = item.find(
-                        '%sremote-system-name' % urn).text
-                except AttributeError:
-                    remote_sys_name = ''
-                if 'Fo ' in local_int_name:
-                    local_int_name = local_int_name.replace(
-                        'Fo ',
-                        'FortyGigabitEthernet '
-                    )
-                if 'Te ' in local_int_name:
-                    local_int_name = local_int_name.replace(
-                        'Te ',
-                        'TenGigabitEthernet '
-                    )
-
-                item_results = {'local-int-name': local_int_name,
-                                'local-int-mac': local_int_mac,
-                                'remote-int-name': remote_int_name,
-                                'remote-int-mac': remote_int_mac,
-                                'remote-chassis-id': remote_chas_id,
-                                'remote-system-name': remote_sys_name}
-                result.append(item_results)
-
-        return result
+            return self.get_lldp_neighbors_request(last_ifindex, rbridge_id)
+
+        def rows(lldp_result):
+            return [self._neighbor(item, urn) for item in
+                    lldp_result.findall('%slldp-neighbor-detail' % urn)]
+
+        return iter(pynos.paging.PageCursor(
+            self._callback, self.get_lldp_neighbors_request('', rbridge_id),
+            rows, next_request))
+
+    def _neighbor(self, item, urn):
+        """Decode one ``lldp-neighbor-detail`` entry."""
+        local_int_name = item.find('%slocal-interface-name' % urn).text
+        local_int_mac = item.find('%slocal-interface-mac' % urn).text
+        remote_int_name = item.find('%sremote-interface-name' % urn).text
+        remote_int_mac = item.find('%sremote-interface-mac' % urn).text
+        remote_chas_id = item.find('%sremote-chassis-id' % urn).text
+        try:
+            remote_sys_name = item.find('%sremote-system-name' % urn).text
+        except AttributeError:
+            remote_sys_name = ''
+        if 'Fo ' in local_int_name:
+            local_int_name = local_int_name.replace(
+                'Fo ',
+                'FortyGigabitEthernet '
+            )
+        if 'Te ' in local_int_name:
+            local_int_name = local_int_name.replace(
+                'Te ',
+                'TenGigabitEthernet '
+            )
+
+        item_results = {'local-int-name': local_int_name,
+                        'local-int-mac': local_int_mac,
+                        'remote-int-name': remote_int_name,
+                        'remote-int-mac': remote_int_mac,
+                        'remote-chassis-id': remote_chas_id,
+                        'remote-system-name': remote_sys_name}
+        return pynos.records.build(
+            pynos.records.LLDPNeighbor, item_results, self._records)
 
     @staticmethod
     def get_lldp_neighbors_request(last_ifindex, rbridge_id):
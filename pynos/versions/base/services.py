@@ -53,24 +53,59 @@ class Services(object):
         results = self._callback(get_arp_info, handler='get')
         result = []
         for item in results.findall('{%s}arp-entry' % xmlns):
-            ip_address = item.find('{%s}ip-address' % xmlns).text
-            mac_address = item.find('{%s}mac-address' % xmlns).text
-            interface_type = item.find('{%s}interface-type' % xmlns).text
-            interface_name = item.find('{%s}interface-name' % xmlns).text
-            is_resolved = item.find('{%s}is-resolved' % xmlns).text
-            age = item.find('{%s}age' % xmlns).text
-            entry_type = item.find('{%s}entry-type' % xmlns).text
-            item_results = {'ip-address': ip_address,
-                            'mac-address': mac_address,
-                            'interface-type': interface_type,
-                            'interface-name': interface_name,
-                            'is-resolved': is_resolved,
-                            'age': age,
-                            'entry-type': entry_type
-                            }
-            result.append(item_results)
+            result.append(self._arp_entry(item, xmlns))
         return result
 
+    def iter_arp(self):
+        """Iterate over the ARP table.
+
+        Same entries as ``arp``, but they are decoded incrementally: each
+        entry is yielded as soon as it is parsed and released after,
+        instead of building a tree of the whole table.  The text of the
+        reply is still received in full before the first entry.
+
+        Args:
+            None
+
+        Returns:
+            Generator of dict.
+
+        Raises:
+            PynosException: if the device answers with an rpc-error.
+
+        Examples:
+            >>> import pynos.device
+            >>> conn = ('10.24.39.211', '22')
+            >>> auth = ('admin', 'password')
+            >>> with pynos.device.Device(conn=conn, auth=auth) as dev:
+            ...     for entry in dev.services.iter_arp():
+            ...         print(entry['ip-address'], entry['mac-address'])
+        """
+        xmlns = 'urn:brocade.com:mgmt:brocade-arp'
+        get_arp_info = ET.Element('get-arp', xmlns=xmlns)
+        reply = self._callback(get_arp_info, handler='get_stream')
+        for item in pynos.utilities.iter_elements(reply,
+                                                  '{%s}arp-entry' % xmlns):
+            yield self._arp_entry(item, xmlns)
+
+    @staticmethod
+    def _arp_entry(item, xmlns):
+        ip_address = item.find('{%s}ip-address' % xmlns).text
+        mac_address = item.find('{%s}mac-address' % xmlns).text
+        interface_type = item.find('{%s}interface-type' % xmlns).text
+        interface_name = item.find('{%s}interface-name' % xmlns).text
+        is_resolved = item.find('{%s}is-resolved' % xmlns).text
+        age = item.find('{%s}age' % xmlns).text
+        entry_type = item.find('{%s}entry-type' % xmlns).text
+        return {'ip-address': ip_address,
+                'mac-address': mac_address,
+                'interface-type': interface_type,
+                'interface-name': interface_name,
+                'is-resolved': is_resolved,
+                'age': age,
+                'entry-type': entry_type
+                }
+
     def vrrp(self, **kwargs):
         """Enable or Disable VRRP.
 
@@ -1,37 +1,9 @@
 #!/usr/bin/env python
-import xml.etree.ElementTree as ET
+from pynos.versions.registry import YangBuilders
 
 
-class brocade_entity(object):
+class brocade_entity(YangBuilders):
     """Auto generated class.
-    """
-    def __init__(self, **kwargs):
-        self._callback = kwargs.pop('callback')
-
-            
-    def get_contained_in_ID_output_contained_in_ID(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_contained_in_ID = ET.Element("get_contained_in_ID")
-        config = get_contained_in_ID
-        output = ET.SubElement(get_contained_in_ID, "output")
-        contained_in_ID = ET.SubElement(output, "contained-in-ID")
-        contained_in_ID.text = kwargs.pop('contained_in_ID')
 
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_contained_in_ID_output_contained_in_ID(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_contained_in_ID = ET.Element("get_contained_in_ID")
-        config = get_contained_in_ID
-        output = ET.SubElement(get_contained_in_ID, "output")
-        contained_in_ID = ET.SubElement(output, "contained-in-ID")
-        contained_in_ID.text = kwargs.pop('contained_in_ID')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
\ No newline at end of file
+    Builders are read from brocade_entity.json.gz.
+    """
@@ -1,85 +1,9 @@
 #!/usr/bin/env python
-import xml.etree.ElementTree as ET
+from pynos.versions.registry import YangBuilders
 
 
-class brocade_ha(object):
+class brocade_ha(YangBuilders):
     """Auto generated class.
-    """
-    def __init__(self, **kwargs):
-        self._callback = kwargs.pop('callback')
-
-            
-    def reload_input_rbridge_id(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        reload = ET.Element("reload")
-        config = reload
-        input = ET.SubElement(reload, "input")
-        rbridge_id = ET.SubElement(input, "rbridge-id")
-        rbridge_id.text = kwargs.pop('rbridge_id')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def reload_input_system(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        reload = ET.Element("reload")
-        config = reload
-        input = ET.SubElement(reload, "input")
-        system = ET.SubElement(input, "system")
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def reload_input_standby(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        reload = ET.Element("reload")
-        config = reload
-        input = ET.SubElement(reload, "input")
-        standby = ET.SubElement(input, "standby")
 
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def reload_input_rbridge_id(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        reload = ET.Element("reload")
-        config = reload
-        input = ET.SubElement(reload, "input")
-        rbridge_id = ET.SubElement(input, "rbridge-id")
-        rbridge_id.text = kwargs.pop('rbridge_id')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def reload_input_system(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        reload = ET.Element("reload")
-        config = reload
-        input = ET.SubElement(reload, "input")
-        system = ET.SubElement(input, "system")
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def reload_input_standby(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        reload = ET.Element("reload")
-        config = reload
-        input = ET.SubElement(reload, "input")
-        standby = ET.SubElement(input, "standby")
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
\ No newline at end of file
+    Builders are read from brocade_ha.json.gz.
+    """
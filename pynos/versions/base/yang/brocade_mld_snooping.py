@@ -1,37 +1,9 @@
 #!/usr/bin/env python
-import xml.etree.ElementTree as ET
+from pynos.versions.registry import YangBuilders
 
 
-class brocade_mld_snooping(object):
+class brocade_mld_snooping(YangBuilders):
     """Auto generated class.
-    """
-    def __init__(self, **kwargs):
-        self._callback = kwargs.pop('callback')
-
-            
-    def mld_snooping_ipv6_mld_snooping_enable(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        mld_snooping = ET.SubElement(config, "mld-snooping", xmlns="urn:brocade.com:mgmt:brocade-mld-snooping")
-        ipv6 = ET.SubElement(mld_snooping, "ipv6")
-        mld = ET.SubElement(ipv6, "mld")
-        snooping = ET.SubElement(mld, "snooping")
-        enable = ET.SubElement(snooping, "enable")
 
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def mld_snooping_ipv6_mld_snooping_enable(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        mld_snooping = ET.SubElement(config, "mld-snooping", xmlns="urn:brocade.com:mgmt:brocade-mld-snooping")
-        ipv6 = ET.SubElement(mld_snooping, "ipv6")
-        mld = ET.SubElement(ipv6, "mld")
-        snooping = ET.SubElement(mld, "snooping")
-        enable = ET.SubElement(snooping, "enable")
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
\ No newline at end of file
+    Builders are read from brocade_mld_snooping.json.gz.
+    """
@@ -0,0 +1,287 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Registry of the generated YANG builders of each NOS release.
+
+The generated classes hold no code.  The builders of a module are packed
+into ``<module>.json.gz`` next to it and read the first time one of them
+is used: a trie of the elements the builders create, and for each builder
+its root element and the trie nodes it adds, in document order.
+``YangBuilders`` turns an entry back into a method with the name and
+output of the generated one.
+
+Only the oldest release holds complete tables.  The ``yang`` module of a
+later release subclasses the same module of the nearest earlier release
+that has it, and its table lists just the builders that are new or
+different and the names the release no longer has.  ``builder_class``
+resolves a module for any supported firmware version.
+"""
+import array
+import importlib
+import json
+import pkgutil
+import threading
+import types
+import xml.etree.ElementTree as ET
+import zlib
+
+import pynos.tracing
+import pynos.utilities
+
+RELEASES = (
+    ('5.0.1', 'pynos.versions.base.yang'),
+    ('6.0.1', 'pynos.versions.ver_6.ver_6_0_1.yang'),
+    ('7.0.0', 'pynos.versions.ver_7.ver_7_0_0.yang'),
+    ('7.1.0', 'pynos.versions.ver_7.ver_7_1_0.yang'),
+)
+"""tuple: (release, package) of each release with generated YANG modules,
+oldest first.  Each release is diffed against the ones before it."""
+
+FIRMWARE = {
+    '5.0.1': '5.0.1',
+    '6.0.1': '6.0.1',
+    '6.0.2': '6.0.1',
+    '7.0.0': '7.0.0',
+    '7.0.1': '7.0.0',
+    '7.1.0': '7.1.0',
+}
+"""dict: Release of the YANG modules used for each firmware version."""
+
+
+class YangBuilders(object):
+    """
+    Base of the generated YANG classes.
+
+    Builders are methods resolved by name from the packed tables of the
+    class and the classes it inherits from, nearest first.  A name the
+    table of a class lists as removed stops the search.
+    """
+
+    def __init__(self, **kwargs):
+        self._callback = kwargs.pop('callback')
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        builder = _builder(type(self), name)
+        if builder is None:
+            raise AttributeError('%r object has no attribute %r'
+                                 % (type(self).__name__, name))
+        if pynos.tracing.active and pynos.tracing.current() is not None:
+            return _traced_builder(self, builder)
+        return types.MethodType(builder, self)
+
+    def __dir__(self):
+        names = set(dir(type(self)))
+        names.update(vars(self))
+        names.update(builder_names(type(self)))
+        return sorted(names)
+
+
+class _Table(object):
+    """The packed builders of one generated class.
+
+    The trie is kept column-wise, and each builder as an array of its root
+    and its trie nodes, which takes a fraction of the memory of tuples.
+    """
+    __slots__ = ['parents', 'tags', 'attribs', 'kwargs', 'roots',
+                 'builders', 'removed']
+
+    def __init__(self, data):
+        strings = data['strings']
+        # ET.SubElement copies the attributes, so they can be shared.
+        attribs = dict((namespace, {'xmlns': strings[namespace]})
+                       for namespace in set(node[2] for node in data['nodes'])
+                       if namespace >= 0)
+        attribs[-1] = {}
+        self.parents = array.array('i', (node[0] for node in data['nodes']))
+        self.tags = [strings[node[1]] for node in data['nodes']]
+        self.attribs = [attribs[node[2]] for node in data['nodes']]
+        self.kwargs = [strings[node[3]] if node[3] >= 0 else None
+                       for node in data['nodes']]
+        self.roots = strings
+        self.builders = dict((name, array.array('i', [root] + path))
+                             for name, root, path in data['builders'])
+        self.removed = frozenset(data['removed'])
+
+
+_EMPTY = _Table({'strings': [], 'nodes': [], 'builders': [], 'removed': []})
+_lock = threading.Lock()
+
+
+def _table(cls):
+    table = cls.__dict__.get('_table')
+    if table is not None:
+        return table
+    package, _, module = cls.__module__.rpartition('.')
+    try:
+        packed = pkgutil.get_data(package, module + '.json.gz')
+    except IOError:
+        # Not a generated class, e.g. a subclass made by the caller.
+        table = _EMPTY
+    else:
+        table = _Table(json.loads(zlib.decompress(
+            packed, 16 + zlib.MAX_WBITS).decode('utf-8')))
+    with _lock:
+        if '_table' not in cls.__dict__:
+            cls._builders = {}
+            cls._table = table
+    return cls.__dict__['_table']
+
+
+def _generated_classes(cls):
+    for klass in cls.__mro__:
+        if klass is YangBuilders:
+            return
+        yield klass
+
+
+def _builder(cls, name):
+    """Return the function of builder `name` of `cls`, or None."""
+    _table(cls)
+    builder = cls.__dict__['_builders'].get(name)
+    if builder is not None:
+        return builder
+    for klass in _generated_classes(cls):
+        table = _table(klass)
+        if name in table.builders:
+            builder = _make_builder(str(name), table, table.builders[name])
+            return cls.__dict__['_builders'].setdefault(name, builder)
+        if name in table.removed:
+            return None
+    return None
+
+
+def _make_builder(name, table, recipe):
+    root = table.roots[recipe[0]]
+    path = recipe[1:]
+    parents, tags, attribs, kwarg_names = (table.parents, table.tags,
+                                           table.attribs, table.kwargs)
+
+    def builder(self, **kwargs):
+        config = ET.Element(root)
+        elements = {}
+        for index in path:
+            parent = parents[index]
+            element = ET.SubElement(
+                config if parent < 0 else elements[parent], tags[index],
+                attribs[index])
+            if kwarg_names[index] is not None:
+                element.text = kwargs.pop(kwarg_names[index])
+            elements[index] = element
+
+        callback = kwargs.pop('callback', self._callback)
+        return callback(config)
+    builder.__name__ = name
+    builder.__doc__ = 'Auto Generated Code'
+    return builder
+
+
+def _traced_builder(instance, builder):
+    """`builder` bound to `instance`, building its document in a span."""
+    def traced(**kwargs):
+        callback = kwargs.pop('callback', instance._callback)
+        with pynos.tracing.span('build', builder=builder.__name__):
+            config = builder(instance, callback=_document, **kwargs)
+        return callback(config)
+    traced.__name__ = builder.__name__
+    return traced
+
+
+def _document(config):
+    return config
+
+
+def builder_names(cls):
+    """Names of the builders available on a generated YANG class.
+
+    Args:
+        cls: A generated YANG class.
+
+    Returns:
+        set: Builder names.
+    """
+    names = set()
+    removed = set()
+    for klass in _generated_classes(cls):
+        table = _table(klass)
+        names.update(name for name in table.builders if name not in removed)
+        removed.update(table.removed)
+    return names
+
+
+def yang_package(firmware):
+    """Package of the YANG modules for a firmware version.
+
+    Args:
+        firmware (str): NOS firmware version.  Ex. '6.0.2'
+
+    Returns:
+        str: Dotted package path.
+
+    Raises:
+        ValueError: if `firmware` is not supported.
+    """
+    try:
+        release = FIRMWARE[firmware]
+    except KeyError:
+        raise ValueError('No YANG modules for firmware %r.' % firmware)
+    return dict(RELEASES)[release]
+
+
+def builder_class(module, firmware):
+    """Return a generated YANG class for a firmware version.
+
+    Args:
+        module (str): YANG module name.  Ex. 'brocade_interface'
+        firmware (str): NOS firmware version.  Ex. '7.0.1'
+
+    Returns:
+        The YANG class.
+
+    Raises:
+        ValueError: if `firmware` is not supported.
+        ImportError: if the release has no such module.
+
+    Examples:
+        >>> import pynos.versions.registry
+        >>> cls = pynos.versions.registry.builder_class('brocade_interface',
+        ...                                             '7.0.1')
+        >>> cls.__module__
+        'pynos.versions.ver_7.ver_7_0_0.yang.brocade_interface'
+    """
+    package = yang_package(firmware)
+    return getattr(importlib.import_module('%s.%s' % (package, module)),
+                   module)
+
+
+def builders(module, firmware, callback=pynos.utilities.return_xml):
+    """Return an instance of a generated YANG class for a firmware version.
+
+    Args:
+        module (str): YANG module name.  Ex. 'brocade_interface'
+        firmware (str): NOS firmware version.  Ex. '7.0.1'
+        callback (function): Callback of the builders.  Default:
+            ``pynos.utilities.return_xml``.
+
+    Returns:
+        The YANG class instance.
+
+    Raises:
+        ValueError: if `firmware` is not supported.
+        ImportError: if the release has no such module.
+    """
+    return builder_class(module, firmware)(callback=callback)
@@ -32,6 +32,7 @@ class Interface(InterfaceBase):
             None
         """
         self._callback = callback
+        self._records = False
 
     def mac_move_detect_enable(self, **kwargs):
         raise NotImplementedError
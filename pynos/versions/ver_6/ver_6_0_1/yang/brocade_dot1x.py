@@ -1,55 +1,11 @@
 #!/usr/bin/env python
-import xml.etree.ElementTree as ET
+from pynos.versions.base.yang.brocade_dot1x import \
+    brocade_dot1x as parent_class
 
 
-class brocade_dot1x(object):
+class brocade_dot1x(parent_class):
     """Auto generated class.
-    """
-    def __init__(self, **kwargs):
-        self._callback = kwargs.pop('callback')
-
-            
-    def dot1x_enable(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        dot1x = ET.SubElement(config, "dot1x", xmlns="urn:brocade.com:mgmt:brocade-dot1x")
-        enable = ET.SubElement(dot1x, "enable")
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def dot1x_test_timeout(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        dot1x = ET.SubElement(config, "dot1x", xmlns="urn:brocade.com:mgmt:brocade-dot1x")
-        test = ET.SubElement(dot1x, "test")
-        timeout = ET.SubElement(test, "timeout")
-        timeout.text = kwargs.pop('timeout')
 
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def dot1x_enable(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        dot1x = ET.SubElement(config, "dot1x", xmlns="urn:brocade.com:mgmt:brocade-dot1x")
-        enable = ET.SubElement(dot1x, "enable")
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def dot1x_test_timeout(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        dot1x = ET.SubElement(config, "dot1x", xmlns="urn:brocade.com:mgmt:brocade-dot1x")
-        test = ET.SubElement(dot1x, "test")
-        timeout = ET.SubElement(test, "timeout")
-        timeout.text = kwargs.pop('timeout')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
\ No newline at end of file
+    Builders that differ from pynos.versions.base.yang.brocade_dot1x
+    are read from brocade_dot1x.json.gz.
+    """
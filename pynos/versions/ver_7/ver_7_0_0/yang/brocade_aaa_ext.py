@@ -1,37 +1,11 @@
 #!/usr/bin/env python
-import xml.etree.ElementTree as ET
+from pynos.versions.ver_6.ver_6_0_1.yang.brocade_aaa_ext import \
+    brocade_aaa_ext as parent_class
 
 
-class brocade_aaa_ext(object):
+class brocade_aaa_ext(parent_class):
     """Auto generated class.
-    """
-    def __init__(self, **kwargs):
-        self._callback = kwargs.pop('callback')
-
-            
-    def user_session_info_output_user_role(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        user_session_info = ET.Element("user_session_info")
-        config = user_session_info
-        output = ET.SubElement(user_session_info, "output")
-        user_role = ET.SubElement(output, "user-role")
-        user_role.text = kwargs.pop('user_role')
 
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def user_session_info_output_user_role(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        user_session_info = ET.Element("user_session_info")
-        config = user_session_info
-        output = ET.SubElement(user_session_info, "output")
-        user_role = ET.SubElement(output, "user-role")
-        user_role.text = kwargs.pop('user_role')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
\ No newline at end of file
+    Builders that differ from pynos.versions.ver_6.ver_6_0_1.yang.brocade_aaa_ext
+    are read from brocade_aaa_ext.json.gz.
+    """
@@ -1,53 +1,11 @@
 #!/usr/bin/env python
-import xml.etree.ElementTree as ET
+from pynos.versions.ver_6.ver_6_0_1.yang.brocade_lacp import \
+    brocade_lacp as parent_class
 
 
-class brocade_lacp(object):
+class brocade_lacp(parent_class):
     """Auto generated class.
-    """
-    def __init__(self, **kwargs):
-        self._callback = kwargs.pop('callback')
-
-            
-    def lacp_system_priority(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        lacp = ET.SubElement(config, "lacp", xmlns="urn:brocade.com:mgmt:brocade-lacp")
-        system_priority = ET.SubElement(lacp, "system-priority")
-        system_priority.text = kwargs.pop('system_priority')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def vlag_commit_mode_disable(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        vlag_commit_mode = ET.SubElement(config, "vlag-commit-mode", xmlns="urn:brocade.com:mgmt:brocade-lacp")
-        disable = ET.SubElement(vlag_commit_mode, "disable")
 
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def lacp_system_priority(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        lacp = ET.SubElement(config, "lacp", xmlns="urn:brocade.com:mgmt:brocade-lacp")
-        system_priority = ET.SubElement(lacp, "system-priority")
-        system_priority.text = kwargs.pop('system_priority')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def vlag_commit_mode_disable(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        vlag_commit_mode = ET.SubElement(config, "vlag-commit-mode", xmlns="urn:brocade.com:mgmt:brocade-lacp")
-        disable = ET.SubElement(vlag_commit_mode, "disable")
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
\ No newline at end of file
+    Builders that differ from pynos.versions.ver_6.ver_6_0_1.yang.brocade_lacp
+    are read from brocade_lacp.json.gz.
+    """
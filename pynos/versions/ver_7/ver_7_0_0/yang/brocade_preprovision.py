@@ -1,93 +1,11 @@
 #!/usr/bin/env python
-import xml.etree.ElementTree as ET
+from pynos.versions.ver_6.ver_6_0_1.yang.brocade_preprovision import \
+    brocade_preprovision as parent_class
 
 
-class brocade_preprovision(object):
+class brocade_preprovision(parent_class):
     """Auto generated class.
-    """
-    def __init__(self, **kwargs):
-        self._callback = kwargs.pop('callback')
-
-            
-    def preprovision_rbridge_id_rbridge_id(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        preprovision = ET.SubElement(config, "preprovision", xmlns="urn:brocade.com:mgmt:brocade-preprovision")
-        rbridge_id = ET.SubElement(preprovision, "rbridge-id")
-        wwn_key = ET.SubElement(rbridge_id, "wwn")
-        wwn_key.text = kwargs.pop('wwn')
-        rbridge_id = ET.SubElement(rbridge_id, "rbridge-id")
-        rbridge_id.text = kwargs.pop('rbridge_id')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def preprovision_rbridge_id_wwn(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        preprovision = ET.SubElement(config, "preprovision", xmlns="urn:brocade.com:mgmt:brocade-preprovision")
-        rbridge_id = ET.SubElement(preprovision, "rbridge-id")
-        rbridge_id_key = ET.SubElement(rbridge_id, "rbridge-id")
-        rbridge_id_key.text = kwargs.pop('rbridge_id')
-        wwn = ET.SubElement(rbridge_id, "wwn")
-        wwn.text = kwargs.pop('wwn')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def show_bare_metal_state_output_bare_metal_state(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        show_bare_metal_state = ET.Element("show_bare_metal_state")
-        config = show_bare_metal_state
-        output = ET.SubElement(show_bare_metal_state, "output")
-        bare_metal_state = ET.SubElement(output, "bare-metal-state")
-        bare_metal_state.text = kwargs.pop('bare_metal_state')
 
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def preprovision_rbridge_id_rbridge_id(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        preprovision = ET.SubElement(config, "preprovision", xmlns="urn:brocade.com:mgmt:brocade-preprovision")
-        rbridge_id = ET.SubElement(preprovision, "rbridge-id")
-        wwn_key = ET.SubElement(rbridge_id, "wwn")
-        wwn_key.text = kwargs.pop('wwn')
-        rbridge_id = ET.SubElement(rbridge_id, "rbridge-id")
-        rbridge_id.text = kwargs.pop('rbridge_id')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def preprovision_rbridge_id_wwn(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        preprovision = ET.SubElement(config, "preprovision", xmlns="urn:brocade.com:mgmt:brocade-preprovision")
-        rbridge_id = ET.SubElement(preprovision, "rbridge-id")
-        rbridge_id_key = ET.SubElement(rbridge_id, "rbridge-id")
-        rbridge_id_key.text = kwargs.pop('rbridge_id')
-        wwn = ET.SubElement(rbridge_id, "wwn")
-        wwn.text = kwargs.pop('wwn')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def show_bare_metal_state_output_bare_metal_state(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        show_bare_metal_state = ET.Element("show_bare_metal_state")
-        config = show_bare_metal_state
-        output = ET.SubElement(show_bare_metal_state, "output")
-        bare_metal_state = ET.SubElement(output, "bare-metal-state")
-        bare_metal_state.text = kwargs.pop('bare_metal_state')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
\ No newline at end of file
+    Builders that differ from pynos.versions.ver_6.ver_6_0_1.yang.brocade_preprovision
+    are read from brocade_preprovision.json.gz.
+    """
@@ -1,2437 +1,11 @@
 #!/usr/bin/env python
-import xml.etree.ElementTree as ET
+from pynos.versions.ver_6.ver_6_0_1.yang.brocade_vswitch import \
+    brocade_vswitch as parent_class
 
 
-class brocade_vswitch(object):
+class brocade_vswitch(parent_class):
     """Auto generated class.
-    """
-    def __init__(self, **kwargs):
-        self._callback = kwargs.pop('callback')
-
-            
-    def get_vnetwork_hosts_input_vcenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_hosts = ET.Element("get_vnetwork_hosts")
-        config = get_vnetwork_hosts
-        input = ET.SubElement(get_vnetwork_hosts, "input")
-        vcenter = ET.SubElement(input, "vcenter")
-        vcenter.text = kwargs.pop('vcenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_hosts_input_datacenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_hosts = ET.Element("get_vnetwork_hosts")
-        config = get_vnetwork_hosts
-        input = ET.SubElement(get_vnetwork_hosts, "input")
-        datacenter = ET.SubElement(input, "datacenter")
-        datacenter.text = kwargs.pop('datacenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_hosts_input_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_hosts = ET.Element("get_vnetwork_hosts")
-        config = get_vnetwork_hosts
-        input = ET.SubElement(get_vnetwork_hosts, "input")
-        name = ET.SubElement(input, "name")
-        name.text = kwargs.pop('name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_hosts_input_last_rcvd_instance(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_hosts = ET.Element("get_vnetwork_hosts")
-        config = get_vnetwork_hosts
-        input = ET.SubElement(get_vnetwork_hosts, "input")
-        last_rcvd_instance = ET.SubElement(input, "last-rcvd-instance")
-        last_rcvd_instance.text = kwargs.pop('last_rcvd_instance')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_hosts_output_vnetwork_hosts_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_hosts = ET.Element("get_vnetwork_hosts")
-        config = get_vnetwork_hosts
-        output = ET.SubElement(get_vnetwork_hosts, "output")
-        vnetwork_hosts = ET.SubElement(output, "vnetwork-hosts")
-        name = ET.SubElement(vnetwork_hosts, "name")
-        name.text = kwargs.pop('name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_hosts_output_vnetwork_hosts_vmnic(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_hosts = ET.Element("get_vnetwork_hosts")
-        config = get_vnetwork_hosts
-        output = ET.SubElement(get_vnetwork_hosts, "output")
-        vnetwork_hosts = ET.SubElement(output, "vnetwork-hosts")
-        vmnic = ET.SubElement(vnetwork_hosts, "vmnic")
-        vmnic.text = kwargs.pop('vmnic')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_hosts_output_vnetwork_hosts_datacenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_hosts = ET.Element("get_vnetwork_hosts")
-        config = get_vnetwork_hosts
-        output = ET.SubElement(get_vnetwork_hosts, "output")
-        vnetwork_hosts = ET.SubElement(output, "vnetwork-hosts")
-        datacenter = ET.SubElement(vnetwork_hosts, "datacenter")
-        datacenter.text = kwargs.pop('datacenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_hosts_output_vnetwork_hosts_mac(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_hosts = ET.Element("get_vnetwork_hosts")
-        config = get_vnetwork_hosts
-        output = ET.SubElement(get_vnetwork_hosts, "output")
-        vnetwork_hosts = ET.SubElement(output, "vnetwork-hosts")
-        mac = ET.SubElement(vnetwork_hosts, "mac")
-        mac.text = kwargs.pop('mac')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_hosts_output_vnetwork_hosts_vswitch(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_hosts = ET.Element("get_vnetwork_hosts")
-        config = get_vnetwork_hosts
-        output = ET.SubElement(get_vnetwork_hosts, "output")
-        vnetwork_hosts = ET.SubElement(output, "vnetwork-hosts")
-        vswitch = ET.SubElement(vnetwork_hosts, "vswitch")
-        vswitch.text = kwargs.pop('vswitch')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_hosts_output_vnetwork_hosts_interface_type(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_hosts = ET.Element("get_vnetwork_hosts")
-        config = get_vnetwork_hosts
-        output = ET.SubElement(get_vnetwork_hosts, "output")
-        vnetwork_hosts = ET.SubElement(output, "vnetwork-hosts")
-        interface_type = ET.SubElement(vnetwork_hosts, "interface-type")
-        interface_type.text = kwargs.pop('interface_type')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_hosts_output_vnetwork_hosts_interface_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_hosts = ET.Element("get_vnetwork_hosts")
-        config = get_vnetwork_hosts
-        output = ET.SubElement(get_vnetwork_hosts, "output")
-        vnetwork_hosts = ET.SubElement(output, "vnetwork-hosts")
-        interface_name = ET.SubElement(vnetwork_hosts, "interface-name")
-        interface_name.text = kwargs.pop('interface_name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_hosts_output_has_more(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_hosts = ET.Element("get_vnetwork_hosts")
-        config = get_vnetwork_hosts
-        output = ET.SubElement(get_vnetwork_hosts, "output")
-        has_more = ET.SubElement(output, "has-more")
-        has_more.text = kwargs.pop('has_more')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_hosts_output_instance_id(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_hosts = ET.Element("get_vnetwork_hosts")
-        config = get_vnetwork_hosts
-        output = ET.SubElement(get_vnetwork_hosts, "output")
-        instance_id = ET.SubElement(output, "instance-id")
-        instance_id.text = kwargs.pop('instance_id')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vms_input_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vms = ET.Element("get_vnetwork_vms")
-        config = get_vnetwork_vms
-        input = ET.SubElement(get_vnetwork_vms, "input")
-        name = ET.SubElement(input, "name")
-        name.text = kwargs.pop('name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vms_input_vcenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vms = ET.Element("get_vnetwork_vms")
-        config = get_vnetwork_vms
-        input = ET.SubElement(get_vnetwork_vms, "input")
-        vcenter = ET.SubElement(input, "vcenter")
-        vcenter.text = kwargs.pop('vcenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vms_input_datacenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vms = ET.Element("get_vnetwork_vms")
-        config = get_vnetwork_vms
-        input = ET.SubElement(get_vnetwork_vms, "input")
-        datacenter = ET.SubElement(input, "datacenter")
-        datacenter.text = kwargs.pop('datacenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vms_input_last_rcvd_instance(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vms = ET.Element("get_vnetwork_vms")
-        config = get_vnetwork_vms
-        input = ET.SubElement(get_vnetwork_vms, "input")
-        last_rcvd_instance = ET.SubElement(input, "last-rcvd-instance")
-        last_rcvd_instance.text = kwargs.pop('last_rcvd_instance')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vms_output_vnetwork_vms_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vms = ET.Element("get_vnetwork_vms")
-        config = get_vnetwork_vms
-        output = ET.SubElement(get_vnetwork_vms, "output")
-        vnetwork_vms = ET.SubElement(output, "vnetwork-vms")
-        name = ET.SubElement(vnetwork_vms, "name")
-        name.text = kwargs.pop('name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vms_output_vnetwork_vms_mac(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vms = ET.Element("get_vnetwork_vms")
-        config = get_vnetwork_vms
-        output = ET.SubElement(get_vnetwork_vms, "output")
-        vnetwork_vms = ET.SubElement(output, "vnetwork-vms")
-        mac = ET.SubElement(vnetwork_vms, "mac")
-        mac.text = kwargs.pop('mac')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vms_output_vnetwork_vms_datacenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vms = ET.Element("get_vnetwork_vms")
-        config = get_vnetwork_vms
-        output = ET.SubElement(get_vnetwork_vms, "output")
-        vnetwork_vms = ET.SubElement(output, "vnetwork-vms")
-        datacenter = ET.SubElement(vnetwork_vms, "datacenter")
-        datacenter.text = kwargs.pop('datacenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vms_output_vnetwork_vms_ip(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vms = ET.Element("get_vnetwork_vms")
-        config = get_vnetwork_vms
-        output = ET.SubElement(get_vnetwork_vms, "output")
-        vnetwork_vms = ET.SubElement(output, "vnetwork-vms")
-        ip = ET.SubElement(vnetwork_vms, "ip")
-        ip.text = kwargs.pop('ip')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vms_output_vnetwork_vms_host_nn(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vms = ET.Element("get_vnetwork_vms")
-        config = get_vnetwork_vms
-        output = ET.SubElement(get_vnetwork_vms, "output")
-        vnetwork_vms = ET.SubElement(output, "vnetwork-vms")
-        host_nn = ET.SubElement(vnetwork_vms, "host-nn")
-        host_nn.text = kwargs.pop('host_nn')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vms_output_has_more(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vms = ET.Element("get_vnetwork_vms")
-        config = get_vnetwork_vms
-        output = ET.SubElement(get_vnetwork_vms, "output")
-        has_more = ET.SubElement(output, "has-more")
-        has_more.text = kwargs.pop('has_more')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vms_output_instance_id(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vms = ET.Element("get_vnetwork_vms")
-        config = get_vnetwork_vms
-        output = ET.SubElement(get_vnetwork_vms, "output")
-        instance_id = ET.SubElement(output, "instance-id")
-        instance_id.text = kwargs.pop('instance_id')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvpgs_input_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvpgs = ET.Element("get_vnetwork_dvpgs")
-        config = get_vnetwork_dvpgs
-        input = ET.SubElement(get_vnetwork_dvpgs, "input")
-        name = ET.SubElement(input, "name")
-        name.text = kwargs.pop('name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvpgs_input_vcenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvpgs = ET.Element("get_vnetwork_dvpgs")
-        config = get_vnetwork_dvpgs
-        input = ET.SubElement(get_vnetwork_dvpgs, "input")
-        vcenter = ET.SubElement(input, "vcenter")
-        vcenter.text = kwargs.pop('vcenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvpgs_input_datacenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvpgs = ET.Element("get_vnetwork_dvpgs")
-        config = get_vnetwork_dvpgs
-        input = ET.SubElement(get_vnetwork_dvpgs, "input")
-        datacenter = ET.SubElement(input, "datacenter")
-        datacenter.text = kwargs.pop('datacenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvpgs_input_last_rcvd_instance(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvpgs = ET.Element("get_vnetwork_dvpgs")
-        config = get_vnetwork_dvpgs
-        input = ET.SubElement(get_vnetwork_dvpgs, "input")
-        last_rcvd_instance = ET.SubElement(input, "last-rcvd-instance")
-        last_rcvd_instance.text = kwargs.pop('last_rcvd_instance')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvpgs_output_vnetwork_dvpgs_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvpgs = ET.Element("get_vnetwork_dvpgs")
-        config = get_vnetwork_dvpgs
-        output = ET.SubElement(get_vnetwork_dvpgs, "output")
-        vnetwork_dvpgs = ET.SubElement(output, "vnetwork-dvpgs")
-        name = ET.SubElement(vnetwork_dvpgs, "name")
-        name.text = kwargs.pop('name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvpgs_output_vnetwork_dvpgs_datacenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvpgs = ET.Element("get_vnetwork_dvpgs")
-        config = get_vnetwork_dvpgs
-        output = ET.SubElement(get_vnetwork_dvpgs, "output")
-        vnetwork_dvpgs = ET.SubElement(output, "vnetwork-dvpgs")
-        datacenter = ET.SubElement(vnetwork_dvpgs, "datacenter")
-        datacenter.text = kwargs.pop('datacenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvpgs_output_vnetwork_dvpgs_dvs_nn(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvpgs = ET.Element("get_vnetwork_dvpgs")
-        config = get_vnetwork_dvpgs
-        output = ET.SubElement(get_vnetwork_dvpgs, "output")
-        vnetwork_dvpgs = ET.SubElement(output, "vnetwork-dvpgs")
-        dvs_nn = ET.SubElement(vnetwork_dvpgs, "dvs-nn")
-        dvs_nn.text = kwargs.pop('dvs_nn')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvpgs_output_vnetwork_dvpgs_vlan(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvpgs = ET.Element("get_vnetwork_dvpgs")
-        config = get_vnetwork_dvpgs
-        output = ET.SubElement(get_vnetwork_dvpgs, "output")
-        vnetwork_dvpgs = ET.SubElement(output, "vnetwork-dvpgs")
-        vlan = ET.SubElement(vnetwork_dvpgs, "vlan")
-        vlan.text = kwargs.pop('vlan')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvpgs_output_has_more(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvpgs = ET.Element("get_vnetwork_dvpgs")
-        config = get_vnetwork_dvpgs
-        output = ET.SubElement(get_vnetwork_dvpgs, "output")
-        has_more = ET.SubElement(output, "has-more")
-        has_more.text = kwargs.pop('has_more')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvpgs_output_instance_id(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvpgs = ET.Element("get_vnetwork_dvpgs")
-        config = get_vnetwork_dvpgs
-        output = ET.SubElement(get_vnetwork_dvpgs, "output")
-        instance_id = ET.SubElement(output, "instance-id")
-        instance_id.text = kwargs.pop('instance_id')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvs_input_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvs = ET.Element("get_vnetwork_dvs")
-        config = get_vnetwork_dvs
-        input = ET.SubElement(get_vnetwork_dvs, "input")
-        name = ET.SubElement(input, "name")
-        name.text = kwargs.pop('name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvs_input_vcenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvs = ET.Element("get_vnetwork_dvs")
-        config = get_vnetwork_dvs
-        input = ET.SubElement(get_vnetwork_dvs, "input")
-        vcenter = ET.SubElement(input, "vcenter")
-        vcenter.text = kwargs.pop('vcenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvs_input_datacenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvs = ET.Element("get_vnetwork_dvs")
-        config = get_vnetwork_dvs
-        input = ET.SubElement(get_vnetwork_dvs, "input")
-        datacenter = ET.SubElement(input, "datacenter")
-        datacenter.text = kwargs.pop('datacenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvs_input_last_rcvd_instance(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvs = ET.Element("get_vnetwork_dvs")
-        config = get_vnetwork_dvs
-        input = ET.SubElement(get_vnetwork_dvs, "input")
-        last_rcvd_instance = ET.SubElement(input, "last-rcvd-instance")
-        last_rcvd_instance.text = kwargs.pop('last_rcvd_instance')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvs_output_vnetwork_dvs_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvs = ET.Element("get_vnetwork_dvs")
-        config = get_vnetwork_dvs
-        output = ET.SubElement(get_vnetwork_dvs, "output")
-        vnetwork_dvs = ET.SubElement(output, "vnetwork-dvs")
-        name = ET.SubElement(vnetwork_dvs, "name")
-        name.text = kwargs.pop('name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvs_output_vnetwork_dvs_host(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvs = ET.Element("get_vnetwork_dvs")
-        config = get_vnetwork_dvs
-        output = ET.SubElement(get_vnetwork_dvs, "output")
-        vnetwork_dvs = ET.SubElement(output, "vnetwork-dvs")
-        host = ET.SubElement(vnetwork_dvs, "host")
-        host.text = kwargs.pop('host')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvs_output_vnetwork_dvs_datacenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvs = ET.Element("get_vnetwork_dvs")
-        config = get_vnetwork_dvs
-        output = ET.SubElement(get_vnetwork_dvs, "output")
-        vnetwork_dvs = ET.SubElement(output, "vnetwork-dvs")
-        datacenter = ET.SubElement(vnetwork_dvs, "datacenter")
-        datacenter.text = kwargs.pop('datacenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvs_output_vnetwork_dvs_pnic(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvs = ET.Element("get_vnetwork_dvs")
-        config = get_vnetwork_dvs
-        output = ET.SubElement(get_vnetwork_dvs, "output")
-        vnetwork_dvs = ET.SubElement(output, "vnetwork-dvs")
-        pnic = ET.SubElement(vnetwork_dvs, "pnic")
-        pnic.text = kwargs.pop('pnic')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvs_output_vnetwork_dvs_interface_type(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvs = ET.Element("get_vnetwork_dvs")
-        config = get_vnetwork_dvs
-        output = ET.SubElement(get_vnetwork_dvs, "output")
-        vnetwork_dvs = ET.SubElement(output, "vnetwork-dvs")
-        interface_type = ET.SubElement(vnetwork_dvs, "interface-type")
-        interface_type.text = kwargs.pop('interface_type')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvs_output_vnetwork_dvs_interface_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvs = ET.Element("get_vnetwork_dvs")
-        config = get_vnetwork_dvs
-        output = ET.SubElement(get_vnetwork_dvs, "output")
-        vnetwork_dvs = ET.SubElement(output, "vnetwork-dvs")
-        interface_name = ET.SubElement(vnetwork_dvs, "interface-name")
-        interface_name.text = kwargs.pop('interface_name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvs_output_has_more(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvs = ET.Element("get_vnetwork_dvs")
-        config = get_vnetwork_dvs
-        output = ET.SubElement(get_vnetwork_dvs, "output")
-        has_more = ET.SubElement(output, "has-more")
-        has_more.text = kwargs.pop('has_more')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvs_output_instance_id(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvs = ET.Element("get_vnetwork_dvs")
-        config = get_vnetwork_dvs
-        output = ET.SubElement(get_vnetwork_dvs, "output")
-        instance_id = ET.SubElement(output, "instance-id")
-        instance_id.text = kwargs.pop('instance_id')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vswitches_input_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vswitches = ET.Element("get_vnetwork_vswitches")
-        config = get_vnetwork_vswitches
-        input = ET.SubElement(get_vnetwork_vswitches, "input")
-        name = ET.SubElement(input, "name")
-        name.text = kwargs.pop('name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vswitches_input_vcenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vswitches = ET.Element("get_vnetwork_vswitches")
-        config = get_vnetwork_vswitches
-        input = ET.SubElement(get_vnetwork_vswitches, "input")
-        vcenter = ET.SubElement(input, "vcenter")
-        vcenter.text = kwargs.pop('vcenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vswitches_input_datacenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vswitches = ET.Element("get_vnetwork_vswitches")
-        config = get_vnetwork_vswitches
-        input = ET.SubElement(get_vnetwork_vswitches, "input")
-        datacenter = ET.SubElement(input, "datacenter")
-        datacenter.text = kwargs.pop('datacenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vswitches_input_last_rcvd_instance(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vswitches = ET.Element("get_vnetwork_vswitches")
-        config = get_vnetwork_vswitches
-        input = ET.SubElement(get_vnetwork_vswitches, "input")
-        last_rcvd_instance = ET.SubElement(input, "last-rcvd-instance")
-        last_rcvd_instance.text = kwargs.pop('last_rcvd_instance')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vswitches_output_vnetwork_vswitches_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vswitches = ET.Element("get_vnetwork_vswitches")
-        config = get_vnetwork_vswitches
-        output = ET.SubElement(get_vnetwork_vswitches, "output")
-        vnetwork_vswitches = ET.SubElement(output, "vnetwork-vswitches")
-        name = ET.SubElement(vnetwork_vswitches, "name")
-        name.text = kwargs.pop('name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vswitches_output_vnetwork_vswitches_host(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vswitches = ET.Element("get_vnetwork_vswitches")
-        config = get_vnetwork_vswitches
-        output = ET.SubElement(get_vnetwork_vswitches, "output")
-        vnetwork_vswitches = ET.SubElement(output, "vnetwork-vswitches")
-        host = ET.SubElement(vnetwork_vswitches, "host")
-        host.text = kwargs.pop('host')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vswitches_output_vnetwork_vswitches_datacenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vswitches = ET.Element("get_vnetwork_vswitches")
-        config = get_vnetwork_vswitches
-        output = ET.SubElement(get_vnetwork_vswitches, "output")
-        vnetwork_vswitches = ET.SubElement(output, "vnetwork-vswitches")
-        datacenter = ET.SubElement(vnetwork_vswitches, "datacenter")
-        datacenter.text = kwargs.pop('datacenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vswitches_output_vnetwork_vswitches_pnic(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vswitches = ET.Element("get_vnetwork_vswitches")
-        config = get_vnetwork_vswitches
-        output = ET.SubElement(get_vnetwork_vswitches, "output")
-        vnetwork_vswitches = ET.SubElement(output, "vnetwork-vswitches")
-        pnic = ET.SubElement(vnetwork_vswitches, "pnic")
-        pnic.text = kwargs.pop('pnic')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vswitches_output_vnetwork_vswitches_interface_type(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vswitches = ET.Element("get_vnetwork_vswitches")
-        config = get_vnetwork_vswitches
-        output = ET.SubElement(get_vnetwork_vswitches, "output")
-        vnetwork_vswitches = ET.SubElement(output, "vnetwork-vswitches")
-        interface_type = ET.SubElement(vnetwork_vswitches, "interface-type")
-        interface_type.text = kwargs.pop('interface_type')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vswitches_output_vnetwork_vswitches_interface_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vswitches = ET.Element("get_vnetwork_vswitches")
-        config = get_vnetwork_vswitches
-        output = ET.SubElement(get_vnetwork_vswitches, "output")
-        vnetwork_vswitches = ET.SubElement(output, "vnetwork-vswitches")
-        interface_name = ET.SubElement(vnetwork_vswitches, "interface-name")
-        interface_name.text = kwargs.pop('interface_name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vswitches_output_has_more(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vswitches = ET.Element("get_vnetwork_vswitches")
-        config = get_vnetwork_vswitches
-        output = ET.SubElement(get_vnetwork_vswitches, "output")
-        has_more = ET.SubElement(output, "has-more")
-        has_more.text = kwargs.pop('has_more')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vswitches_output_instance_id(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vswitches = ET.Element("get_vnetwork_vswitches")
-        config = get_vnetwork_vswitches
-        output = ET.SubElement(get_vnetwork_vswitches, "output")
-        instance_id = ET.SubElement(output, "instance-id")
-        instance_id.text = kwargs.pop('instance_id')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_portgroups_input_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_portgroups = ET.Element("get_vnetwork_portgroups")
-        config = get_vnetwork_portgroups
-        input = ET.SubElement(get_vnetwork_portgroups, "input")
-        name = ET.SubElement(input, "name")
-        name.text = kwargs.pop('name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_portgroups_input_vcenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_portgroups = ET.Element("get_vnetwork_portgroups")
-        config = get_vnetwork_portgroups
-        input = ET.SubElement(get_vnetwork_portgroups, "input")
-        vcenter = ET.SubElement(input, "vcenter")
-        vcenter.text = kwargs.pop('vcenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_portgroups_input_datacenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_portgroups = ET.Element("get_vnetwork_portgroups")
-        config = get_vnetwork_portgroups
-        input = ET.SubElement(get_vnetwork_portgroups, "input")
-        datacenter = ET.SubElement(input, "datacenter")
-        datacenter.text = kwargs.pop('datacenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_portgroups_input_last_rcvd_instance(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_portgroups = ET.Element("get_vnetwork_portgroups")
-        config = get_vnetwork_portgroups
-        input = ET.SubElement(get_vnetwork_portgroups, "input")
-        last_rcvd_instance = ET.SubElement(input, "last-rcvd-instance")
-        last_rcvd_instance.text = kwargs.pop('last_rcvd_instance')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_portgroups_output_vnetwork_pgs_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_portgroups = ET.Element("get_vnetwork_portgroups")
-        config = get_vnetwork_portgroups
-        output = ET.SubElement(get_vnetwork_portgroups, "output")
-        vnetwork_pgs = ET.SubElement(output, "vnetwork-pgs")
-        name = ET.SubElement(vnetwork_pgs, "name")
-        name.text = kwargs.pop('name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_portgroups_output_vnetwork_pgs_datacenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_portgroups = ET.Element("get_vnetwork_portgroups")
-        config = get_vnetwork_portgroups
-        output = ET.SubElement(get_vnetwork_portgroups, "output")
-        vnetwork_pgs = ET.SubElement(output, "vnetwork-pgs")
-        datacenter = ET.SubElement(vnetwork_pgs, "datacenter")
-        datacenter.text = kwargs.pop('datacenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_portgroups_output_vnetwork_pgs_vs_nn(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_portgroups = ET.Element("get_vnetwork_portgroups")
-        config = get_vnetwork_portgroups
-        output = ET.SubElement(get_vnetwork_portgroups, "output")
-        vnetwork_pgs = ET.SubElement(output, "vnetwork-pgs")
-        vs_nn = ET.SubElement(vnetwork_pgs, "vs-nn")
-        vs_nn.text = kwargs.pop('vs_nn')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_portgroups_output_vnetwork_pgs_vlan(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_portgroups = ET.Element("get_vnetwork_portgroups")
-        config = get_vnetwork_portgroups
-        output = ET.SubElement(get_vnetwork_portgroups, "output")
-        vnetwork_pgs = ET.SubElement(output, "vnetwork-pgs")
-        vlan = ET.SubElement(vnetwork_pgs, "vlan")
-        vlan.text = kwargs.pop('vlan')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_portgroups_output_vnetwork_pgs_host_nn(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_portgroups = ET.Element("get_vnetwork_portgroups")
-        config = get_vnetwork_portgroups
-        output = ET.SubElement(get_vnetwork_portgroups, "output")
-        vnetwork_pgs = ET.SubElement(output, "vnetwork-pgs")
-        host_nn = ET.SubElement(vnetwork_pgs, "host-nn")
-        host_nn.text = kwargs.pop('host_nn')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_portgroups_output_has_more(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_portgroups = ET.Element("get_vnetwork_portgroups")
-        config = get_vnetwork_portgroups
-        output = ET.SubElement(get_vnetwork_portgroups, "output")
-        has_more = ET.SubElement(output, "has-more")
-        has_more.text = kwargs.pop('has_more')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_portgroups_output_instance_id(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_portgroups = ET.Element("get_vnetwork_portgroups")
-        config = get_vnetwork_portgroups
-        output = ET.SubElement(get_vnetwork_portgroups, "output")
-        instance_id = ET.SubElement(output, "instance-id")
-        instance_id.text = kwargs.pop('instance_id')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vmpolicy_macaddr_input_mac(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vmpolicy_macaddr = ET.Element("get_vmpolicy_macaddr")
-        config = get_vmpolicy_macaddr
-        input = ET.SubElement(get_vmpolicy_macaddr, "input")
-        mac = ET.SubElement(input, "mac")
-        mac.text = kwargs.pop('mac')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vmpolicy_macaddr_input_vcenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vmpolicy_macaddr = ET.Element("get_vmpolicy_macaddr")
-        config = get_vmpolicy_macaddr
-        input = ET.SubElement(get_vmpolicy_macaddr, "input")
-        vcenter = ET.SubElement(input, "vcenter")
-        vcenter.text = kwargs.pop('vcenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vmpolicy_macaddr_input_datacenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vmpolicy_macaddr = ET.Element("get_vmpolicy_macaddr")
-        config = get_vmpolicy_macaddr
-        input = ET.SubElement(get_vmpolicy_macaddr, "input")
-        datacenter = ET.SubElement(input, "datacenter")
-        datacenter.text = kwargs.pop('datacenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vmpolicy_macaddr_input_last_rcvd_instance(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vmpolicy_macaddr = ET.Element("get_vmpolicy_macaddr")
-        config = get_vmpolicy_macaddr
-        input = ET.SubElement(get_vmpolicy_macaddr, "input")
-        last_rcvd_instance = ET.SubElement(input, "last-rcvd-instance")
-        last_rcvd_instance.text = kwargs.pop('last_rcvd_instance')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vmpolicy_macaddr_output_vmpolicy_macaddr_mac(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vmpolicy_macaddr = ET.Element("get_vmpolicy_macaddr")
-        config = get_vmpolicy_macaddr
-        output = ET.SubElement(get_vmpolicy_macaddr, "output")
-        vmpolicy_macaddr = ET.SubElement(output, "vmpolicy-macaddr")
-        mac = ET.SubElement(vmpolicy_macaddr, "mac")
-        mac.text = kwargs.pop('mac')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vmpolicy_macaddr_output_vmpolicy_macaddr_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vmpolicy_macaddr = ET.Element("get_vmpolicy_macaddr")
-        config = get_vmpolicy_macaddr
-        output = ET.SubElement(get_vmpolicy_macaddr, "output")
-        vmpolicy_macaddr = ET.SubElement(output, "vmpolicy-macaddr")
-        name = ET.SubElement(vmpolicy_macaddr, "name")
-        name.text = kwargs.pop('name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vmpolicy_macaddr_output_vmpolicy_macaddr_datacenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vmpolicy_macaddr = ET.Element("get_vmpolicy_macaddr")
-        config = get_vmpolicy_macaddr
-        output = ET.SubElement(get_vmpolicy_macaddr, "output")
-        vmpolicy_macaddr = ET.SubElement(output, "vmpolicy-macaddr")
-        datacenter = ET.SubElement(vmpolicy_macaddr, "datacenter")
-        datacenter.text = kwargs.pop('datacenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vmpolicy_macaddr_output_vmpolicy_macaddr_dvpg_nn(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vmpolicy_macaddr = ET.Element("get_vmpolicy_macaddr")
-        config = get_vmpolicy_macaddr
-        output = ET.SubElement(get_vmpolicy_macaddr, "output")
-        vmpolicy_macaddr = ET.SubElement(output, "vmpolicy-macaddr")
-        dvpg_nn = ET.SubElement(vmpolicy_macaddr, "dvpg-nn")
-        dvpg_nn.text = kwargs.pop('dvpg_nn')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vmpolicy_macaddr_output_vmpolicy_macaddr_port_nn(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vmpolicy_macaddr = ET.Element("get_vmpolicy_macaddr")
-        config = get_vmpolicy_macaddr
-        output = ET.SubElement(get_vmpolicy_macaddr, "output")
-        vmpolicy_macaddr = ET.SubElement(output, "vmpolicy-macaddr")
-        port_nn = ET.SubElement(vmpolicy_macaddr, "port-nn")
-        port_nn.text = kwargs.pop('port_nn')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vmpolicy_macaddr_output_vmpolicy_macaddr_port_prof(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vmpolicy_macaddr = ET.Element("get_vmpolicy_macaddr")
-        config = get_vmpolicy_macaddr
-        output = ET.SubElement(get_vmpolicy_macaddr, "output")
-        vmpolicy_macaddr = ET.SubElement(output, "vmpolicy-macaddr")
-        port_prof = ET.SubElement(vmpolicy_macaddr, "port-prof")
-        port_prof.text = kwargs.pop('port_prof')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vmpolicy_macaddr_output_has_more(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vmpolicy_macaddr = ET.Element("get_vmpolicy_macaddr")
-        config = get_vmpolicy_macaddr
-        output = ET.SubElement(get_vmpolicy_macaddr, "output")
-        has_more = ET.SubElement(output, "has-more")
-        has_more.text = kwargs.pop('has_more')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vmpolicy_macaddr_output_instance_id(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vmpolicy_macaddr = ET.Element("get_vmpolicy_macaddr")
-        config = get_vmpolicy_macaddr
-        output = ET.SubElement(get_vmpolicy_macaddr, "output")
-        instance_id = ET.SubElement(output, "instance-id")
-        instance_id.text = kwargs.pop('instance_id')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def vcenter_id(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        vcenter = ET.SubElement(config, "vcenter", xmlns="urn:brocade.com:mgmt:brocade-vswitch")
-        id = ET.SubElement(vcenter, "id")
-        id.text = kwargs.pop('id')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def vcenter_credentials_url(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        vcenter = ET.SubElement(config, "vcenter", xmlns="urn:brocade.com:mgmt:brocade-vswitch")
-        id_key = ET.SubElement(vcenter, "id")
-        id_key.text = kwargs.pop('id')
-        credentials = ET.SubElement(vcenter, "credentials")
-        url = ET.SubElement(credentials, "url")
-        url.text = kwargs.pop('url')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def vcenter_credentials_username(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        vcenter = ET.SubElement(config, "vcenter", xmlns="urn:brocade.com:mgmt:brocade-vswitch")
-        id_key = ET.SubElement(vcenter, "id")
-        id_key.text = kwargs.pop('id')
-        credentials = ET.SubElement(vcenter, "credentials")
-        username = ET.SubElement(credentials, "username")
-        username.text = kwargs.pop('username')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def vcenter_credentials_password(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        vcenter = ET.SubElement(config, "vcenter", xmlns="urn:brocade.com:mgmt:brocade-vswitch")
-        id_key = ET.SubElement(vcenter, "id")
-        id_key.text = kwargs.pop('id')
-        credentials = ET.SubElement(vcenter, "credentials")
-        password = ET.SubElement(credentials, "password")
-        password.text = kwargs.pop('password')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def vcenter_credentials_vrf_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        vcenter = ET.SubElement(config, "vcenter", xmlns="urn:brocade.com:mgmt:brocade-vswitch")
-        id_key = ET.SubElement(vcenter, "id")
-        id_key.text = kwargs.pop('id')
-        credentials = ET.SubElement(vcenter, "credentials")
-        vrf_name = ET.SubElement(credentials, "vrf-name")
-        vrf_name.text = kwargs.pop('vrf_name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def vcenter_activate(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        vcenter = ET.SubElement(config, "vcenter", xmlns="urn:brocade.com:mgmt:brocade-vswitch")
-        id_key = ET.SubElement(vcenter, "id")
-        id_key.text = kwargs.pop('id')
-        activate = ET.SubElement(vcenter, "activate")
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def vcenter_interval(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        vcenter = ET.SubElement(config, "vcenter", xmlns="urn:brocade.com:mgmt:brocade-vswitch")
-        id_key = ET.SubElement(vcenter, "id")
-        id_key.text = kwargs.pop('id')
-        interval = ET.SubElement(vcenter, "interval")
-        interval.text = kwargs.pop('interval')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def vcenter_discovery_ignore_delete_all_response_ignore_value(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        vcenter = ET.SubElement(config, "vcenter", xmlns="urn:brocade.com:mgmt:brocade-vswitch")
-        id_key = ET.SubElement(vcenter, "id")
-        id_key.text = kwargs.pop('id')
-        discovery = ET.SubElement(vcenter, "discovery")
-        ignore_delete_all_response = ET.SubElement(discovery, "ignore-delete-all-response")
-        ignore_value = ET.SubElement(ignore_delete_all_response, "ignore-value")
-        ignore_value.text = kwargs.pop('ignore_value')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def vcenter_discovery_ignore_delete_all_response_always(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        vcenter = ET.SubElement(config, "vcenter", xmlns="urn:brocade.com:mgmt:brocade-vswitch")
-        id_key = ET.SubElement(vcenter, "id")
-        id_key.text = kwargs.pop('id')
-        discovery = ET.SubElement(vcenter, "discovery")
-        ignore_delete_all_response = ET.SubElement(discovery, "ignore-delete-all-response")
-        always = ET.SubElement(ignore_delete_all_response, "always")
 
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_hosts_input_vcenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_hosts = ET.Element("get_vnetwork_hosts")
-        config = get_vnetwork_hosts
-        input = ET.SubElement(get_vnetwork_hosts, "input")
-        vcenter = ET.SubElement(input, "vcenter")
-        vcenter.text = kwargs.pop('vcenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_hosts_input_datacenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_hosts = ET.Element("get_vnetwork_hosts")
-        config = get_vnetwork_hosts
-        input = ET.SubElement(get_vnetwork_hosts, "input")
-        datacenter = ET.SubElement(input, "datacenter")
-        datacenter.text = kwargs.pop('datacenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_hosts_input_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_hosts = ET.Element("get_vnetwork_hosts")
-        config = get_vnetwork_hosts
-        input = ET.SubElement(get_vnetwork_hosts, "input")
-        name = ET.SubElement(input, "name")
-        name.text = kwargs.pop('name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_hosts_input_last_rcvd_instance(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_hosts = ET.Element("get_vnetwork_hosts")
-        config = get_vnetwork_hosts
-        input = ET.SubElement(get_vnetwork_hosts, "input")
-        last_rcvd_instance = ET.SubElement(input, "last-rcvd-instance")
-        last_rcvd_instance.text = kwargs.pop('last_rcvd_instance')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_hosts_output_vnetwork_hosts_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_hosts = ET.Element("get_vnetwork_hosts")
-        config = get_vnetwork_hosts
-        output = ET.SubElement(get_vnetwork_hosts, "output")
-        vnetwork_hosts = ET.SubElement(output, "vnetwork-hosts")
-        name = ET.SubElement(vnetwork_hosts, "name")
-        name.text = kwargs.pop('name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_hosts_output_vnetwork_hosts_vmnic(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_hosts = ET.Element("get_vnetwork_hosts")
-        config = get_vnetwork_hosts
-        output = ET.SubElement(get_vnetwork_hosts, "output")
-        vnetwork_hosts = ET.SubElement(output, "vnetwork-hosts")
-        vmnic = ET.SubElement(vnetwork_hosts, "vmnic")
-        vmnic.text = kwargs.pop('vmnic')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_hosts_output_vnetwork_hosts_datacenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_hosts = ET.Element("get_vnetwork_hosts")
-        config = get_vnetwork_hosts
-        output = ET.SubElement(get_vnetwork_hosts, "output")
-        vnetwork_hosts = ET.SubElement(output, "vnetwork-hosts")
-        datacenter = ET.SubElement(vnetwork_hosts, "datacenter")
-        datacenter.text = kwargs.pop('datacenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_hosts_output_vnetwork_hosts_mac(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_hosts = ET.Element("get_vnetwork_hosts")
-        config = get_vnetwork_hosts
-        output = ET.SubElement(get_vnetwork_hosts, "output")
-        vnetwork_hosts = ET.SubElement(output, "vnetwork-hosts")
-        mac = ET.SubElement(vnetwork_hosts, "mac")
-        mac.text = kwargs.pop('mac')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_hosts_output_vnetwork_hosts_vswitch(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_hosts = ET.Element("get_vnetwork_hosts")
-        config = get_vnetwork_hosts
-        output = ET.SubElement(get_vnetwork_hosts, "output")
-        vnetwork_hosts = ET.SubElement(output, "vnetwork-hosts")
-        vswitch = ET.SubElement(vnetwork_hosts, "vswitch")
-        vswitch.text = kwargs.pop('vswitch')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_hosts_output_vnetwork_hosts_interface_type(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_hosts = ET.Element("get_vnetwork_hosts")
-        config = get_vnetwork_hosts
-        output = ET.SubElement(get_vnetwork_hosts, "output")
-        vnetwork_hosts = ET.SubElement(output, "vnetwork-hosts")
-        interface_type = ET.SubElement(vnetwork_hosts, "interface-type")
-        interface_type.text = kwargs.pop('interface_type')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_hosts_output_vnetwork_hosts_interface_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_hosts = ET.Element("get_vnetwork_hosts")
-        config = get_vnetwork_hosts
-        output = ET.SubElement(get_vnetwork_hosts, "output")
-        vnetwork_hosts = ET.SubElement(output, "vnetwork-hosts")
-        interface_name = ET.SubElement(vnetwork_hosts, "interface-name")
-        interface_name.text = kwargs.pop('interface_name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_hosts_output_has_more(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_hosts = ET.Element("get_vnetwork_hosts")
-        config = get_vnetwork_hosts
-        output = ET.SubElement(get_vnetwork_hosts, "output")
-        has_more = ET.SubElement(output, "has-more")
-        has_more.text = kwargs.pop('has_more')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_hosts_output_instance_id(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_hosts = ET.Element("get_vnetwork_hosts")
-        config = get_vnetwork_hosts
-        output = ET.SubElement(get_vnetwork_hosts, "output")
-        instance_id = ET.SubElement(output, "instance-id")
-        instance_id.text = kwargs.pop('instance_id')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vms_input_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vms = ET.Element("get_vnetwork_vms")
-        config = get_vnetwork_vms
-        input = ET.SubElement(get_vnetwork_vms, "input")
-        name = ET.SubElement(input, "name")
-        name.text = kwargs.pop('name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vms_input_vcenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vms = ET.Element("get_vnetwork_vms")
-        config = get_vnetwork_vms
-        input = ET.SubElement(get_vnetwork_vms, "input")
-        vcenter = ET.SubElement(input, "vcenter")
-        vcenter.text = kwargs.pop('vcenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vms_input_datacenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vms = ET.Element("get_vnetwork_vms")
-        config = get_vnetwork_vms
-        input = ET.SubElement(get_vnetwork_vms, "input")
-        datacenter = ET.SubElement(input, "datacenter")
-        datacenter.text = kwargs.pop('datacenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vms_input_last_rcvd_instance(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vms = ET.Element("get_vnetwork_vms")
-        config = get_vnetwork_vms
-        input = ET.SubElement(get_vnetwork_vms, "input")
-        last_rcvd_instance = ET.SubElement(input, "last-rcvd-instance")
-        last_rcvd_instance.text = kwargs.pop('last_rcvd_instance')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vms_output_vnetwork_vms_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vms = ET.Element("get_vnetwork_vms")
-        config = get_vnetwork_vms
-        output = ET.SubElement(get_vnetwork_vms, "output")
-        vnetwork_vms = ET.SubElement(output, "vnetwork-vms")
-        name = ET.SubElement(vnetwork_vms, "name")
-        name.text = kwargs.pop('name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vms_output_vnetwork_vms_mac(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vms = ET.Element("get_vnetwork_vms")
-        config = get_vnetwork_vms
-        output = ET.SubElement(get_vnetwork_vms, "output")
-        vnetwork_vms = ET.SubElement(output, "vnetwork-vms")
-        mac = ET.SubElement(vnetwork_vms, "mac")
-        mac.text = kwargs.pop('mac')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vms_output_vnetwork_vms_datacenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vms = ET.Element("get_vnetwork_vms")
-        config = get_vnetwork_vms
-        output = ET.SubElement(get_vnetwork_vms, "output")
-        vnetwork_vms = ET.SubElement(output, "vnetwork-vms")
-        datacenter = ET.SubElement(vnetwork_vms, "datacenter")
-        datacenter.text = kwargs.pop('datacenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vms_output_vnetwork_vms_ip(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vms = ET.Element("get_vnetwork_vms")
-        config = get_vnetwork_vms
-        output = ET.SubElement(get_vnetwork_vms, "output")
-        vnetwork_vms = ET.SubElement(output, "vnetwork-vms")
-        ip = ET.SubElement(vnetwork_vms, "ip")
-        ip.text = kwargs.pop('ip')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vms_output_vnetwork_vms_host_nn(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vms = ET.Element("get_vnetwork_vms")
-        config = get_vnetwork_vms
-        output = ET.SubElement(get_vnetwork_vms, "output")
-        vnetwork_vms = ET.SubElement(output, "vnetwork-vms")
-        host_nn = ET.SubElement(vnetwork_vms, "host-nn")
-        host_nn.text = kwargs.pop('host_nn')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vms_output_has_more(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vms = ET.Element("get_vnetwork_vms")
-        config = get_vnetwork_vms
-        output = ET.SubElement(get_vnetwork_vms, "output")
-        has_more = ET.SubElement(output, "has-more")
-        has_more.text = kwargs.pop('has_more')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vms_output_instance_id(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vms = ET.Element("get_vnetwork_vms")
-        config = get_vnetwork_vms
-        output = ET.SubElement(get_vnetwork_vms, "output")
-        instance_id = ET.SubElement(output, "instance-id")
-        instance_id.text = kwargs.pop('instance_id')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvpgs_input_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvpgs = ET.Element("get_vnetwork_dvpgs")
-        config = get_vnetwork_dvpgs
-        input = ET.SubElement(get_vnetwork_dvpgs, "input")
-        name = ET.SubElement(input, "name")
-        name.text = kwargs.pop('name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvpgs_input_vcenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvpgs = ET.Element("get_vnetwork_dvpgs")
-        config = get_vnetwork_dvpgs
-        input = ET.SubElement(get_vnetwork_dvpgs, "input")
-        vcenter = ET.SubElement(input, "vcenter")
-        vcenter.text = kwargs.pop('vcenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvpgs_input_datacenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvpgs = ET.Element("get_vnetwork_dvpgs")
-        config = get_vnetwork_dvpgs
-        input = ET.SubElement(get_vnetwork_dvpgs, "input")
-        datacenter = ET.SubElement(input, "datacenter")
-        datacenter.text = kwargs.pop('datacenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvpgs_input_last_rcvd_instance(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvpgs = ET.Element("get_vnetwork_dvpgs")
-        config = get_vnetwork_dvpgs
-        input = ET.SubElement(get_vnetwork_dvpgs, "input")
-        last_rcvd_instance = ET.SubElement(input, "last-rcvd-instance")
-        last_rcvd_instance.text = kwargs.pop('last_rcvd_instance')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvpgs_output_vnetwork_dvpgs_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvpgs = ET.Element("get_vnetwork_dvpgs")
-        config = get_vnetwork_dvpgs
-        output = ET.SubElement(get_vnetwork_dvpgs, "output")
-        vnetwork_dvpgs = ET.SubElement(output, "vnetwork-dvpgs")
-        name = ET.SubElement(vnetwork_dvpgs, "name")
-        name.text = kwargs.pop('name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvpgs_output_vnetwork_dvpgs_datacenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvpgs = ET.Element("get_vnetwork_dvpgs")
-        config = get_vnetwork_dvpgs
-        output = ET.SubElement(get_vnetwork_dvpgs, "output")
-        vnetwork_dvpgs = ET.SubElement(output, "vnetwork-dvpgs")
-        datacenter = ET.SubElement(vnetwork_dvpgs, "datacenter")
-        datacenter.text = kwargs.pop('datacenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvpgs_output_vnetwork_dvpgs_dvs_nn(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvpgs = ET.Element("get_vnetwork_dvpgs")
-        config = get_vnetwork_dvpgs
-        output = ET.SubElement(get_vnetwork_dvpgs, "output")
-        vnetwork_dvpgs = ET.SubElement(output, "vnetwork-dvpgs")
-        dvs_nn = ET.SubElement(vnetwork_dvpgs, "dvs-nn")
-        dvs_nn.text = kwargs.pop('dvs_nn')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvpgs_output_vnetwork_dvpgs_vlan(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvpgs = ET.Element("get_vnetwork_dvpgs")
-        config = get_vnetwork_dvpgs
-        output = ET.SubElement(get_vnetwork_dvpgs, "output")
-        vnetwork_dvpgs = ET.SubElement(output, "vnetwork-dvpgs")
-        vlan = ET.SubElement(vnetwork_dvpgs, "vlan")
-        vlan.text = kwargs.pop('vlan')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvpgs_output_has_more(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvpgs = ET.Element("get_vnetwork_dvpgs")
-        config = get_vnetwork_dvpgs
-        output = ET.SubElement(get_vnetwork_dvpgs, "output")
-        has_more = ET.SubElement(output, "has-more")
-        has_more.text = kwargs.pop('has_more')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvpgs_output_instance_id(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvpgs = ET.Element("get_vnetwork_dvpgs")
-        config = get_vnetwork_dvpgs
-        output = ET.SubElement(get_vnetwork_dvpgs, "output")
-        instance_id = ET.SubElement(output, "instance-id")
-        instance_id.text = kwargs.pop('instance_id')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvs_input_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvs = ET.Element("get_vnetwork_dvs")
-        config = get_vnetwork_dvs
-        input = ET.SubElement(get_vnetwork_dvs, "input")
-        name = ET.SubElement(input, "name")
-        name.text = kwargs.pop('name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvs_input_vcenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvs = ET.Element("get_vnetwork_dvs")
-        config = get_vnetwork_dvs
-        input = ET.SubElement(get_vnetwork_dvs, "input")
-        vcenter = ET.SubElement(input, "vcenter")
-        vcenter.text = kwargs.pop('vcenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvs_input_datacenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvs = ET.Element("get_vnetwork_dvs")
-        config = get_vnetwork_dvs
-        input = ET.SubElement(get_vnetwork_dvs, "input")
-        datacenter = ET.SubElement(input, "datacenter")
-        datacenter.text = kwargs.pop('datacenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvs_input_last_rcvd_instance(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvs = ET.Element("get_vnetwork_dvs")
-        config = get_vnetwork_dvs
-        input = ET.SubElement(get_vnetwork_dvs, "input")
-        last_rcvd_instance = ET.SubElement(input, "last-rcvd-instance")
-        last_rcvd_instance.text = kwargs.pop('last_rcvd_instance')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvs_output_vnetwork_dvs_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvs = ET.Element("get_vnetwork_dvs")
-        config = get_vnetwork_dvs
-        output = ET.SubElement(get_vnetwork_dvs, "output")
-        vnetwork_dvs = ET.SubElement(output, "vnetwork-dvs")
-        name = ET.SubElement(vnetwork_dvs, "name")
-        name.text = kwargs.pop('name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvs_output_vnetwork_dvs_host(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvs = ET.Element("get_vnetwork_dvs")
-        config = get_vnetwork_dvs
-        output = ET.SubElement(get_vnetwork_dvs, "output")
-        vnetwork_dvs = ET.SubElement(output, "vnetwork-dvs")
-        host = ET.SubElement(vnetwork_dvs, "host")
-        host.text = kwargs.pop('host')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvs_output_vnetwork_dvs_datacenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvs = ET.Element("get_vnetwork_dvs")
-        config = get_vnetwork_dvs
-        output = ET.SubElement(get_vnetwork_dvs, "output")
-        vnetwork_dvs = ET.SubElement(output, "vnetwork-dvs")
-        datacenter = ET.SubElement(vnetwork_dvs, "datacenter")
-        datacenter.text = kwargs.pop('datacenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvs_output_vnetwork_dvs_pnic(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvs = ET.Element("get_vnetwork_dvs")
-        config = get_vnetwork_dvs
-        output = ET.SubElement(get_vnetwork_dvs, "output")
-        vnetwork_dvs = ET.SubElement(output, "vnetwork-dvs")
-        pnic = ET.SubElement(vnetwork_dvs, "pnic")
-        pnic.text = kwargs.pop('pnic')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvs_output_vnetwork_dvs_interface_type(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvs = ET.Element("get_vnetwork_dvs")
-        config = get_vnetwork_dvs
-        output = ET.SubElement(get_vnetwork_dvs, "output")
-        vnetwork_dvs = ET.SubElement(output, "vnetwork-dvs")
-        interface_type = ET.SubElement(vnetwork_dvs, "interface-type")
-        interface_type.text = kwargs.pop('interface_type')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvs_output_vnetwork_dvs_interface_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvs = ET.Element("get_vnetwork_dvs")
-        config = get_vnetwork_dvs
-        output = ET.SubElement(get_vnetwork_dvs, "output")
-        vnetwork_dvs = ET.SubElement(output, "vnetwork-dvs")
-        interface_name = ET.SubElement(vnetwork_dvs, "interface-name")
-        interface_name.text = kwargs.pop('interface_name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvs_output_has_more(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvs = ET.Element("get_vnetwork_dvs")
-        config = get_vnetwork_dvs
-        output = ET.SubElement(get_vnetwork_dvs, "output")
-        has_more = ET.SubElement(output, "has-more")
-        has_more.text = kwargs.pop('has_more')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_dvs_output_instance_id(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_dvs = ET.Element("get_vnetwork_dvs")
-        config = get_vnetwork_dvs
-        output = ET.SubElement(get_vnetwork_dvs, "output")
-        instance_id = ET.SubElement(output, "instance-id")
-        instance_id.text = kwargs.pop('instance_id')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vswitches_input_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vswitches = ET.Element("get_vnetwork_vswitches")
-        config = get_vnetwork_vswitches
-        input = ET.SubElement(get_vnetwork_vswitches, "input")
-        name = ET.SubElement(input, "name")
-        name.text = kwargs.pop('name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vswitches_input_vcenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vswitches = ET.Element("get_vnetwork_vswitches")
-        config = get_vnetwork_vswitches
-        input = ET.SubElement(get_vnetwork_vswitches, "input")
-        vcenter = ET.SubElement(input, "vcenter")
-        vcenter.text = kwargs.pop('vcenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vswitches_input_datacenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vswitches = ET.Element("get_vnetwork_vswitches")
-        config = get_vnetwork_vswitches
-        input = ET.SubElement(get_vnetwork_vswitches, "input")
-        datacenter = ET.SubElement(input, "datacenter")
-        datacenter.text = kwargs.pop('datacenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vswitches_input_last_rcvd_instance(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vswitches = ET.Element("get_vnetwork_vswitches")
-        config = get_vnetwork_vswitches
-        input = ET.SubElement(get_vnetwork_vswitches, "input")
-        last_rcvd_instance = ET.SubElement(input, "last-rcvd-instance")
-        last_rcvd_instance.text = kwargs.pop('last_rcvd_instance')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vswitches_output_vnetwork_vswitches_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vswitches = ET.Element("get_vnetwork_vswitches")
-        config = get_vnetwork_vswitches
-        output = ET.SubElement(get_vnetwork_vswitches, "output")
-        vnetwork_vswitches = ET.SubElement(output, "vnetwork-vswitches")
-        name = ET.SubElement(vnetwork_vswitches, "name")
-        name.text = kwargs.pop('name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vswitches_output_vnetwork_vswitches_host(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vswitches = ET.Element("get_vnetwork_vswitches")
-        config = get_vnetwork_vswitches
-        output = ET.SubElement(get_vnetwork_vswitches, "output")
-        vnetwork_vswitches = ET.SubElement(output, "vnetwork-vswitches")
-        host = ET.SubElement(vnetwork_vswitches, "host")
-        host.text = kwargs.pop('host')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vswitches_output_vnetwork_vswitches_datacenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vswitches = ET.Element("get_vnetwork_vswitches")
-        config = get_vnetwork_vswitches
-        output = ET.SubElement(get_vnetwork_vswitches, "output")
-        vnetwork_vswitches = ET.SubElement(output, "vnetwork-vswitches")
-        datacenter = ET.SubElement(vnetwork_vswitches, "datacenter")
-        datacenter.text = kwargs.pop('datacenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vswitches_output_vnetwork_vswitches_pnic(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vswitches = ET.Element("get_vnetwork_vswitches")
-        config = get_vnetwork_vswitches
-        output = ET.SubElement(get_vnetwork_vswitches, "output")
-        vnetwork_vswitches = ET.SubElement(output, "vnetwork-vswitches")
-        pnic = ET.SubElement(vnetwork_vswitches, "pnic")
-        pnic.text = kwargs.pop('pnic')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vswitches_output_vnetwork_vswitches_interface_type(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vswitches = ET.Element("get_vnetwork_vswitches")
-        config = get_vnetwork_vswitches
-        output = ET.SubElement(get_vnetwork_vswitches, "output")
-        vnetwork_vswitches = ET.SubElement(output, "vnetwork-vswitches")
-        interface_type = ET.SubElement(vnetwork_vswitches, "interface-type")
-        interface_type.text = kwargs.pop('interface_type')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vswitches_output_vnetwork_vswitches_interface_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vswitches = ET.Element("get_vnetwork_vswitches")
-        config = get_vnetwork_vswitches
-        output = ET.SubElement(get_vnetwork_vswitches, "output")
-        vnetwork_vswitches = ET.SubElement(output, "vnetwork-vswitches")
-        interface_name = ET.SubElement(vnetwork_vswitches, "interface-name")
-        interface_name.text = kwargs.pop('interface_name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vswitches_output_has_more(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vswitches = ET.Element("get_vnetwork_vswitches")
-        config = get_vnetwork_vswitches
-        output = ET.SubElement(get_vnetwork_vswitches, "output")
-        has_more = ET.SubElement(output, "has-more")
-        has_more.text = kwargs.pop('has_more')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_vswitches_output_instance_id(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_vswitches = ET.Element("get_vnetwork_vswitches")
-        config = get_vnetwork_vswitches
-        output = ET.SubElement(get_vnetwork_vswitches, "output")
-        instance_id = ET.SubElement(output, "instance-id")
-        instance_id.text = kwargs.pop('instance_id')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_portgroups_input_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_portgroups = ET.Element("get_vnetwork_portgroups")
-        config = get_vnetwork_portgroups
-        input = ET.SubElement(get_vnetwork_portgroups, "input")
-        name = ET.SubElement(input, "name")
-        name.text = kwargs.pop('name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_portgroups_input_vcenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_portgroups = ET.Element("get_vnetwork_portgroups")
-        config = get_vnetwork_portgroups
-        input = ET.SubElement(get_vnetwork_portgroups, "input")
-        vcenter = ET.SubElement(input, "vcenter")
-        vcenter.text = kwargs.pop('vcenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_portgroups_input_datacenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_portgroups = ET.Element("get_vnetwork_portgroups")
-        config = get_vnetwork_portgroups
-        input = ET.SubElement(get_vnetwork_portgroups, "input")
-        datacenter = ET.SubElement(input, "datacenter")
-        datacenter.text = kwargs.pop('datacenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_portgroups_input_last_rcvd_instance(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_portgroups = ET.Element("get_vnetwork_portgroups")
-        config = get_vnetwork_portgroups
-        input = ET.SubElement(get_vnetwork_portgroups, "input")
-        last_rcvd_instance = ET.SubElement(input, "last-rcvd-instance")
-        last_rcvd_instance.text = kwargs.pop('last_rcvd_instance')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_portgroups_output_vnetwork_pgs_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_portgroups = ET.Element("get_vnetwork_portgroups")
-        config = get_vnetwork_portgroups
-        output = ET.SubElement(get_vnetwork_portgroups, "output")
-        vnetwork_pgs = ET.SubElement(output, "vnetwork-pgs")
-        name = ET.SubElement(vnetwork_pgs, "name")
-        name.text = kwargs.pop('name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_portgroups_output_vnetwork_pgs_datacenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_portgroups = ET.Element("get_vnetwork_portgroups")
-        config = get_vnetwork_portgroups
-        output = ET.SubElement(get_vnetwork_portgroups, "output")
-        vnetwork_pgs = ET.SubElement(output, "vnetwork-pgs")
-        datacenter = ET.SubElement(vnetwork_pgs, "datacenter")
-        datacenter.text = kwargs.pop('datacenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_portgroups_output_vnetwork_pgs_vs_nn(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_portgroups = ET.Element("get_vnetwork_portgroups")
-        config = get_vnetwork_portgroups
-        output = ET.SubElement(get_vnetwork_portgroups, "output")
-        vnetwork_pgs = ET.SubElement(output, "vnetwork-pgs")
-        vs_nn = ET.SubElement(vnetwork_pgs, "vs-nn")
-        vs_nn.text = kwargs.pop('vs_nn')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_portgroups_output_vnetwork_pgs_vlan(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_portgroups = ET.Element("get_vnetwork_portgroups")
-        config = get_vnetwork_portgroups
-        output = ET.SubElement(get_vnetwork_portgroups, "output")
-        vnetwork_pgs = ET.SubElement(output, "vnetwork-pgs")
-        vlan = ET.SubElement(vnetwork_pgs, "vlan")
-        vlan.text = kwargs.pop('vlan')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_portgroups_output_vnetwork_pgs_host_nn(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_portgroups = ET.Element("get_vnetwork_portgroups")
-        config = get_vnetwork_portgroups
-        output = ET.SubElement(get_vnetwork_portgroups, "output")
-        vnetwork_pgs = ET.SubElement(output, "vnetwork-pgs")
-        host_nn = ET.SubElement(vnetwork_pgs, "host-nn")
-        host_nn.text = kwargs.pop('host_nn')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_portgroups_output_has_more(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_portgroups = ET.Element("get_vnetwork_portgroups")
-        config = get_vnetwork_portgroups
-        output = ET.SubElement(get_vnetwork_portgroups, "output")
-        has_more = ET.SubElement(output, "has-more")
-        has_more.text = kwargs.pop('has_more')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vnetwork_portgroups_output_instance_id(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vnetwork_portgroups = ET.Element("get_vnetwork_portgroups")
-        config = get_vnetwork_portgroups
-        output = ET.SubElement(get_vnetwork_portgroups, "output")
-        instance_id = ET.SubElement(output, "instance-id")
-        instance_id.text = kwargs.pop('instance_id')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vmpolicy_macaddr_input_mac(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vmpolicy_macaddr = ET.Element("get_vmpolicy_macaddr")
-        config = get_vmpolicy_macaddr
-        input = ET.SubElement(get_vmpolicy_macaddr, "input")
-        mac = ET.SubElement(input, "mac")
-        mac.text = kwargs.pop('mac')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vmpolicy_macaddr_input_vcenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vmpolicy_macaddr = ET.Element("get_vmpolicy_macaddr")
-        config = get_vmpolicy_macaddr
-        input = ET.SubElement(get_vmpolicy_macaddr, "input")
-        vcenter = ET.SubElement(input, "vcenter")
-        vcenter.text = kwargs.pop('vcenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vmpolicy_macaddr_input_datacenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vmpolicy_macaddr = ET.Element("get_vmpolicy_macaddr")
-        config = get_vmpolicy_macaddr
-        input = ET.SubElement(get_vmpolicy_macaddr, "input")
-        datacenter = ET.SubElement(input, "datacenter")
-        datacenter.text = kwargs.pop('datacenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vmpolicy_macaddr_input_last_rcvd_instance(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vmpolicy_macaddr = ET.Element("get_vmpolicy_macaddr")
-        config = get_vmpolicy_macaddr
-        input = ET.SubElement(get_vmpolicy_macaddr, "input")
-        last_rcvd_instance = ET.SubElement(input, "last-rcvd-instance")
-        last_rcvd_instance.text = kwargs.pop('last_rcvd_instance')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vmpolicy_macaddr_output_vmpolicy_macaddr_mac(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vmpolicy_macaddr = ET.Element("get_vmpolicy_macaddr")
-        config = get_vmpolicy_macaddr
-        output = ET.SubElement(get_vmpolicy_macaddr, "output")
-        vmpolicy_macaddr = ET.SubElement(output, "vmpolicy-macaddr")
-        mac = ET.SubElement(vmpolicy_macaddr, "mac")
-        mac.text = kwargs.pop('mac')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vmpolicy_macaddr_output_vmpolicy_macaddr_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vmpolicy_macaddr = ET.Element("get_vmpolicy_macaddr")
-        config = get_vmpolicy_macaddr
-        output = ET.SubElement(get_vmpolicy_macaddr, "output")
-        vmpolicy_macaddr = ET.SubElement(output, "vmpolicy-macaddr")
-        name = ET.SubElement(vmpolicy_macaddr, "name")
-        name.text = kwargs.pop('name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vmpolicy_macaddr_output_vmpolicy_macaddr_datacenter(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vmpolicy_macaddr = ET.Element("get_vmpolicy_macaddr")
-        config = get_vmpolicy_macaddr
-        output = ET.SubElement(get_vmpolicy_macaddr, "output")
-        vmpolicy_macaddr = ET.SubElement(output, "vmpolicy-macaddr")
-        datacenter = ET.SubElement(vmpolicy_macaddr, "datacenter")
-        datacenter.text = kwargs.pop('datacenter')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vmpolicy_macaddr_output_vmpolicy_macaddr_dvpg_nn(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vmpolicy_macaddr = ET.Element("get_vmpolicy_macaddr")
-        config = get_vmpolicy_macaddr
-        output = ET.SubElement(get_vmpolicy_macaddr, "output")
-        vmpolicy_macaddr = ET.SubElement(output, "vmpolicy-macaddr")
-        dvpg_nn = ET.SubElement(vmpolicy_macaddr, "dvpg-nn")
-        dvpg_nn.text = kwargs.pop('dvpg_nn')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vmpolicy_macaddr_output_vmpolicy_macaddr_port_nn(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vmpolicy_macaddr = ET.Element("get_vmpolicy_macaddr")
-        config = get_vmpolicy_macaddr
-        output = ET.SubElement(get_vmpolicy_macaddr, "output")
-        vmpolicy_macaddr = ET.SubElement(output, "vmpolicy-macaddr")
-        port_nn = ET.SubElement(vmpolicy_macaddr, "port-nn")
-        port_nn.text = kwargs.pop('port_nn')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vmpolicy_macaddr_output_vmpolicy_macaddr_port_prof(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vmpolicy_macaddr = ET.Element("get_vmpolicy_macaddr")
-        config = get_vmpolicy_macaddr
-        output = ET.SubElement(get_vmpolicy_macaddr, "output")
-        vmpolicy_macaddr = ET.SubElement(output, "vmpolicy-macaddr")
-        port_prof = ET.SubElement(vmpolicy_macaddr, "port-prof")
-        port_prof.text = kwargs.pop('port_prof')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vmpolicy_macaddr_output_has_more(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vmpolicy_macaddr = ET.Element("get_vmpolicy_macaddr")
-        config = get_vmpolicy_macaddr
-        output = ET.SubElement(get_vmpolicy_macaddr, "output")
-        has_more = ET.SubElement(output, "has-more")
-        has_more.text = kwargs.pop('has_more')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def get_vmpolicy_macaddr_output_instance_id(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        get_vmpolicy_macaddr = ET.Element("get_vmpolicy_macaddr")
-        config = get_vmpolicy_macaddr
-        output = ET.SubElement(get_vmpolicy_macaddr, "output")
-        instance_id = ET.SubElement(output, "instance-id")
-        instance_id.text = kwargs.pop('instance_id')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def vcenter_id(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        vcenter = ET.SubElement(config, "vcenter", xmlns="urn:brocade.com:mgmt:brocade-vswitch")
-        id = ET.SubElement(vcenter, "id")
-        id.text = kwargs.pop('id')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def vcenter_credentials_url(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        vcenter = ET.SubElement(config, "vcenter", xmlns="urn:brocade.com:mgmt:brocade-vswitch")
-        id_key = ET.SubElement(vcenter, "id")
-        id_key.text = kwargs.pop('id')
-        credentials = ET.SubElement(vcenter, "credentials")
-        url = ET.SubElement(credentials, "url")
-        url.text = kwargs.pop('url')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def vcenter_credentials_username(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        vcenter = ET.SubElement(config, "vcenter", xmlns="urn:brocade.com:mgmt:brocade-vswitch")
-        id_key = ET.SubElement(vcenter, "id")
-        id_key.text = kwargs.pop('id')
-        credentials = ET.SubElement(vcenter, "credentials")
-        username = ET.SubElement(credentials, "username")
-        username.text = kwargs.pop('username')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def vcenter_credentials_password(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        vcenter = ET.SubElement(config, "vcenter", xmlns="urn:brocade.com:mgmt:brocade-vswitch")
-        id_key = ET.SubElement(vcenter, "id")
-        id_key.text = kwargs.pop('id')
-        credentials = ET.SubElement(vcenter, "credentials")
-        password = ET.SubElement(credentials, "password")
-        password.text = kwargs.pop('password')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def vcenter_credentials_vrf_name(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        vcenter = ET.SubElement(config, "vcenter", xmlns="urn:brocade.com:mgmt:brocade-vswitch")
-        id_key = ET.SubElement(vcenter, "id")
-        id_key.text = kwargs.pop('id')
-        credentials = ET.SubElement(vcenter, "credentials")
-        vrf_name = ET.SubElement(credentials, "vrf-name")
-        vrf_name.text = kwargs.pop('vrf_name')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def vcenter_activate(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        vcenter = ET.SubElement(config, "vcenter", xmlns="urn:brocade.com:mgmt:brocade-vswitch")
-        id_key = ET.SubElement(vcenter, "id")
-        id_key.text = kwargs.pop('id')
-        activate = ET.SubElement(vcenter, "activate")
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def vcenter_interval(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        vcenter = ET.SubElement(config, "vcenter", xmlns="urn:brocade.com:mgmt:brocade-vswitch")
-        id_key = ET.SubElement(vcenter, "id")
-        id_key.text = kwargs.pop('id')
-        interval = ET.SubElement(vcenter, "interval")
-        interval.text = kwargs.pop('interval')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def vcenter_discovery_ignore_delete_all_response_ignore_value(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        vcenter = ET.SubElement(config, "vcenter", xmlns="urn:brocade.com:mgmt:brocade-vswitch")
-        id_key = ET.SubElement(vcenter, "id")
-        id_key.text = kwargs.pop('id')
-        discovery = ET.SubElement(vcenter, "discovery")
-        ignore_delete_all_response = ET.SubElement(discovery, "ignore-delete-all-response")
-        ignore_value = ET.SubElement(ignore_delete_all_response, "ignore-value")
-        ignore_value.text = kwargs.pop('ignore_value')
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
-    def vcenter_discovery_ignore_delete_all_response_always(self, **kwargs):
-        """Auto Generated Code
-        """
-        config = ET.Element("config")
-        vcenter = ET.SubElement(config, "vcenter", xmlns="urn:brocade.com:mgmt:brocade-vswitch")
-        id_key = ET.SubElement(vcenter, "id")
-        id_key.text = kwargs.pop('id')
-        discovery = ET.SubElement(vcenter, "discovery")
-        ignore_delete_all_response = ET.SubElement(discovery, "ignore-delete-all-response")
-        always = ET.SubElement(ignore_delete_all_response, "always")
-
-        callback = kwargs.pop('callback', self._callback)
-        return callback(config)
-        
\ No newline at end of file
+    Builders that differ from pynos.versions.ver_6.ver_6_0_1.yang.brocade_vswitch
+    are read from brocade_vswitch.json.gz.
+    """
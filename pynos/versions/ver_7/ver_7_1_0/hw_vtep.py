@@ -13,6 +13,7 @@
 # under the License.
 
 import xml.etree.ElementTree as ET
+import pynos.paging
 import pynos.utilities
 from pynos.versions.ver_7.ver_7_1_0.yang.brocade_tunnels import brocade_tunnels
 
@@ -242,7 +243,7 @@ class hwvtep():
         ET.SubElement(config, "overlay-gateway", xmlns=urn)
         output = self._callback(config, handler='get_config')
         result = {}
-        element = ET.fromstring(str(output))
+        element = output.data_ele
         for overlayGw in element.iter('{%s}overlay-gateway' % urn):
             result['name'] = overlayGw.find('{%s}name' % urn).text
             isactivate = overlayGw.find('{%s}activate' % urn)
@@ -271,3 +272,72 @@ class hwvtep():
                 result['attached-vlan'] = vlans
 
         return result
+
+    @staticmethod
+    def get_tunnel_statistics_request(page_cursor=None):
+        """Creates a new Netconf request for the tunnel statistics page that
+        starts at `page_cursor`, or for the first page.
+        """
+        request = ET.Element(
+            'get-tunnel-statistics',
+            xmlns='urn:brocade.com:mgmt:brocade-tunnels-ext')
+        if page_cursor:
+            cursor_el = ET.SubElement(request, 'page-cursor')
+            cursor_el.text = page_cursor
+        return request
+
+    def get_tunnel_statistics(self):
+        """
+        Get the frame and byte counters of the VXLAN tunnels.
+
+        Returns:
+            list[dict]: One dictionary per tunnel with its 'id',
+            'tx-frames', 'tx-bytes', 'rx-frames' and 'rx-bytes'.
+
+        Raises:
+            None
+        """
+        return list(self.iter_tunnel_statistics())
+
+    def iter_tunnel_statistics(self):
+        """
+        Iterate over the tunnel counters of ``get_tunnel_statistics`` as
+        pages arrive.
+
+        Returns:
+            Generator of dictionaries.
+
+        Raises:
+            None
+
+        Examples:
+            >>> import pynos.device
+            >>> conn = ('10.24.39.211', '22')
+            >>> auth = ('admin', 'password')
+            >>> with pynos.device.Device(conn=conn, auth=auth) as dev:
+            ...     busy = [tunnel['id'] for tunnel in
+            ...             dev.hw_vtep.iter_tunnel_statistics()
+            ...             if int(tunnel['tx-bytes']) > 10 ** 9]
+        """
+        urn = '{urn:brocade.com:mgmt:brocade-tunnels-ext}'
+        fields = ('id', 'tx-frames', 'tx-bytes', 'rx-frames', 'rx-bytes')
+
+        def next_request(output):
+            page_cursor = output.find('%snext-page-cursor' % urn)
+            if page_cursor is None or not page_cursor.text:
+                return None
+            return self.get_tunnel_statistics_request(page_cursor.text)
+
+        def rows(output):
+            result = []
+            for tunnel in output.findall('%stunnel-stat' % urn):
+                stat = {}
+                for field in fields:
+                    node = tunnel.find('%s%s' % (urn, field))
+                    stat[field] = None if node is None else node.text
+                result.append(stat)
+            return result
+
+        return iter(pynos.paging.PageCursor(
+            self._callback, self.get_tunnel_statistics_request(), rows,
+            next_request))
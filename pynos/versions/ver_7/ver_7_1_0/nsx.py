@@ -163,7 +163,7 @@ class Nsx():
         ET.SubElement(config, "nsx-controller", xmlns=urn)
         output = self._callback(config, handler='get_config')
         result = {}
-        element = ET.fromstring(str(output))
+        element = output.data_ele
         for controller in element.iter('{%s}nsx-controller'%urn):
             result['name'] = controller.find('{%s}name'%urn).text
             isactivate = controller.find('{%s}activate'%urn)
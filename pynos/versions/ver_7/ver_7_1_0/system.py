@@ -16,7 +16,6 @@ limitations under the License.
 
 from pynos.versions.base.system import System as BaseSystem
 from pynos.versions.ver_7.ver_7_1_0.yang.brocade_rbridge import brocade_rbridge
-import xml.etree.ElementTree as ET
 import pynos.utilities
 
 class System(BaseSystem):
@@ -70,8 +69,7 @@ class System(BaseSystem):
         config = rid(**rid_args)
         if is_get_config:
             maint_mode = callback(config, handler='get_config')
-            mode = maint_mode.data_xml
-            root = ET.fromstring(mode)
+            root = maint_mode.data_ele
             namespace = 'urn:brocade.com:mgmt:brocade-rbridge'
             for rbridge_id_node in root.findall('{%s}rbridge-id' % namespace):
                 system_mode = rbridge_id_node.find(
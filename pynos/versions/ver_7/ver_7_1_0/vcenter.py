@@ -127,7 +127,7 @@ class Vcenter():
         ET.SubElement(config, "vcenter", xmlns=urn)
         output = self._callback(config, handler='get_config')
         result = []
-        element = ET.fromstring(str(output))
+        element = output.data_ele
         for vcenter in element.iter('{%s}vcenter'%urn):
             vc = {}
             vc['name'] = vcenter.find('{%s}id' % urn).text
@@ -11,7 +11,9 @@ setup(name='pynos',
       author_email='mstone@brocade.com, ssavla@brocade.com',
       url='http://www.brocade.com/',
       packages=find_packages(exclude=['templates']),
-      install_requires=["ncclient==0.4.5", "ipaddress"],
+      package_data={'': ['*.json.gz']},
+      install_requires=["ncclient==0.4.5", "ipaddress",
+                        "futures; python_version < '3'"],
       classifiers=[
           'Development Status :: 5 - Production/Stable',
           'Intended Audience :: Developers',
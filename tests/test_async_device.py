@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+import unittest
+import xml.etree.ElementTree as ET
+
+import pynos.async_device
+
+
+def uptime_reply(call, handler='edit_config'):
+    namespace = 'urn:brocade.com:mgmt:brocade-system'
+    return ET.fromstring(
+        '<rpc-reply xmlns:ns1="{0}"><ns1:show-system-uptime>'
+        '<ns1:days>1</ns1:days><ns1:hours>2</ns1:hours>'
+        '<ns1:minutes>3</ns1:minutes><ns1:seconds>4</ns1:seconds>'
+        '</ns1:show-system-uptime></rpc-reply>'.format(namespace))
+
+
+@unittest.skipIf(pynos.async_device.asyncio is None, 'requires asyncio')
+class TestAsyncDevice(unittest.TestCase):
+    """
+    AsyncDevice unit tests. Run devices in test mode on a private loop.
+    """
+    def setUp(self):
+        asyncio = pynos.async_device.asyncio
+        self.loop = asyncio.new_event_loop()
+        self.gather = asyncio.gather
+
+    def tearDown(self):
+        self.loop.close()
+
+    def make_device(self):
+        return pynos.async_device.AsyncDevice(conn=('127.0.0.1', '22'),
+                                              test=True, loop=self.loop,
+                                              callback=uptime_reply)
+
+    def test_feature_property(self):
+        expected = {'days': '1', 'hours': '2', 'minutes': '3', 'seconds': '4'}
+        devs = [self.make_device() for _ in range(5)]
+        self.loop.run_until_complete(
+            self.gather(*[dev.connect() for dev in devs]))
+        results = self.loop.run_until_complete(
+            self.gather(*[dev.system.uptime() for dev in devs]))
+        self.assertEqual([expected] * 5, results)
+
+    def test_call_and_run(self):
+        dev = self.make_device()
+        self.loop.run_until_complete(dev.connect())
+        by_path = self.loop.run_until_complete(dev.call('system.uptime'))
+        by_func = self.loop.run_until_complete(
+            dev.run(lambda device: device.system.uptime))
+        self.assertEqual(by_path, by_func)
+
+    def test_not_connected(self):
+        dev = self.make_device()
+        with self.assertRaises(pynos.async_device.PynosException):
+            self.loop.run_until_complete(dev.call('system.uptime'))
@@ -0,0 +1,253 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+import os
+import shutil
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+
+import lxml.etree
+import ncclient.operations
+
+import pynos.cache
+import pynos.device
+
+
+class FakeManager(object):
+    """ncclient manager stand-in advertising fixed capabilities."""
+    server_capabilities = ['urn:ietf:params:netconf:base:1.0',
+                           'urn:brocade.com:mgmt:brocade-interface']
+
+
+class VersionedDevice(pynos.device.Device):
+    """Device that connects to a FakeManager and counts version RPCs."""
+    version_rpcs = 0
+
+    def reconnect(self):
+        self._mgr = FakeManager()
+        return True
+
+    @property
+    def connection(self):
+        return True
+
+    def close(self):
+        pass
+
+
+def firmware_reply(call, handler='edit_config'):
+    VersionedDevice.version_rpcs += 1
+    return ET.fromstring(
+        '<rpc-reply xmlns:ns1="urn:brocade.com:mgmt:brocade-firmware-ext">'
+        '<ns1:show-firmware-version><ns1:os-version>6.0.1</ns1:os-version>'
+        '</ns1:show-firmware-version></rpc-reply>')
+
+
+class TestVersionCache(unittest.TestCase):
+    """
+    VersionCache unit tests.
+    """
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'sub', 'versions.json')
+        self.caps = ['urn:a', 'urn:b']
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_persisted(self):
+        pynos.cache.VersionCache(self.path).set('sw1:22', self.caps, '7.0.1')
+        cache = pynos.cache.VersionCache(self.path)
+        self.assertEqual('7.0.1', cache.get('sw1:22', reversed(self.caps)))
+        self.assertIsNone(cache.get('sw2:22', self.caps))
+
+    def test_capabilities_changed(self):
+        cache = pynos.cache.VersionCache(self.path)
+        cache.set('sw1:22', self.caps, '7.0.1')
+        self.assertIsNone(cache.get('sw1:22', self.caps + ['urn:c']))
+
+    def test_expired(self):
+        cache = pynos.cache.VersionCache(self.path, ttl=-1)
+        cache.set('sw1:22', self.caps, '7.0.1')
+        self.assertIsNone(cache.get('sw1:22', self.caps))
+
+    def test_invalidate(self):
+        cache = pynos.cache.VersionCache(None)
+        cache.set('sw1:22', self.caps, '7.0.1')
+        cache.invalidate('sw1:22')
+        self.assertIsNone(cache.get('sw1:22', self.caps))
+
+    def test_unreadable_file(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, 'w') as cache_file:
+            cache_file.write('hodor')
+        self.assertIsNone(pynos.cache.VersionCache(self.path).get(
+            'sw1:22', self.caps))
+
+    def test_device_skips_version_rpc(self):
+        cache = pynos.cache.VersionCache(self.path)
+        VersionedDevice.version_rpcs = 0
+        for _ in range(3):
+            dev = VersionedDevice(conn=('sw1', '22'), callback=firmware_reply,
+                                  version_cache=cache)
+            self.assertEqual('6.0.1', dev._version)
+        self.assertEqual(1, VersionedDevice.version_rpcs)
+
+
+class ConfigReply(object):
+    xml = '<rpc-reply><data/></rpc-reply>'
+
+
+class EditManager(object):
+    """ncclient manager stand-in that records edit-configs."""
+    def __init__(self):
+        self.edits = 0
+        self.reads = 0
+
+    def edit_config(self, target, config):
+        self.edits += 1
+
+    def get(self, filter):
+        self.reads += 1
+        return ConfigReply()
+
+
+class TestResponseCache(unittest.TestCase):
+    """
+    ResponseCache unit tests. Read through a device whose RPCs are counted.
+    """
+    ext = 'urn:brocade.com:mgmt:brocade-interface-ext'
+
+    def setUp(self):
+        self.cache = pynos.cache.ResponseCache(ttl=60)
+        self.dev = pynos.device.Device(conn=('127.0.0.1', '22'), test=True,
+                                       response_cache=self.cache)
+        self.dev._mgr = EditManager()
+        self.dev._dispatch_raw = self.dispatch
+        self.rpcs = []
+
+    def dispatch(self, call):
+        self.rpcs.append(lxml.etree.QName(call).localname)
+        return ('<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">'
+                '<ok>%d</ok></rpc-reply>' % len(self.rpcs))
+
+    def get(self, tag='get-vlan-brief', namespace=ext, **children):
+        call = ET.Element(tag, xmlns=namespace)
+        for name, text in children.items():
+            ET.SubElement(call, name).text = text
+        return self.dev._callback(call, handler='get')
+
+    def edit(self, namespace):
+        config = ET.Element('config')
+        ET.SubElement(config, 'interface-vlan', xmlns=namespace)
+        self.dev._callback(config)
+
+    def test_hit(self):
+        first = self.get()
+        second = self.get()
+        self.assertEqual(['get-vlan-brief'], self.rpcs)
+        self.assertEqual(lxml.etree.tostring(first),
+                         lxml.etree.tostring(second))
+        self.assertIsNot(first, second)
+        stats = self.cache.stats()
+        self.assertEqual((1, 1, 1), (stats['hits'], stats['misses'],
+                                     stats['entries']))
+
+    def test_key_is_request(self):
+        self.get(**{'last-rcvd-vlan-id': '10'})
+        self.get(**{'last-rcvd-vlan-id': '20'})
+        self.get(**{'last-rcvd-vlan-id': '10'})
+        self.assertEqual(2, len(self.rpcs))
+
+    def test_namespace_ttl(self):
+        self.cache = pynos.cache.ResponseCache(ttls={self.ext: 0})
+        self.dev._response_cache = self.cache
+        self.get()
+        self.get()
+        self.assertEqual(2, len(self.rpcs))
+
+    def test_expired(self):
+        self.cache._ttl = -1
+        self.get()
+        self.get()
+        self.assertEqual(2, len(self.rpcs))
+
+    def test_edit_invalidates_family(self):
+        self.get()
+        self.get('show-vcs', 'urn:brocade.com:mgmt:brocade-vcs')
+        self.edit('urn:brocade.com:mgmt:brocade-interface')
+        self.assertEqual(1, self.dev._mgr.edits)
+        self.get()
+        self.get('show-vcs', 'urn:brocade.com:mgmt:brocade-vcs')
+        self.assertEqual(['get-vlan-brief', 'show-vcs', 'get-vlan-brief'],
+                         self.rpcs)
+        self.assertEqual(1, self.cache.stats()['invalidations'])
+
+    def test_edit_keeps_config_of_other_family(self):
+        query = ET.Element('config')
+        ET.SubElement(query, 'router', xmlns='urn:brocade.com:mgmt:'
+                                             'brocade-bgp')
+        self.dev._callback(query, handler='get_config')
+        self.edit('urn:brocade.com:mgmt:brocade-interface')
+        self.dev._callback(query, handler='get_config')
+        self.assertEqual(1, self.dev._mgr.reads)
+        stats = self.cache.stats()
+        self.assertEqual((1, 0), (stats['entries'], stats['invalidations']))
+        self.edit('urn:brocade.com:mgmt:brocade-bgp')
+        self.assertEqual(1, self.cache.stats()['invalidations'])
+
+    def test_other_rpc_invalidates_all(self):
+        self.get()
+        self.get('commit', 'urn:ietf:params:xml:ns:netconf:base:1.0')
+        self.get()
+        self.assertEqual(['get-vlan-brief', 'commit', 'get-vlan-brief'],
+                         self.rpcs)
+
+    def test_rpc_error_not_cached(self):
+        self.dev._dispatch_raw = lambda call: (
+            '<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">'
+            '<rpc-error><error-message>bad</error-message></rpc-error>'
+            '</rpc-reply>')
+        for _ in range(2):
+            with self.assertRaises(ncclient.operations.RPCError):
+                self.get()
+        self.assertEqual(0, self.cache.stats()['entries'])
+
+    def test_write_during_read(self):
+        call = lxml.etree.fromstring('<get-arp xmlns="urn:a"/>')
+        key = self.cache.key(call, 'get')
+        generation = self.cache.generation
+        self.cache.invalidate(['urn:b'])
+        self.cache.put(key, call, b'<reply/>', 8, generation)
+        self.assertIsNone(self.cache.get(key))
+
+    def test_eviction(self):
+        cache = pynos.cache.ResponseCache(max_entries=2)
+        for name in ('a', 'b', 'a', 'c'):
+            call = lxml.etree.fromstring('<get-%s xmlns="urn:x"/>' % name)
+            key = cache.key(call, 'get')
+            if cache.get(key) is None:
+                cache.put(key, call, name, 1, cache.generation)
+        self.assertEqual(1, cache.stats()['evictions'])
+        # b was the least recently used.
+        self.assertIsNone(cache.get(cache.key(
+            lxml.etree.fromstring('<get-b xmlns="urn:x"/>'), 'get')))
+        self.assertEqual('a', cache.get(cache.key(
+            lxml.etree.fromstring('<get-a xmlns="urn:x"/>'), 'get')))
+
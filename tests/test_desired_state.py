@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import unittest
+
+import lxml.etree
+import ncclient.transport
+
+import pynos.device
+import pynos.instrumentation
+import pynos.mirror
+from pynos.exceptions import PynosException
+from pynos.versions.base.interface import Interface
+
+RUNNING = (
+    '<data xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">'
+    '<interface xmlns="urn:brocade.com:mgmt:brocade-interface">'
+    '<tengigabitethernet><name>1/0/1</name><description>a</description>'
+    '<ip><ip-config xmlns="urn:brocade.com:mgmt:brocade-ip-config">'
+    '<address><address>10.0.0.1/24</address></address>'
+    '</ip-config></ip></tengigabitethernet>'
+    '<tengigabitethernet><name>1/0/2</name><description>b</description>'
+    '</tengigabitethernet>'
+    '</interface>'
+    '<interface-vlan xmlns="urn:brocade.com:mgmt:brocade-interface">'
+    '<interface><vlan><name>10</name></vlan></interface>'
+    '</interface-vlan>'
+    '</data>')
+
+
+class FakeReply(object):
+    def __init__(self, data):
+        self.data_ele = data
+
+
+class FakeManager(object):
+    """ncclient manager stand-in that filters a fixed running
+    configuration."""
+    def __init__(self):
+        self.filters = []
+        self.edits = []
+
+    def get_config(self, source, filter=None):
+        self.filters.append(filter)
+        running = lxml.etree.fromstring(RUNNING)
+        data = lxml.etree.Element(running.tag)
+        for selector in filter:
+            data.extend(pynos.mirror._filter(running, selector))
+        return FakeReply(data)
+
+    def edit_config(self, target, config):
+        self.edits.append(config)
+
+
+class TestDesiredState(unittest.TestCase):
+    """
+    DesiredState unit tests. Send only what differs from the device.
+    """
+    def setUp(self):
+        self.dev = pynos.device.Device(conn=('127.0.0.1', '22'), test=True)
+        self.dev._mgr = FakeManager()
+        self.interface = Interface(self.dev._call)
+
+    def describe(self, port, desc):
+        self.interface.description(int_type='tengigabitethernet',
+                                   name='1/0/%d' % port, desc=desc)
+
+    def sent(self):
+        self.assertEqual(1, len(self.dev._mgr.edits))
+        return self.dev._mgr.edits[0]
+
+    def test_steady_state(self):
+        with self.dev.desired_state() as state:
+            self.describe(1, 'a')
+            self.describe(2, 'b')
+            self.interface.add_vlan_int('10')
+        self.assertIsNone(state.delta)
+        self.assertEqual(1, state.rpcs)
+        self.assertEqual(1, len(self.dev._mgr.filters))
+        self.assertEqual([], self.dev._mgr.edits)
+
+    def test_one_fetch_selects_keys(self):
+        with self.dev.desired_state(dry_run=True):
+            self.describe(1, 'a')
+            self.interface.add_vlan_int('20')
+        spec = self.dev._mgr.filters[0]
+        self.assertEqual('subtree', spec.get('type'))
+        self.assertEqual(2, len(spec))
+        port = spec[0].find('{*}tengigabitethernet')
+        self.assertEqual(['1/0/1', None], [node.text for node in port])
+
+    def test_only_changes_sent(self):
+        with self.dev.desired_state() as state:
+            self.describe(1, 'a')
+            self.describe(2, 'uplink')
+            self.describe(3, 'new')
+            self.interface.add_vlan_int('10')
+            self.interface.add_vlan_int('20')
+        self.assertEqual(2, state.rpcs)
+        sent = self.sent()
+        ports = sent.findall('.//{*}tengigabitethernet')
+        self.assertEqual(['1/0/2', '1/0/3'],
+                         [port.findtext('{*}name') for port in ports])
+        self.assertEqual(['uplink', 'new'],
+                         [port.findtext('{*}description') for port in ports])
+        self.assertEqual(['20'], [vlan.text for vlan in
+                                  sent.findall('.//{*}vlan/{*}name')])
+
+    def test_deletes_of_missing_config_dropped(self):
+        with self.dev.desired_state() as state:
+            self.interface.del_ip('tengigabitethernet', '1/0/1',
+                                  '10.0.9.1/24')
+            self.interface.del_ip('tengigabitethernet', '1/0/7',
+                                  '10.0.9.1/24')
+        self.assertIsNone(state.delta)
+        with self.dev.desired_state():
+            self.interface.del_ip('tengigabitethernet', '1/0/1',
+                                  '10.0.0.1/24')
+        address = self.sent().find('.//{*}ip-config/{*}address')
+        self.assertEqual('delete', address.get('operation'))
+        self.assertEqual('10.0.0.1/24', address.findtext('{*}address'))
+
+    def test_fetch_through_callback(self):
+        records = []
+        self.dev._instrumentation = pynos.instrumentation.Instrumentation(
+            listeners=[records.append])
+        with self.dev.desired_state(dry_run=True):
+            self.describe(1, 'a')
+        self.assertEqual([('get_config', 'interface', True)],
+                         [(record.handler, record.name, record.sent)
+                          for record in records])
+
+        def drop(source, filter=None):
+            raise ncclient.transport.TransportError('closed')
+        self.dev._mgr.get_config = drop
+        with self.assertRaises(pynos.device.DeviceCommError):
+            with self.dev.desired_state(dry_run=True):
+                self.describe(1, 'a')
+
+    def test_conflict(self):
+        state = self.dev.desired_state()
+        with self.assertRaises(PynosException) as ctx:
+            with state:
+                self.describe(1, 'x')
+                self.describe(1, 'y')
+        self.assertIn('Interface.description', str(ctx.exception))
+        self.assertEqual([], self.dev._mgr.filters)
+        self.assertIsNone(self.dev._transaction)
+
+    def test_candidate_refused(self):
+        state = self.dev.desired_state()
+        with self.assertRaises(PynosException):
+            state.capture('<config/>', target='candidate')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,242 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+import subprocess
+import sys
+import unittest
+import xml.etree.ElementTree as ET
+
+import lxml.etree
+import ncclient.operations
+import ncclient.transport
+
+import pynos.device
+import pynos.records
+import pynos.utilities
+
+
+class FakeManager(object):
+    """Stand-in for an ncclient manager whose session can be dropped.
+    """
+    def __init__(self, broken=False):
+        self.broken = broken
+        self.calls = 0
+
+    def edit_config(self, target, config):
+        self.calls += 1
+        self.config = config
+        if self.broken:
+            raise ncclient.transport.TransportError('Not connected')
+
+
+class FakeReply(object):
+    """Reply of an RPC answered by ``FakeSession``.
+    """
+    def __init__(self, xml):
+        self.xml = xml
+        self.error = None
+
+    def parse(self):
+        pass
+
+
+class FakeRPC(object):
+    """RPC written to a ``FakeSession``, answered when it is waited on.
+    """
+    def __init__(self, session, call):
+        self.session = session
+        self.call = call
+        self.error = None
+        self.reply = None
+        self.event = self
+
+    def wait(self, timeout=None):
+        self.session.outstanding -= 1
+        self.reply = FakeReply('<rpc-reply><%s/></rpc-reply>' % self.call.tag)
+
+    def is_set(self):
+        return self.reply is not None
+
+
+class FakeSession(object):
+    """Records how many requests are outstanding at once.
+    """
+    def __init__(self):
+        self.outstanding = 0
+        self.most_outstanding = 0
+
+    def send(self, call, handler, target):
+        self.outstanding += 1
+        self.most_outstanding = max(self.most_outstanding, self.outstanding)
+        return FakeRPC(self, call)
+
+
+class TestDevice(unittest.TestCase):
+    """
+    Device unit tests. Run the device in test mode against a local callback.
+    """
+    def setUp(self):
+        self.dev = pynos.device.Device(conn=('127.0.0.1', '22'), test=True,
+                                       callback=pynos.utilities.return_xml)
+
+    def test_versions_resolve(self):
+        for version in ['5.0.1', '6.0.1', '6.0.2']:
+            for path in pynos.device.VERSIONS[version].values():
+                cls = pynos.device.resolve_class(path)
+                self.assertEqual(cls.__name__, path.rsplit('.', 1)[1])
+
+    def test_feature_built_on_access(self):
+        self.assertNotIn('interface', self.dev.__dict__)
+        interface = self.dev.interface
+        self.assertIs(interface, self.dev.interface)
+        self.assertIn('interface', self.dev.__dict__)
+
+    def test_unsupported_feature(self):
+        with self.assertRaises(AttributeError):
+            self.dev.nsx
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            self.dev.hodor
+
+    def test_import_is_lazy(self):
+        code = ('import sys, pynos.device\n'
+                'assert not [m for m in sys.modules '
+                'if m.startswith("pynos.versions.")]\n'
+                'dev = pynos.device.Device(conn=("127.0.0.1", "22"), '
+                'test=True, callback=lambda *a, **k: None)\n'
+                'dev.lldp\n'
+                'loaded = [m for m in sys.modules '
+                'if m.startswith("pynos.versions.ver_") and '
+                'm.count(".") == 4]\n'
+                'assert loaded == ["pynos.versions.ver_5.ver_5_0_1.lldp"], '
+                'loaded\n')
+        subprocess.check_call([sys.executable, '-c', code])
+
+    def make_flaky_device(self, auto_reconnect):
+        dev = pynos.device.Device(conn=('127.0.0.1', '22'), test=True,
+                                  auto_reconnect=auto_reconnect)
+        managers = [FakeManager(broken=True), FakeManager()]
+
+        def reconnect():
+            dev._mgr = managers.pop(0)
+
+        dev.reconnect = reconnect
+        dev.reconnect()
+        return dev
+
+    def test_dropped_session(self):
+        dev = self.make_flaky_device(auto_reconnect=False)
+        with self.assertRaises(pynos.device.DeviceCommError):
+            dev._callback(ET.Element('config'))
+
+    def test_auto_reconnect(self):
+        dev = self.make_flaky_device(auto_reconnect=True)
+        dev._callback(ET.Element('config'))
+        self.assertEqual(1, dev._mgr.calls)
+        self.assertEqual(1, dev._reconnects)
+
+    def mac_table_reply(self, call, handler='edit_config'):
+        namespace = 'urn:brocade.com:mgmt:brocade-mac-address-table'
+        entry = ('<mac-address-table><vlanid>{0}</vlanid>'
+                 '<mac-address>0005.33e5.d7{0:02}</mac-address>'
+                 '<mac-type>dynamic</mac-type><mac-state>active</mac-state>'
+                 '<forwarding-interface><interface-type>TenGigabitEthernet'
+                 '</interface-type><interface-name>1/0/{0}</interface-name>'
+                 '</forwarding-interface></mac-address-table>')
+        reply = ('<rpc-reply><get-mac-address-table-output xmlns="{0}">{1}'
+                 '</get-mac-address-table-output></rpc-reply>'.format(
+                     namespace, ''.join(entry.format(i) for i in range(3))))
+        if handler == 'get_stream':
+            return reply
+        return ET.fromstring(reply).find('{%s}get-mac-address-table-output'
+                                         % namespace)
+
+    def test_iter_mac_table(self):
+        self.dev._callback = self.mac_table_reply
+        expected = self.dev.mac_table
+        self.assertEqual(3, len(expected))
+        self.assertEqual('TenGigabitEthernet1/0/2', expected[2]['interface'])
+        self.assertEqual(expected, list(self.dev.iter_mac_table()))
+
+    def test_mac_table_records(self):
+        dev = pynos.device.Device(conn=('127.0.0.1', '22'), test=True,
+                                  callback=self.mac_table_reply, records=True)
+        table = dev.mac_table
+        self.assertIsInstance(table[0], pynos.records.MacTableEntry)
+        self.assertEqual(table, list(dev.iter_mac_table()))
+        self.dev._callback = self.mac_table_reply
+        self.assertEqual(self.dev.mac_table, table)
+        self.assertTrue(dev.lldp._records)
+
+    def test_execute_many_sequential(self):
+        calls = []
+
+        def callback(call, handler='edit_config', **kwargs):
+            calls.append((call.tag, handler))
+            return call.tag
+
+        self.dev._callback = callback
+        results = self.dev.execute_many([(ET.Element('a'), 'get'),
+                                         ET.Element('b')])
+        self.assertEqual(['a', 'b'], results)
+        self.assertEqual([('a', 'get'), ('b', 'edit_config')], calls)
+
+    def test_execute_many_pipelined(self):
+        session = FakeSession()
+        dev = pynos.device.Device(conn=('127.0.0.1', '22'), test=True)
+        dev._mgr = FakeManager()
+        dev._mgr.timeout = 1
+        dev._send_async = session.send
+        calls = [(ET.Element('page%d' % i), 'get') for i in range(10)]
+        results = dev.execute_many(calls, window=4)
+        self.assertEqual(['page%d' % i for i in range(10)],
+                         [r[0].tag for r in results])
+        self.assertEqual(4, session.most_outstanding)
+
+    def test_execute_many_handler(self):
+        with self.assertRaises(ValueError):
+            self.dev.execute_many([(ET.Element('config'), 'copy_config')])
+
+    def test_send_lxml(self):
+        dev = pynos.device.Device(conn=('127.0.0.1', '22'), test=True)
+        dev._mgr = FakeManager()
+        dev._send(ET.Element('config'), 'edit_config', 'running', None)
+        self.assertIsInstance(dev._mgr.config, lxml.etree._Element)
+        requests = []
+
+        def dispatch(call):
+            requests.append(call)
+            return ('<?xml version="1.0" encoding="UTF-8"?><rpc-reply '
+                    'xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">'
+                    '<has-more>false</has-more></rpc-reply>')
+        dev._dispatch_raw = dispatch
+        reply = dev._send(ET.Element('get-vlan-brief'), 'get', 'running',
+                          None)
+        self.assertIsInstance(requests[0], lxml.etree._Element)
+        self.assertEqual('false', reply.find(
+            '{urn:ietf:params:xml:ns:netconf:base:1.0}has-more').text)
+
+    def test_send_rpc_error(self):
+        dev = pynos.device.Device(conn=('127.0.0.1', '22'), test=True)
+        dev._dispatch_raw = lambda call: (
+            '<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">'
+            '<rpc-error><error-message>bad</error-message></rpc-error>'
+            '</rpc-reply>')
+        with self.assertRaises(ncclient.operations.RPCError):
+            dev._send(ET.Element('get-vlan-brief'), 'get', 'running', None)
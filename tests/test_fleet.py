@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+import threading
+import time
+import unittest
+
+import pynos.device
+import pynos.fleet
+import pynos.utilities
+
+
+class TestFleet(unittest.TestCase):
+    """
+    Fleet unit tests. Devices run in test mode against a local callback.
+    """
+    def setUp(self):
+        self.hosts = ['10.0.0.%s' % i for i in range(1, 9)]
+        self.defaults = dict(test=True, callback=pynos.utilities.return_xml)
+
+    def test_operation_path(self):
+        fleet = pynos.fleet.Fleet(self.hosts, concurrency=3, **self.defaults)
+        results = list(fleet.run('interface.add_vlan_int', '10'))
+        self.assertEqual(sorted(self.hosts), sorted(r.host for r in results))
+        for result in results:
+            self.assertTrue(result.ok)
+            self.assertEqual(1, result.attempts)
+            self.assertTrue(result.result)
+
+    def test_operation_callable(self):
+        results = pynos.fleet.run(self.hosts[:2],
+                                  lambda dev, value: value * 2, 21,
+                                  options=self.defaults)
+        self.assertEqual([42, 42], [r.result for r in results])
+
+    def test_bounded_concurrency(self):
+        lock = threading.Lock()
+        state = dict(active=0, peak=0)
+
+        def operation(dev):
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+            time.sleep(0.05)
+            with lock:
+                state['active'] -= 1
+
+        fleet = pynos.fleet.Fleet(self.hosts, concurrency=2, **self.defaults)
+        list(fleet.run(operation))
+        self.assertEqual(2, state['peak'])
+
+    def test_retry(self):
+        attempts = {}
+
+        def flaky(dev):
+            host = dev._conn[0]
+            attempts[host] = attempts.get(host, 0) + 1
+            if attempts[host] < 3:
+                raise pynos.device.DeviceCommError
+            return 'done'
+
+        fleet = pynos.fleet.Fleet(self.hosts[:1], retries=2, retry_delay=0,
+                                  **self.defaults)
+        result = next(fleet.run(flaky))
+        self.assertEqual(('done', 3), (result.result, result.attempts))
+
+        fleet = pynos.fleet.Fleet(self.hosts[1:2], retries=1, retry_delay=0,
+                                  **self.defaults)
+        result = next(fleet.run(flaky))
+        self.assertIsInstance(result.error, pynos.device.DeviceCommError)
+
+    def test_no_retry_on_other_errors(self):
+        def broken(dev):
+            raise KeyError('hodor')
+
+        fleet = pynos.fleet.Fleet(self.hosts[:1], retries=5, retry_delay=0,
+                                  **self.defaults)
+        result = next(fleet.run(broken))
+        self.assertIsInstance(result.error, KeyError)
+        self.assertEqual(1, result.attempts)
+
+    def test_timeout_streams_other_results(self):
+        def operation(dev):
+            if dev._conn[0] == self.hosts[0]:
+                time.sleep(1)
+            return dev._conn[0]
+
+        fleet = pynos.fleet.Fleet(self.hosts, concurrency=4, timeout=0.2,
+                                  **self.defaults)
+        start = time.time()
+        results = list(fleet.run(operation))
+        self.assertLess(time.time() - start, 0.9)
+        self.assertEqual(len(self.hosts), len(results))
+        failed = [r for r in results if not r.ok]
+        self.assertEqual([self.hosts[0]], [r.host for r in failed])
+        self.assertIsInstance(failed[0].error, pynos.fleet.FleetTimeout)
+
+    def test_timeout_passed_to_devices(self):
+        inventory = [self.hosts[0], dict(conn=(self.hosts[1], '22'),
+                                         timeout=5)]
+        fleet = pynos.fleet.Fleet(inventory, timeout=30, **self.defaults)
+        results = fleet.run(lambda dev: (dev._conn[0], dev._timeout))
+        self.assertEqual([(self.hosts[0], 30), (self.hosts[1], 5)],
+                         sorted(r.result for r in results))
+        fleet = pynos.fleet.Fleet(self.hosts[:1], **self.defaults)
+        self.assertNotIn('timeout', fleet.inventory[0])
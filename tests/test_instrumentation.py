@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import threading
+import unittest
+import xml.etree.ElementTree as ET
+
+import ncclient.operations
+
+import pynos.device
+import pynos.instrumentation
+from pynos.versions.base.interface import Interface
+from pynos.versions.base.system import System
+
+UPTIME = ('<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">'
+          '<show-system-uptime xmlns="urn:brocade.com:mgmt:brocade-system">'
+          '<days>1</days><hours>2</hours><minutes>3</minutes>'
+          '<seconds>4</seconds></show-system-uptime></rpc-reply>')
+
+
+class EditManager(object):
+    """ncclient manager stand-in that accepts edits."""
+    def __init__(self):
+        self.edits = []
+
+    def edit_config(self, target, config):
+        self.edits.append(config)
+
+
+class FakeReply(object):
+    xml = UPTIME
+
+
+class FakeRPC(object):
+    """Pipelined RPC stand-in whose reply has arrived."""
+    reply = FakeReply()
+
+
+class TestInstrumentation(unittest.TestCase):
+    """
+    Instrumentation unit tests. Measure the calls of a device whose RPCs
+    are answered locally.
+    """
+    def setUp(self):
+        self.records = []
+        self.metrics = pynos.instrumentation.Instrumentation(
+            listeners=[self.records.append])
+        self.dev = pynos.device.Device(conn=('127.0.0.1', '22'), test=True,
+                                       instrumentation=self.metrics)
+        self.dev._mgr = EditManager()
+        self.dev._dispatch_raw = lambda call: UPTIME
+        self.interface = Interface(self.dev._call)
+        self.system = System(self.dev._call)
+
+    def test_disabled(self):
+        dev = pynos.device.Device(conn=('127.0.0.1', '22'), test=True)
+        self.assertIsNone(dev.instrumentation)
+        dev = pynos.device.Device(conn=('127.0.0.1', '22'), test=True,
+                                  instrumentation=True)
+        self.assertIsInstance(dev.instrumentation,
+                              pynos.instrumentation.Instrumentation)
+
+    def test_get_record(self):
+        self.system.uptime
+        record, = self.records
+        self.assertEqual('get', record.handler)
+        self.assertEqual('get-system-uptime', record.name)
+        self.assertEqual('urn:brocade.com:mgmt:brocade-system',
+                         record.namespace)
+        self.assertEqual('System.uptime', record.method)
+        self.assertTrue(record.sent)
+        self.assertEqual(len(UPTIME), record.reply_bytes)
+        self.assertGreater(record.request_bytes, 0)
+        self.assertGreaterEqual(record.seconds, record.parse_seconds)
+        self.assertIsNone(record.error)
+
+    def test_edit_record(self):
+        self.interface.description(int_type='tengigabitethernet',
+                                   name='1/0/1', desc='uplink')
+        record, = self.records
+        self.assertEqual('edit_config', record.handler)
+        self.assertEqual('interface', record.name)
+        self.assertEqual('Interface.description', record.method)
+        self.assertEqual('running', record.target)
+
+    def test_error_recorded(self):
+        def dispatch(call):
+            raise ncclient.operations.TimeoutExpiredError('timed out')
+        self.dev._dispatch_raw = dispatch
+        with self.assertRaises(ncclient.operations.TimeoutExpiredError):
+            self.system.uptime
+        self.assertIsInstance(self.records[0].error,
+                              ncclient.operations.TimeoutExpiredError)
+        self.assertEqual(1, self.metrics.stats()['get-system-uptime'].errors)
+
+    def test_cache_hit_not_sent(self):
+        dev = pynos.device.Device(conn=('127.0.0.1', '22'), test=True,
+                                  instrumentation=self.metrics,
+                                  response_cache=True)
+        dev._dispatch_raw = lambda call: UPTIME
+        system = System(dev._call)
+        system.uptime
+        system.uptime
+        self.assertEqual([True, False],
+                         [record.sent for record in self.records])
+        aggregate = self.metrics.stats()['get-system-uptime']
+        self.assertEqual((2, 1), (aggregate.count, aggregate.sent))
+
+    def test_stats_and_report(self):
+        self.system.uptime
+        self.system.uptime
+        self.interface.description(int_type='tengigabitethernet',
+                                   name='1/0/1', desc='uplink')
+        by_handler = self.metrics.stats(by='handler')
+        self.assertEqual(2, by_handler['get'].count)
+        self.assertEqual(1, by_handler['edit_config'].count)
+        self.assertEqual(2 * len(UPTIME), by_handler['get'].reply_bytes)
+        self.assertEqual(2, sum(by_handler['get'].latency.counts))
+        report = self.metrics.report(by='method')
+        self.assertIn('System.uptime', report)
+        self.assertIn('Interface.description', report)
+        with self.assertRaises(ValueError):
+            self.metrics.stats(by='target')
+        self.metrics.reset()
+        self.assertEqual({}, self.metrics.stats())
+
+    def test_listener_failure_ignored(self):
+        def fail(record):
+            raise RuntimeError('listener')
+        self.metrics.add_listener(fail)
+        self.metrics.add_listener(self.records.append)
+        self.system.uptime
+        self.assertEqual(2, len(self.records))
+        self.metrics.remove_listener(self.records.append)
+        self.metrics.remove_listener(fail)
+        self.system.uptime
+        self.assertEqual(2, len(self.records))
+
+    def test_execute_many(self):
+        self.dev._send_async = lambda call, handler, target: FakeRPC()
+        self.dev._reply = lambda rpc, handler: rpc.reply.xml
+        calls = [ET.Element('get-system-uptime',
+                            xmlns='urn:brocade.com:mgmt:brocade-system')
+                 for _ in range(3)]
+        self.dev.execute_many(calls, handler='get', window=1)
+        self.assertEqual(3, len(self.records))
+        self.assertEqual(['Device.execute_many'] * 3,
+                         [record.method for record in self.records])
+
+    def test_inherited_method(self):
+        call = ET.Element('get-system-uptime',
+                          xmlns='urn:brocade.com:mgmt:brocade-system')
+        worker = pynos.instrumentation.inherit(self.dev._callback)
+        thread = threading.Thread(target=worker, args=(call, 'get'))
+        thread.start()
+        thread.join(5)
+        thread = threading.Thread(target=lambda: self.system.uptime)
+        thread.start()
+        thread.join(5)
+        worker(call, 'get')
+        self.system.uptime
+        self.assertEqual(['TestInstrumentation.test_inherited_method',
+                          'System.uptime',
+                          'TestInstrumentation.test_inherited_method',
+                          'System.uptime'],
+                         [record.method for record in self.records])
+
+
+class TestHistogram(unittest.TestCase):
+    """
+    Histogram unit tests.
+    """
+    def test_quantile(self):
+        histogram = pynos.instrumentation.Histogram((1, 10, 100))
+        self.assertIsNone(histogram.quantile(0.5))
+        for value in (0.5, 5, 5, 50, 500):
+            histogram.add(value)
+        self.assertEqual([1, 2, 1, 1], histogram.counts)
+        self.assertEqual(10, histogram.quantile(0.5))
+        self.assertEqual(float('inf'), histogram.quantile(0.99))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import unittest
+import xml.etree.ElementTree as ET
+
+import pynos.device
+import pynos.mac_table
+
+
+class TestMacTableIndex(unittest.TestCase):
+    """
+    MacTableIndex unit tests. Index a canned MAC table reply.
+    """
+    def setUp(self):
+        self.calls = 0
+        self.dev = pynos.device.Device(conn=('127.0.0.1', '22'), test=True,
+                                       callback=self.mac_table_reply)
+
+    def mac_table_reply(self, call, handler='edit_config'):
+        self.calls += 1
+        namespace = 'urn:brocade.com:mgmt:brocade-mac-address-table'
+        entry = ('<mac-address-table><vlanid>{0}</vlanid>'
+                 '<mac-address>0005.33e5.d7{1:02}</mac-address>'
+                 '<mac-type>dynamic</mac-type><mac-state>active</mac-state>'
+                 '<forwarding-interface><interface-type>TenGigabitEthernet'
+                 '</interface-type><interface-name>1/0/{2}</interface-name>'
+                 '</forwarding-interface></mac-address-table>')
+        reply = ('<rpc-reply><get-mac-address-table-output xmlns="{0}">{1}'
+                 '</get-mac-address-table-output></rpc-reply>'.format(
+                     namespace, ''.join(entry.format(10 + i % 2, i, i % 3)
+                                        for i in range(6))))
+        if handler == 'get_stream':
+            return reply
+        return ET.fromstring(reply).find('{%s}get-mac-address-table-output'
+                                         % namespace)
+
+    def test_normalize_mac(self):
+        for mac in ['00:05:33:E5:D7:01', '00-05-33-e5-d7-01',
+                    '0005.33e5.d701', '000533e5d701']:
+            self.assertEqual('0005.33e5.d701',
+                             pynos.mac_table.normalize_mac(mac))
+        with self.assertRaises(ValueError):
+            pynos.mac_table.normalize_mac('0005.33e5.d70g')
+
+    def test_one_fetch_for_many_lookups(self):
+        found = self.dev.find_interfaces_by_macs(
+            ['00:05:33:e5:d7:01', '0005.33e5.d704', '00:00:00:00:00:00'])
+        self.assertEqual('TenGigabitEthernet1/0/1',
+                         found['00:05:33:e5:d7:01'][0]['interface'])
+        self.assertEqual(1, len(found['0005.33e5.d704']))
+        self.assertEqual([], found['00:00:00:00:00:00'])
+        index = self.dev.mac_table_index()
+        self.assertEqual(3, len(index.by_vlan(10)))
+        self.assertEqual(2, len(index.by_interface('TenGigabitEthernet1/0/2')))
+        self.assertEqual(6, len(index))
+        self.assertEqual(1, self.calls)
+
+    def test_refresh(self):
+        index = pynos.mac_table.MacTableIndex(self.dev, ttl=None)
+        index.lookup('0005.33e5.d701')
+        index.lookup('0005.33e5.d702')
+        self.assertEqual(1, self.calls)
+        index.refresh()
+        self.assertEqual(2, self.calls)
+
+    def test_ttl(self):
+        index = pynos.mac_table.MacTableIndex(self.dev, ttl=0)
+        index.lookup('0005.33e5.d701')
+        index.lookup('0005.33e5.d701')
+        self.assertEqual(2, self.calls)
+
+    def test_snapshot(self):
+        entries = self.dev.mac_table
+        index = pynos.mac_table.MacTableIndex(entries=entries)
+        self.assertEqual(entries[:1], index.lookup('0005.33e5.d700'))
+        with self.assertRaises(ValueError):
+            index.refresh()
@@ -0,0 +1,254 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import unittest
+import xml.etree.ElementTree as ET
+
+import lxml.etree
+import ncclient.operations
+import ncclient.transport
+
+import pynos.device
+import pynos.instrumentation
+import pynos.mirror
+import pynos.scheduler
+import pynos.utilities
+from pynos.versions.base.interface import Interface
+from pynos.versions.base.yang.brocade_interface import brocade_interface
+
+RUNNING = (
+    '<data xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">'
+    '<interface xmlns="urn:brocade.com:mgmt:brocade-interface">'
+    '<tengigabitethernet><name>1/0/1</name><description>a</description>'
+    '<ip><ip-config xmlns="urn:brocade.com:mgmt:brocade-ip-config">'
+    '<address><address>10.0.0.1/24</address></address>'
+    '<address><address>10.0.1.1/24</address></address>'
+    '</ip-config></ip></tengigabitethernet>'
+    '<tengigabitethernet><name>1/0/2</name><description>b</description>'
+    '</tengigabitethernet>'
+    '</interface>'
+    '<interface-vlan xmlns="urn:brocade.com:mgmt:brocade-interface">'
+    '<interface><vlan><name>10</name></vlan></interface>'
+    '</interface-vlan>'
+    '</data>')
+
+
+class FakeReply(object):
+    def __init__(self, data):
+        self.data_ele = data
+
+
+class FakeManager(object):
+    """ncclient manager stand-in serving a fixed running configuration."""
+    def __init__(self):
+        self.fetches = []
+        self.edits = 0
+        self.broken = False
+
+    def get_config(self, source, filter=None):
+        data = lxml.etree.fromstring(RUNNING)
+        self.fetches.append(None if filter is None else filter[0].tag)
+        if filter is not None:
+            for child in list(data):
+                if child.tag != filter[0].tag:
+                    data.remove(child)
+        return FakeReply(data)
+
+    def edit_config(self, target, config):
+        self.edits += 1
+        if self.broken:
+            raise ncclient.operations.RPCError(lxml.etree.fromstring(
+                '<rpc-error><error-message>bad</error-message></rpc-error>'))
+
+
+class TestConfigMirror(unittest.TestCase):
+    """
+    ConfigMirror unit tests. Answer getters from a mirrored configuration.
+    """
+    container = '{urn:brocade.com:mgmt:brocade-interface}interface'
+
+    def setUp(self):
+        self.dev = pynos.device.Device(conn=('127.0.0.1', '22'), test=True,
+                                       config_mirror=True)
+        self.dev._mgr = FakeManager()
+        self.dev._dispatch_raw = lambda call: (
+            '<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">'
+            '<ok/></rpc-reply>')
+        self.yang = brocade_interface(callback=pynos.utilities.return_xml)
+        self.interface = Interface(self.dev._call)
+
+    def ips(self, name):
+        return self.interface.get_ip_addresses(
+            int_type='tengigabitethernet', name=name, version=4)
+
+    def description(self, name):
+        config = self.yang.interface_tengigabitethernet_description(
+            name=name, description='')
+        reply = self.dev._callback(config, handler='get_config')
+        return [item.text for item in reply.data.findall(
+            './/{*}description')]
+
+    def test_one_fetch_per_container(self):
+        self.assertEqual(['10.0.0.1/24', '10.0.1.1/24'], self.ips('1/0/1'))
+        self.assertEqual([], self.ips('1/0/2'))
+        self.assertEqual(['b'], self.description('1/0/2'))
+        self.assertEqual([self.container], self.dev._mgr.fetches)
+        self.assertEqual(3, self.dev.config_mirror.stats()['queries'])
+
+    def test_reply_as_string(self):
+        config = self.yang.interface_tengigabitethernet_description(
+            name='1/0/2', description='')
+        reply = self.dev._callback(config, handler='get_config')
+        for text in (str(reply), repr(reply)):
+            tree = pynos.utilities.return_xml(text)
+            self.assertEqual(['b'], [item.text for item in tree.findall(
+                './/{*}description')])
+
+    def test_fetch_through_callback(self):
+        records = []
+        scheduler = pynos.scheduler.Scheduler(initial_limit=1, max_limit=1)
+        self.dev._instrumentation = pynos.instrumentation.Instrumentation(
+            listeners=[records.append])
+        self.dev._scheduler = scheduler
+        self.dev.config_mirror.load()
+        self.assertEqual([('get_config', 'filter', True)],
+                         [(record.handler, record.name, record.sent)
+                          for record in records])
+        self.assertEqual(1, scheduler.stats()['completed'])
+
+        def drop(source, filter=None):
+            raise ncclient.transport.TransportError('closed')
+        self.dev._mgr.get_config = drop
+        self.dev.config_mirror.resync()
+        with self.assertRaises(pynos.device.DeviceCommError):
+            self.ips('1/0/1')
+
+    def test_load(self):
+        self.dev.config_mirror.load()
+        self.ips('1/0/1')
+        self.description('1/0/1')
+        self.assertEqual([None], self.dev._mgr.fetches)
+
+    def test_edit_applied(self):
+        self.description('1/0/1')
+        config = self.yang.\
+            interface_tengigabitethernet_ip_ip_config_address_address(
+                name='1/0/1', address='10.0.2.1/24')
+        self.dev._callback(config)
+        self.assertEqual(1, self.dev._mgr.edits)
+        self.assertEqual(['10.0.0.1/24', '10.0.1.1/24', '10.0.2.1/24'],
+                         self.ips('1/0/1'))
+        self.assertEqual(['a'], self.description('1/0/1'))
+        self.assertEqual(1, len(self.dev._mgr.fetches))
+
+    def test_changed_leaf_refetches(self):
+        self.description('1/0/2')
+        self.dev._callback(self.yang.interface_tengigabitethernet_description(
+            name='1/0/2', description='uplink'))
+        self.description('1/0/2')
+        self.assertEqual(2, len(self.dev._mgr.fetches))
+
+    def test_leaf_list_values(self):
+        running = ['10']
+
+        def fetch(subtree):
+            return lxml.etree.fromstring(
+                '<data><host xmlns="urn:example"><name>a</name>%s</host>'
+                '</data>' % ''.join('<server>%s</server>' % value
+                                    for value in running))
+
+        def add(value):
+            if value not in running:
+                running.append(value)
+            mirror.apply(lxml.etree.fromstring(
+                '<config><host xmlns="urn:example"><name>a</name>'
+                '<server>%s</server></host></config>' % value))
+
+        def servers():
+            return [item.text for item in mirror.query(lxml.etree.Element(
+                '{urn:example}host')).data.findall('.//{*}server')]
+        mirror = pynos.mirror.ConfigMirror(fetch)
+        servers()
+        add('20')
+        self.assertEqual(['10', '20'], servers())
+        add('30')
+        add('20')
+        self.assertEqual(['10', '20', '30'], servers())
+        self.assertEqual(2, mirror.stats()['fetches'])
+
+    def test_new_list_entry(self):
+        self.ips('1/0/1')
+        self.dev._callback(self.yang.interface_tengigabitethernet_description(
+            name='1/0/3', description='new'))
+        self.assertEqual(['new'], self.description('1/0/3'))
+        self.assertEqual(1, len(self.dev._mgr.fetches))
+
+    def test_delete_applied(self):
+        self.ips('1/0/1')
+        config = self.yang.\
+            interface_tengigabitethernet_ip_ip_config_address_address(
+                name='1/0/1', address='10.0.0.1/24')
+        config.find('.//address').set('operation', 'delete')
+        self.dev._callback(config)
+        self.assertEqual(['10.0.1.1/24'], self.ips('1/0/1'))
+
+    def test_ambiguous_edit_refetches(self):
+        vlan = '{urn:brocade.com:mgmt:brocade-interface}interface-vlan'
+        query = ET.Element('config')
+        ET.SubElement(ET.SubElement(query, 'interface-vlan',
+                                    xmlns='urn:brocade.com:mgmt:'
+                                          'brocade-interface'),
+                      'interface')
+        self.dev._callback(query, handler='get_config')
+        config = ET.fromstring(
+            '<config><interface-vlan xmlns="urn:brocade.com:mgmt:'
+            'brocade-interface"><interface><vlan><name>20</name></vlan>'
+            '</interface></interface-vlan></config>')
+        self.dev._callback(config)
+        self.dev._callback(query, handler='get_config')
+        self.assertEqual([vlan, vlan], self.dev._mgr.fetches)
+
+    def test_failed_edit_refetches(self):
+        self.description('1/0/1')
+        self.dev._mgr.broken = True
+        with self.assertRaises(ncclient.operations.RPCError):
+            self.dev._callback(
+                self.yang.interface_tengigabitethernet_description(
+                    name='1/0/1', description='x'))
+        self.assertEqual(['a'], self.description('1/0/1'))
+        self.assertEqual(2, len(self.dev._mgr.fetches))
+
+    def test_commit_resyncs(self):
+        self.description('1/0/1')
+        self.dev._callback(ET.Element('commit'), handler='get')
+        self.description('1/0/1')
+        self.assertEqual(2, len(self.dev._mgr.fetches))
+
+    def test_content_match_only(self):
+        data = lxml.etree.fromstring(RUNNING)
+        subtree = lxml.etree.fromstring(
+            '<interface xmlns="urn:brocade.com:mgmt:brocade-interface">'
+            '<tengigabitethernet><name>1/0/1</name></tengigabitethernet>'
+            '</interface>')
+        mirror = pynos.mirror.ConfigMirror(lambda subtree: data)
+        entries = mirror.query(subtree).data.findall('.//{*}name')
+        self.assertEqual(['1/0/1'], [entry.text for entry in entries])
+        self.assertIsNotNone(mirror.query(subtree).data.find(
+            './/{*}description'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import threading
+import unittest
+import xml.etree.ElementTree as ET
+
+import pynos.device
+import pynos.paging
+
+
+class TestPageCursor(unittest.TestCase):
+    """
+    PageCursor unit tests. Page through a canned VLAN table of 3 pages.
+    """
+    urn = '{urn:brocade.com:mgmt:brocade-interface-ext}'
+    pages = 3
+    per_page = 4
+
+    def setUp(self):
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def vlan_brief_reply(self, call, handler='edit_config'):
+        last = call.find('last-rcvd-vlan-id')
+        page = 0 if last is None else int(last.text) // self.per_page
+        with self.lock:
+            self.requests.append(page)
+        vlans = ''.join('<vlan><vlan-id>{0}</vlan-id></vlan>'.format(
+            page * self.per_page + i + 1) for i in range(self.per_page))
+        reply = ('<output xmlns="{0}">{1}<last-vlan-id>{2}</last-vlan-id>'
+                 '<has-more>{3}</has-more></output>'.format(
+                     self.urn[1:-1], vlans, (page + 1) * self.per_page,
+                     str(page + 1 < self.pages).lower()))
+        return ET.fromstring(reply)
+
+    def next_request(self, reply):
+        if reply.find('%shas-more' % self.urn).text != 'true':
+            return None
+        request = ET.Element('get-vlan-brief', xmlns=self.urn[1:-1])
+        last = ET.SubElement(request, 'last-rcvd-vlan-id')
+        last.text = reply.find('%slast-vlan-id' % self.urn).text
+        return request
+
+    def cursor(self, **kwargs):
+        return pynos.paging.PageCursor(
+            self.vlan_brief_reply,
+            ET.Element('get-vlan-brief', xmlns=self.urn[1:-1]),
+            lambda reply: [vlan.find('%svlan-id' % self.urn).text
+                           for vlan in reply.findall('%svlan' % self.urn)],
+            self.next_request, **kwargs)
+
+    def test_all_pages(self):
+        cursor = self.cursor()
+        self.assertEqual([str(i) for i in range(1, 13)], list(cursor))
+        self.assertEqual(3, cursor.pages)
+        self.assertEqual([0, 1, 2], sorted(self.requests))
+
+    def test_lazy(self):
+        cursor = iter(self.cursor())
+        self.assertEqual([], self.requests)
+        self.assertEqual('1', next(cursor))
+
+    def test_prefetch(self):
+        cursor = iter(self.cursor())
+        next(cursor)
+        # The second page is requested before the first is consumed.
+        for _ in range(100):
+            with self.lock:
+                if len(self.requests) == 2:
+                    break
+            threading.Event().wait(0.01)
+        self.assertEqual([0, 1], sorted(self.requests))
+
+    def test_early_exit_stops_paging(self):
+        for vlan_id in self.cursor(prefetch=False):
+            if vlan_id == '2':
+                break
+        self.assertEqual([0], self.requests)
+
+    def test_first_reply(self):
+        first = self.vlan_brief_reply(ET.Element('get-vlan-brief'))
+        cursor = self.cursor(first_reply=first, prefetch=False)
+        self.assertEqual(12, len(list(cursor)))
+        self.assertEqual([0, 1, 2], self.requests)
+
+
+class TestPagedGetters(unittest.TestCase):
+    """
+    Paged getters of the features stop requesting when abandoned.
+    """
+    def setUp(self):
+        self.requests = 0
+        self.dev = pynos.device.Device(conn=('127.0.0.1', '22'), test=True,
+                                       callback=self.lldp_reply)
+
+    def lldp_reply(self, call, handler='edit_config'):
+        self.requests += 1
+        urn = 'urn:brocade.com:mgmt:brocade-lldp-ext'
+        last = call.find('last-rcvd-ifindex')
+        first = 0 if last is None else int(last.text)
+        neighbors = ''.join(
+            '<lldp-neighbor-detail>'
+            '<local-interface-name>Te 1/0/{0}</local-interface-name>'
+            '<local-interface-ifindex>{0}</local-interface-ifindex>'
+            '<local-interface-mac>0005.33e5.d764</local-interface-mac>'
+            '<remote-interface-name>port{0}</remote-interface-name>'
+            '<remote-interface-mac>8c7c.ff02.f100</remote-interface-mac>'
+            '<remote-chassis-id>8c7c.ff02.f100</remote-chassis-id>'
+            '<remote-system-name>spine</remote-system-name>'
+            '</lldp-neighbor-detail>'.format(first + i + 1)
+            for i in range(2))
+        return ET.fromstring(
+            '<output xmlns="{0}">{1}<has-more>{2}</has-more></output>'.format(
+                urn, neighbors, str(first < 4).lower()))
+
+    def test_neighbors(self):
+        neighbors = self.dev.lldp.neighbors()
+        self.assertEqual(['port%d' % i for i in range(1, 7)],
+                         [row['remote-int-name'] for row in neighbors])
+        self.assertEqual('TenGigabitEthernet 1/0/6',
+                         neighbors[-1]['local-int-name'])
+        self.assertEqual(3, self.requests)
+
+    def test_iter_neighbors(self):
+        first = next(self.dev.lldp.iter_neighbors())
+        self.assertEqual('port1', first['remote-int-name'])
+        # At most the first page and the one fetched ahead.
+        self.assertLessEqual(self.requests, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+import unittest
+
+import pynos.device
+import pynos.pool
+import pynos.utilities
+
+
+class TestSessionPool(unittest.TestCase):
+    """
+    SessionPool unit tests. Devices run in test mode.
+    """
+    def setUp(self):
+        self.pool = pynos.pool.SessionPool(
+            test=True, callback=pynos.utilities.return_xml, max_per_key=2)
+        self.auth = ('admin', 'password')
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_reuse(self):
+        conn = ('10.0.0.1', '22')
+        with self.pool.device(conn=conn, auth=self.auth) as dev:
+            first = dev
+        with self.pool.device(conn=conn, auth=self.auth) as dev:
+            self.assertIs(first, dev)
+        stats = self.pool.stats
+        self.assertEqual((1, 1, 1), (stats['hits'], stats['misses'],
+                                     stats['connects']))
+        self.assertEqual(1, stats['idle'])
+
+    def test_keys(self):
+        with self.pool.device(conn=('10.0.0.1', '22'), auth=self.auth):
+            pass
+        with self.pool.device(conn=('10.0.0.1', '22'), auth=('other', 'x')):
+            pass
+        with self.pool.device(conn=('10.0.0.1', 830), auth=self.auth):
+            pass
+        self.assertEqual(3, self.pool.stats['misses'])
+
+    def test_concurrent_acquire(self):
+        conn = ('10.0.0.1', '22')
+        devs = [self.pool.acquire(conn=conn) for _ in range(3)]
+        self.assertEqual(3, len(set(devs)))
+        self.assertEqual(3, self.pool.stats['in_use'])
+        for dev in devs:
+            self.pool.release(dev)
+        stats = self.pool.stats
+        self.assertEqual((2, 1, 0), (stats['idle'], stats['evictions'],
+                                     stats['in_use']))
+
+    def test_evict_idle(self):
+        pool = pynos.pool.SessionPool(test=True, max_idle=0,
+                                      callback=pynos.utilities.return_xml)
+        with pool.device(conn=('10.0.0.1', '22')):
+            pass
+        self.assertEqual(1, pool.evict_idle())
+        self.assertEqual(0, pool.stats['idle'])
+
+    def test_failed_device_not_reused(self):
+        conn = ('10.0.0.1', '22')
+        with self.assertRaises(pynos.device.DeviceCommError):
+            with self.pool.device(conn=conn) as dev:
+                raise pynos.device.DeviceCommError
+        self.assertEqual(0, self.pool.stats['idle'])
+
+    def test_released_after_other_error(self):
+        conn = ('10.0.0.1', '22')
+        with self.assertRaises(ValueError):
+            with self.pool.device(conn=conn):
+                raise ValueError('in the block')
+        stats = self.pool.stats
+        self.assertEqual((0, 1), (stats['in_use'], stats['idle']))
+
+    def test_keepalive_takes_device_out(self):
+        conn = ('10.0.0.1', '22')
+        with self.pool.device(conn=conn) as dev:
+            probed = dev
+        acquired = []
+
+        def alive(dev, idle_for):
+            acquired.append(self.pool.acquire(conn=conn))
+            return dev is probed
+        self.pool._alive = alive
+        self.pool.keepalive()
+        self.assertIsNot(probed, acquired[0])
+        self.assertEqual(1, self.pool.stats['idle'])
+        self.pool._alive = lambda dev, idle_for: False
+        self.pool.keepalive()
+        stats = self.pool.stats
+        self.assertEqual((0, 1), (stats['idle'], stats['probe_failures']))
+
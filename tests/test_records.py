@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import pickle
+import unittest
+
+import pynos.records
+
+
+class TestRecords(unittest.TestCase):
+    """
+    Record unit tests.
+    """
+    def setUp(self):
+        self.row = {'interface-type': 'tengigabitethernet',
+                    'interface-name': '1/0/1',
+                    'tag': 'true'}
+        self.port = pynos.records.VlanPort.from_dict(self.row)
+
+    def test_dict_access(self):
+        self.assertEqual('1/0/1', self.port['interface-name'])
+        self.assertEqual('1/0/1', self.port.interface_name)
+        self.assertEqual('true', self.port.get('tag'))
+        self.assertIsNone(self.port.get('hodor'))
+        self.assertIn('interface-type', self.port)
+        self.assertEqual(sorted(self.row), sorted(self.port.keys()))
+        self.assertEqual(sorted(self.row.items()), sorted(self.port.items()))
+        for key in ('hodor', 'keys', 'to_dict', '_keys', 1):
+            with self.assertRaises(KeyError):
+                self.port[key]
+        self.assertIsNone(self.port.get('values'))
+
+    def test_equality(self):
+        self.assertEqual(self.port, self.row)
+        self.assertEqual(self.row, self.port.to_dict())
+        other = dict(self.row, tag='false')
+        self.assertNotEqual(self.port, other)
+
+    def test_read_only(self):
+        with self.assertRaises(AttributeError):
+            self.port.tag = 'false'
+        self.assertFalse(hasattr(self.port, '__dict__'))
+
+    def test_interned(self):
+        first = pynos.records.VlanPort(''.join(['tengigabit', 'ethernet']),
+                                       '1/0/1', 'true')
+        second = pynos.records.VlanPort(''.join(['tengiga', 'bitethernet']),
+                                        '1/0/2', 'true')
+        self.assertIs(first.interface_type, second.interface_type)
+
+    def test_nested_to_dict(self):
+        vlan = pynos.records.Vlan(interface=[self.port], **{'vlan-id': '10'})
+        self.assertEqual([self.row], vlan.to_dict()['interface'])
+
+    def test_pickle(self):
+        self.assertEqual(self.port, pickle.loads(pickle.dumps(self.port)))
+
+    def test_unknown_field(self):
+        with self.assertRaises(TypeError):
+            pynos.records.VlanPort(hodor='1')
+
+    def test_build(self):
+        self.assertIs(self.row, pynos.records.build(pynos.records.VlanPort,
+                                                    self.row, False))
+        self.assertIsInstance(pynos.records.build(pynos.records.VlanPort,
+                                                  self.row),
+                              pynos.records.VlanPort)
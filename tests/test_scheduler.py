@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import threading
+import time
+import unittest
+import xml.etree.ElementTree as ET
+
+import ncclient.operations
+
+import pynos.device
+import pynos.scheduler
+
+UPTIME = ('<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">'
+          '<show-system-uptime xmlns="urn:brocade.com:mgmt:brocade-system">'
+          '<days>1</days><hours>2</hours><minutes>3</minutes>'
+          '<seconds>4</seconds></show-system-uptime></rpc-reply>')
+
+
+class Clock(object):
+    """Clock moved by hand."""
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeReply(object):
+    xml = UPTIME
+
+
+class FakeRPC(object):
+    """Pipelined RPC stand-in whose reply has arrived."""
+    reply = FakeReply()
+
+
+class TestScheduler(unittest.TestCase):
+    """
+    Scheduler unit tests. Round trips are timed on a clock moved by hand.
+    """
+    def setUp(self):
+        self.clock = Clock()
+        self.scheduler = pynos.scheduler.Scheduler(
+            initial_limit=2, max_limit=4, slack=0, clock=self.clock)
+
+    def round_trip(self, seconds, error=None):
+        ticket = self.scheduler.acquire('get')
+        self.clock.now += seconds
+        ticket.release(error)
+
+    def test_limit(self):
+        first = self.scheduler.acquire()
+        second = self.scheduler.acquire()
+        self.assertIsNone(self.scheduler.acquire(blocking=False))
+        second.release()
+        second.release()
+        self.assertEqual(1, self.scheduler.stats()['in_flight'])
+        third = self.scheduler.acquire(blocking=False)
+        self.assertIsNotNone(third)
+        first.cancel()
+        third.cancel()
+        stats = self.scheduler.stats()
+        self.assertEqual((0, 1), (stats['in_flight'], stats['completed']))
+
+    def test_additive_increase(self):
+        for _ in range(4):
+            tickets = [self.scheduler.acquire('get')
+                       for _ in range(int(self.scheduler.limit))]
+            self.clock.now += 0.1
+            for ticket in tickets:
+                ticket.release()
+        self.assertEqual(4, self.scheduler.limit)
+        # Spare slots do not raise the limit further.
+        self.scheduler.max_limit = 8
+        self.round_trip(0.1)
+        self.assertEqual(4, self.scheduler.limit)
+
+    def test_cut_once_per_round_trip(self):
+        self.scheduler.limit = 4.0
+        self.round_trip(0.1)
+        tickets = [self.scheduler.acquire('get') for _ in range(4)]
+        self.clock.now += 0.5
+        for ticket in tickets:
+            ticket.release()
+        self.assertAlmostEqual(2.8, self.scheduler.limit)
+        self.round_trip(0.5)
+        self.assertAlmostEqual(1.96, self.scheduler.limit)
+        self.assertEqual(2, self.scheduler.stats()['cuts'])
+        for _ in range(5):
+            self.round_trip(0.5)
+        self.assertEqual(1, self.scheduler.limit)
+
+    def test_baseline_per_kind(self):
+        self.round_trip(0.1)
+        ticket = self.scheduler.acquire('get_config')
+        self.clock.now += 1.0
+        ticket.release()
+        self.assertEqual(0, self.scheduler.stats()['cuts'])
+
+    def test_baseline_ages_out(self):
+        self.round_trip(0.1)
+        self.clock.now += 61
+        self.round_trip(0.3)
+        self.clock.now += 61
+        self.round_trip(0.3)
+        self.assertEqual(1, self.scheduler.stats()['cuts'])
+        self.round_trip(0.3)
+        self.assertEqual(1, self.scheduler.stats()['cuts'])
+
+    def test_timeout_cuts(self):
+        self.round_trip(0.1, ncclient.operations.TimeoutExpiredError('t'))
+        self.assertAlmostEqual(1.4, self.scheduler.limit)
+        self.round_trip(0.1, ncclient.operations.RPCError(
+            ET.fromstring('<rpc-error><error-message>x</error-message>'
+                          '</rpc-error>')))
+        stats = self.scheduler.stats()
+        self.assertEqual((1, 1, 1), (stats['timeouts'], stats['cuts'],
+                                     stats['completed']))
+
+    def test_fair_queue(self):
+        scheduler = pynos.scheduler.Scheduler(initial_limit=1,
+                                              max_limit=1)
+        held = scheduler.acquire()
+        served = []
+
+        def wait(caller):
+            with scheduler.acquire(caller=caller):
+                served.append(caller)
+        threads = []
+        for caller in ('a', 'a', 'a', 'b'):
+            threads.append(threading.Thread(target=wait, args=(caller,)))
+            threads[-1].start()
+            while scheduler.stats()['queued'] < len(threads):
+                time.sleep(0.001)
+        held.release()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(['a', 'b', 'a', 'a'], served)
+
+    def test_queue_timeout(self):
+        scheduler = pynos.scheduler.Scheduler(initial_limit=1,
+                                              queue_timeout=0.01)
+        scheduler.acquire()
+        with self.assertRaises(pynos.scheduler.SchedulerTimeout):
+            scheduler.acquire()
+        self.assertEqual(0, scheduler.stats()['queued'])
+
+
+class TestDeviceScheduler(unittest.TestCase):
+    """
+    Device unit tests with a scheduler.
+    """
+    def setUp(self):
+        self.scheduler = pynos.scheduler.Scheduler(initial_limit=2,
+                                                   max_limit=2)
+        self.dev = pynos.device.Device(conn=('127.0.0.1', '22'), test=True,
+                                       scheduler=self.scheduler)
+        self.dev._dispatch_raw = lambda call: UPTIME
+
+    def test_switch_scheduler_shared(self):
+        dev = pynos.device.Device(conn=('127.0.0.9', '22'), test=True,
+                                  scheduler=True)
+        other = pynos.device.Device(conn=('127.0.0.9', '22'), test=True,
+                                    scheduler=True)
+        self.assertIs(dev.scheduler, other.scheduler)
+        self.assertIs(dev.scheduler,
+                      pynos.scheduler.switch_scheduler('127.0.0.9', '22'))
+
+    def test_call_holds_slot(self):
+        def dispatch(call):
+            self.assertEqual(1, self.scheduler.stats()['in_flight'])
+            return UPTIME
+        self.dev._dispatch_raw = dispatch
+        self.dev.system.uptime
+        stats = self.scheduler.stats()
+        self.assertEqual((0, 1), (stats['in_flight'], stats['completed']))
+
+    def test_execute_many_window(self):
+        in_flight = []
+
+        def send(call, handler, target):
+            in_flight.append(self.scheduler.stats()['in_flight'])
+            return FakeRPC()
+        self.dev._send_async = send
+        self.dev._reply = lambda rpc, handler: rpc.reply.xml
+        self.dev._callback = self.dev._callback_main
+        calls = [(ET.Element('get-system-uptime',
+                             xmlns='urn:brocade.com:mgmt:brocade-system'),
+                  'get') for _ in range(5)]
+        self.assertEqual([UPTIME] * 5, self.dev.execute_many(calls))
+        self.assertEqual(2, max(in_flight))
+        stats = self.scheduler.stats()
+        self.assertEqual((0, 5), (stats['in_flight'], stats['completed']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import time
+import unittest
+import xml.etree.ElementTree as ET
+
+import ncclient.operations
+
+import pynos.device
+import pynos.simulator
+
+
+class TestSimulator(unittest.TestCase):
+    """
+    Simulator unit tests. Drive a Device over SSH against the simulator.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.sim = pynos.simulator.Simulator(interfaces=250, vlans=120,
+                                            macs=300, page_size=50,
+                                            latencies={'show-vcs': 0.2})
+        cls.sim.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.sim.stop()
+
+    def setUp(self):
+        self.sim.calls.clear()
+        self.dev = pynos.device.Device(conn=self.sim.conn, auth=self.sim.auth)
+
+    def tearDown(self):
+        self.dev.close()
+
+    def test_session(self):
+        self.assertEqual('6.0.1', self.dev._version)
+        self.assertTrue(self.dev.connection)
+        self.assertEqual(1, self.sim.calls['show-firmware-version'])
+
+    def test_paging(self):
+        detail = self.dev.interface.interface_detail
+        self.assertEqual(250, len(detail))
+        self.assertEqual('6/0/10', detail[-1]['interface-name'])
+        self.assertEqual(5, self.sim.calls['get-interface-detail'])
+        self.assertEqual(120, len(self.dev.interface.vlans))
+        self.assertEqual(3, self.sim.calls['get-vlan-brief'])
+        self.assertEqual(250, len(self.dev.lldp.neighbors()))
+        self.assertEqual(16, len(self.dev.interface.port_channels))
+
+    def test_tables(self):
+        self.assertEqual(300, len(self.dev.mac_table))
+        self.assertEqual(1000, len(self.dev.services.arp))
+        self.assertEqual(6, len(self.dev.vcs.vcs_nodes))
+
+    def test_edit_config(self):
+        self.dev.interface.description(int_type='tengigabitethernet',
+                                       name='2/0/3', desc='uplink')
+        reply = self.dev._mgr.get_config(
+            source='running', filter=('subtree', (
+                '<interface xmlns="urn:brocade.com:mgmt:brocade-interface">'
+                '<tengigabitethernet><name>2/0/3</name></tengigabitethernet>'
+                '</interface>')))
+        self.assertEqual(['uplink'], [
+            node.text for node in reply.data_ele.iter('{*}description')])
+
+    def test_latency(self):
+        start = time.time()
+        self.dev.vcs.vcs_nodes
+        self.assertGreaterEqual(time.time() - start, 0.2)
+
+    def test_reply_without_session(self):
+        reply = pynos.device.Device._reply_tree(self.sim.reply(
+            ET.Element('show-firmware-version',
+                       xmlns='urn:brocade.com:mgmt:brocade-firmware-ext')))
+        self.assertEqual('6.0.1', reply.findtext('.//{*}os-version'))
+
+    def test_unsupported(self):
+        with self.assertRaises(ncclient.operations.RPCError):
+            self.dev._callback(ET.Element('get-no-such-table'),
+                               handler='get')
+
+
+if __name__ == '__main__':
+    unittest.main()
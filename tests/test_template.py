@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import unittest
+import xml.etree.ElementTree as ET
+
+import pynos.device
+import pynos.template
+import pynos.utilities
+from pynos.versions.base.yang.brocade_interface import brocade_interface
+
+
+class LowerCaseBuilder(object):
+    """Builder that does not copy its value unchanged."""
+    def description(self, **kwargs):
+        config = ET.Element('config')
+        ET.SubElement(config, 'description').text = kwargs.pop(
+            'description').lower()
+        return kwargs.pop('callback')(config)
+
+
+class TestTemplate(unittest.TestCase):
+    """
+    Template unit tests. Compare rendered templates to the YANG builders.
+    """
+    def setUp(self):
+        self.yang = brocade_interface(callback=pynos.utilities.return_xml)
+        self.template = pynos.template.compile_builder(
+            self.yang.interface_tengigabitethernet_description,
+            'name', 'description')
+
+    def test_render_matches_builder(self):
+        expected = ET.tostring(
+            self.yang.interface_tengigabitethernet_description(
+                name='1/0/1', description='server 1'))
+        result = self.template.render(name='1/0/1', description='server 1')
+        self.assertEqual(expected, result)
+        self.assertEqual(('description', 'name'), self.template.slots)
+
+    def test_escaping(self):
+        description = 'R&D <lab> "rack 2"'
+        result = ET.fromstring(self.template.render(name='1/0/1',
+                                                    description=description))
+        self.assertEqual(description, result.find(
+            './/{urn:brocade.com:mgmt:brocade-interface}description').text)
+
+    def test_compiled_once(self):
+        other = brocade_interface(callback=pynos.utilities.return_xml)
+        self.assertIs(self.template, pynos.template.compile_builder(
+            other.interface_tengigabitethernet_description,
+            'name', 'description'))
+
+    def test_missing_slot(self):
+        with self.assertRaises(KeyError):
+            self.template.render(name='1/0/1')
+
+    def test_changed_value(self):
+        with self.assertRaises(ValueError):
+            pynos.template.compile_builder(LowerCaseBuilder().description,
+                                           'description')
+
+    def test_transaction_captures_rendered(self):
+        dev = pynos.device.Device(conn=('127.0.0.1', '22'), test=True,
+                                  callback=pynos.utilities.return_xml)
+        with dev.transaction() as tx:
+            dev.execute_many([self.template.render(name='1/0/%d' % port,
+                                                   description='server')
+                              for port in range(1, 5)])
+        self.assertEqual(4, len(tx.operations))
+        self.assertEqual(1, tx.rpcs)
+
+
+if __name__ == '__main__':
+    unittest.main()
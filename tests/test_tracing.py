@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import pynos.device
+import pynos.tracing
+from pynos.versions.base.interface import Interface
+
+UPTIME = ('<rpc-reply xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">'
+          '<show-system-uptime xmlns="urn:brocade.com:mgmt:brocade-system">'
+          '<days>1</days><hours>2</hours><minutes>3</minutes>'
+          '<seconds>4</seconds></show-system-uptime></rpc-reply>')
+
+
+class EditManager(object):
+    """ncclient manager stand-in that accepts edits."""
+    def edit_config(self, target, config):
+        pass
+
+
+class Feature(object):
+    """Feature class stand-in."""
+    def rows(self):
+        for row in range(2):
+            yield row
+
+    def fail(self):
+        raise ValueError('invalid')
+
+
+class TestTracing(unittest.TestCase):
+    """
+    Tracing unit tests. Trace the calls of a device whose RPCs are answered
+    locally.
+    """
+    def setUp(self):
+        self.spans = []
+        self.tracer = pynos.tracing.Tracer([self.spans.append])
+        self.dev = pynos.device.Device(conn=('127.0.0.1', '22'), test=True,
+                                       tracer=self.tracer)
+        self.dev._mgr = EditManager()
+        self.dev._dispatch_raw = lambda call: UPTIME
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def paths(self):
+        return [';'.join(span.path) for span in self.spans]
+
+    def test_disabled(self):
+        dev = pynos.device.Device(conn=('127.0.0.1', '22'), test=True)
+        self.assertNotIsInstance(dev.interface, pynos.tracing.TracedFeature)
+        self.assertIsNone(pynos.tracing.current())
+        with pynos.tracing.span('parse') as span:
+            self.assertIsNone(span)
+
+    def test_edit_spans(self):
+        interface = pynos.tracing.TracedFeature(Interface(self.dev._call),
+                                                self.tracer)
+        interface.description(int_type='tengigabitethernet',
+                              name='1/0/1', desc='uplink')
+        self.assertEqual(
+            ['Interface.description;build',
+             'Interface.description;rpc interface;serialize',
+             'Interface.description;rpc interface;transport',
+             'Interface.description;rpc interface',
+             'Interface.description'], self.paths())
+        self.assertEqual('interface_tengigabitethernet_description',
+                         self.spans[0].attributes['builder'])
+        method = self.spans[-1]
+        self.assertAlmostEqual(method.seconds, method.self_seconds +
+                               method.child_seconds)
+        self.assertIsNone(pynos.tracing.current())
+
+    def test_get_spans(self):
+        self.dev.system.uptime
+        self.assertEqual(
+            ['System.uptime;rpc get-system-uptime;serialize',
+             'System.uptime;rpc get-system-uptime;transport',
+             'System.uptime;rpc get-system-uptime;parse',
+             'System.uptime;rpc get-system-uptime',
+             'System.uptime'], self.paths())
+        self.assertEqual('get', self.spans[3].attributes['handler'])
+
+    def test_error_and_generator(self):
+        feature = pynos.tracing.TracedFeature(Feature(), self.tracer)
+        self.assertEqual([0, 1], list(feature.rows()))
+        self.assertEqual(['Feature.rows'] * 4, self.paths())
+        with self.assertRaises(ValueError):
+            feature.fail()
+        self.assertEqual('ValueError', self.spans[-1].attributes['error'])
+
+    def test_folded_exporter(self):
+        path = os.path.join(self.tmpdir, 'pynos.folded')
+        exporter = pynos.tracing.FileExporter(path)
+        self.tracer.add_exporter(exporter)
+        self.dev.system.uptime
+        self.tracer.close()
+        with open(path) as trace:
+            lines = trace.read().splitlines()
+        self.assertEqual(self.paths(),
+                         [line.rsplit(' ', 1)[0] for line in lines])
+        for line in lines:
+            self.assertGreaterEqual(int(line.rsplit(' ', 1)[1]), 0)
+
+    def test_chrome_exporter(self):
+        path = os.path.join(self.tmpdir, 'pynos.json')
+        exporter = pynos.tracing.FileExporter(path, format='chrome')
+        self.tracer.add_exporter(exporter)
+        self.dev.system.uptime
+        self.dev.system.uptime
+        self.tracer.close()
+        with open(path) as trace:
+            events = json.load(trace)
+        self.assertEqual(10, len(events))
+        self.assertEqual('System.uptime', events[-1]['name'])
+        self.assertEqual('X', events[-1]['ph'])
+        self.assertLessEqual(events[-1]['ts'], events[-2]['ts'])
+        with self.assertRaises(ValueError):
+            pynos.tracing.FileExporter(path, format='svg')
+
+
+if __name__ == '__main__':
+    unittest.main()
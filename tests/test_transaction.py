@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import unittest
+import xml.etree.ElementTree as ET
+
+from ncclient import xml_
+import ncclient.operations
+
+import pynos.device
+from pynos.exceptions import PynosException
+import pynos.transaction
+import pynos.utilities
+from pynos.versions.base.yang.brocade_interface import brocade_interface
+
+
+class Feature(object):
+    """Feature class stand-in whose builders send their calls."""
+    def __init__(self, callback):
+        self._interface = brocade_interface(callback=callback)
+
+    def describe(self, name):
+        self._interface.interface_tengigabitethernet_description(
+            name=name, description='uplink')
+
+
+class TestTransaction(unittest.TestCase):
+    """
+    Transaction unit tests. Capture the edit-configs sent by the device.
+    """
+    def setUp(self):
+        self.sent = []
+        self.rpcs = []
+        self.reject = None
+        self.dev = pynos.device.Device(conn=('127.0.0.1', '22'), test=True,
+                                       callback=self.callback)
+        self.dev._features = pynos.device.VERSIONS['6.0.1']
+
+    def callback(self, call, handler='edit_config', **kwargs):
+        text = ET.tostring(call).decode('utf-8')
+        if handler == 'get':
+            self.rpcs.append(call.tag)
+            if call.tag == self.reject:
+                raise self.rpc_error()
+            return ET.Element('ok')
+        self.rpcs.append('edit-config:%s' % kwargs.get('target', 'running'))
+        if self.reject is not None and self.reject in text:
+            raise self.rpc_error()
+        self.sent.append(text)
+
+    @staticmethod
+    def rpc_error():
+        return ncclient.operations.RPCError(xml_.to_ele(
+            '<rpc-error xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">'
+            '<error-type>application</error-type>'
+            '<error-tag>invalid-value</error-tag>'
+            '<error-severity>error</error-severity>'
+            '<error-message>rejected</error-message></rpc-error>'))
+
+    def configure_ports(self, ports):
+        for port in ports:
+            name = '1/0/%d' % port
+            self.dev.interface.description(int_type='tengigabitethernet',
+                                           name=name, desc='port %d' % port)
+            self.dev.interface.mtu(int_type='tengigabitethernet',
+                                   name=name, mtu='9216')
+
+    def test_one_rpc(self):
+        with self.dev.transaction() as tx:
+            self.configure_ports(range(1, 49))
+            self.assertEqual([], self.sent)
+        self.assertEqual(1, tx.rpcs)
+        self.assertEqual(96, len(tx.operations))
+        self.assertEqual('Interface.description', tx.operations[0].name)
+        config = ET.fromstring(self.sent[0])
+        self.assertEqual(48, len(config[0]))
+
+    def test_conflicting_changes_split(self):
+        with self.dev.transaction() as tx:
+            self.dev.interface.mtu(int_type='tengigabitethernet',
+                                   name='1/0/1', mtu='1600')
+            self.dev.interface.mtu(int_type='tengigabitethernet',
+                                   name='1/0/1', mtu='9216')
+        self.assertEqual(2, tx.rpcs)
+        self.assertIn('1600', self.sent[0])
+        self.assertIn('9216', self.sent[1])
+
+    def test_error_mapped_to_operation(self):
+        self.reject = 'port 2<'
+        with self.assertRaises(pynos.transaction.TransactionError) as ctx:
+            with self.dev.transaction():
+                self.configure_ports(range(1, 4))
+        failed = ctx.exception.failed
+        self.assertEqual([2], [op.index for op in failed])
+        self.assertEqual('Interface.description', failed[0].name)
+        # The rejected batch and then each operation alone.
+        self.assertEqual(5, len(self.sent))
+
+    def test_discard_on_exception(self):
+        with self.assertRaises(ValueError):
+            with self.dev.transaction():
+                self.configure_ports([1])
+                raise ValueError
+        self.assertEqual([], self.sent)
+        self.configure_ports([1])
+        self.assertEqual(2, len(self.sent))
+
+    def test_candidate(self):
+        with self.dev.transaction(target='candidate',
+                                  confirm_timeout=60) as tx:
+            self.configure_ports(range(1, 3))
+        self.assertEqual(['lock', 'discard-changes', 'edit-config:candidate',
+                          'validate', 'commit', 'unlock'],
+                         self.rpcs)
+        self.assertTrue(tx.pending_confirm)
+        tx.confirm()
+        self.assertFalse(tx.pending_confirm)
+        self.assertEqual('commit', self.rpcs[-1])
+
+    def test_candidate_all_or_nothing(self):
+        self.reject = 'validate'
+        with self.assertRaises(ncclient.operations.RPCError):
+            with self.dev.transaction(target='candidate'):
+                self.configure_ports(range(1, 3))
+        self.assertEqual(['lock', 'discard-changes', 'edit-config:candidate',
+                          'validate', 'discard-changes', 'unlock'],
+                         self.rpcs)
+
+    def test_confirm_needs_candidate(self):
+        with self.assertRaises(ValueError):
+            self.dev.transaction(confirm_timeout=60)
+
+    def test_operation_name(self):
+        feature = Feature(self.dev._call)
+        with self.dev.transaction() as tx:
+            feature.describe('1/0/1')
+            self.dev.interface.mtu(int_type='tengigabitethernet',
+                                   name='1/0/1', mtu='9216')
+        self.assertEqual(['Feature.describe', 'Interface.mtu'],
+                         [op.name for op in tx.operations])
+
+    def test_nested(self):
+        with self.dev.transaction():
+            with self.assertRaises(PynosException):
+                with self.dev.transaction():
+                    pass
+
+
+class TestMergeConfig(unittest.TestCase):
+    """
+    merge_config unit tests.
+    """
+    def test_leaf_conflict(self):
+        first = ET.fromstring('<config><vlan><name>10</name><mtu>1500</mtu>'
+                              '</vlan></config>')
+        second = ET.fromstring('<config><vlan><name>10</name><mtu>9216</mtu>'
+                               '</vlan></config>')
+        before = ET.tostring(first)
+        self.assertFalse(pynos.utilities.merge_config(first, second))
+        self.assertEqual(before, ET.tostring(first))
+
+    def test_list_entries(self):
+        first = ET.fromstring('<config><vlan><name>10</name></vlan>'
+                              '</config>')
+        second = ET.fromstring('<config><vlan><name>11</name></vlan>'
+                               '</config>')
+        self.assertTrue(pynos.utilities.merge_config(first, second))
+        self.assertEqual(2, len(first))
+
+    def test_operation_conflict(self):
+        first = ET.fromstring('<config><vlan><name>10</name></vlan>'
+                              '</config>')
+        second = ET.fromstring('<config><vlan operation="delete"><name>10'
+                               '</name></vlan></config>')
+        self.assertFalse(pynos.utilities.merge_config(first, second))
+
+    def test_container_merge(self):
+        first = ET.fromstring('<config><system><mtu>1500</mtu></system>'
+                              '</config>')
+        second = ET.fromstring('<config><system><host>a</host></system>'
+                               '</config>')
+        self.assertTrue(pynos.utilities.merge_config(first, second))
+        self.assertEqual(b'<config><system><mtu>1500</mtu><host>a</host>'
+                         b'</system></config>', ET.tostring(first))
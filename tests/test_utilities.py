@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+
+import unittest
+import xml.etree.ElementTree as ET
+
+import lxml.etree
+
+import pynos.utilities
+from pynos.exceptions import PynosException
+
+
+class TestUtilities(unittest.TestCase):
+    """
+    Utilities unit tests.
+    """
+    def setUp(self):
+        self.reply = ('<?xml version="1.0" encoding="UTF-8"?>'
+                      '<rpc-reply xmlns="urn:x">{0}<has-more>false'
+                      '</has-more></rpc-reply>'.format(
+                          ''.join('<entry><id>{0}</id></entry>'.format(i)
+                                  for i in range(5000))))
+
+    def test_iter_elements_text(self):
+        ids = [e.find('{urn:x}id').text for e in
+               pynos.utilities.iter_elements(self.reply, '{urn:x}entry')]
+        self.assertEqual([str(i) for i in range(5000)], ids)
+
+    def test_iter_elements_parsed(self):
+        reply = ET.fromstring(self.reply)
+        ids = [e.find('{urn:x}id').text for e in
+               pynos.utilities.iter_elements(reply, '{urn:x}entry')]
+        self.assertEqual([str(i) for i in range(5000)], ids)
+
+    def test_iter_elements_releases_entries(self):
+        previous = None
+        for entry in pynos.utilities.iter_elements(self.reply,
+                                                   '{urn:x}entry'):
+            if previous is not None:
+                self.assertEqual(0, len(previous))
+            previous = entry
+
+    def test_iter_elements_rpc_error(self):
+        reply = ('<rpc-reply><rpc-error><error-message>bad</error-message>'
+                 '</rpc-error></rpc-reply>')
+        with self.assertRaises(PynosException):
+            list(pynos.utilities.iter_elements(reply, 'entry'))
+
+    def test_merge_xml_lxml(self):
+        first = lxml.etree.fromstring('<config><a><b>1</b></a></config>')
+        second = lxml.etree.fromstring('<config><a><c>2</c></a><d/></config>')
+        merged = pynos.utilities.merge_xml(first, second)
+        self.assertIs(first, merged)
+        self.assertEqual(b'<config><a><b>1</b><c>2</c></a><d/></config>',
+                         lxml.etree.tostring(merged))
+
+    def test_merge_xml_mixed(self):
+        first = ET.fromstring('<config><a><b>1</b></a></config>')
+        second = lxml.etree.fromstring('<config><a><b>3</b></a></config>')
+        merged = pynos.utilities.merge_xml(first, second)
+        self.assertEqual(b'<config><a><b>3</b></a></config>',
+                         lxml.etree.tostring(merged))
+
+    def test_edit_entry(self):
+        config = lxml.etree.fromstring(
+            '<vlans><vlan><name>10</name><tag>a</tag></vlan>'
+            '<vlan><name>20</name></vlan></vlans>')
+        vlans = config.findall('vlan')
+        edit = lxml.etree.fromstring(
+            '<vlan operation="delete"><name>20</name></vlan>')
+        self.assertEqual((vlans[1], True),
+                         pynos.utilities.edit_entry(vlans, edit))
+        self.assertEqual('delete', pynos.utilities.edit_operation(edit))
+        self.assertEqual(b'<vlan><name>20</name></vlan>', lxml.etree.tostring(
+            pynos.utilities.strip_operations(edit)))
+        edit = lxml.etree.fromstring('<vlan><name>30</name></vlan>')
+        self.assertEqual((None, True),
+                         pynos.utilities.edit_entry(vlans, edit))
+        tags = vlans[0].findall('tag')
+        edit = lxml.etree.fromstring('<tag>b</tag>')
+        self.assertEqual((None, False),
+                         pynos.utilities.edit_entry(tags, edit))
@@ -1520,6 +1520,29 @@ class TestInterface(unittest.TestCase):
         self.assertDictEqual(expected_2, results[1])
         self.count = 0
 
+    def test_switchport_list(self):
+        urn = 'urn:brocade.com:mgmt:brocade-interface-ext'
+        reply = ET.fromstring(
+            '<rpc-reply xmlns="{0}"><switchport xmlns="{1}">'
+            '<interface-name>1/0/5</interface-name>'
+            '<interface-type>tengigabitethernet</interface-type>'
+            '<mode>trunk</mode>'
+            '<active-vlans><vlanid>10</vlanid><vlanid>20</vlanid>'
+            '</active-vlans></switchport></rpc-reply>'.format(self.netconf_namespace, urn))
+        requests = []
+
+        def switchport_side_effect(call, handler='edit_config'):
+            requests.append((call.tag, call.get('xmlns'), handler))
+            return reply
+        self.interface._callback = switchport_side_effect
+        expected = [{'vlan-id': ['10', '20'],
+                     'mode': 'trunk',
+                     'interface-name': '1/0/5',
+                     'interface_type': 'tengigabitethernet'}]
+        self.assertEqual(expected, self.interface.switchport_list)
+        self.assertEqual([('get-interface-switchport', urn, 'get')],
+                         requests)
+
     def vlan_side_effect(self, call, handler='edit_config', target='running',
                          source='startup'):
         vlan_xml = self.vlan_xml()[self.count]
@@ -1642,3 +1665,50 @@ class TestInterface(unittest.TestCase):
         port_channel_xml = self.port_channel_xml()[self.count]
         self.count += 1
         return port_channel_xml
+
+    def interfaces_side_effect(self, call, handler='edit_config',
+                               target='running', source='startup'):
+        namespace = 'urn:brocade.com:mgmt:brocade-interface-ext'
+        if call.tag == 'get-ip-interface':
+            reply = ('<interface><interface-type>tengigabitethernet'
+                     '</interface-type><interface-name>1/0/2'
+                     '</interface-name><if-state>up</if-state>'
+                     '<line-protocol-state>up</line-protocol-state>'
+                     '<ip-address><ipv4>10.0.0.1/24</ipv4></ip-address>'
+                     '</interface><interface><interface-type>loopback'
+                     '</interface-type><interface-name>1</interface-name>'
+                     '<if-state>up</if-state><line-protocol-state>up'
+                     '</line-protocol-state><ip-address><ipv4>1.1.1.1/32'
+                     '</ipv4></ip-address></interface>')
+        else:
+            reply = ''.join(
+                '<interface><interface-type>tengigabitethernet'
+                '</interface-type><interface-name>1/0/{0}</interface-name>'
+                '<port-role>Edge</port-role><if-name>TenGigabitEthernet '
+                '1/0/{0}</if-name><if-state>down</if-state>'
+                '<line-protocol-state>down</line-protocol-state>'
+                '<current-hardware-address>0005.33e5.d76{0}'
+                '</current-hardware-address></interface>'.format(i)
+                for i in range(1, 4)) + '<has-more>false</has-more>'
+        return ET.fromstring('<output xmlns="{0}">{1}</output>'.format(
+            namespace, reply))
+
+    def test_interfaces(self):
+        expected = [{'interface-type': 'tengigabitethernet',
+                     'interface-name': '1/0/2',
+                     'interface-role': 'Edge',
+                     'if-name': 'TenGigabitEthernet 1/0/2',
+                     'interface-state': 'down',
+                     'interface-proto-state': 'down',
+                     'interface-mac': '0005.33e5.d762',
+                     'ip-address': '10.0.0.1/24'},
+                    {'interface-type': 'loopback',
+                     'interface-name': '1',
+                     'interface-role': None,
+                     'if-name': None,
+                     'interface-state': 'up',
+                     'interface-proto-state': 'up',
+                     'interface-mac': None,
+                     'ip-address': '1.1.1.1/32'}]
+        self.interface._callback = self.interfaces_side_effect
+        self.assertEqual(expected, self.interface.interfaces)
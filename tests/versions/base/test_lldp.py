@@ -18,6 +18,7 @@ limitations under the License.
 
 import unittest
 import xml.etree.ElementTree as ET
+import pynos.records
 import pynos.versions.base.lldp
 import pynos.utilities
 
@@ -69,6 +70,15 @@ class TestLLDP(unittest.TestCase):
         self.assertIsInstance(results, list)
         self.assertDictEqual(expected, results[0])
 
+    def test_neighbors_records(self):
+        self.lldp._callback = self.lldp_neighbors_xml
+        expected = self.lldp.neighbors()
+        self.lldp._records = True
+        results = self.lldp.neighbors()
+        self.assertIsInstance(results[0], pynos.records.LLDPNeighbor)
+        self.assertEqual('port0', results[0]['remote-int-name'])
+        self.assertEqual(expected, results)
+
     def test_get_lldp_neighbors_request(self):
         expected = ('<get-lldp-neighbor-detail xmlns="{0}"><last-rcvd-ifindex>'
                     '1</last-rcvd-ifindex></get-lldp-neighbor-detail>'
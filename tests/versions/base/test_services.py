@@ -80,3 +80,35 @@ class TestServices(unittest.TestCase):
                                     enabled=False)
         result = ET.tostring(result)
         self.assertEquals(expected, result)
+
+    def arp_reply(self, call, handler='edit_config'):
+        xmlns = 'urn:brocade.com:mgmt:brocade-arp'
+        entry = ('<arp-entry><ip-address>10.0.0.{0}</ip-address>'
+                 '<mac-address>0005.33e5.d7{0:02}</mac-address>'
+                 '<interface-type>Ve</interface-type>'
+                 '<interface-name>10</interface-name>'
+                 '<is-resolved>true</is-resolved><age>00:01:00</age>'
+                 '<entry-type>dynamic</entry-type></arp-entry>')
+        reply = '<rpc-reply xmlns="{0}">{1}</rpc-reply>'.format(
+            xmlns, ''.join(entry.format(i) for i in range(3)))
+        if handler == 'get_stream':
+            return reply
+        return ET.fromstring(reply)
+
+    def test_arp(self):
+        expected = {'ip-address': '10.0.0.1',
+                    'mac-address': '0005.33e5.d701',
+                    'interface-type': 'Ve',
+                    'interface-name': '10',
+                    'is-resolved': 'true',
+                    'age': '00:01:00',
+                    'entry-type': 'dynamic'}
+        self.services._callback = self.arp_reply
+        results = self.services.arp
+        self.assertEqual(3, len(results))
+        self.assertDictEqual(expected, results[1])
+
+    def test_iter_arp(self):
+        self.services._callback = self.arp_reply
+        expected = self.services.arp
+        self.assertEqual(expected, list(self.services.iter_arp()))
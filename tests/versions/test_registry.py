@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+import unittest
+import xml.etree.ElementTree as ET
+
+import pynos.utilities
+import pynos.versions.registry
+from pynos.versions.base.yang.brocade_interface import brocade_interface
+from pynos.versions.base.yang.brocade_interface_ext import \
+    brocade_interface_ext
+from pynos.versions.ver_7.ver_7_0_0.yang.brocade_interface import \
+    brocade_interface as brocade_interface_7_0_0
+
+
+class TestRegistry(unittest.TestCase):
+    """
+    Registry unit tests. Resolve builders of several releases.
+    """
+    removed = 'interface_tengigabitethernet_ip_interface_te_ospf_conf_' \
+              'ospf1_priority'
+
+    def test_builder_class(self):
+        cls = pynos.versions.registry.builder_class('brocade_interface',
+                                                    '7.0.1')
+        self.assertIs(brocade_interface_7_0_0, cls)
+        cls = pynos.versions.registry.builder_class('brocade_interface',
+                                                    '6.0.2')
+        self.assertEqual('pynos.versions.ver_6.ver_6_0_1.yang.'
+                         'brocade_interface', cls.__module__)
+
+    def test_unknown_firmware(self):
+        with self.assertRaises(ValueError):
+            pynos.versions.registry.builder_class('brocade_interface',
+                                                  '4.1.0')
+
+    def test_releases_share_builders(self):
+        cls = pynos.versions.registry.builder_class('brocade_interface',
+                                                    '7.1.0')
+        self.assertTrue(issubclass(cls, brocade_interface_7_0_0))
+        self.assertTrue(issubclass(cls, brocade_interface))
+        name = 'interface_tengigabitethernet_description'
+        self.assertIn(name, pynos.versions.registry.builder_names(cls))
+        self.assertIn(name, brocade_interface._table.builders)
+        self.assertNotIn(name, cls._table.builders)
+
+    def test_inherited_builder(self):
+        expected = ET.tostring(pynos.versions.registry.builders(
+            'brocade_interface', '5.0.1').interface_tengigabitethernet_mtu(
+                name='1/0/1', mtu='9216'))
+        result = ET.tostring(pynos.versions.registry.builders(
+            'brocade_interface', '7.1.0').interface_tengigabitethernet_mtu(
+                name='1/0/1', mtu='9216'))
+        self.assertEqual(expected, result)
+
+    def test_removed_builder(self):
+        self.assertTrue(hasattr(pynos.versions.registry.builders(
+            'brocade_interface', '6.0.1'), self.removed))
+        yang = pynos.versions.registry.builders('brocade_interface', '7.0.0')
+        self.assertFalse(hasattr(yang, self.removed))
+        with self.assertRaises(AttributeError):
+            getattr(yang, self.removed)(name='1/0/1', priority='1')
+        self.assertNotIn(self.removed, dir(yang))
+
+    def test_packed_builder(self):
+        yang = brocade_interface(callback=pynos.utilities.return_xml)
+        builder = yang.interface_tengigabitethernet_description
+        self.assertEqual('interface_tengigabitethernet_description',
+                         builder.__name__)
+        self.assertIn('interface_tengigabitethernet_description', dir(yang))
+        config = builder(name='1/0/1', description='uplink')
+        self.assertEqual('config', config.tag)
+        interface = config.find('interface')
+        self.assertEqual('urn:brocade.com:mgmt:brocade-interface',
+                         interface.get('xmlns'))
+        self.assertEqual('1/0/1',
+                         interface.find('tengigabitethernet/name').text)
+        self.assertEqual('uplink', interface.find(
+            'tengigabitethernet/description').text)
+
+    def test_packed_rpc(self):
+        yang = brocade_interface_ext(callback=pynos.utilities.return_xml)
+        rpc = yang.get_vlan_brief_input_request_type_get_request_vlan_id(
+            vlan_id='10')
+        self.assertEqual('get_vlan_brief', rpc.tag)
+        self.assertEqual('10', rpc.find(
+            'input/request-type/get-request/vlan-id').text)
+
+    def test_packed_builder_arguments(self):
+        yang = brocade_interface(callback=pynos.utilities.return_xml)
+        with self.assertRaises(KeyError):
+            yang.interface_tengigabitethernet_description(name='1/0/1')
+        result = yang.interface_tengigabitethernet_description(
+            name='1/0/1', description='uplink', callback=ET.tostring)
+        self.assertIsInstance(result, bytes)
+
+    def test_unknown_builder(self):
+        yang = brocade_interface(callback=pynos.utilities.return_xml)
+        with self.assertRaises(AttributeError):
+            yang.interface_tengigabitethernet_no_such_leaf
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,295 @@
+#!/usr/bin/env python
+"""
+Copyright 2015 Brocade Communications Systems, Inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Pack generated YANG modules into builder tables.
+
+Generate the modules of a new release into its ``yang`` package, add the
+release to ``pynos.versions.registry.RELEASES`` and run:
+
+    python tools/yang_pack.py
+
+Every generated module is replaced by a class without code and its
+builders are written to ``<module>.json.gz`` beside it.  A module that an
+earlier release also has subclasses the module of the nearest such
+release, and its table keeps only the builders that are new or different
+and the names of those the release no longer has.  Modules that are
+already packed are left alone.
+"""
+from __future__ import print_function
+import ast
+import gzip
+import importlib
+import io
+import json
+import os
+import sys
+import zlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from pynos.versions import registry  # noqa: E402
+
+BASE = '''#!/usr/bin/env python
+from pynos.versions.registry import YangBuilders
+
+
+class {name}(YangBuilders):
+    """Auto generated class.
+
+    Builders are read from {name}.json.gz.
+    """
+'''
+
+DIFF = '''#!/usr/bin/env python
+from {parent} import \\
+    {name} as parent_class
+
+
+class {name}(parent_class):
+    """Auto generated class.
+
+    Builders that differ from {parent}
+    are read from {name}.json.gz.
+    """
+'''
+
+
+def package_path(package):
+    return os.path.dirname(importlib.import_module(package).__file__)
+
+
+def _string(node):
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    raise ValueError('Expected a string at line %d.' % node.lineno)
+
+
+def _call(node, name):
+    """Return the arguments of ``ET.<name>(...)`` or ``<x>.pop(...)``."""
+    if (isinstance(node, ast.Call) and
+            isinstance(node.func, ast.Attribute) and
+            node.func.attr == name):
+        return node
+    return None
+
+
+def recipe_of(method):
+    """Replay a generated builder.
+
+    Returns:
+        tuple: (root tag, ((parent position, tag, namespace, kwarg), ...))
+        where the parent position is -1 for the root.
+    """
+    variables = {}
+    roots = []
+    nodes = []
+    result = None
+    for statement in method.body:
+        if (isinstance(statement, ast.Expr) and
+                isinstance(statement.value, ast.Constant)):
+            continue
+        if isinstance(statement, ast.Return):
+            call = statement.value
+            if (not isinstance(call, ast.Call) or call.func.id != 'callback'
+                    or call.args[0].id not in variables):
+                raise ValueError('Unexpected return at line %d.'
+                                 % statement.lineno)
+            result = variables[call.args[0].id]
+            continue
+        if not isinstance(statement, ast.Assign) or \
+                len(statement.targets) != 1:
+            raise ValueError('Unexpected statement at line %d.'
+                             % statement.lineno)
+        target, value = statement.targets[0], statement.value
+        if isinstance(target, ast.Attribute):
+            pop = _call(value, 'pop')
+            if target.attr != 'text' or pop is None:
+                raise ValueError('Unexpected assignment at line %d.'
+                                 % statement.lineno)
+            node = variables[target.value.id]
+            if node != len(nodes) - 1 or nodes[node][3] is not None:
+                raise ValueError('Text out of order at line %d.'
+                                 % statement.lineno)
+            nodes[node][3] = _string(pop.args[0])
+        elif target.id == 'callback':
+            continue
+        elif isinstance(value, ast.Name):
+            variables[target.id] = variables[value.id]
+        elif _call(value, 'Element'):
+            roots.append(_string(value.args[0]))
+            variables[target.id] = ('root', len(roots) - 1)
+        elif _call(value, 'SubElement'):
+            parent = variables[value.args[0].id]
+            namespace = None
+            for keyword in value.keywords:
+                if keyword.arg != 'xmlns':
+                    raise ValueError('Unexpected attribute at line %d.'
+                                     % statement.lineno)
+                namespace = _string(keyword.value)
+            nodes.append([parent, _string(value.args[1]), namespace, None])
+            variables[target.id] = len(nodes) - 1
+        else:
+            raise ValueError('Unexpected statement at line %d.'
+                             % statement.lineno)
+    if not isinstance(result, tuple):
+        raise ValueError('%s does not return a root element.' % method.name)
+    for node in nodes:
+        if isinstance(node[0], tuple):
+            if node[0] != result:
+                raise ValueError('%s drops elements.' % method.name)
+            node[0] = -1
+    return roots[result[1]], tuple(tuple(node) for node in nodes)
+
+
+def parse_module(source, name):
+    """Read a generated or packed module.
+
+    Returns:
+        tuple: (complete, builders, removed) where `complete` tells a
+        freshly generated module from one that subclasses another, and
+        `builders` maps each builder the module defines to its recipe.
+    """
+    tree = ast.parse(source)
+    complete = False
+    builders = {}
+    removed = []
+    for statement in tree.body:
+        if isinstance(statement, ast.ClassDef) and statement.name == name:
+            complete = [getattr(base, 'id', None)
+                        for base in statement.bases] == ['object']
+            for method in statement.body:
+                if (isinstance(method, ast.FunctionDef) and
+                        method.name != '__init__'):
+                    builders[method.name] = recipe_of(method)
+        elif (isinstance(statement, ast.Expr) and
+              isinstance(statement.value, ast.Call) and
+              getattr(statement.value.func, 'id', '') == 'remove_builders'):
+            # A diff module of an earlier version of this tool.
+            removed = [_string(item)
+                       for item in statement.value.args[1].elts]
+    return complete, builders, removed
+
+
+def read_table(filename):
+    """Read a packed table back into recipes."""
+    with open(filename, 'rb') as handle:
+        data = json.loads(zlib.decompress(
+            handle.read(), 16 + zlib.MAX_WBITS).decode('utf-8'))
+    strings = data['strings']
+    builders = {}
+    for name, root, path in data['builders']:
+        position = dict((index, number) for number, index in
+                        enumerate(path))
+        nodes = []
+        for index in path:
+            parent, tag, namespace, kwarg = data['nodes'][index]
+            nodes.append((position[parent] if parent >= 0 else -1,
+                          strings[tag],
+                          strings[namespace] if namespace >= 0 else None,
+                          strings[kwarg] if kwarg >= 0 else None))
+        builders[name] = (strings[root], tuple(nodes))
+    return builders, data['removed']
+
+
+def write_table(filename, builders, removed):
+    """Pack recipes into a trie shared by the builders of a table."""
+    strings = []
+    string_index = {}
+    trie = []
+    trie_index = {}
+
+    def string(value):
+        if value is None:
+            return -1
+        if value not in string_index:
+            string_index[value] = len(strings)
+            strings.append(value)
+        return string_index[value]
+
+    entries = []
+    for name in sorted(builders):
+        root, nodes = builders[name]
+        path = []
+        seen = {}
+        for parent, tag, namespace, kwarg in nodes:
+            parent = path[parent] if parent >= 0 else -1
+            node = (parent, string(tag), string(namespace), string(kwarg))
+            # A builder that creates the same element twice needs two
+            # nodes, or the children of both would meet under one.
+            occurrence = seen.get(node, 0)
+            seen[node] = occurrence + 1
+            key = node + (occurrence,)
+            if key not in trie_index:
+                trie_index[key] = len(trie)
+                trie.append(node)
+            path.append(trie_index[key])
+        entries.append([name, string(root), path])
+    data = json.dumps({'strings': strings, 'nodes': trie,
+                       'builders': entries, 'removed': sorted(removed)},
+                      separators=(',', ':'), sort_keys=True)
+    buf = io.BytesIO()
+    with gzip.GzipFile(filename='', mode='wb', fileobj=buf, mtime=0) as out:
+        out.write(data.encode('utf-8'))
+    with open(filename, 'wb') as handle:
+        handle.write(buf.getvalue())
+
+
+def pack():
+    tables = {}
+    for index, (release, package) in enumerate(registry.RELEASES):
+        earlier = [candidate for _, candidate in
+                   registry.RELEASES[:index]][::-1]
+        path = package_path(package)
+        for filename in sorted(os.listdir(path)):
+            if not filename.endswith('.py') or filename == '__init__.py':
+                continue
+            name = filename[:-3]
+            table_path = os.path.join(path, name + '.json.gz')
+            parent = next((candidate for candidate in earlier
+                           if (candidate, name) in tables), None)
+            inherited = tables.get((parent, name), {})
+            with open(os.path.join(path, filename)) as handle:
+                complete, builders, removed = parse_module(handle.read(),
+                                                           name)
+            if (not complete and not builders and not removed and
+                    os.path.exists(table_path)):
+                builders, removed = read_table(table_path)
+            if complete:
+                effective = builders
+            else:
+                effective = dict(inherited)
+                effective.update(builders)
+                for builder in removed:
+                    effective.pop(builder, None)
+            tables[(package, name)] = effective
+            changed = dict((builder, recipe) for builder, recipe in
+                           effective.items()
+                           if inherited.get(builder) != recipe)
+            removed = sorted(set(inherited) - set(effective))
+            write_table(table_path, changed, removed)
+            with open(os.path.join(path, filename), 'w') as handle:
+                if parent is None:
+                    handle.write(BASE.format(name=name))
+                else:
+                    handle.write(DIFF.format(parent='%s.%s' % (parent, name),
+                                             name=name))
+            print('%s %s: %d builders, %d removed' % (
+                release, filename, len(changed), len(removed)))
+
+
+if __name__ == '__main__':
+    pack()